@@ -96,6 +96,12 @@ from .file_operations import (
     clean_output_directories,
     copy_final_deliverables,
 )
+from .blob_cache import BlobCache
+from .json_store import (
+    JsonJournal,
+    JsonStore,
+    write_json_atomic,
+)
 from .config_validator import (
     validate_literature_config,
     validate_llm_config,
@@ -182,6 +188,11 @@ __all__ = [
     "clean_output_directory",
     "clean_output_directories",
     "copy_final_deliverables",
+    # JSON Stores
+    "BlobCache",
+    "JsonJournal",
+    "JsonStore",
+    "write_json_atomic",
     # Configuration Validation
     "validate_literature_config",
     "validate_llm_config",
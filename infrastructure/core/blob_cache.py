@@ -0,0 +1,243 @@
+"""Persistent SQLite cache of compressed blobs with LRU eviction.
+
+Several response caches store one serialized payload per content-derived
+key. ``BlobCache`` implements the common parts once:
+
+- a single SQLite file, created on first use
+- zlib-compressed payloads
+- optional expiry of entries older than a caller-supplied age
+- least-recently-used eviction once the total payload size exceeds
+  ``max_bytes``, tracked as a running total instead of rescanning the
+  table on every write
+- hit/miss counts on a PerformanceMonitor
+
+Subclasses build keys and (de)serialize payloads, and call ``_load`` and
+``_store``.
+
+Part of the infrastructure layer (Layer 1) - reusable across all projects.
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from infrastructure.core.logging_utils import get_logger
+from infrastructure.core.performance import PerformanceMonitor
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Caches created before BlobCache kept per-module "responses" tables whose
+# columns differ; they are dropped rather than migrated.
+_SCHEMA = """
+DROP TABLE IF EXISTS responses;
+CREATE TABLE IF NOT EXISTS blobs (
+    key TEXT PRIMARY KEY,
+    label TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_blobs_accessed ON blobs(accessed);
+"""
+
+# Rows fetched per eviction query
+_EVICT_BATCH = 32
+
+
+class BlobCache:
+    """Thread-safe SQLite store of compressed blobs.
+
+    Subclasses set ``DESCRIPTION`` (used in log messages) and expose
+    typed ``get``/``put`` methods built on ``_load`` and ``_store``.
+
+    Attributes:
+        path: Path to the SQLite cache file.
+        max_bytes: Maximum total payload size before LRU eviction.
+        monitor: PerformanceMonitor receiving cache hit/miss counts.
+    """
+
+    DESCRIPTION = "Blob cache"
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int,
+        monitor: Optional[PerformanceMonitor] = None
+    ):
+        """Initialize the cache (the database is opened on first use).
+
+        Args:
+            path: Path to the SQLite cache file.
+            max_bytes: Maximum total payload size before LRU eviction.
+            monitor: Optional PerformanceMonitor for hit/miss metrics.
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        if monitor is None:
+            monitor = PerformanceMonitor()
+            monitor.start()
+        self.monitor = monitor
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # Total payload size, read from the database on first write
+        self._total: Optional[int] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use (caller must hold the lock)."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def _total_size(self, conn: sqlite3.Connection) -> int:
+        """Get the running total payload size (caller must hold the lock)."""
+        if self._total is None:
+            self._total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+        return self._total
+
+    def _delete(self, conn: sqlite3.Connection, key: str, size: int) -> None:
+        """Delete one entry and update the running total."""
+        conn.execute("DELETE FROM blobs WHERE key = ?", (key,))
+        if self._total is not None:
+            self._total -= size
+
+    def _load(
+        self,
+        key: str,
+        decode: Callable[[bytes], T],
+        max_age: Optional[float] = None
+    ) -> Optional[T]:
+        """Look up and decode an entry.
+
+        Expired entries are deleted. Unreadable entries, and entries that
+        ``decode`` rejects with ValueError or TypeError, count as misses.
+
+        Args:
+            key: Entry key.
+            decode: Converts the decompressed payload to the cached value.
+            max_age: Optional maximum entry age in seconds.
+
+        Returns:
+            Decoded value, or None on a miss.
+        """
+        with self._lock:
+            try:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT payload, size, created FROM blobs WHERE key = ?", (key,)
+                ).fetchone()
+                now = time.time()
+                if row is None or (max_age is not None and now - row[2] > max_age):
+                    if row is not None:
+                        self._delete(conn, key, row[1])
+                        conn.commit()
+                    self.monitor.record_cache_miss()
+                    return None
+                conn.execute("UPDATE blobs SET accessed = ? WHERE key = ?", (now, key))
+                conn.commit()
+                value = decode(zlib.decompress(row[0]))
+            except (sqlite3.Error, zlib.error, ValueError, TypeError) as e:
+                logger.warning(f"{self.DESCRIPTION} lookup failed: {e}")
+                self._total = None
+                self.monitor.record_cache_miss()
+                return None
+            self.monitor.record_cache_hit()
+        return value
+
+    def _store(self, key: str, data: bytes, label: str = "") -> None:
+        """Compress and store an entry, evicting old entries if needed.
+
+        Args:
+            key: Entry key.
+            data: Serialized value.
+            label: Short description kept with the entry (e.g. a model or
+                source name).
+        """
+        payload = zlib.compress(data)
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connect()
+                total = self._total_size(conn)
+                old = conn.execute("SELECT size FROM blobs WHERE key = ?", (key,)).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO blobs (key, label, payload, size, created, accessed) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, label, payload, len(payload), now, now),
+                )
+                self._total = total + len(payload) - (old[0] if old else 0)
+                if self._total > self.max_bytes:
+                    self._evict(conn)
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"{self.DESCRIPTION} store failed: {e}")
+                self._total = None
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete least-recently-used entries until under max_bytes."""
+        evicted = 0
+        while self._total > self.max_bytes:
+            rows = conn.execute(
+                "SELECT key, size FROM blobs ORDER BY accessed ASC LIMIT ?", (_EVICT_BATCH,)
+            ).fetchall()
+            if not rows:
+                self._total = 0
+                break
+            for key, size in rows:
+                if self._total <= self.max_bytes:
+                    break
+                self._delete(conn, key, size)
+                evicted += 1
+        logger.debug(f"{self.DESCRIPTION} evicted {evicted} least-recently-used entries")
+
+    def clear(self) -> int:
+        """Remove all cached entries.
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._lock:
+            conn = self._connect()
+            count = conn.execute("DELETE FROM blobs").rowcount
+            conn.commit()
+            self._total = 0
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with entries, size_bytes, hits, misses and hit_rate.
+        """
+        entries, size = 0, 0
+        if self.path.exists():
+            with self._lock:
+                entries, size = self._connect().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs"
+                ).fetchone()
+        hits = self.monitor.cache_hits
+        misses = self.monitor.cache_misses
+        lookups = hits + misses
+        return {
+            "entries": entries,
+            "size_bytes": size,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+                self._total = None
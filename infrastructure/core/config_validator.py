@@ -182,6 +182,8 @@ def validate_environment_variables() -> Tuple[bool, List[str]]:
         "LLM_TIMEOUT": ("float", 0.1, None),
         "LLM_LONG_MAX_TOKENS": ("int", 1, None),
         "MAX_PARALLEL_SUMMARIES": ("int", 1, None),
+        "LITERATURE_CHUNK_CONCURRENCY": ("int", 1, None),
+        "LITERATURE_CHUNK_RETRIES": ("int", 0, None),
         "LOG_LEVEL": ("int", 0, 3),
     }
     
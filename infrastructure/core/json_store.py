@@ -0,0 +1,281 @@
+"""Persisted JSON stores shared across threads.
+
+Several caches and manifests keep a dictionary in memory and persist it
+as one JSON document (``{"version", "updated", <section>: {...}}``).
+``JsonStore`` implements the common parts once:
+
+- one shared instance per subclass and resolved file path (``shared``)
+- lazy loading on first use, with a hook for derived state
+- write-behind ``batch()``: changes are written once when the outermost
+  batch exits
+- atomic writes (temp file + rename) through ``write_json_atomic``
+
+Larger documents that change one key at a time use a ``JsonJournal``
+instead: mutations are appended to a JSONL file and folded into the JSON
+document on compaction.
+
+Part of the infrastructure layer (Layer 1) - reusable across all projects.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from infrastructure.core.exceptions import FileOperationError
+from infrastructure.core.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+def write_json_atomic(
+    path: Path,
+    data: Any,
+    description: str,
+    fsync: bool = False,
+    **dump_kwargs: Any
+) -> None:
+    """Write JSON to a file atomically (temp file + rename).
+
+    Args:
+        path: Destination file; parent directories are created.
+        data: JSON-serializable data.
+        description: What is being saved, used in the error message.
+        fsync: Sync the temp file to disk before the rename.
+        **dump_kwargs: Passed to ``json.dump`` (e.g. ``indent``).
+
+    Raises:
+        FileOperationError: If the file cannot be written.
+    """
+    path = Path(path)
+    temp_path = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, **dump_kwargs)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except OSError as e:
+        raise FileOperationError(
+            f"Failed to save {description}: {e}",
+            context={"path": str(path)}
+        )
+
+
+class JsonStore:
+    """Thread-safe dictionary persisted as a JSON document.
+
+    Subclasses set ``SECTION`` (the document key holding the data),
+    ``DESCRIPTION`` (used in log and error messages) and optionally
+    ``VERSION``, and work on ``self._data`` while holding ``self._lock``.
+    After a change they call ``_changed()`` to write it (deferred inside
+    ``batch()``), or set ``_dirty`` and leave writing to ``flush()``.
+
+    Attributes:
+        path: JSON file holding the store.
+    """
+
+    SECTION = "records"
+    DESCRIPTION = "JSON store"
+    VERSION = "1.0"
+
+    _shared: Dict[Tuple[type, str], JsonStore] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: Path):
+        """Initialize the store (loaded lazily on first use).
+
+        Args:
+            path: JSON file.
+        """
+        self.path = Path(path)
+        self._data: Dict[str, Any] = {}
+        self._loaded = False
+        self._dirty = False
+        self._batch_depth = 0
+        self._lock = threading.RLock()
+
+    @classmethod
+    def shared(cls, path: Path, **kwargs: Any) -> JsonStore:
+        """Get the shared instance of this class for a file.
+
+        Args:
+            path: JSON file.
+            **kwargs: Constructor arguments used if the instance is created.
+
+        Returns:
+            The instance for ``path``, created on first request.
+        """
+        key = (cls, str(Path(path).resolve()))
+        with JsonStore._shared_lock:
+            store = JsonStore._shared.get(key)
+            if store is None:
+                store = cls(path, **kwargs)
+                JsonStore._shared[key] = store
+            return store
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            if not self.path.exists():
+                self._on_load(None)
+                return
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    document = json.load(f)
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning(f"Failed to load {self.DESCRIPTION}: {e}")
+                return
+            self._on_load(document)
+
+    def _on_load(self, document: Optional[Dict[str, Any]]) -> None:
+        """Take the data from a loaded document (None if the file is missing).
+
+        Called once, with the lock held. Subclasses override this to
+        migrate old formats or build derived indexes.
+        """
+        if document is not None:
+            self._data = document.get(self.SECTION, {})
+
+    def _changed(self) -> None:
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.flush()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer writes until the outermost batch exits."""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.flush()
+
+    def flush(self) -> None:
+        """Write the store if it changed (atomic replace).
+
+        Raises:
+            FileOperationError: If the file cannot be written.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "version": self.VERSION,
+                "updated": datetime.now().isoformat(),
+                self.SECTION: self._data,
+            }
+            write_json_atomic(self.path, data, self.DESCRIPTION, indent=1, sort_keys=True)
+            self._dirty = False
+
+
+class JsonJournal:
+    """Append-only JSONL journal of mutations to a JSON document.
+
+    The owner appends mutation records on flush and rewrites its JSON
+    document (then calls ``remove``) once ``needs_compaction`` is True.
+    Records must be idempotent so that a crash between writing the
+    document and removing the journal is safe. The journal is not
+    thread-safe; the owner serializes calls.
+
+    Attributes:
+        path: JSONL journal file.
+        description: What the journal belongs to, used in messages.
+        compact_every: Records after which the journal should be compacted.
+        records: Records currently in the journal file.
+    """
+
+    def __init__(self, path: Path, description: str, compact_every: int):
+        """Initialize the journal.
+
+        Args:
+            path: JSONL journal file.
+            description: What the journal belongs to (e.g. "library").
+            compact_every: Records after which compaction is due (min. 1).
+        """
+        self.path = Path(path)
+        self.description = description
+        self.compact_every = max(1, compact_every)
+        self.records = 0
+
+    @property
+    def needs_compaction(self) -> bool:
+        """Whether the journal holds ``compact_every`` records or more."""
+        return self.records >= self.compact_every
+
+    def replay(self, apply: Callable[[Dict[str, Any]], None]) -> int:
+        """Apply every journal record in order.
+
+        Corrupt lines (e.g. a final line truncated by a crash during
+        append) are skipped.
+
+        Args:
+            apply: Called with each decoded record.
+
+        Returns:
+            Number of records applied.
+        """
+        applied = 0
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except json.JSONDecodeError:
+                            logger.warning(f"Skipping corrupt {self.description} journal record in {self.path}")
+                            continue
+                        apply(record)
+                        applied += 1
+            except OSError as e:
+                logger.warning(f"Failed to read {self.description} journal: {e}")
+        if applied:
+            logger.debug(f"Replayed {applied} {self.description} journal records")
+        self.records = applied
+        return applied
+
+    def append(self, records: List[Dict[str, Any]]) -> None:
+        """Append records in one synced write.
+
+        Raises:
+            FileOperationError: If the journal cannot be written.
+        """
+        if not records:
+            return
+        lines = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            raise FileOperationError(
+                f"Failed to append to {self.description} journal: {e}",
+                context={"path": str(self.path)}
+            )
+        self.records += len(records)
+
+    def remove(self) -> None:
+        """Delete the journal after its records were folded into the document."""
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to remove {self.description} journal: {e}")
+        if self.records:
+            logger.debug(f"Compacted {self.records} {self.description} journal records")
+        self.records = 0
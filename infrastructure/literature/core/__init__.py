@@ -6,6 +6,7 @@ from infrastructure.literature.core.core import (
     SourceStatistics,
 )
 from infrastructure.literature.core.config import LiteratureConfig, BROWSER_USER_AGENTS
+from infrastructure.literature.core.dedup import ResultDeduplicator
 from infrastructure.literature.core.cli import main as cli_main
 # Export cli module for direct import
 from infrastructure.literature.core import cli
@@ -17,6 +18,7 @@ __all__ = [
     "SourceStatistics",
     "LiteratureConfig",
     "BROWSER_USER_AGENTS",
+    "ResultDeduplicator",
     "cli_main",
     "cli",
 ]
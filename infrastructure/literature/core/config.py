@@ -33,13 +33,76 @@ class LiteratureConfig:
         pdf_download_timeout: Timeout for PDF downloads in seconds (default: 60.0).
         bibtex_file: Path to BibTeX file (default: data/references.bib).
         library_index_file: Path to JSON library index (default: data/library.json).
+        library_journal: Append library mutations to a JSONL journal instead of
+            rewriting library.json on every flush (default: False).
+        library_journal_compact_every: Journal records before compacting into
+            library.json (default: 500).
+        failed_tracker_journal: Append failed-download tracker mutations to
+            failed_downloads.journal.jsonl instead of rewriting failed_downloads.json
+            (default: False).
+        failed_tracker_compact_every: Journal records before compacting into
+            failed_downloads.json (default: 500).
+        failed_tracker_flush_every: Tracker mutations coalesced inside a batch before
+            an intermediate flush (default: 50).
+        library_backend: Library index storage, "json" or "sqlite" (default: json).
+        library_db_file: SQLite library database path (default: library_index_file
+            with a .sqlite suffix).
         sources: List of enabled sources (default: arxiv, semanticscholar).
         use_unpaywall: Enable Unpaywall API for open access PDF fallback (default: False).
         unpaywall_email: Email for Unpaywall API (required if use_unpaywall is True).
         download_retry_attempts: Retry attempts for PDF downloads (default: 2).
         download_retry_delay: Base delay for download retry in seconds (default: 2.0).
         use_browser_user_agent: Use browser-like User-Agent for downloads (default: True).
-        max_parallel_downloads: Maximum parallel download workers (default: 4).
+        resume_downloads: Resume interrupted PDF downloads from their .part file
+            with HTTP Range requests (default: True).
+        download_chunk_size: Bytes per chunk when streaming PDFs to disk (default: 65536).
+        race_candidate_urls: Probe the top candidate PDF URLs concurrently and download
+            the first that serves a PDF first (default: False).
+        race_candidate_count: Candidate URLs probed per race (default: 4).
+        pdf_content_index: Index stored PDFs by SHA-256 so duplicates (e.g. a preprint
+            and its published version) reuse extraction and summaries (default: True).
+        pdf_content_index_file: Content index path (default: cache/pdf_content.json
+            next to download_dir).
+        link_duplicate_pdfs: Replace duplicate PDFs by hard links to the first copy
+            (default: True).
+        learn_download_strategies: Rank candidate PDF URLs and recovery strategies by
+            recorded per-host success rate and latency (default: True).
+        download_stats_file: Download statistics path (default: cache/download_stats.json
+            next to download_dir).
+        download_stats_prune_after: Attempts without success before a host or strategy
+            is skipped for a week; 0 disables pruning (default: 0, opt-in). Failures
+            imported from failed_downloads.json never prune.
+        max_parallel_downloads: Maximum downloads in flight in the async download
+            pipeline; 1 downloads sequentially (default: 4).
+        max_downloads_per_host: Maximum downloads in flight per host (default: 4).
+        download_queue_size: Downloaded papers buffered for post-download text
+            extraction before downloads wait (default: 32).
+        extract_text_on_download: Extract text to data/extracted_text while the
+            remaining papers download (default: False).
+        extraction_workers: Worker processes for run_extract_text; 0 uses one per
+            CPU core, 1 extracts sequentially in-process (default: 0).
+        extraction_timeout: Seconds a single PDF may take in a worker process
+            before it is killed and the PDF skipped (default: 300).
+        pack_extracted_text: Pack data/extracted_text into the memory-mapped
+            data/extracted_text.corpus after text extraction (default: False).
+        corpus_codec: Corpus record compression: auto (zstd if installed, else
+            zlib), zstd, zlib or none (default: auto).
+        http_pool_hosts: Hosts with cached keep-alive connection pools (default: 32).
+        http_pool_maxsize: Keep-alive connections per host (default: the larger of
+            max_parallel_downloads and max_parallel_sources).
+        rate_limit_hosts: Throttle all HTTP requests with per-host token buckets
+            shared across threads (default: True).
+        host_rate_limit: Requests per second per host for hosts without a
+            source-specific delay (default: 2.0).
+        host_rate_burst: Requests a host may receive back to back (default: 4).
+        parallel_search: Query all sources concurrently in search() (default: True).
+        max_parallel_sources: Maximum sources queried at once (default: 8).
+        use_search_cache: Cache source search responses on disk (default: True).
+        search_cache_file: SQLite cache path (default: cache/search_cache.sqlite next to download_dir).
+        search_cache_ttl: Default cache entry lifetime in seconds; per-source
+            ``cache_ttl`` in source_configs overrides it (default: 86400).
+        search_cache_max_mb: Cache size bound before LRU eviction in MB (default: 100).
+        refresh_search_cache: Ignore cached responses but store fresh ones (default: False).
         max_url_attempts_per_pdf: Maximum total URL attempts per PDF (default: 8).
         max_fallback_strategies: Maximum fallback strategy attempts (default: 3).
         html_text_min_length: Minimum character length for extracted HTML text to be considered valid (default: 2000).
@@ -58,13 +121,49 @@ class LiteratureConfig:
         LITERATURE_PDF_DOWNLOAD_TIMEOUT: Override pdf_download_timeout.
         LITERATURE_BIBTEX_FILE: Override bibtex_file.
         LITERATURE_LIBRARY_INDEX: Override library_index_file.
+        LITERATURE_LIBRARY_JOURNAL: Enable library journal (true/false).
+        LITERATURE_LIBRARY_JOURNAL_COMPACT_EVERY: Override library_journal_compact_every.
+        LITERATURE_FAILED_TRACKER_JOURNAL: Enable failed-download journal (true/false).
+        LITERATURE_FAILED_TRACKER_COMPACT_EVERY: Override failed_tracker_compact_every.
+        LITERATURE_FAILED_TRACKER_FLUSH_EVERY: Override failed_tracker_flush_every.
+        LITERATURE_LIBRARY_BACKEND: Override library_backend (json/sqlite).
+        LITERATURE_LIBRARY_DB: Override library_db_file.
         LITERATURE_SOURCES: Comma-separated list of sources (available: arxiv, semanticscholar, biorxiv, pubmed, europepmc, crossref, openalex, dblp).
         LITERATURE_USE_UNPAYWALL: Enable Unpaywall (true/false).
         UNPAYWALL_EMAIL: Email for Unpaywall API.
         LITERATURE_DOWNLOAD_RETRY_ATTEMPTS: Override download_retry_attempts.
         LITERATURE_DOWNLOAD_RETRY_DELAY: Override download_retry_delay.
         LITERATURE_USE_BROWSER_USER_AGENT: Use browser User-Agent (true/false).
+        LITERATURE_RESUME_DOWNLOADS: Resume partial downloads (true/false).
+        LITERATURE_DOWNLOAD_CHUNK_SIZE: Override download_chunk_size.
+        LITERATURE_RACE_CANDIDATE_URLS: Enable candidate URL racing (true/false).
+        LITERATURE_RACE_CANDIDATE_COUNT: Override race_candidate_count.
+        LITERATURE_PDF_CONTENT_INDEX: Enable the PDF content index (true/false).
+        LITERATURE_PDF_CONTENT_INDEX_FILE: Override pdf_content_index_file.
+        LITERATURE_LINK_DUPLICATE_PDFS: Hard-link duplicate PDFs (true/false).
+        LITERATURE_EXTRACTION_WORKERS: Override extraction_workers.
+        LITERATURE_EXTRACTION_TIMEOUT: Override extraction_timeout.
+        LITERATURE_PACK_EXTRACTED_TEXT: Pack extracted texts after extraction (true/false).
+        LITERATURE_CORPUS_CODEC: Override corpus_codec.
+        LITERATURE_LEARN_DOWNLOAD_STRATEGIES: Enable learned URL ranking (true/false).
+        LITERATURE_DOWNLOAD_STATS_FILE: Override download_stats_file.
+        LITERATURE_DOWNLOAD_STATS_PRUNE_AFTER: Override download_stats_prune_after.
         LITERATURE_MAX_PARALLEL_DOWNLOADS: Override max_parallel_downloads.
+        LITERATURE_MAX_DOWNLOADS_PER_HOST: Override max_downloads_per_host.
+        LITERATURE_DOWNLOAD_QUEUE_SIZE: Override download_queue_size.
+        LITERATURE_EXTRACT_TEXT_ON_DOWNLOAD: Extract text during downloads (true/false).
+        LITERATURE_HTTP_POOL_HOSTS: Override http_pool_hosts.
+        LITERATURE_HTTP_POOL_MAXSIZE: Override http_pool_maxsize.
+        LITERATURE_RATE_LIMIT_HOSTS: Enable per-host rate limiting (true/false).
+        LITERATURE_HOST_RATE_LIMIT: Override host_rate_limit.
+        LITERATURE_HOST_RATE_BURST: Override host_rate_burst.
+        LITERATURE_PARALLEL_SEARCH: Query sources concurrently (true/false).
+        LITERATURE_MAX_PARALLEL_SOURCES: Override max_parallel_sources.
+        LITERATURE_SEARCH_CACHE: Enable search response cache (true/false).
+        LITERATURE_SEARCH_CACHE_FILE: Override search_cache_file.
+        LITERATURE_SEARCH_CACHE_TTL: Override search_cache_ttl.
+        LITERATURE_SEARCH_CACHE_MAX_MB: Override search_cache_max_mb.
+        LITERATURE_SEARCH_CACHE_REFRESH: Refresh cached responses (true/false).
         LITERATURE_MAX_URL_ATTEMPTS_PER_PDF: Override max_url_attempts_per_pdf.
         LITERATURE_MAX_FALLBACK_STRATEGIES: Override max_fallback_strategies.
         LITERATURE_HTML_TEXT_MIN_LENGTH: Override html_text_min_length.
@@ -88,7 +187,8 @@ class LiteratureConfig:
             "delay": 3.0,
             "max_retries": 3,
             "timeout": 30.0,
-            "health_check_enabled": True
+            "health_check_enabled": True,
+            "cache_ttl": 21600.0  # Preprint listings change daily
         },
         "semanticscholar": {
             "delay": 1.5,
@@ -131,7 +231,8 @@ class LiteratureConfig:
             "delay": 1.0,
             "max_retries": 3,
             "timeout": 30.0,
-            "health_check_enabled": True
+            "health_check_enabled": True,
+            "cache_ttl": 21600.0  # Preprint listings change daily
         }
     })
     
@@ -143,6 +244,15 @@ class LiteratureConfig:
     # Reference settings
     bibtex_file: str = "data/references.bib"
     library_index_file: str = "data/library.json"
+    library_journal: bool = False  # Append-only JSONL journal with periodic compaction
+    library_journal_compact_every: int = 500
+    
+    # Failed download tracker persistence (coalesced writes, optional journal)
+    failed_tracker_journal: bool = False
+    failed_tracker_compact_every: int = 500
+    failed_tracker_flush_every: int = 50
+    library_backend: str = "json"  # "json" (library.json) or "sqlite"
+    library_db_file: Optional[str] = None
     
     # Enabled sources
     # Available sources: arxiv, semanticscholar, biorxiv, pubmed, europepmc, crossref, openalex, dblp, unpaywall
@@ -170,8 +280,55 @@ class LiteratureConfig:
     # Use browser-like User-Agent for PDF downloads (helps avoid 403 errors)
     use_browser_user_agent: bool = True
     
+    # Streaming PDF downloads (written to <name>.pdf.part, renamed when complete)
+    resume_downloads: bool = True  # Continue partial files with Range requests
+    download_chunk_size: int = 65536
+    
+    # Concurrent probing of candidate PDF URLs (opt-in)
+    race_candidate_urls: bool = False
+    race_candidate_count: int = 4
+    
+    # Content-addressed duplicate detection for stored PDFs
+    pdf_content_index: bool = True
+    pdf_content_index_file: Optional[str] = None  # Default: <download_dir parent>/cache/pdf_content.json
+    link_duplicate_pdfs: bool = True
+    
+    # Learned URL/strategy ranking from recorded download outcomes
+    learn_download_strategies: bool = True
+    download_stats_file: Optional[str] = None  # Default: <download_dir parent>/cache/download_stats.json
+    download_stats_prune_after: int = 0  # Opt-in pruning of never-successful hosts
+    
     # Parallel download settings
-    max_parallel_downloads: int = 4  # Maximum parallel download workers
+    max_parallel_downloads: int = 4  # Maximum downloads in flight
+    max_downloads_per_host: int = 4
+    download_queue_size: int = 32  # Bounded queue feeding post-download extraction
+    extract_text_on_download: bool = False
+    
+    # Multi-process text extraction (run_extract_text)
+    extraction_workers: int = 0  # 0 = one worker process per CPU core
+    extraction_timeout: float = 300.0  # Per-PDF limit before the worker is killed
+    pack_extracted_text: bool = False  # Rebuild data/extracted_text.corpus after extraction
+    corpus_codec: str = "auto"
+    
+    # Shared HTTP session pools (keep-alive connections per host)
+    http_pool_hosts: int = 32
+    http_pool_maxsize: Optional[int] = None  # Default: max(max_parallel_downloads, max_parallel_sources)
+    
+    # Per-host token-bucket rate limiting (shared by sources and downloads)
+    rate_limit_hosts: bool = True
+    host_rate_limit: float = 2.0  # Requests per second; source delays override for their API host
+    host_rate_burst: int = 4
+    
+    # Parallel search settings (each source keeps its own rate-limit delay)
+    parallel_search: bool = True  # Fan out one search across all sources at once
+    max_parallel_sources: int = 8  # Maximum sources queried concurrently
+    
+    # Search response cache (keyed by source, query and limit)
+    use_search_cache: bool = True
+    search_cache_file: Optional[str] = None  # Default: <download_dir parent>/cache/search_cache.sqlite
+    search_cache_ttl: float = 86400.0  # Seconds; per-source "cache_ttl" overrides
+    search_cache_max_mb: float = 100.0  # LRU eviction above this size
+    refresh_search_cache: bool = False  # Skip cached reads, store fresh responses
     
     # PDF download attempt limits (to prevent excessive retries)
     max_url_attempts_per_pdf: int = 8  # Maximum total URL attempts per PDF
@@ -204,6 +361,46 @@ class LiteratureConfig:
 
         use_browser_ua_str = os.environ.get("LITERATURE_USE_BROWSER_USER_AGENT", "true").lower()
         use_browser_user_agent = use_browser_ua_str in ("true", "1", "yes")
+
+        resume_downloads_str = os.environ.get("LITERATURE_RESUME_DOWNLOADS", "true").lower()
+        resume_downloads = resume_downloads_str in ("true", "1", "yes")
+
+        extract_on_download_str = os.environ.get("LITERATURE_EXTRACT_TEXT_ON_DOWNLOAD", "false").lower()
+        extract_text_on_download = extract_on_download_str in ("true", "1", "yes")
+
+        race_urls_str = os.environ.get("LITERATURE_RACE_CANDIDATE_URLS", "false").lower()
+        race_candidate_urls = race_urls_str in ("true", "1", "yes")
+
+        content_index_str = os.environ.get("LITERATURE_PDF_CONTENT_INDEX", "true").lower()
+        pdf_content_index = content_index_str in ("true", "1", "yes")
+        link_duplicates_str = os.environ.get("LITERATURE_LINK_DUPLICATE_PDFS", "true").lower()
+        link_duplicate_pdfs = link_duplicates_str in ("true", "1", "yes")
+
+        pack_text_str = os.environ.get("LITERATURE_PACK_EXTRACTED_TEXT", "false").lower()
+        pack_extracted_text = pack_text_str in ("true", "1", "yes")
+
+        learn_strategies_str = os.environ.get("LITERATURE_LEARN_DOWNLOAD_STRATEGIES", "true").lower()
+        learn_download_strategies = learn_strategies_str in ("true", "1", "yes")
+
+        parallel_search_str = os.environ.get("LITERATURE_PARALLEL_SEARCH", "true").lower()
+        parallel_search = parallel_search_str in ("true", "1", "yes")
+
+        use_search_cache_str = os.environ.get("LITERATURE_SEARCH_CACHE", "true").lower()
+        use_search_cache = use_search_cache_str in ("true", "1", "yes")
+
+        refresh_cache_str = os.environ.get("LITERATURE_SEARCH_CACHE_REFRESH", "false").lower()
+        refresh_search_cache = refresh_cache_str in ("true", "1", "yes")
+
+        library_journal_str = os.environ.get("LITERATURE_LIBRARY_JOURNAL", "false").lower()
+        library_journal = library_journal_str in ("true", "1", "yes")
+
+        failed_journal_str = os.environ.get("LITERATURE_FAILED_TRACKER_JOURNAL", "false").lower()
+        failed_tracker_journal = failed_journal_str in ("true", "1", "yes")
+
+        rate_limit_hosts_str = os.environ.get("LITERATURE_RATE_LIMIT_HOSTS", "true").lower()
+        rate_limit_hosts = rate_limit_hosts_str in ("true", "1", "yes")
+
+        http_pool_maxsize_str = os.environ.get("LITERATURE_HTTP_POOL_MAXSIZE")
         
         return cls(
             default_limit=int(os.environ.get("LITERATURE_DEFAULT_LIMIT", "25")),
@@ -222,6 +419,13 @@ class LiteratureConfig:
             pdf_download_timeout=float(os.environ.get("LITERATURE_PDF_DOWNLOAD_TIMEOUT", "60.0")),
             bibtex_file=os.environ.get("LITERATURE_BIBTEX_FILE", "data/references.bib"),
             library_index_file=os.environ.get("LITERATURE_LIBRARY_INDEX", "data/library.json"),
+            library_journal=library_journal,
+            library_journal_compact_every=int(os.environ.get("LITERATURE_LIBRARY_JOURNAL_COMPACT_EVERY", "500")),
+            failed_tracker_journal=failed_tracker_journal,
+            failed_tracker_compact_every=int(os.environ.get("LITERATURE_FAILED_TRACKER_COMPACT_EVERY", "500")),
+            failed_tracker_flush_every=int(os.environ.get("LITERATURE_FAILED_TRACKER_FLUSH_EVERY", "50")),
+            library_backend=os.environ.get("LITERATURE_LIBRARY_BACKEND", "json"),
+            library_db_file=os.environ.get("LITERATURE_LIBRARY_DB"),
             sources=sources if sources else [
                 "arxiv", 
                 "semanticscholar", 
@@ -237,7 +441,36 @@ class LiteratureConfig:
             download_retry_attempts=int(os.environ.get("LITERATURE_DOWNLOAD_RETRY_ATTEMPTS", "2")),
             download_retry_delay=float(os.environ.get("LITERATURE_DOWNLOAD_RETRY_DELAY", "2.0")),
             use_browser_user_agent=use_browser_user_agent,
+            resume_downloads=resume_downloads,
+            download_chunk_size=int(os.environ.get("LITERATURE_DOWNLOAD_CHUNK_SIZE", "65536")),
+            race_candidate_urls=race_candidate_urls,
+            race_candidate_count=int(os.environ.get("LITERATURE_RACE_CANDIDATE_COUNT", "4")),
+            pdf_content_index=pdf_content_index,
+            pdf_content_index_file=os.environ.get("LITERATURE_PDF_CONTENT_INDEX_FILE"),
+            link_duplicate_pdfs=link_duplicate_pdfs,
+            learn_download_strategies=learn_download_strategies,
+            download_stats_file=os.environ.get("LITERATURE_DOWNLOAD_STATS_FILE"),
+            download_stats_prune_after=int(os.environ.get("LITERATURE_DOWNLOAD_STATS_PRUNE_AFTER", "0")),
             max_parallel_downloads=int(os.environ.get("LITERATURE_MAX_PARALLEL_DOWNLOADS", "4")),
+            max_downloads_per_host=int(os.environ.get("LITERATURE_MAX_DOWNLOADS_PER_HOST", "4")),
+            download_queue_size=int(os.environ.get("LITERATURE_DOWNLOAD_QUEUE_SIZE", "32")),
+            extract_text_on_download=extract_text_on_download,
+            extraction_workers=int(os.environ.get("LITERATURE_EXTRACTION_WORKERS", "0")),
+            extraction_timeout=float(os.environ.get("LITERATURE_EXTRACTION_TIMEOUT", "300")),
+            pack_extracted_text=pack_extracted_text,
+            corpus_codec=os.environ.get("LITERATURE_CORPUS_CODEC", "auto"),
+            http_pool_hosts=int(os.environ.get("LITERATURE_HTTP_POOL_HOSTS", "32")),
+            http_pool_maxsize=int(http_pool_maxsize_str) if http_pool_maxsize_str else None,
+            rate_limit_hosts=rate_limit_hosts,
+            host_rate_limit=float(os.environ.get("LITERATURE_HOST_RATE_LIMIT", "2.0")),
+            host_rate_burst=int(os.environ.get("LITERATURE_HOST_RATE_BURST", "4")),
+            parallel_search=parallel_search,
+            max_parallel_sources=int(os.environ.get("LITERATURE_MAX_PARALLEL_SOURCES", "8")),
+            use_search_cache=use_search_cache,
+            search_cache_file=os.environ.get("LITERATURE_SEARCH_CACHE_FILE"),
+            search_cache_ttl=float(os.environ.get("LITERATURE_SEARCH_CACHE_TTL", "86400")),
+            search_cache_max_mb=float(os.environ.get("LITERATURE_SEARCH_CACHE_MAX_MB", "100")),
+            refresh_search_cache=refresh_search_cache,
             max_url_attempts_per_pdf=int(os.environ.get("LITERATURE_MAX_URL_ATTEMPTS_PER_PDF", "8")),
             max_fallback_strategies=int(os.environ.get("LITERATURE_MAX_FALLBACK_STRATEGIES", "3")),
             html_text_min_length=int(os.environ.get("LITERATURE_HTML_TEXT_MIN_LENGTH", "2000")),
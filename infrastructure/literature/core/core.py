@@ -1,6 +1,8 @@
 """Core logic for literature search module."""
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any, Union, Tuple
 from pathlib import Path
@@ -8,6 +10,7 @@ from pathlib import Path
 from infrastructure.core.logging_utils import get_logger
 from infrastructure.core.exceptions import APIRateLimitError
 from infrastructure.literature.core.config import LiteratureConfig
+from infrastructure.literature.core.dedup import ResultDeduplicator
 from infrastructure.literature.sources import (
     SearchResult,
     ArxivSource,
@@ -19,7 +22,8 @@ from infrastructure.literature.sources import (
     CrossRefSource,
     OpenAlexSource,
     DBLPSource,
-    LiteratureSource
+    LiteratureSource,
+    SearchResponseCache,
 )
 from infrastructure.literature.pdf.handler import PDFHandler
 from infrastructure.literature.library.references import ReferenceManager
@@ -82,11 +86,18 @@ class SearchStatistics:
         total_results: Total unique results after deduplication.
         source_stats: Dictionary mapping source names to SourceStatistics.
         total_time: Total search time in seconds.
+        new_results: Results not yet in the library (set by the workflow).
+        known_results: Results already in the library (set by the workflow).
+        skipped_complete_results: Known results dropped because their PDF and
+            summary already exist (set by the workflow).
     """
     query: str
     total_results: int = 0
     source_stats: Dict[str, SourceStatistics] = field(default_factory=dict)
     total_time: float = 0.0
+    new_results: int = 0
+    known_results: int = 0
+    skipped_complete_results: int = 0
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -95,6 +106,9 @@ class SearchStatistics:
             "total_results": self.total_results,
             "source_stats": {k: v.to_dict() for k, v in self.source_stats.items()},
             "total_time": self.total_time,
+            "new_results": self.new_results,
+            "known_results": self.known_results,
+            "skipped_complete_results": self.skipped_complete_results,
         }
 
 
@@ -184,6 +198,13 @@ class LiteratureSearch:
         if self.config.use_unpaywall and self.config.unpaywall_email:
             self.sources["unpaywall"] = UnpaywallSource(self.config)
         
+        # Share one on-disk response cache across all sources
+        self.search_cache: Optional[SearchResponseCache] = (
+            SearchResponseCache.from_config(self.config) if self.config.use_search_cache else None
+        )
+        for source in self.sources.values():
+            source.response_cache = self.search_cache
+        
         # Source health monitoring
         self._source_health_cache: Dict[str, bool] = {}
         self._last_health_check: float = 0.0
@@ -273,6 +294,10 @@ class LiteratureSearch:
     ) -> Union[List[SearchResult], Tuple[List[SearchResult], SearchStatistics]]:
         """Search for papers across enabled sources.
         
+        When ``config.parallel_search`` is enabled, every source is queried in
+        its own worker thread so the total latency is roughly that of the
+        slowest source. Each source still honours its own rate-limit delay.
+        
         Args:
             query: Search query string.
             limit: Maximum results per source.
@@ -283,7 +308,6 @@ class LiteratureSearch:
             Combined list of deduplicated search results, or tuple of (results, statistics)
             if return_stats is True.
         """
-        import time
         start_time = time.time()
         results = []
         source_stats: Dict[str, SourceStatistics] = {}
@@ -292,97 +316,38 @@ class LiteratureSearch:
         # Ping sources before search
         source_health = self._ping_sources(sources_to_use)
         
+        max_workers = min(len(sources_to_use), max(1, self.config.max_parallel_sources))
+        parallel = self.config.parallel_search and max_workers > 1
+        
         logger.info(f"Searching across {len(sources_to_use)} source(s): {', '.join(sources_to_use)}")
-        logger.info(f"Query: '{query}' | Limit per source: {limit}")
+        mode = f"parallel ({max_workers} workers)" if parallel else "sequential"
+        logger.info(f"Query: '{query}' | Limit per source: {limit} | Mode: {mode}")
         logger.info("")
         
-        for source_name in sources_to_use:
-            source_start_time = time.time()
-            stats = SourceStatistics(source_name=source_name)
-            
-            if source_name not in self.sources:
-                logger.warning(f"✗ {source_name.upper()}: Unknown source, skipping")
-                stats.skipped = True
-                stats.healthy = False
-                source_stats[source_name] = stats
-                continue
-            
-            # Check source health before attempting search
-            source = self.sources[source_name]
-            
-            # Check if source supports health status
-            if hasattr(source, 'get_health_status') and hasattr(source, 'is_healthy'):
-                try:
-                    health_status = source.get_health_status()
-                    stats.healthy = health_status.get("healthy", True)
-                    
-                    if not source.is_healthy:
-                        consecutive_failures = getattr(source, '_consecutive_failures', 0)
-                        logger.warning(f"✗ {source_name.upper()}: Unhealthy ({consecutive_failures} consecutive failures), skipping")
-                        stats.skipped = True
-                        stats.healthy = False
-                        source_stats[source_name] = stats
-                        continue
-                except Exception as e:
-                    logger.debug(f"Error checking health for {source_name}: {e}, proceeding with search")
-                    stats.healthy = True  # Default to healthy if check fails
-            else:
-                # Source doesn't support health checks, assume healthy
-                stats.healthy = True
-                
-            try:
-                # Check if source has search method (some sources like Unpaywall don't)
-                if not hasattr(source, 'search'):
-                    logger.debug(f"ℹ️  {source_name.upper()}: No search support (lookup only), skipping")
-                    stats.skipped = True
+        per_source_results: Dict[str, List[SearchResult]] = {}
+        if parallel:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_source = {
+                    executor.submit(self._search_single_source, source_name, query, limit): source_name
+                    for source_name in sources_to_use
+                }
+                for future in as_completed(future_to_source):
+                    source_name = future_to_source[future]
+                    source_results, stats = future.result()
+                    per_source_results[source_name] = source_results
                     source_stats[source_name] = stats
-                    continue
-                
-                logger.debug(f"Searching {source_name}...")
-                source_results = source.search(query, limit)
-                source_time = time.time() - source_start_time
-                
-                # Calculate statistics
-                stats.results_found = len(source_results)
-                stats.citations_found = sum(r.citation_count or 0 for r in source_results)
-                stats.pdfs_available = sum(1 for r in source_results if r.pdf_url)
-                stats.dois_available = sum(1 for r in source_results if r.doi)
-                stats.time_taken = source_time
-                stats.healthy = True
-                
-                results.extend(source_results)
-                
-                # Log detailed per-source results with health status
-                health_indicator = "✓" if stats.healthy else "✗"
-                avg_citations = stats.citations_found / stats.results_found if stats.results_found > 0 else 0
-                logger.info(f"{health_indicator} {source_name.upper()}: {stats.results_found} results "
-                          f"({stats.citations_found} total citations, avg: {avg_citations:.1f}, "
-                          f"{stats.pdfs_available} PDFs, {stats.dois_available} DOIs) - {source_time:.2f}s")
-                
-            except APIRateLimitError as e:
-                source_time = time.time() - source_start_time
-                error_context = getattr(e, 'context', {})
-                attempt = error_context.get('attempt', '?')
-                logger.error(f"✗ {source_name.upper()}: Rate limit exceeded (attempt {attempt}) - {source_time:.2f}s")
-                stats.errors = 1
-                stats.time_taken = source_time
-                stats.healthy = False
-                if hasattr(source, '_consecutive_failures'):
-                    source._consecutive_failures += 1
-            except Exception as e:
-                source_time = time.time() - source_start_time
-                error_type = type(e).__name__
-                error_context = getattr(e, 'context', {}) if hasattr(e, 'context') else {}
-                attempt = error_context.get('attempt', '?')
-                logger.error(f"✗ {source_name.upper()}: Search failed ({error_type}, attempt {attempt}) - {e} - {source_time:.2f}s")
-                stats.errors = 1
-                stats.time_taken = source_time
-                stats.healthy = False
-                if hasattr(source, '_consecutive_failures'):
-                    source._consecutive_failures += 1
-            
-            source_stats[source_name] = stats
-                
+        else:
+            for source_name in sources_to_use:
+                source_results, stats = self._search_single_source(source_name, query, limit)
+                per_source_results[source_name] = source_results
+                source_stats[source_name] = stats
+        
+        # Merge in configured source order so deduplication is deterministic
+        # regardless of which source answered first
+        for source_name in sources_to_use:
+            results.extend(per_source_results.get(source_name, []))
+        source_stats = {name: source_stats[name] for name in sources_to_use if name in source_stats}
+        
         # Deduplicate by DOI or Title
         deduplicated = self._deduplicate_results(results)
         total_time = time.time() - start_time
@@ -421,6 +386,103 @@ class LiteratureSearch:
             return deduplicated, search_stats
         return deduplicated
 
+    def _search_single_source(
+        self,
+        source_name: str,
+        query: str,
+        limit: int
+    ) -> Tuple[List[SearchResult], SourceStatistics]:
+        """Search one source and collect its statistics.
+        
+        Safe to run concurrently for different sources: each source owns its
+        rate-limit state, and failures are captured in the returned statistics
+        rather than raised.
+        
+        Args:
+            source_name: Name of the source to query.
+            query: Search query string.
+            limit: Maximum results for this source.
+            
+        Returns:
+            Tuple of (results, statistics) for the source.
+        """
+        source_start_time = time.time()
+        stats = SourceStatistics(source_name=source_name)
+        
+        if source_name not in self.sources:
+            logger.warning(f"✗ {source_name.upper()}: Unknown source, skipping")
+            stats.skipped = True
+            stats.healthy = False
+            return [], stats
+        
+        # Check source health before attempting search
+        source = self.sources[source_name]
+        
+        # Check if source supports health status
+        if hasattr(source, 'get_health_status') and hasattr(source, 'is_healthy'):
+            try:
+                health_status = source.get_health_status()
+                stats.healthy = health_status.get("healthy", True)
+                
+                if not source.is_healthy:
+                    consecutive_failures = getattr(source, '_consecutive_failures', 0)
+                    logger.warning(f"✗ {source_name.upper()}: Unhealthy ({consecutive_failures} consecutive failures), skipping")
+                    stats.skipped = True
+                    stats.healthy = False
+                    return [], stats
+            except Exception as e:
+                logger.debug(f"Error checking health for {source_name}: {e}, proceeding with search")
+                stats.healthy = True  # Default to healthy if check fails
+        else:
+            # Source doesn't support health checks, assume healthy
+            stats.healthy = True
+        
+        # Check if source has search method (some sources like Unpaywall don't)
+        if not hasattr(source, 'search'):
+            logger.debug(f"ℹ️  {source_name.upper()}: No search support (lookup only), skipping")
+            stats.skipped = True
+            return [], stats
+        
+        try:
+            logger.debug(f"Searching {source_name}...")
+            source_results = source.search(query, limit)
+            source_time = time.time() - source_start_time
+            
+            # Calculate statistics
+            stats.results_found = len(source_results)
+            stats.citations_found = sum(r.citation_count or 0 for r in source_results)
+            stats.pdfs_available = sum(1 for r in source_results if r.pdf_url)
+            stats.dois_available = sum(1 for r in source_results if r.doi)
+            stats.time_taken = source_time
+            stats.healthy = True
+            
+            # Log detailed per-source results with health status
+            health_indicator = "✓" if stats.healthy else "✗"
+            avg_citations = stats.citations_found / stats.results_found if stats.results_found > 0 else 0
+            logger.info(f"{health_indicator} {source_name.upper()}: {stats.results_found} results "
+                      f"({stats.citations_found} total citations, avg: {avg_citations:.1f}, "
+                      f"{stats.pdfs_available} PDFs, {stats.dois_available} DOIs) - {source_time:.2f}s")
+            return source_results, stats
+            
+        except APIRateLimitError as e:
+            source_time = time.time() - source_start_time
+            error_context = getattr(e, 'context', {})
+            attempt = error_context.get('attempt', '?')
+            logger.error(f"✗ {source_name.upper()}: Rate limit exceeded (attempt {attempt}) - {source_time:.2f}s")
+        except Exception as e:
+            source_time = time.time() - source_start_time
+            error_type = type(e).__name__
+            error_context = getattr(e, 'context', {}) if hasattr(e, 'context') else {}
+            attempt = error_context.get('attempt', '?')
+            logger.error(f"✗ {source_name.upper()}: Search failed ({error_type}, attempt {attempt}) - {e} - {source_time:.2f}s")
+        
+        stats.errors = 1
+        stats.time_taken = source_time
+        stats.healthy = False
+        if hasattr(source, '_consecutive_failures'):
+            source._consecutive_failures += 1
+        return [], stats
+
     def download_paper(self, result: SearchResult) -> Optional[Path]:
         """Download PDF for a search result.
         
@@ -439,7 +501,7 @@ class LiteratureSearch:
             
         return self.pdf_handler.download_pdf(result.pdf_url, result=result)
     
-    def download_paper_with_result(self, result: SearchResult) -> DownloadResult:
+    def download_paper_with_result(self, result: SearchResult, record: bool = True) -> DownloadResult:
         """Download PDF for a search result with detailed result tracking.
         
         Similar to download_paper but returns a DownloadResult with
@@ -447,6 +509,9 @@ class LiteratureSearch:
         
         Args:
             result: Search result with pdf_url.
+            record: Record the download in the library index, PDF content
+                index and download statistics. Pass False to only download
+                and call ``record_download`` with the result later.
             
         Returns:
             DownloadResult with download status and details.
@@ -463,7 +528,7 @@ class LiteratureSearch:
         # Attempt download - pass pdf_url even if None (fallbacks will handle it)
         attempted_urls = [result.pdf_url] if result.pdf_url else []
         try:
-            pdf_path = self.pdf_handler.download_pdf(result.pdf_url, result=result)
+            pdf_path = self.pdf_handler.download_pdf(result.pdf_url, result=result, record=record)
             return DownloadResult(
                 citation_key=citation_key,
                 success=True,
@@ -502,6 +567,20 @@ class LiteratureSearch:
                 result=result
             )
 
+    def record_download(self, download_result: DownloadResult) -> None:
+        """Record a download made with ``download_paper_with_result(record=False)``.
+        
+        Sets the PDF path in the library index, indexes the PDF content and
+        saves the download statistics.
+        
+        Args:
+            download_result: Outcome of the download.
+        """
+        pdf_path = None
+        if download_result.success and download_result.pdf_path:
+            pdf_path = Path(download_result.pdf_path)
+        self.pdf_handler.record_download(pdf_path, download_result.result)
+
     def add_to_library(self, result: SearchResult) -> str:
         """Add paper to local library.
         
@@ -509,12 +588,25 @@ class LiteratureSearch:
         - data/references.bib (BibTeX)
         - data/library.json (JSON index)
         
+        Papers already in the library (matched by DOI, arXiv id or
+        normalized title) return their existing key without touching
+        either file.
+
         Args:
             result: Search result to add.
-            
+
         Returns:
             Citation key for the paper.
         """
+        existing_key = self.library_index.find_existing_key(
+            doi=result.doi,
+            title=result.title,
+            url=result.url,
+            pdf_url=result.pdf_url
+        )
+        if existing_key:
+            logger.debug(f"Paper already in library: {existing_key}")
+            return existing_key
         return self.reference_manager.add_reference(result)
 
     def export_library(self, path: Optional[Path] = None, format: str = "json") -> Path:
@@ -547,6 +639,16 @@ class LiteratureSearch:
         """
         return self.library_index.get_stats()
     
+    def log_search_cache_summary(self) -> None:
+        """Log search response cache hit/miss counts for this session."""
+        if self.search_cache is None:
+            return
+        cache_stats = self.search_cache.get_stats()
+        logger.info(
+            f"Search cache: {cache_stats['hits']} hit(s), {cache_stats['misses']} miss(es) "
+            f"({cache_stats['entries']} entries, {cache_stats['size_bytes'] / 1024:.0f} KB)"
+        )
+    
     def get_source_health_status(self) -> Dict[str, Any]:
         """Get health status for all sources.
         
@@ -617,7 +719,7 @@ class LiteratureSearch:
         
         Uses multiple strategies:
         1. Exact DOI matching (highest priority)
-        2. Fuzzy title similarity matching
+        2. Fuzzy title similarity matching (blocking-indexed, see ResultDeduplicator)
         3. Relevance ranking to keep best results
         
         Args:
@@ -626,166 +728,18 @@ class LiteratureSearch:
         Returns:
             Deduplicated and ranked list of results.
         """
-        from infrastructure.literature.sources.base import normalize_title, title_similarity
-        
         if not results:
             return []
         
-        # First pass: exact DOI deduplication
-        seen_dois: Dict[str, SearchResult] = {}
-        doi_results = []
-        non_doi_results = []
-        
-        for r in results:
-            if r.doi:
-                doi_lower = r.doi.lower().strip()
-                if doi_lower not in seen_dois:
-                    seen_dois[doi_lower] = r
-                    doi_results.append(r)
-            else:
-                non_doi_results.append(r)
-        
-        # Second pass: fuzzy title matching for non-DOI results
-        unique_results = list(doi_results)  # Start with DOI-matched results
-        seen_titles: Dict[str, SearchResult] = {}
-        TITLE_SIMILARITY_THRESHOLD = 0.85  # High threshold for fuzzy matching
-        
-        for r in non_doi_results:
-            norm_title = normalize_title(r.title)
-            
-            # Check for exact match
-            if norm_title in seen_titles:
-                # Keep the one with better metadata (DOI, citation count, etc.)
-                existing = seen_titles[norm_title]
-                if self._is_better_result(r, existing):
-                    seen_titles[norm_title] = r
-                    # Replace in unique_results if it was added
-                    if existing in unique_results:
-                        idx = unique_results.index(existing)
-                        unique_results[idx] = r
-                continue
-            
-            # Check for fuzzy match
-            is_duplicate = False
-            for existing_title, existing_result in seen_titles.items():
-                similarity = title_similarity(norm_title, existing_title)
-                if similarity >= TITLE_SIMILARITY_THRESHOLD:
-                    # Similar title found - keep the better one
-                    if self._is_better_result(r, existing_result):
-                        seen_titles[existing_title] = r
-                        if existing_result in unique_results:
-                            idx = unique_results.index(existing_result)
-                            unique_results[idx] = r
-                    is_duplicate = True
-                    break
-            
-            if not is_duplicate:
-                seen_titles[norm_title] = r
-                unique_results.append(r)
-        
-        # Third pass: relevance ranking
-        ranked_results = self._rank_by_relevance(unique_results)
+        deduplicator = ResultDeduplicator()
+        deduplicator.add(results)
+        ranked_results = deduplicator.results()
         
-        logger.debug(f"Deduplicated {len(results)} results to {len(ranked_results)} unique papers")
+        logger.debug(
+            f"Deduplicated {len(results)} results to {len(ranked_results)} unique papers "
+            f"({deduplicator.comparisons} title comparisons)"
+        )
         return ranked_results
-    
-    def _is_better_result(self, r1: SearchResult, r2: SearchResult) -> bool:
-        """Compare two results to determine which is better.
-        
-        Prefers results with:
-        - DOI over no DOI
-        - Higher citation count
-        - More complete metadata
-        
-        Args:
-            r1: First result.
-            r2: Second result.
-            
-        Returns:
-            True if r1 is better than r2.
-        """
-        # DOI is preferred
-        if r1.doi and not r2.doi:
-            return True
-        if r2.doi and not r1.doi:
-            return False
-        
-        # Higher citation count is preferred
-        if r1.citation_count is not None and r2.citation_count is not None:
-            if r1.citation_count > r2.citation_count:
-                return True
-            if r2.citation_count > r1.citation_count:
-                return False
-        
-        # More complete abstract is preferred
-        if len(r1.abstract or "") > len(r2.abstract or ""):
-            return True
-        
-        # Prefer results with venue information
-        if r1.venue and not r2.venue:
-            return True
-        
-        return False
-    
-    def _rank_by_relevance(self, results: List[SearchResult]) -> List[SearchResult]:
-        """Rank results by relevance score.
-        
-        Relevance factors:
-        - Citation count (higher is better)
-        - Recency (newer is better, within reason)
-        - Source quality (prefer certain sources)
-        - Metadata completeness
-        
-        Args:
-            results: List of results to rank.
-            
-        Returns:
-            Ranked list of results (best first).
-        """
-        def relevance_score(r: SearchResult) -> float:
-            score = 0.0
-            
-            # Citation count (normalized, max 100 citations = 1.0)
-            if r.citation_count is not None:
-                score += min(1.0, r.citation_count / 100.0) * 0.4
-            
-            # Recency (prefer papers from last 10 years)
-            if r.year:
-                current_year = 2025  # Could be dynamic
-                age = current_year - r.year
-                if age <= 10:
-                    score += (1.0 - age / 10.0) * 0.3
-                elif age <= 20:
-                    score += 0.1
-            
-            # Source quality
-            source_scores = {
-                "arxiv": 0.1,
-                "semanticscholar": 0.15,
-                "pubmed": 0.1,
-                "crossref": 0.1
-            }
-            score += source_scores.get(r.source, 0.05) * 0.1
-            
-            # Metadata completeness
-            completeness = 0.0
-            if r.doi:
-                completeness += 0.2
-            if r.abstract and len(r.abstract) > 100:
-                completeness += 0.3
-            if r.venue:
-                completeness += 0.2
-            if r.pdf_url:
-                completeness += 0.3
-            score += completeness * 0.2
-            
-            return score
-        
-        # Sort by relevance score (descending)
-        scored_results = [(r, relevance_score(r)) for r in results]
-        scored_results.sort(key=lambda x: x[1], reverse=True)
-        
-        return [r for r, _ in scored_results]
 
     def remove_paper(self, citation_key: str) -> bool:
         """Remove a paper from the library.
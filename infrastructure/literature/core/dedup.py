@@ -0,0 +1,250 @@
+"""Deduplication and relevance ranking of search results.
+
+Results are deduplicated by exact DOI and by fuzzy title similarity
+(Jaccard over normalized title words). Fuzzy matching uses prefix
+filtering: every title is indexed under the first few of its
+lexicographically sorted words, and two titles can only reach the
+similarity threshold if their prefixes share a word. Only those candidates
+(further restricted by set size) are compared. The result is identical to
+comparing against every previously seen title, at near-linear cost.
+
+``ResultDeduplicator`` is incremental, so a whole multi-keyword search run
+can feed results in as each query completes.
+"""
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from typing import Dict, FrozenSet, Iterable, List, Set
+
+from infrastructure.core.logging_utils import get_logger
+from infrastructure.literature.sources.base import SearchResult, normalize_title
+
+logger = get_logger(__name__)
+
+# High threshold for fuzzy title matching
+TITLE_SIMILARITY_THRESHOLD = 0.85
+
+
+def is_better_result(r1: SearchResult, r2: SearchResult) -> bool:
+    """Compare two results to determine which is better.
+
+    Prefers results with:
+    - DOI over no DOI
+    - Higher citation count
+    - More complete metadata
+
+    Args:
+        r1: First result.
+        r2: Second result.
+
+    Returns:
+        True if r1 is better than r2.
+    """
+    # DOI is preferred
+    if r1.doi and not r2.doi:
+        return True
+    if r2.doi and not r1.doi:
+        return False
+
+    # Higher citation count is preferred
+    if r1.citation_count is not None and r2.citation_count is not None:
+        if r1.citation_count > r2.citation_count:
+            return True
+        if r2.citation_count > r1.citation_count:
+            return False
+
+    # More complete abstract is preferred
+    if len(r1.abstract or "") > len(r2.abstract or ""):
+        return True
+
+    # Prefer results with venue information
+    if r1.venue and not r2.venue:
+        return True
+
+    return False
+
+
+def rank_by_relevance(results: List[SearchResult]) -> List[SearchResult]:
+    """Rank results by relevance score.
+
+    Relevance factors:
+    - Citation count (higher is better)
+    - Recency (newer is better, within reason)
+    - Source quality (prefer certain sources)
+    - Metadata completeness
+
+    Args:
+        results: List of results to rank.
+
+    Returns:
+        Ranked list of results (best first).
+    """
+    def relevance_score(r: SearchResult) -> float:
+        score = 0.0
+
+        # Citation count (normalized, max 100 citations = 1.0)
+        if r.citation_count is not None:
+            score += min(1.0, r.citation_count / 100.0) * 0.4
+
+        # Recency (prefer papers from last 10 years)
+        if r.year:
+            current_year = 2025  # Could be dynamic
+            age = current_year - r.year
+            if age <= 10:
+                score += (1.0 - age / 10.0) * 0.3
+            elif age <= 20:
+                score += 0.1
+
+        # Source quality
+        source_scores = {
+            "arxiv": 0.1,
+            "semanticscholar": 0.15,
+            "pubmed": 0.1,
+            "crossref": 0.1
+        }
+        score += source_scores.get(r.source, 0.05) * 0.1
+
+        # Metadata completeness
+        completeness = 0.0
+        if r.doi:
+            completeness += 0.2
+        if r.abstract and len(r.abstract) > 100:
+            completeness += 0.3
+        if r.venue:
+            completeness += 0.2
+        if r.pdf_url:
+            completeness += 0.3
+        score += completeness * 0.2
+
+        return score
+
+    # Sort by relevance score (descending)
+    scored_results = [(r, relevance_score(r)) for r in results]
+    scored_results.sort(key=lambda x: x[1], reverse=True)
+
+    return [r for r, _ in scored_results]
+
+
+class ResultDeduplicator:
+    """Incremental deduplicator for search results.
+
+    Results with a DOI are deduplicated by exact (case-insensitive) DOI,
+    keeping the first occurrence. Results without a DOI are matched against
+    earlier DOI-less results by exact normalized title, then by title
+    similarity >= threshold; the better result (see ``is_better_result``)
+    takes the slot of the first one seen.
+
+    Attributes:
+        threshold: Jaccard similarity threshold for fuzzy title matches.
+        total_added: Number of results fed in so far.
+        comparisons: Number of pairwise similarity computations performed.
+    """
+
+    def __init__(self, threshold: float = TITLE_SIMILARITY_THRESHOLD):
+        """Initialize an empty deduplicator.
+
+        Args:
+            threshold: Jaccard similarity threshold for fuzzy title matches.
+        """
+        self.threshold = threshold
+        self.total_added = 0
+        self.comparisons = 0
+        self._seen_dois: Set[str] = set()
+        self._doi_results: List[SearchResult] = []
+        # DOI-less results; each slot keeps the title it was first seen with
+        self._title_results: List[SearchResult] = []
+        self._title_slots: Dict[str, int] = {}
+        self._slot_tokens: List[FrozenSet[str]] = []
+        self._token_index: Dict[str, List[int]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        """Number of unique results so far."""
+        return len(self._doi_results) + len(self._title_results)
+
+    def _prefix(self, tokens: FrozenSet[str]) -> List[str]:
+        """Words under which a title is indexed and probed.
+
+        Two sets with Jaccard similarity >= t must share a word within the
+        first ``n - ceil(t * n) + 1`` words of a fixed (sorted) order.
+        """
+        n = len(tokens)
+        min_overlap = math.ceil(self.threshold * n - 1e-9)
+        return sorted(tokens)[:n - min_overlap + 1]
+
+    def _find_similar(self, tokens: FrozenSet[str]) -> int:
+        """Find the earliest slot whose title reaches the threshold, or -1."""
+        if not tokens:
+            return -1
+        size = len(tokens)
+        candidates: Set[int] = set()
+        for token in self._prefix(tokens):
+            candidates.update(self._token_index.get(token, ()))
+        for slot in sorted(candidates):
+            other = self._slot_tokens[slot]
+            # Jaccard can only reach t if the smaller set is >= t * larger set
+            if min(size, len(other)) < self.threshold * max(size, len(other)) - 1e-9:
+                continue
+            self.comparisons += 1
+            intersection = len(tokens & other)
+            if intersection / (size + len(other) - intersection) >= self.threshold:
+                return slot
+        return -1
+
+    def add_result(self, result: SearchResult) -> bool:
+        """Add one result.
+
+        Args:
+            result: Search result to add.
+
+        Returns:
+            True if the result is a new unique paper, False if it was a
+            duplicate (it may still replace the kept result if better).
+        """
+        self.total_added += 1
+        if result.doi:
+            doi = result.doi.lower().strip()
+            if doi in self._seen_dois:
+                return False
+            self._seen_dois.add(doi)
+            self._doi_results.append(result)
+            return True
+
+        norm_title = normalize_title(result.title)
+        slot = self._title_slots.get(norm_title, -1)
+        tokens = frozenset(norm_title.split())
+        if slot < 0:
+            slot = self._find_similar(tokens)
+        if slot >= 0:
+            # Keep the one with better metadata (DOI, citation count, etc.)
+            if is_better_result(result, self._title_results[slot]):
+                self._title_results[slot] = result
+            return False
+
+        slot = len(self._title_results)
+        self._title_results.append(result)
+        self._title_slots[norm_title] = slot
+        self._slot_tokens.append(tokens)
+        for token in self._prefix(tokens):
+            self._token_index[token].append(slot)
+        return True
+
+    def add(self, results: Iterable[SearchResult]) -> int:
+        """Add a batch of results.
+
+        Args:
+            results: Search results to add.
+
+        Returns:
+            Number of results that were new unique papers.
+        """
+        return sum(1 for result in results if self.add_result(result))
+
+    def results(self) -> List[SearchResult]:
+        """Unique results ranked by relevance.
+
+        Returns:
+            DOI results followed by title-deduplicated results, ranked by
+            relevance (ties keep that order).
+        """
+        return rank_by_relevance(self._doi_results + self._title_results)
@@ -1,5 +1,10 @@
 """Library management and indexing."""
 from infrastructure.literature.library.index import LibraryIndex, LibraryEntry
+from infrastructure.literature.library.storage import (
+    LibraryStore,
+    SQLiteLibraryStore,
+    create_library_store,
+)
 from infrastructure.literature.library.stats import (
     get_library_statistics,
     format_library_stats_display,
@@ -14,6 +19,9 @@ from infrastructure.literature.library.clear import (
 __all__ = [
     "LibraryIndex",
     "LibraryEntry",
+    "LibraryStore",
+    "SQLiteLibraryStore",
+    "create_library_store",
     "get_library_statistics",
     "format_library_stats_display",
     "ReferenceManager",
@@ -9,15 +9,45 @@ import json
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Optional
 
 from infrastructure.core.logging_utils import get_logger
 from infrastructure.literature.library.index import LibraryIndex
 from infrastructure.literature.core.config import LiteratureConfig
+from infrastructure.literature.pdf.content_index import PDFContentIndex
 
 logger = get_logger(__name__)
 
 
+def forget_pdf_contents(content_index: Optional[PDFContentIndex], citation_keys: Iterable[str]) -> None:
+    """Remove deleted PDFs from the PDF content index and save it.
+    
+    Without this, duplicate detection would keep matching new downloads
+    against keys whose PDF no longer exists.
+    
+    Args:
+        content_index: PDF content index to update (None: nothing to do).
+        citation_keys: Citation keys whose PDF was deleted.
+    """
+    if content_index is None:
+        return
+    try:
+        for citation_key in citation_keys:
+            content_index.forget(citation_key)
+        content_index.flush()
+    except Exception as e:
+        logger.warning(f"Failed to update PDF content index: {e}")
+
+
+def _content_index(config: LiteratureConfig) -> Optional[PDFContentIndex]:
+    """Shared PDF content index of a configuration, or None if unavailable."""
+    try:
+        return PDFContentIndex.for_config(config)
+    except Exception as e:
+        logger.warning(f"Failed to open PDF content index: {e}")
+        return None
+
+
 def clear_pdfs(confirm: bool = True, interactive: bool = False) -> Dict[str, Any]:
     """Clear all PDFs from the data/pdfs directory.
     
@@ -43,7 +73,12 @@ def clear_pdfs(confirm: bool = True, interactive: bool = False) -> Dict[str, Any
         }
     
     # Count files and size
-    pdf_files = list(pdf_dir.glob("*.pdf"))
+    # Include partial downloads left by interrupted transfers
+    pdf_files = (
+        list(pdf_dir.glob("*.pdf"))
+        + list(pdf_dir.glob("*.pdf.part"))
+        + list(pdf_dir.glob("*.pdf.part.json"))
+    )
     total_size = sum(f.stat().st_size for f in pdf_files if f.is_file())
     file_count = len(pdf_files)
     
@@ -72,16 +107,20 @@ def clear_pdfs(confirm: bool = True, interactive: bool = False) -> Dict[str, Any
     
     # Remove files
     removed = 0
+    removed_keys = []
     for pdf_file in pdf_files:
         try:
             pdf_file.unlink()
             removed += 1
+            if pdf_file.suffix == ".pdf":
+                removed_keys.append(pdf_file.stem)
         except Exception as e:
             logger.warning(f"Failed to remove {pdf_file}: {e}")
     
     # Update library index to remove PDF paths
     try:
         config = LiteratureConfig.from_env()
+        forget_pdf_contents(_content_index(config), removed_keys)
         library_index = LibraryIndex(config)
         entries = library_index.list_entries()
         updated = 0
@@ -292,12 +331,15 @@ def clear_library(confirm: bool = True, interactive: bool = False) -> Dict[str,
         
         # 1. Delete PDFs
         pdfs_removed = 0
+        removed_keys = []
         for pdf_file in pdf_files:
             try:
                 pdf_file.unlink()
                 pdfs_removed += 1
+                removed_keys.append(pdf_file.stem)
             except Exception as e:
                 logger.warning(f"Failed to remove PDF {pdf_file}: {e}")
+        forget_pdf_contents(_content_index(config), removed_keys)
         
         # 2. Delete summaries
         summaries_removed = 0
@@ -340,6 +382,22 @@ def clear_library(confirm: bool = True, interactive: bool = False) -> Dict[str,
             except Exception as e:
                 logger.warning(f"Failed to delete library index file: {e}")
         
+        # Empty the SQLite library database when that backend is active
+        if library_index.store is not None:
+            try:
+                library_index.store.clear()
+                logger.debug("Cleared library database")
+            except Exception as e:
+                logger.warning(f"Failed to clear library database: {e}")
+        
+        # Delete the mutation journal so it is not replayed onto the empty index
+        if library_index.journal_path.exists():
+            try:
+                library_index.journal_path.unlink()
+                logger.debug(f"Deleted library journal: {library_index.journal_path}")
+            except Exception as e:
+                logger.warning(f"Failed to delete library journal: {e}")
+        
         # Create a new empty index file with proper structure
         try:
             index_path.parent.mkdir(parents=True, exist_ok=True)
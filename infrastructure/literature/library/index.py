@@ -1,22 +1,83 @@
 """Library index management for tracking papers and metadata.
 
 Provides a JSON-based index for comprehensive tracking of all papers
-in the library, including download status and metadata.
+in the library, including download status and metadata. Secondary hash
+indexes on normalized DOI, normalized title and arXiv id make duplicate
+checks O(1) regardless of library size.
+
+Mutations can be coalesced with ``LibraryIndex.batch()`` and, when
+``library_journal`` is enabled, are appended to a JSONL journal that is
+periodically compacted into the JSON file. All writes of the JSON file
+are atomic (temp file + rename).
 """
 from __future__ import annotations
 
 import json
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from infrastructure.core.exceptions import FileOperationError
+from infrastructure.core.json_store import JsonJournal, write_json_atomic
 from infrastructure.core.logging_utils import get_logger
 from infrastructure.literature.core.config import LiteratureConfig
+from infrastructure.literature.library.storage import create_library_store
+from infrastructure.literature.sources.base import normalize_title
 
 logger = get_logger(__name__)
 
+# Matches new-style (2301.00001) and old-style (hep-th/9901001) arXiv ids in
+# abs/pdf URLs and in arXiv DOIs (10.48550/arXiv.2301.00001)
+_ARXIV_ID_PATTERN = re.compile(
+    r'(?:arxiv\.org/(?:abs|pdf)/|10\.48550/arxiv\.)((?:\d{4}\.\d{4,5})|(?:[a-z\-]+(?:\.[a-z]{2})?/\d{7}))',
+    re.IGNORECASE
+)
+
+# Store lookup column of each ``_lookup_keys`` value
+_LOOKUP_NAMES = {"doi_norm": "doi", "title_norm": "title", "arxiv_id": "arxiv"}
+
+
+def normalize_doi(doi: Optional[str]) -> Optional[str]:
+    """Normalize a DOI for comparison.
+    
+    Lowercases and strips resolver prefixes such as ``https://doi.org/``
+    and ``doi:``.
+    
+    Args:
+        doi: DOI string, possibly None or a resolver URL.
+        
+    Returns:
+        Normalized DOI, or None if empty.
+    """
+    if not doi:
+        return None
+    normalized = doi.strip().lower()
+    normalized = re.sub(r'^(?:https?://(?:dx\.)?doi\.org/|doi:\s*)', '', normalized)
+    return normalized or None
+
+
+def extract_arxiv_id(*values: Optional[str]) -> Optional[str]:
+    """Extract a version-less arXiv id from URLs or DOIs.
+    
+    Args:
+        *values: Candidate strings (URL, PDF URL, DOI); None values are skipped.
+        
+    Returns:
+        Lowercase arXiv id (e.g., "2301.00001"), or None if not found.
+    """
+    for value in values:
+        if not value:
+            continue
+        match = _ARXIV_ID_PATTERN.search(value)
+        if match:
+            return match.group(1).lower()
+    return None
+
 
 @dataclass
 class LibraryEntry:
@@ -112,6 +173,21 @@ class LibraryIndex:
     
     The index is stored as a JSON file containing all papers added to the
     library, with metadata for each entry including download status.
+    
+    Lookups by DOI, title and arXiv id go through secondary hash indexes
+    that are kept in sync with the entries on add, remove and reload.
+    
+    Persistence is write-behind inside ``batch()``: mutations are applied in
+    memory and flushed once when the outermost batch exits. With
+    ``config.library_journal`` enabled, flushes append to
+    ``<index>.journal.jsonl`` and the JSON file is only rewritten on
+    compaction.
+    
+    With ``config.library_backend = "sqlite"`` entries live in a
+    SQLiteLibraryStore instead. Entries are then loaded lazily on first
+    full access, while lookups, ``get_stats``, ``get_entries_without_pdf``
+    and ``query_entries`` run as SQL queries. An existing library.json is
+    migrated into the database once.
     """
 
     def __init__(self, config: LiteratureConfig):
@@ -122,50 +198,347 @@ class LibraryIndex:
         """
         self.config = config
         self.index_path = Path(config.library_index_file)
-        self._entries: Dict[str, LibraryEntry] = {}
-        self._load_index()
+        self._entry_cache: Optional[Dict[str, LibraryEntry]] = None
+        self._doi_index: Dict[str, str] = {}
+        self._title_index: Dict[str, str] = {}
+        self._arxiv_index: Dict[str, str] = {}
+        self.journal = JsonJournal(
+            self.index_path.with_suffix(".journal.jsonl"),
+            "library",
+            config.library_journal_compact_every,
+        )
+        self.journal_path = self.journal.path
+        self.store = create_library_store(config)
+        self.use_journal = config.library_journal and self.store is None
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._dirty = False
+        self._pending: List[Dict[str, Any]] = []
+        # Unflushed store records by citation key (None for a delete), so
+        # key and lookup queries see them without loading every entry
+        self._pending_entries: Dict[str, Optional[Dict[str, Any]]] = {}
+        if self.store is None:
+            self._load_index()
+        elif self.store.needs_migration() and (self.index_path.exists() or self.journal_path.exists()):
+            self._migrate_json_to_store()
+
+    @property
+    def _entries(self) -> Dict[str, LibraryEntry]:
+        """All entries keyed by citation key (loaded from the store on first use)."""
+        if self._entry_cache is None:
+            self._load_index()
+        return self._entry_cache
+
+    @_entries.setter
+    def _entries(self, entries: Dict[str, LibraryEntry]) -> None:
+        self._entry_cache = entries
+
+    def _use_store_queries(self) -> bool:
+        """Whether queries can be answered by the store without loading entries."""
+        return self.store is not None and not self._dirty
 
     def _load_index(self) -> None:
-        """Load index from disk if it exists."""
+        """Load all entries from the store or from the JSON file and journal."""
+        if self.store is not None:
+            entries = {
+                key: LibraryEntry.from_dict(data)
+                for key, data in self.store.load_all().items()
+            }
+            logger.info(f"Loaded {len(entries)} entries from library database")
+            for key, record in self._pending_entries.items():
+                if record is None:
+                    entries.pop(key, None)
+                else:
+                    entries[key] = LibraryEntry.from_dict(record["entry"])
+        else:
+            entries = self._read_json_entries()
+        self._entry_cache = entries
+        self._rebuild_lookup_indexes()
+
+    def _read_json_entries(self) -> Dict[str, LibraryEntry]:
+        """Read library.json and replay the journal on top of it."""
+        entries: Dict[str, LibraryEntry] = {}
         if self.index_path.exists():
             try:
                 with open(self.index_path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     for key, entry_data in data.get("entries", {}).items():
-                        self._entries[key] = LibraryEntry.from_dict(entry_data)
-                logger.info(f"Loaded {len(self._entries)} entries from library index")
+                        entries[key] = LibraryEntry.from_dict(entry_data)
+                logger.info(f"Loaded {len(entries)} entries from library index")
             except (json.JSONDecodeError, OSError) as e:
                 logger.warning(f"Failed to load library index: {e}")
-                self._entries = {}
+                entries = {}
+        self._replay_journal(entries)
+        return entries
+
+    def _replay_journal(self, entries: Dict[str, LibraryEntry]) -> int:
+        """Apply journal records on top of loaded entries.
+        
+        Args:
+            entries: Entries loaded from library.json, updated in place.
+        
+        Returns:
+            Number of journal records applied.
+        """
+        def apply(record: Dict[str, Any]) -> None:
+            if record.get("op") == "put":
+                entries[record["key"]] = LibraryEntry.from_dict(record["entry"])
+            elif record.get("op") == "delete":
+                entries.pop(record["key"], None)
+
+        return self.journal.replay(apply)
+
+    def _migrate_json_to_store(self) -> None:
+        """Import library.json (and its journal) into an empty store once."""
+        entries = self._read_json_entries()
+        imported = self.store.import_entries(
+            ((entry.to_dict(), self._lookup_keys(entry)) for entry in entries.values()),
+            origin=str(self.index_path),
+        )
+        logger.info(f"Migrated {imported} library entries from {self.index_path} to SQLite")
     
     def reload(self) -> None:
         """Reload the library index from disk.
         
         Clears the in-memory entries and reloads from the index file.
         Useful after external operations that modify the index file (e.g., clear operations).
+        Unflushed mutations are discarded.
+        """
+        with self._lock:
+            self._entry_cache = None
+            self._pending = []
+            self._pending_entries = {}
+            self._dirty = False
+            if self.store is None:
+                self._load_index()
+        logger.debug("Reloaded library index from disk")
+
+    @staticmethod
+    def _lookup_keys(entry: LibraryEntry) -> Dict[str, Optional[str]]:
+        """Compute the secondary index keys for an entry."""
+        return {
+            "doi": normalize_doi(entry.doi),
+            "title": normalize_title(entry.title) or None,
+            "arxiv": extract_arxiv_id(entry.url, entry.metadata.get("pdf_url"), entry.doi),
+        }
+
+    def _index_entry(self, entry: LibraryEntry) -> None:
+        """Add an entry to the secondary indexes (first entry wins)."""
+        keys = self._lookup_keys(entry)
+        for index, value in (
+            (self._doi_index, keys["doi"]),
+            (self._title_index, keys["title"]),
+            (self._arxiv_index, keys["arxiv"]),
+        ):
+            if value:
+                index.setdefault(value, entry.citation_key)
+
+    def _unindex_entry(self, entry: LibraryEntry) -> None:
+        """Remove an entry from the secondary indexes."""
+        keys = self._lookup_keys(entry)
+        for index, value in (
+            (self._doi_index, keys["doi"]),
+            (self._title_index, keys["title"]),
+            (self._arxiv_index, keys["arxiv"]),
+        ):
+            if value and index.get(value) == entry.citation_key:
+                del index[value]
+
+    def _rebuild_lookup_indexes(self) -> None:
+        """Rebuild all secondary indexes from the entries."""
+        self._doi_index = {}
+        self._title_index = {}
+        self._arxiv_index = {}
+        for entry in self._entries.values():
+            self._index_entry(entry)
+
+    def _find_key(self, column: str, index: Dict[str, str], value: str) -> Optional[str]:
+        """Look up a normalized value in memory, or in the store if not loaded."""
+        if self._entry_cache is None and self.store is not None:
+            lookup_name = _LOOKUP_NAMES[column]
+            for key, record in self._pending_entries.items():
+                if record is not None and record["lookup"][lookup_name] == value:
+                    return key
+            key = self.store.find_key(column, value)
+            if key is not None and key in self._pending_entries and self._pending_entries[key] is None:
+                return None
+            return key
+        return index.get(value)
+
+    def _lookup_entry(self, citation_key: str) -> Optional[LibraryEntry]:
+        """Get an entry, reading only its row if the store-backed entries are not loaded."""
+        if self._entry_cache is None and self.store is not None:
+            if citation_key in self._pending_entries:
+                record = self._pending_entries[citation_key]
+                return LibraryEntry.from_dict(record["entry"]) if record is not None else None
+            data = self.store.get(citation_key)
+            return LibraryEntry.from_dict(data) if data else None
+        return self._entries.get(citation_key)
+
+    def find_by_doi(self, doi: Optional[str]) -> Optional[str]:
+        """Find the citation key of an entry by DOI (case-insensitive).
+        
+        Args:
+            doi: DOI or DOI resolver URL.
+            
+        Returns:
+            Citation key if found, None otherwise.
         """
-        self._entries = {}
-        self._load_index()
-        logger.debug(f"Reloaded library index from disk: {len(self._entries)} entries")
+        normalized = normalize_doi(doi)
+        return self._find_key("doi_norm", self._doi_index, normalized) if normalized else None
+
+    def find_by_title(self, title: Optional[str]) -> Optional[str]:
+        """Find the citation key of an entry by normalized title.
+        
+        Titles are compared after lowercasing and removing punctuation.
+        
+        Args:
+            title: Paper title.
+            
+        Returns:
+            Citation key if found, None otherwise.
+        """
+        normalized = normalize_title(title) if title else ""
+        return self._find_key("title_norm", self._title_index, normalized) if normalized else None
+
+    def find_by_arxiv_id(self, arxiv_id: Optional[str]) -> Optional[str]:
+        """Find the citation key of an entry by arXiv id.
+        
+        Args:
+            arxiv_id: arXiv id (e.g., "2301.00001"), version suffix ignored.
+            
+        Returns:
+            Citation key if found, None otherwise.
+        """
+        if not arxiv_id:
+            return None
+        normalized = re.sub(r'v\d+$', '', arxiv_id.strip().lower())
+        return self._find_key("arxiv_id", self._arxiv_index, normalized)
+
+    def find_existing_key(
+        self,
+        doi: Optional[str] = None,
+        title: Optional[str] = None,
+        url: Optional[str] = None,
+        pdf_url: Optional[str] = None
+    ) -> Optional[str]:
+        """Find an existing entry matching any of the paper identifiers.
+        
+        Checks DOI first, then arXiv id (from DOI or URLs), then title.
+        
+        Args:
+            doi: DOI of the paper.
+            title: Title of the paper.
+            url: Landing page URL.
+            pdf_url: PDF URL.
+            
+        Returns:
+            Citation key of the matching entry, or None.
+        """
+        return (
+            self.find_by_doi(doi)
+            or self.find_by_arxiv_id(extract_arxiv_id(url, pdf_url, doi))
+            or self.find_by_title(title)
+        )
 
     def _save_index(self) -> None:
-        """Save index to disk."""
+        """Save index to disk atomically (temp file + rename)."""
+        data = {
+            "version": "1.0",
+            "updated": datetime.now().isoformat(),
+            "count": len(self._entries),
+            "entries": {key: entry.to_dict() for key, entry in self._entries.items()}
+        }
+        write_json_atomic(self.index_path, data, "library index", fsync=True, indent=2, ensure_ascii=False)
+        logger.debug(f"Saved library index with {len(self._entries)} entries")
+
+    def _record(self, op: str, citation_key: str, entry: Optional[LibraryEntry] = None) -> None:
+        """Record a mutation and flush unless inside a batch.
+        
+        Args:
+            op: "put" (entry added or changed) or "delete".
+            citation_key: Citation key of the mutated entry.
+            entry: The entry written by a "put".
+        """
+        if self.use_journal or self.store is not None:
+            record: Dict[str, Any] = {"op": op, "key": citation_key}
+            if op == "put":
+                record["entry"] = entry.to_dict()
+                if self.store is not None:
+                    record["lookup"] = self._lookup_keys(entry)
+            self._pending.append(record)
+            if self.store is not None:
+                self._pending_entries[citation_key] = record if op == "put" else None
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        """Persist pending mutations.
+        
+        Without a journal the JSON file is rewritten atomically and any
+        journal left from journal mode is removed. With a journal, pending
+        records are appended and the journal is compacted once it holds
+        ``library_journal_compact_every`` records. With a store, pending
+        records are applied in one transaction.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            if self.store is not None:
+                try:
+                    self.store.apply(self._pending)
+                except sqlite3.Error as e:
+                    raise FileOperationError(
+                        f"Failed to save library database: {e}",
+                        context={"path": str(getattr(self.store, "path", ""))}
+                    )
+                self._pending = []
+                self._pending_entries = {}
+            elif self.use_journal:
+                self.journal.append(self._pending)
+                self._pending = []
+                if self.journal.needs_compaction:
+                    self.compact()
+            else:
+                # A journal left from journal mode was replayed on load and
+                # is now folded into library.json
+                self._save_index()
+                self.journal.remove()
+            self._dirty = False
+
+    def compact(self) -> None:
+        """Fold the journal into library.json and remove the journal.
+        
+        The JSON file is written atomically before the journal is deleted,
+        and journal records are idempotent, so a crash in between is safe.
+        """
+        with self._lock:
+            self._pending = []
+            self._save_index()
+            self.journal.remove()
+            self._dirty = False
+
+    @contextmanager
+    def batch(self) -> Iterator[LibraryIndex]:
+        """Coalesce mutations and flush once when the outermost batch exits.
+        
+        Batches nest; mutations made before an exception are still flushed.
+        
+        Example:
+            >>> with index.batch():
+            ...     for result in results:
+            ...         index.add_entry(title=result.title, authors=result.authors)
+        """
+        with self._lock:
+            self._batch_depth += 1
         try:
-            self.index_path.parent.mkdir(parents=True, exist_ok=True)
-            data = {
-                "version": "1.0",
-                "updated": datetime.now().isoformat(),
-                "count": len(self._entries),
-                "entries": {key: entry.to_dict() for key, entry in self._entries.items()}
-            }
-            with open(self.index_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            logger.debug(f"Saved library index with {len(self._entries)} entries")
-        except OSError as e:
-            raise FileOperationError(
-                f"Failed to save library index: {e}",
-                context={"path": str(self.index_path)}
-            )
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.flush()
 
     def generate_citation_key(self, title: str, authors: List[str], year: Optional[int]) -> str:
         """Generate a consistent citation key.
@@ -208,14 +581,15 @@ class LibraryIndex:
         
         base_key = f"{author_part}{year_part}{title_word}"
         
+        # Same paper already stored under this base key (or a suffixed variant)
+        existing_key = self.find_by_title(title)
+        if existing_key and re.fullmatch(re.escape(base_key) + r'\d*', existing_key):
+            return existing_key
+        
         # Handle duplicates by adding suffix
         key = base_key
         suffix = 1
-        while key in self._entries:
-            existing = self._entries[key]
-            # Check if it's the same paper (same DOI or exact title match)
-            if existing.title.lower().strip() == title.lower().strip():
-                return key  # Same paper, return existing key
+        while self._lookup_entry(key) is not None:
             suffix += 1
             key = f"{base_key}{suffix}"
         
@@ -253,51 +627,46 @@ class LibraryIndex:
         Returns:
             Citation key for the entry.
         """
-        # Check for existing entry by DOI
-        if doi:
-            for key, entry in self._entries.items():
-                if entry.doi == doi:
-                    logger.debug(f"Entry already exists (DOI match): {key}")
-                    return key
-        
-        # Check for existing entry by exact title
-        norm_title = title.lower().strip()
-        for key, entry in self._entries.items():
-            if entry.title.lower().strip() == norm_title:
-                logger.debug(f"Entry already exists (title match): {key}")
-                return key
-        
-        # Generate citation key
-        citation_key = self.generate_citation_key(title, authors, year)
-        
-        # Check if already exists (same key means same paper)
-        if citation_key in self._entries:
-            logger.debug(f"Entry already exists: {citation_key} (skipping)")
-            return citation_key
-        
-        # Store pdf_url in metadata
-        if pdf_url:
-            metadata["pdf_url"] = pdf_url
-        
-        # Create entry
-        entry = LibraryEntry(
-            citation_key=citation_key,
-            title=title,
-            authors=authors,
-            year=year,
-            doi=doi,
-            source=source,
-            url=url,
-            pdf_path=None,
-            added_date=datetime.now().isoformat(),
-            abstract=abstract,
-            venue=venue,
-            citation_count=citation_count,
-            metadata=metadata
-        )
+        with self._lock:
+            # Check for existing entry by DOI, arXiv id or normalized title
+            existing_key = self.find_existing_key(doi=doi, title=title, url=url, pdf_url=pdf_url)
+            if existing_key:
+                logger.debug(f"Entry already exists: {existing_key}")
+                return existing_key
+        
+            # Generate citation key
+            citation_key = self.generate_citation_key(title, authors, year)
+        
+            # Check if already exists (same key means same paper)
+            if self._lookup_entry(citation_key) is not None:
+                logger.debug(f"Entry already exists: {citation_key} (skipping)")
+                return citation_key
+        
+            # Store pdf_url in metadata
+            if pdf_url:
+                metadata["pdf_url"] = pdf_url
+        
+            # Create entry
+            entry = LibraryEntry(
+                citation_key=citation_key,
+                title=title,
+                authors=authors,
+                year=year,
+                doi=doi,
+                source=source,
+                url=url,
+                pdf_path=None,
+                added_date=datetime.now().isoformat(),
+                abstract=abstract,
+                venue=venue,
+                citation_count=citation_count,
+                metadata=metadata
+            )
         
-        self._entries[citation_key] = entry
-        self._save_index()
+            if self._entry_cache is not None:
+                self._entry_cache[citation_key] = entry
+                self._index_entry(entry)
+            self._record("put", citation_key, entry)
         logger.info(f"Added entry to library: {citation_key}")
         
         return citation_key
@@ -309,12 +678,13 @@ class LibraryIndex:
             citation_key: Citation key of the entry.
             pdf_path: Relative path to the downloaded PDF.
         """
-        if citation_key not in self._entries:
-            logger.warning(f"Entry not found: {citation_key}")
-            return
-        
-        self._entries[citation_key].pdf_path = pdf_path
-        self._save_index()
+        with self._lock:
+            entry = self._lookup_entry(citation_key)
+            if entry is None:
+                logger.warning(f"Entry not found: {citation_key}")
+                return
+            entry.pdf_path = pdf_path
+            self._record("put", citation_key, entry)
         logger.debug(f"Updated PDF path for {citation_key}: {pdf_path}")
 
     def get_entry(self, citation_key: str) -> Optional[LibraryEntry]:
@@ -326,7 +696,7 @@ class LibraryIndex:
         Returns:
             LibraryEntry if found, None otherwise.
         """
-        return self._entries.get(citation_key)
+        return self._lookup_entry(citation_key)
 
     def list_entries(self) -> List[LibraryEntry]:
         """Get all entries in the library.
@@ -336,28 +706,106 @@ class LibraryIndex:
         """
         return list(self._entries.values())
 
-    def has_paper(self, doi: Optional[str] = None, title: Optional[str] = None) -> bool:
+    def count(self) -> int:
+        """Get the number of entries in the library.
+        
+        Returns:
+            Number of library entries.
+        """
+        if self._entry_cache is None and self._use_store_queries():
+            return self.store.count()
+        return len(self._entries)
+
+    def query_entries(
+        self,
+        citation_keys: Optional[List[str]] = None,
+        year_range: Optional[Tuple[Optional[int], Optional[int]]] = None,
+        sources: Optional[List[str]] = None,
+        has_pdf_path: Optional[bool] = None,
+        text_terms: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> List[LibraryEntry]:
+        """Select entries by structured filters, in library order.
+        
+        With the SQLite backend the filters run as a single SQL query;
+        otherwise the in-memory entries are filtered. ``text_terms`` is a
+        candidate pre-filter (case-insensitive substring match, or FTS5 word
+        prefix match with SQLite) that callers refine with exact matching.
+        
+        Args:
+            citation_keys: Restrict to these citation keys.
+            year_range: ``(min, max)`` bounds, either may be None; entries
+                without a year are excluded.
+            sources: Restrict to these sources.
+            has_pdf_path: Require (True) or exclude (False) a stored PDF path.
+            text_terms: Terms that must all occur in title or abstract.
+            limit: Maximum number of entries to return.
+            
+        Returns:
+            Matching library entries.
+        """
+        if self._use_store_queries():
+            rows = self.store.query(
+                citation_keys=citation_keys,
+                year_range=year_range,
+                sources=sources,
+                has_pdf_path=has_pdf_path,
+                text_terms=text_terms,
+                limit=limit,
+            )
+            return [LibraryEntry.from_dict(row) for row in rows]
+
+        key_set = set(citation_keys) if citation_keys else None
+        source_set = set(sources) if sources else None
+        terms = [term.lower() for term in (text_terms or [])]
+        selected: List[LibraryEntry] = []
+        if limit is not None and limit <= 0:
+            return selected
+        for entry in self._entries.values():
+            if key_set is not None and entry.citation_key not in key_set:
+                continue
+            if year_range is not None:
+                year_min, year_max = year_range
+                if entry.year is None:
+                    continue
+                if year_min is not None and entry.year < year_min:
+                    continue
+                if year_max is not None and entry.year > year_max:
+                    continue
+            if source_set is not None and entry.source not in source_set:
+                continue
+            if has_pdf_path is not None and bool(entry.pdf_path) != has_pdf_path:
+                continue
+            if terms:
+                text = f"{entry.title or ''} {entry.abstract or ''}".lower()
+                if not all(term in text for term in terms):
+                    continue
+            selected.append(entry)
+            if limit is not None and len(selected) >= limit:
+                break
+        return selected
+
+    def has_paper(
+        self,
+        doi: Optional[str] = None,
+        title: Optional[str] = None,
+        arxiv_id: Optional[str] = None
+    ) -> bool:
         """Check if a paper exists in the library.
         
         Args:
-            doi: DOI to check.
-            title: Title to check (case-insensitive).
+            doi: DOI to check (case-insensitive).
+            title: Title to check (normalized, case-insensitive).
+            arxiv_id: arXiv id to check.
             
         Returns:
             True if paper exists in library.
         """
-        if doi:
-            for entry in self._entries.values():
-                if entry.doi == doi:
-                    return True
-        
-        if title:
-            norm_title = title.lower().strip()
-            for entry in self._entries.values():
-                if entry.title.lower().strip() == norm_title:
-                    return True
-        
-        return False
+        return bool(
+            self.find_by_doi(doi)
+            or self.find_by_arxiv_id(arxiv_id)
+            or self.find_by_title(title)
+        )
 
     def export_json(self, path: Optional[Path] = None) -> Path:
         """Export the library to a JSON file.
@@ -399,8 +847,6 @@ class LibraryIndex:
             - Completion percentages
             - Disk usage estimates
         """
-        entries = list(self._entries.values())
-        
         sources = {}
         years = {}
         downloaded = 0
@@ -423,27 +869,42 @@ class LibraryIndex:
                     pdf_size += pdf_file.stat().st_size
                     pdf_count_filesystem += 1
         
-        for entry in entries:
-            # Count by source
-            sources[entry.source] = sources.get(entry.source, 0) + 1
-            
-            # Count by year
-            if entry.year:
-                years[entry.year] = years.get(entry.year, 0) + 1
-            
-            # Count downloads
-            if entry.pdf_path:
-                pdf_path = Path(entry.pdf_path)
-                if not pdf_path.is_absolute():
-                    pdf_path = Path("literature") / pdf_path
-                if pdf_path.exists():
-                    downloaded += 1
-            
-            # Count summaries
-            if entry.citation_key in summary_files:
-                with_summaries += 1
+        if self._use_store_queries():
+            # Group counts run in SQL; only PDF paths and keys come back
+            aggregates = self.store.aggregate()
+            total = aggregates["total"]
+            sources = aggregates["sources"]
+            years = aggregates["years"]
+            pdf_paths = aggregates["pdf_paths"]
+            citation_keys = aggregates["citation_keys"]
+        else:
+            entries = list(self._entries.values())
+            total = len(entries)
+            pdf_paths = []
+            citation_keys = []
+            for entry in entries:
+                # Count by source
+                sources[entry.source] = sources.get(entry.source, 0) + 1
+                
+                # Count by year
+                if entry.year:
+                    years[entry.year] = years.get(entry.year, 0) + 1
+                
+                if entry.pdf_path:
+                    pdf_paths.append(entry.pdf_path)
+                citation_keys.append(entry.citation_key)
+        
+        # Count downloads
+        for stored_path in pdf_paths:
+            pdf_path = Path(stored_path)
+            if not pdf_path.is_absolute():
+                pdf_path = Path("literature") / pdf_path
+            if pdf_path.exists():
+                downloaded += 1
+        
+        # Count summaries
+        with_summaries = sum(1 for key in citation_keys if key in summary_files)
         
-        total = len(entries)
         pdf_percentage = (downloaded / total * 100) if total > 0 else 0.0
         summary_percentage = (with_summaries / total * 100) if total > 0 else 0.0
         
@@ -472,8 +933,11 @@ class LibraryIndex:
         Returns:
             List of recent entry dictionaries with citation_key, title, and added_date.
         """
-        entries = list(self._entries.values())
-        sorted_entries = sorted(entries, key=lambda e: e.added_date, reverse=True)
+        if self._use_store_queries():
+            sorted_entries = [LibraryEntry.from_dict(data) for data in self.store.recent(limit)]
+        else:
+            entries = list(self._entries.values())
+            sorted_entries = sorted(entries, key=lambda e: e.added_date, reverse=True)
         
         return [
             {
@@ -494,14 +958,15 @@ class LibraryIndex:
         Returns:
             True if entry was removed, False if not found.
         """
-        if citation_key in self._entries:
-            del self._entries[citation_key]
-            self._save_index()
-            logger.info(f"Removed entry from library: {citation_key}")
-            return True
-        else:
-            logger.warning(f"Entry not found for removal: {citation_key}")
-            return False
+        with self._lock:
+            if self._lookup_entry(citation_key) is None:
+                logger.warning(f"Entry not found for removal: {citation_key}")
+                return False
+            if self._entry_cache is not None:
+                self._unindex_entry(self._entry_cache.pop(citation_key))
+            self._record("delete", citation_key)
+        logger.info(f"Removed entry from library: {citation_key}")
+        return True
 
     def get_entries_without_pdf(self) -> List[LibraryEntry]:
         """Get all entries that do not have a PDF file.
@@ -509,6 +974,11 @@ class LibraryIndex:
         Returns:
             List of LibraryEntry objects that are missing PDF files.
         """
+        if self._use_store_queries():
+            # Only rows with a stored path need a filesystem check
+            rows = self.store.entries_without_pdf(lambda pdf_path: Path(pdf_path).exists())
+            return [LibraryEntry.from_dict(row) for row in rows]
+
         entries_without_pdf = []
         for entry in self._entries.values():
             if not entry.pdf_path:
@@ -531,9 +1001,10 @@ class LibraryIndex:
         entries_to_remove = self.get_entries_without_pdf()
         removed_count = 0
 
-        for entry in entries_to_remove:
-            if self.remove_entry(entry.citation_key):
-                removed_count += 1
+        with self.batch():
+            for entry in entries_to_remove:
+                if self.remove_entry(entry.citation_key):
+                    removed_count += 1
 
         logger.info(f"Removed {removed_count} entries without PDFs from library")
         return removed_count
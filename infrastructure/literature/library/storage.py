@@ -0,0 +1,512 @@
+"""Storage backends for the library index.
+
+``LibraryIndex`` keeps the JSON file (``library.json``) as its default
+storage. This module provides the pluggable alternative: a store interface
+and a SQLite implementation with indexed columns (citation key, DOI, year,
+source, PDF presence) and an FTS5 table over title and abstract, so that
+statistics and filtered selections run as SQL queries instead of loading
+every entry into memory.
+
+Stores exchange entries as plain dictionaries (``LibraryEntry.to_dict()``
+output) so they do not depend on the index module.
+"""
+from __future__ import annotations
+
+import abc
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from infrastructure.core.logging_utils import get_logger
+from infrastructure.literature.core.config import LiteratureConfig
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    citation_key TEXT PRIMARY KEY,
+    doi TEXT,
+    doi_norm TEXT,
+    title_norm TEXT,
+    arxiv_id TEXT,
+    year INTEGER,
+    source TEXT,
+    pdf_path TEXT,
+    has_pdf_path INTEGER NOT NULL DEFAULT 0,
+    added_date TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_doi_norm ON entries(doi_norm);
+CREATE INDEX IF NOT EXISTS idx_entries_title_norm ON entries(title_norm);
+CREATE INDEX IF NOT EXISTS idx_entries_arxiv_id ON entries(arxiv_id);
+CREATE INDEX IF NOT EXISTS idx_entries_year ON entries(year);
+CREATE INDEX IF NOT EXISTS idx_entries_source ON entries(source);
+CREATE INDEX IF NOT EXISTS idx_entries_has_pdf_path ON entries(has_pdf_path);
+CREATE INDEX IF NOT EXISTS idx_entries_added_date ON entries(added_date);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+    citation_key UNINDEXED,
+    title,
+    abstract
+);
+"""
+
+# Lookup columns that find_key() may query
+_LOOKUP_COLUMNS = ("doi_norm", "title_norm", "arxiv_id")
+
+
+class LibraryStore(abc.ABC):
+    """Interface for library index storage backends.
+
+    Records passed to ``apply`` use the journal format of LibraryIndex:
+    ``{"op": "put", "key": ..., "entry": {...}, "lookup": {...}}`` or
+    ``{"op": "delete", "key": ...}``, where ``lookup`` holds the normalized
+    ``doi``, ``title`` and ``arxiv`` values of the entry. Backends must
+    implement every abstract method; ``close`` is optional.
+    """
+
+    @abc.abstractmethod
+    def needs_migration(self) -> bool:
+        """Return True if the store is empty and has never been migrated."""
+        pass
+
+    @abc.abstractmethod
+    def import_entries(self, rows: Iterable[Tuple[Dict[str, Any], Dict[str, Optional[str]]]], origin: str) -> int:
+        """Bulk-insert ``(entry, lookup)`` rows and mark the store as migrated."""
+        pass
+
+    @abc.abstractmethod
+    def apply(self, records: List[Dict[str, Any]]) -> None:
+        """Apply put/delete records in a single transaction."""
+        pass
+
+    @abc.abstractmethod
+    def load_all(self) -> Dict[str, Dict[str, Any]]:
+        """Load all entries in insertion order."""
+        pass
+
+    @abc.abstractmethod
+    def get(self, citation_key: str) -> Optional[Dict[str, Any]]:
+        """Get a single entry by citation key."""
+        pass
+
+    @abc.abstractmethod
+    def count(self) -> int:
+        """Count stored entries."""
+        pass
+
+    @abc.abstractmethod
+    def find_key(self, column: str, value: str) -> Optional[str]:
+        """Find the first citation key whose lookup column equals value."""
+        pass
+
+    @abc.abstractmethod
+    def aggregate(self) -> Dict[str, Any]:
+        """Compute the aggregates used by LibraryIndex.get_stats."""
+        pass
+
+    @abc.abstractmethod
+    def recent(self, limit: int) -> List[Dict[str, Any]]:
+        """Most recently added entries, newest first."""
+        pass
+
+    @abc.abstractmethod
+    def entries_without_pdf(self, pdf_exists: Callable[[str], bool]) -> List[Dict[str, Any]]:
+        """Entries with no PDF path or whose PDF path fails ``pdf_exists``."""
+        pass
+
+    @abc.abstractmethod
+    def query(
+        self,
+        citation_keys: Optional[List[str]] = None,
+        year_range: Optional[Tuple[Optional[int], Optional[int]]] = None,
+        sources: Optional[List[str]] = None,
+        has_pdf_path: Optional[bool] = None,
+        text_terms: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Select entries matching structured filters."""
+        pass
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove all entries (the store stays marked as migrated)."""
+        pass
+
+    def close(self) -> None:
+        """Release resources held by the store."""
+
+
+class SQLiteLibraryStore(LibraryStore):
+    """SQLite implementation of the library store.
+
+    Each entry is stored as its JSON dictionary plus indexed columns used
+    for lookups and filters. Title and abstract are mirrored into an FTS5
+    table used to pre-filter keyword selections; if the SQLite build lacks
+    FTS5, keyword pre-filtering is skipped and callers fall back to their
+    own matching.
+
+    Attributes:
+        path: Path to the SQLite database file.
+        fts_enabled: Whether the FTS5 table is available.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize the store, creating the database if needed.
+
+        Args:
+            path: Path to the SQLite database file.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        try:
+            self._conn.executescript(_FTS_SCHEMA)
+            self.fts_enabled = True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"SQLite FTS5 unavailable, keyword pre-filtering disabled: {e}")
+            self.fts_enabled = False
+        self._conn.commit()
+
+    @classmethod
+    def from_config(cls, config: LiteratureConfig) -> SQLiteLibraryStore:
+        """Create a store from literature configuration.
+
+        The database defaults to the library index path with a ``.sqlite``
+        suffix (e.g., ``data/library.sqlite``).
+
+        Args:
+            config: Literature configuration.
+
+        Returns:
+            Configured SQLiteLibraryStore.
+        """
+        path = (
+            Path(config.library_db_file)
+            if config.library_db_file
+            else Path(config.library_index_file).with_suffix(".sqlite")
+        )
+        return cls(path)
+
+    def _put(self, entry: Dict[str, Any], lookup: Dict[str, Optional[str]]) -> None:
+        """Insert or update one entry (caller holds the lock and commits)."""
+        key = entry["citation_key"]
+        pdf_path = entry.get("pdf_path")
+        self._conn.execute(
+            "INSERT INTO entries (citation_key, doi, doi_norm, title_norm, arxiv_id, year, "
+            "source, pdf_path, has_pdf_path, added_date, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(citation_key) DO UPDATE SET doi = excluded.doi, "
+            "doi_norm = excluded.doi_norm, title_norm = excluded.title_norm, "
+            "arxiv_id = excluded.arxiv_id, year = excluded.year, source = excluded.source, "
+            "pdf_path = excluded.pdf_path, has_pdf_path = excluded.has_pdf_path, "
+            "added_date = excluded.added_date, data = excluded.data",
+            (
+                key, entry.get("doi"), lookup.get("doi"), lookup.get("title"),
+                lookup.get("arxiv"), entry.get("year"), entry.get("source"),
+                pdf_path, 1 if pdf_path else 0, entry.get("added_date"),
+                json.dumps(entry, ensure_ascii=False),
+            ),
+        )
+        if self.fts_enabled:
+            self._conn.execute("DELETE FROM entries_fts WHERE citation_key = ?", (key,))
+            self._conn.execute(
+                "INSERT INTO entries_fts (citation_key, title, abstract) VALUES (?, ?, ?)",
+                (key, entry.get("title") or "", entry.get("abstract") or ""),
+            )
+
+    def _delete(self, citation_key: str) -> None:
+        """Delete one entry (caller holds the lock and commits)."""
+        self._conn.execute("DELETE FROM entries WHERE citation_key = ?", (citation_key,))
+        if self.fts_enabled:
+            self._conn.execute("DELETE FROM entries_fts WHERE citation_key = ?", (citation_key,))
+
+    def needs_migration(self) -> bool:
+        """Return True if the store is empty and has never been migrated."""
+        with self._lock:
+            migrated = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'migrated_from'"
+            ).fetchone()
+            return migrated is None and self.count() == 0
+
+    def import_entries(self, rows: Iterable[Tuple[Dict[str, Any], Dict[str, Optional[str]]]], origin: str) -> int:
+        """Bulk-insert entries and mark the store as migrated.
+
+        Args:
+            rows: ``(entry, lookup)`` pairs.
+            origin: Description of the import source stored in ``meta``.
+
+        Returns:
+            Number of entries imported.
+        """
+        imported = 0
+        with self._lock:
+            try:
+                for entry, lookup in rows:
+                    self._put(entry, lookup)
+                    imported += 1
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_from', ?)", (origin,)
+                )
+                self._conn.commit()
+            except sqlite3.Error:
+                self._conn.rollback()
+                raise
+        return imported
+
+    def apply(self, records: List[Dict[str, Any]]) -> None:
+        """Apply put/delete records in a single transaction.
+
+        Args:
+            records: Mutation records in LibraryIndex journal format.
+        """
+        with self._lock:
+            try:
+                for record in records:
+                    if record["op"] == "put":
+                        self._put(record["entry"], record.get("lookup", {}))
+                    elif record["op"] == "delete":
+                        self._delete(record["key"])
+                self._conn.commit()
+            except sqlite3.Error:
+                self._conn.rollback()
+                raise
+
+    def load_all(self) -> Dict[str, Dict[str, Any]]:
+        """Load all entries in insertion order.
+
+        Returns:
+            Mapping of citation key to entry dictionary.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT citation_key, data FROM entries ORDER BY rowid"
+            ).fetchall()
+        return {key: json.loads(data) for key, data in rows}
+
+    def get(self, citation_key: str) -> Optional[Dict[str, Any]]:
+        """Get a single entry by citation key.
+
+        Args:
+            citation_key: Citation key.
+
+        Returns:
+            Entry dictionary, or None if not found.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM entries WHERE citation_key = ?", (citation_key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def count(self) -> int:
+        """Count stored entries."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def find_key(self, column: str, value: str) -> Optional[str]:
+        """Find the first citation key whose lookup column equals value.
+
+        Args:
+            column: One of ``doi_norm``, ``title_norm`` or ``arxiv_id``.
+            value: Normalized value to match.
+
+        Returns:
+            Citation key of the earliest matching entry, or None.
+        """
+        if column not in _LOOKUP_COLUMNS:
+            raise ValueError(f"Unsupported lookup column: {column}")
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT citation_key FROM entries WHERE {column} = ? ORDER BY rowid LIMIT 1",
+                (value,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def aggregate(self) -> Dict[str, Any]:
+        """Compute the aggregates used by LibraryIndex.get_stats.
+
+        Returns:
+            Dictionary with total, sources (counts), years (counts),
+            pdf_paths (stored PDF paths) and citation_keys.
+        """
+        with self._lock:
+            conn = self._conn
+            total = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            sources = dict(conn.execute(
+                "SELECT source, COUNT(*) FROM entries GROUP BY source"
+            ).fetchall())
+            years = dict(conn.execute(
+                "SELECT year, COUNT(*) FROM entries WHERE year IS NOT NULL AND year != 0 GROUP BY year"
+            ).fetchall())
+            pdf_paths = [row[0] for row in conn.execute(
+                "SELECT pdf_path FROM entries WHERE has_pdf_path = 1"
+            )]
+            citation_keys = [row[0] for row in conn.execute("SELECT citation_key FROM entries")]
+        return {
+            "total": total,
+            "sources": sources,
+            "years": years,
+            "pdf_paths": pdf_paths,
+            "citation_keys": citation_keys,
+        }
+
+    def recent(self, limit: int) -> List[Dict[str, Any]]:
+        """Most recently added entries, newest first.
+
+        Args:
+            limit: Maximum number of entries.
+
+        Returns:
+            Entry dictionaries ordered by added_date descending.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM entries ORDER BY added_date DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def entries_without_pdf(self, pdf_exists: Callable[[str], bool]) -> List[Dict[str, Any]]:
+        """Entries with no PDF path or whose PDF file is missing.
+
+        Args:
+            pdf_exists: Callable checking whether a stored PDF path exists.
+
+        Returns:
+            Entry dictionaries in insertion order.
+        """
+        with self._lock:
+            missing = [
+                key for key, pdf_path in self._conn.execute(
+                    "SELECT citation_key, pdf_path FROM entries WHERE has_pdf_path = 1"
+                )
+                if not pdf_exists(pdf_path)
+            ]
+            rows = self._conn.execute(
+                "SELECT rowid, data FROM entries WHERE has_pdf_path = 0 "
+                "OR citation_key IN (SELECT value FROM json_each(?)) ORDER BY rowid",
+                (json.dumps(missing),),
+            ).fetchall()
+        return [json.loads(data) for _, data in rows]
+
+    @staticmethod
+    def _fts_query(terms: List[str]) -> str:
+        """Build an FTS5 query requiring every term as a prefix phrase."""
+        return " AND ".join('"' + term.replace('"', '""') + '"*' for term in terms)
+
+    def query(
+        self,
+        citation_keys: Optional[List[str]] = None,
+        year_range: Optional[Tuple[Optional[int], Optional[int]]] = None,
+        sources: Optional[List[str]] = None,
+        has_pdf_path: Optional[bool] = None,
+        text_terms: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Select entries matching structured filters.
+
+        Args:
+            citation_keys: Restrict to these citation keys.
+            year_range: ``(min, max)`` bounds; entries without a year are excluded.
+            sources: Restrict to these sources.
+            has_pdf_path: Require (True) or exclude (False) a stored PDF path.
+            text_terms: Terms that must all occur as word prefixes in title or
+                abstract (FTS5 pre-filter; ignored without FTS5).
+            limit: Maximum number of entries.
+
+        Returns:
+            Matching entry dictionaries in insertion order.
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+        if citation_keys:
+            clauses.append("citation_key IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps(citation_keys))
+        if year_range is not None:
+            clauses.append("year IS NOT NULL")
+            year_min, year_max = year_range
+            if year_min is not None:
+                clauses.append("year >= ?")
+                params.append(year_min)
+            if year_max is not None:
+                clauses.append("year <= ?")
+                params.append(year_max)
+        if sources:
+            clauses.append("source IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps(sources))
+        if has_pdf_path is not None:
+            clauses.append("has_pdf_path = ?")
+            params.append(1 if has_pdf_path else 0)
+        # Terms without word characters tokenize to nothing in FTS5
+        terms = [term for term in (text_terms or []) if any(c.isalnum() for c in term)]
+        if terms and self.fts_enabled:
+            clauses.append(
+                "citation_key IN (SELECT citation_key FROM entries_fts WHERE entries_fts MATCH ?)"
+            )
+            params.append(self._fts_query(terms))
+
+        sql = "SELECT data FROM entries"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY rowid"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            try:
+                rows = self._conn.execute(sql, params).fetchall()
+            except sqlite3.OperationalError as e:
+                if not (terms and self.fts_enabled):
+                    raise
+                # Terms FTS5 cannot parse: retry without the text pre-filter
+                logger.debug(f"FTS5 query failed, skipping keyword pre-filter: {e}")
+                return self.query(citation_keys, year_range, sources, has_pdf_path, None, limit)
+        return [json.loads(row[0]) for row in rows]
+
+    def clear(self) -> None:
+        """Remove all entries (the store stays marked as migrated)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            if self.fts_enabled:
+                self._conn.execute("DELETE FROM entries_fts")
+            self._conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('migrated_from', 'cleared')"
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def create_library_store(config: LiteratureConfig) -> Optional[LibraryStore]:
+    """Create the storage backend selected by ``config.library_backend``.
+
+    Args:
+        config: Literature configuration.
+
+    Returns:
+        A LibraryStore for the ``"sqlite"`` backend, or None for the default
+        ``"json"`` backend (handled by LibraryIndex itself).
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    backend = (config.library_backend or "json").lower()
+    if backend == "json":
+        return None
+    if backend == "sqlite":
+        return SQLiteLibraryStore.from_config(config)
+    raise ValueError(f"Unknown library backend: {config.library_backend}")
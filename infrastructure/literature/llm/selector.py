@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from dataclasses import dataclass, field
 
 import yaml
@@ -15,6 +15,9 @@ import yaml
 from infrastructure.core.logging_utils import get_logger
 from infrastructure.literature.library.index import LibraryEntry
 
+if TYPE_CHECKING:
+    from infrastructure.literature.library.index import LibraryIndex
+
 logger = get_logger(__name__)
 
 
@@ -160,6 +163,49 @@ class PaperSelector:
         logger.info(f"Selected {len(selected)} papers from {len(library_entries)} total")
         return selected
 
+    def select_from_index(self, library_index: "LibraryIndex") -> List[LibraryEntry]:
+        """Select papers directly from a library index.
+
+        Citation key, year, source and PDF-path filters (and the limit, when
+        no filesystem or keyword filter follows) are pushed down to
+        ``LibraryIndex.query_entries``, which runs them as SQL with the
+        SQLite backend. Keywords are pre-filtered there and then matched
+        exactly; PDF and summary existence are checked on the candidates.
+
+        Args:
+            library_index: Library index to select from.
+
+        Returns:
+            Library entries matching all criteria, in library order.
+        """
+        needs_post_filter = (
+            self.config.has_pdf is not None
+            or self.config.has_summary is not None
+            or bool(self.config.keywords)
+        )
+        years = self.config.years
+        selected = library_index.query_entries(
+            citation_keys=self.config.citation_keys or None,
+            year_range=(years.get("min"), years.get("max")) if years else None,
+            sources=self.config.sources or None,
+            has_pdf_path=True if self.config.has_pdf else None,
+            text_terms=self.config.keywords or None,
+            limit=None if needs_post_filter else self.config.limit,
+        )
+        logger.debug(f"Index query returned {len(selected)} candidate papers")
+
+        if self.config.has_pdf is not None:
+            selected = self._filter_by_pdf_availability(selected)
+        if self.config.has_summary is not None:
+            selected = self._filter_by_summary_availability(selected)
+        if self.config.keywords:
+            selected = self._filter_by_keywords(selected)
+        if self.config.limit is not None and len(selected) > self.config.limit:
+            selected = selected[:self.config.limit]
+
+        logger.info(f"Selected {len(selected)} papers from library index")
+        return selected
+
     def _filter_by_citation_keys(self, entries: List[LibraryEntry]) -> List[LibraryEntry]:
         """Filter by specific citation keys."""
         citation_key_set = set(self.config.citation_keys)
@@ -14,6 +14,7 @@ from dataclasses import dataclass
 from infrastructure.core.logging_utils import get_logger
 from infrastructure.literature.library.index import LibraryIndex, LibraryEntry
 from infrastructure.literature.core.config import LiteratureConfig
+from infrastructure.literature.summarization.corpus import corpus_path_for, open_corpus
 
 logger = get_logger(__name__)
 
@@ -360,13 +361,19 @@ class DataAggregator:
     def prepare_text_corpus(
         self,
         entries: Optional[List[LibraryEntry]] = None,
-        extracted_text_dir: Optional[Path] = None
+        extracted_text_dir: Optional[Path] = None,
+        corpus_path: Optional[Path] = None
     ) -> TextCorpus:
         """Prepare text corpus for PCA analysis.
         
+        Texts are read in one sequential pass from the packed corpus when
+        it exists and is current for a paper, and from the loose text
+        files otherwise.
+        
         Args:
             entries: Optional list of entries (uses default or all if not provided).
             extracted_text_dir: Directory containing extracted text files.
+            corpus_path: Packed corpus file (default: next to extracted_text_dir).
             
         Returns:
             TextCorpus with texts for analysis.
@@ -389,6 +396,17 @@ class DataAggregator:
         abstract_fallback_count = 0
         empty_count = 0
         
+        packed_texts: Dict[str, str] = {}
+        corpus = open_corpus(corpus_path or corpus_path_for(extracted_text_dir))
+        if corpus is not None:
+            with corpus:
+                current = [
+                    e.citation_key for e in entries
+                    if corpus.is_current(e.citation_key, extracted_text_dir / f"{e.citation_key}.txt")
+                ]
+                packed_texts = dict(corpus.iter_texts(current))
+            logger.debug(f"Loaded {len(packed_texts)} texts from packed corpus {corpus.path}")
+        
         for entry in entries:
             citation_keys.append(entry.citation_key)
             titles.append(entry.title)
@@ -398,7 +416,10 @@ class DataAggregator:
             
             # Try to load extracted text
             text_file = extracted_text_dir / f"{entry.citation_key}.txt"
-            if text_file.exists():
+            if entry.citation_key in packed_texts:
+                texts.append(packed_texts[entry.citation_key])
+                extracted_count += 1
+            elif text_file.exists():
                 try:
                     text_content = text_file.read_text(encoding='utf-8')
                     texts.append(text_content)
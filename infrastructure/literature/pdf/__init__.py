@@ -1,6 +1,8 @@
 """PDF handling and processing."""
 from infrastructure.literature.pdf.handler import PDFHandler
 from infrastructure.literature.pdf.downloader import PDFDownloader
+from infrastructure.literature.pdf.strategy_stats import DownloadStrategyStats
+from infrastructure.literature.pdf.content_index import PDFContentIndex
 from infrastructure.literature.pdf.extractor import (
     extract_pdf_urls_from_html,
     extract_citations,
@@ -14,6 +16,8 @@ from infrastructure.literature.pdf.fallbacks import (
 __all__ = [
     "PDFHandler",
     "PDFDownloader",
+    "DownloadStrategyStats",
+    "PDFContentIndex",
     "extract_pdf_urls_from_html",
     "extract_citations",
     "transform_pdf_url",
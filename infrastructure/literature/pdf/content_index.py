@@ -0,0 +1,211 @@
+"""Content-addressed index of downloaded PDFs.
+
+PDFs stay at ``data/pdfs/{citation_key}.pdf``; this index maps every
+citation key to the SHA-256 of its file (computed while the download is
+streamed, or read once for older files) and groups keys by hash. The
+same paper fetched under two citation keys, e.g. a preprint and its
+published version, is then detected:
+
+- the duplicate file is replaced by a hard link to the existing copy, so
+  the bytes are stored once
+- text extraction and summarization reuse the results of the copy that
+  was processed first instead of redoing the work
+
+Hashes are cached with the file size and mtime and recomputed when the
+file changes. The index is persisted as JSON (default
+``cache/pdf_content.json`` next to the download directory) and shared by
+all users of the same file through ``PDFContentIndex.for_config``.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from infrastructure.core.json_store import JsonStore
+from infrastructure.core.logging_utils import get_logger
+from infrastructure.literature.core.config import LiteratureConfig
+
+logger = get_logger(__name__)
+
+# Bytes read per chunk when hashing existing files
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PDFContentIndex(JsonStore):
+    """Thread-safe mapping of citation keys to PDF content hashes.
+
+    Mutations mark the index dirty; callers write it with ``flush()``.
+
+    Attributes:
+        path: JSON file holding the index.
+        link_duplicates: Replace duplicate PDFs by hard links.
+    """
+
+    SECTION = "keys"
+    DESCRIPTION = "PDF content index"
+
+    def __init__(self, path: Path, link_duplicates: bool = True):
+        """Initialize the index (loaded lazily on first use).
+
+        Args:
+            path: JSON index file.
+            link_duplicates: Replace duplicate PDFs by hard links.
+        """
+        super().__init__(path)
+        self.link_duplicates = link_duplicates
+        self._by_hash: Dict[str, List[str]] = {}
+
+    @classmethod
+    def for_config(cls, config: LiteratureConfig) -> PDFContentIndex:
+        """Get the shared index for a configuration.
+
+        The default file is ``cache/pdf_content.json`` next to the
+        download directory.
+
+        Args:
+            config: Literature configuration.
+
+        Returns:
+            Shared PDFContentIndex instance for the configured path.
+        """
+        path = Path(config.pdf_content_index_file) if config.pdf_content_index_file else (
+            Path(config.download_dir).parent / "cache" / "pdf_content.json"
+        )
+        return cls.shared(path, link_duplicates=config.link_duplicate_pdfs)
+
+    def _on_load(self, document: Optional[Dict[str, Any]]) -> None:
+        super()._on_load(document)
+        for citation_key, record in self._data.items():
+            self._by_hash.setdefault(record["sha256"], []).append(citation_key)
+
+    def _set(self, citation_key: str, sha256: str, stat: os.stat_result) -> None:
+        old = self._data.get(citation_key)
+        if old and old["sha256"] != sha256:
+            keys = self._by_hash.get(old["sha256"], [])
+            if citation_key in keys:
+                keys.remove(citation_key)
+        self._data[citation_key] = {"sha256": sha256, "size": stat.st_size, "mtime": stat.st_mtime}
+        keys = self._by_hash.setdefault(sha256, [])
+        if citation_key not in keys:
+            keys.append(citation_key)
+        self._dirty = True
+
+    def hash_of(self, citation_key: str, pdf_path: Path, sha256: Optional[str] = None) -> Optional[str]:
+        """Content hash of a citation key's PDF, indexing it if needed.
+
+        Args:
+            citation_key: Citation key.
+            pdf_path: Path of the key's PDF.
+            sha256: Hash already computed for the file (e.g. while downloading).
+
+        Returns:
+            Hex digest, or None if the file does not exist.
+        """
+        self._ensure_loaded()
+        try:
+            stat = pdf_path.stat()
+        except OSError:
+            return None
+        with self._lock:
+            record = self._data.get(citation_key)
+            if sha256 is None and record and (record["size"], record["mtime"]) == (stat.st_size, stat.st_mtime):
+                return record["sha256"]
+        if sha256 is None:
+            sha256 = file_sha256(pdf_path)
+        with self._lock:
+            self._set(citation_key, sha256, stat)
+        return sha256
+
+    def duplicates_of(self, citation_key: str, pdf_path: Path) -> List[str]:
+        """Other citation keys whose PDF has the same content.
+
+        Args:
+            citation_key: Citation key.
+            pdf_path: Path of the key's PDF.
+
+        Returns:
+            Citation keys with identical content, first indexed first.
+        """
+        sha256 = self.hash_of(citation_key, pdf_path)
+        if sha256 is None:
+            return []
+        with self._lock:
+            return [k for k in self._by_hash.get(sha256, []) if k != citation_key]
+
+    def register(self, citation_key: str, pdf_path: Path, sha256: Optional[str] = None) -> Optional[str]:
+        """Index a newly stored PDF and deduplicate its bytes.
+
+        If another key already has the same content and its file still
+        exists, the new file is replaced by a hard link to it (when
+        ``link_duplicates`` is enabled and the filesystem supports it).
+
+        Args:
+            citation_key: Citation key of the new PDF.
+            pdf_path: Path of the new PDF.
+            sha256: Hash computed while downloading, if known.
+
+        Returns:
+            Citation key of the existing copy, or None if the content is new.
+        """
+        sha256 = self.hash_of(citation_key, pdf_path, sha256)
+        if sha256 is None:
+            return None
+        with self._lock:
+            candidates = [k for k in self._by_hash.get(sha256, []) if k != citation_key]
+        for original_key in candidates:
+            original_path = pdf_path.with_name(f"{original_key}.pdf")
+            if not original_path.exists():
+                continue
+            logger.info(f"[{citation_key}] Same PDF content as {original_key}; reusing its results")
+            if self.link_duplicates:
+                self._link(original_path, pdf_path, citation_key, sha256)
+            return original_key
+        return None
+
+    def _link(self, original_path: Path, pdf_path: Path, citation_key: str, sha256: str) -> None:
+        """Replace ``pdf_path`` by a hard link to ``original_path``."""
+        try:
+            if os.path.samefile(original_path, pdf_path):
+                return
+            temp_path = pdf_path.with_name(pdf_path.name + ".link")
+            temp_path.unlink(missing_ok=True)
+            os.link(original_path, temp_path)
+            os.replace(temp_path, pdf_path)
+        except OSError as e:
+            logger.debug(f"Could not hard-link duplicate PDF {pdf_path.name}: {e}")
+            return
+        with self._lock:
+            self._set(citation_key, sha256, pdf_path.stat())
+
+    def forget(self, citation_key: str) -> None:
+        """Remove a citation key from the index (e.g. when its PDF is deleted)."""
+        self._ensure_loaded()
+        with self._lock:
+            record = self._data.pop(citation_key, None)
+            if record:
+                keys = self._by_hash.get(record["sha256"], [])
+                if citation_key in keys:
+                    keys.remove(citation_key)
+                self._dirty = True
+
+    def get_stats(self) -> Dict[str, int]:
+        """Indexed PDFs, distinct contents and duplicate keys."""
+        self._ensure_loaded()
+        with self._lock:
+            unique = sum(1 for keys in self._by_hash.values() if keys)
+            return {
+                "pdfs": len(self._data),
+                "unique_contents": unique,
+                "duplicates": len(self._data) - unique,
+            }
@@ -1,11 +1,32 @@
-"""PDF download logic with retry mechanisms and error handling."""
+"""PDF download logic with retry mechanisms and error handling.
+
+Downloads are streamed: the first bytes are sniffed for PDF/HTML, then the
+body is written chunk by chunk to ``<name>.pdf.part`` while being hashed,
+and the file is renamed into place once complete. Memory per download is
+bounded by the chunk size. An interrupted download leaves its partial
+file behind, with the source URL, validator (ETag or Last-Modified) and
+total length recorded in ``<name>.pdf.part.json``. The next attempt of the
+same URL resumes it with an HTTP Range request guarded by ``If-Range``;
+a partial from another URL, without a validator, or whose Content-Range
+reports a different resource is discarded and the download starts over.
+
+With ``race_candidate_urls`` enabled, the top candidate URLs of a paper
+are probed concurrently with small ranged GETs; the first one whose
+response sniffs as a PDF is downloaded first (see ``race_candidates``).
+"""
 from __future__ import annotations
 
+import hashlib
+import itertools
+import json
 import os
 import random
+import re
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
 
@@ -13,10 +34,18 @@ from infrastructure.core.exceptions import FileOperationError, LiteratureSearchE
 from infrastructure.core.logging_utils import get_logger
 from infrastructure.literature.core.config import LiteratureConfig, BROWSER_USER_AGENTS
 from infrastructure.literature.sources import SearchResult
+from infrastructure.literature.sources.http import get_session
 from infrastructure.literature.pdf.fallbacks import transform_pdf_url, doi_to_pdf_urls, PDFFallbackStrategies
+from infrastructure.literature.pdf.strategy_stats import DownloadStrategyStats, host_of
 
 logger = get_logger(__name__)
 
+# Bytes inspected to tell PDFs from HTML pages
+SNIFF_BYTES = 2048
+
+# Upper bound for HTML pages read in full to look for PDF links
+MAX_HTML_BYTES = 5 * 1024 * 1024
+
 
 def is_pdf_content(content: bytes) -> bool:
     """Check if content is a PDF by examining magic bytes.
@@ -76,6 +105,10 @@ class PDFDownloader:
             config: Literature configuration.
         """
         self.config = config
+        self._content_hashes: Dict[str, str] = {}
+        # Learned per-host strategy statistics (set by PDFHandler)
+        self.strategy_stats: Optional[DownloadStrategyStats] = None
+        self._hash_lock = threading.Lock()
         self._ensure_download_dir()
     
     def _ensure_download_dir(self) -> None:
@@ -88,6 +121,205 @@ class PDFDownloader:
                 context={"path": self.config.download_dir}
             )
     
+    @staticmethod
+    def partial_path(output_path: Path) -> Path:
+        """Path of the in-progress download for an output file."""
+        return output_path.with_name(output_path.name + ".part")
+
+    @staticmethod
+    def partial_meta_path(output_path: Path) -> Path:
+        """Path of the metadata recorded beside an in-progress download."""
+        return output_path.with_name(output_path.name + ".part.json")
+
+    def content_hash(self, output_path: Path) -> Optional[str]:
+        """SHA-256 of a file downloaded by this downloader, if known.
+
+        Args:
+            output_path: Final path of the downloaded PDF.
+
+        Returns:
+            Hex digest computed while the file was written, or None.
+        """
+        with self._hash_lock:
+            return self._content_hashes.get(str(output_path))
+
+    def _discard_partial(self, output_path: Path) -> None:
+        """Remove a partial download and its metadata."""
+        self.partial_path(output_path).unlink(missing_ok=True)
+        self.partial_meta_path(output_path).unlink(missing_ok=True)
+
+    def _resumable_partial(self, output_path: Path, url: str) -> Tuple[int, Dict[str, Any]]:
+        """Partial download of ``url`` that can be resumed.
+
+        A partial file is only resumed if resuming is enabled, it starts with
+        the PDF magic bytes, and its metadata records the same URL and a
+        validator to send as ``If-Range``. Anything else is discarded.
+
+        Args:
+            output_path: Final path of the download.
+            url: URL about to be requested.
+
+        Returns:
+            Tuple of (size, metadata); (0, {}) if there is nothing to resume.
+        """
+        partial_path = self.partial_path(output_path)
+        if not partial_path.exists():
+            self.partial_meta_path(output_path).unlink(missing_ok=True)
+            return 0, {}
+        if self.config.resume_downloads:
+            try:
+                meta = json.loads(self.partial_meta_path(output_path).read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                meta = {}
+            if isinstance(meta, dict) and meta.get("url") == url and self._if_range(meta):
+                with open(partial_path, 'rb') as f:
+                    head = f.read(4)
+                size = partial_path.stat().st_size
+                total = meta.get("total")
+                if is_pdf_content(head) and (not total or size < total):
+                    return size, meta
+        self._discard_partial(output_path)
+        return 0, {}
+
+    @staticmethod
+    def _if_range(meta: Dict[str, Any]) -> Optional[str]:
+        """Validator of a partial download for the ``If-Range`` header."""
+        return meta.get("etag") or meta.get("last_modified")
+
+    def _save_partial_meta(self, output_path: Path, url: str, response) -> None:
+        """Record the source of a download about to be written from scratch.
+
+        Weak ETags cannot be used with ``If-Range``, so only strong ETags are
+        kept; the total length is only known for unencoded bodies.
+        """
+        etag = response.headers.get("ETag")
+        length = response.headers.get("Content-Length")
+        meta = {
+            "url": url,
+            "etag": etag if etag and not etag.startswith("W/") else None,
+            "last_modified": response.headers.get("Last-Modified"),
+            "total": int(length) if length and length.isdigit()
+            and not response.headers.get("Content-Encoding") else None,
+        }
+        self.partial_meta_path(output_path).write_text(json.dumps(meta), encoding="utf-8")
+
+    @staticmethod
+    def _is_matching_range(response, start: int, meta: Dict[str, Any]) -> bool:
+        """Check that a 206 response continues the partial file at byte ``start``.
+
+        The Content-Range start must equal ``start``, its total length must
+        match the recorded one, and a returned ETag must match the recorded
+        ETag.
+        """
+        match = re.match(r"bytes (\d+)-\d+/(\d+|\*)", response.headers.get("Content-Range", ""))
+        if not match or int(match.group(1)) != start:
+            return False
+        total = meta.get("total")
+        if total and match.group(2) != "*" and int(match.group(2)) != total:
+            return False
+        etag = response.headers.get("ETag")
+        return not (etag and meta.get("etag") and etag != meta["etag"])
+
+    @staticmethod
+    def _read_sample(chunks, size: int) -> bytes:
+        """Read at least ``size`` bytes (or the whole body) from a chunk iterator."""
+        sample = b''
+        for chunk in chunks:
+            sample += chunk
+            if len(sample) >= size:
+                break
+        return sample
+
+    @staticmethod
+    def _read_html(sample: bytes, chunks) -> bytes:
+        """Read the rest of an HTML page, up to MAX_HTML_BYTES."""
+        parts = [sample]
+        total = len(sample)
+        for chunk in chunks:
+            parts.append(chunk)
+            total += len(chunk)
+            if total >= MAX_HTML_BYTES:
+                break
+        return b''.join(parts)
+
+    def _probe_pdf(self, url: str, timeout: float, cancelled: threading.Event) -> bool:
+        """Check whether a URL serves a PDF by fetching its first bytes.
+
+        Args:
+            url: Candidate URL.
+            timeout: Request timeout in seconds.
+            cancelled: Set once another candidate has won the race.
+
+        Returns:
+            True if the response starts with the PDF magic bytes.
+        """
+        if cancelled.is_set():
+            return False
+        headers = {
+            "User-Agent": self._get_user_agent(),
+            "Accept": "application/pdf,*/*",
+            "Accept-Encoding": "identity",
+            "Range": f"bytes=0-{SNIFF_BYTES - 1}",
+        }
+        try:
+            with get_session(self.config).get(
+                url, stream=True, timeout=timeout, headers=headers, allow_redirects=True
+            ) as response:
+                if response.status_code not in (200, 206) or cancelled.is_set():
+                    return False
+                sample = self._read_sample(response.iter_content(chunk_size=SNIFF_BYTES), 4)
+                return is_pdf_content(sample)
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"Race probe failed for {url}: {e}")
+            return False
+
+    def race_candidates(self, urls: List[str], timeout: Optional[float] = None) -> Optional[str]:
+        """Probe candidate URLs concurrently and return the first serving a PDF.
+
+        Each candidate gets a ranged GET for its first bytes (subject to the
+        per-host rate limits of the shared session). The race ends as soon
+        as one response sniffs as a PDF: pending probes are cancelled and
+        running ones stop before reading their body.
+
+        Args:
+            urls: Candidate URLs, best first.
+            timeout: Probe timeout in seconds. If None, uses config timeout.
+
+        Returns:
+            Winning URL, or None if no candidate served a PDF.
+        """
+        if not urls:
+            return None
+        if timeout is None:
+            timeout = getattr(self.config, 'pdf_download_timeout', self.config.timeout)
+
+        cancelled = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=len(urls), thread_name_prefix="pdf-race")
+        futures = {executor.submit(self._probe_pdf, u, timeout, cancelled): u for u in urls}
+        winner: Optional[str] = None
+        start = time.monotonic()
+        try:
+            pending = set(futures)
+            while pending and winner is None:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                # Prefer the best-ranked candidate among probes finishing together
+                for future in sorted(done, key=lambda f: urls.index(futures[f])):
+                    if future.result():
+                        winner = futures[future]
+                        break
+        finally:
+            cancelled.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if winner:
+            logger.debug(
+                f"Race won by {winner} after {time.monotonic() - start:.2f}s "
+                f"({len(urls)} candidates)"
+            )
+        else:
+            logger.debug(f"No PDF among {len(urls)} raced candidates")
+        return winner
+
     def _get_user_agent(self) -> str:
         """Get User-Agent string for requests.
         
@@ -225,64 +457,59 @@ class PDFDownloader:
             else:
                 logger.debug(f"HTML response detected, trying fallback URLs for {url}")
 
+            def _attempt(target_url: str, attempt_type: str, label: str,
+                         custom_headers: Optional[Dict[str, str]] = None) -> bool:
+                result = self._download_single_attempt(
+                    target_url, output_path, attempt_type=attempt_type,
+                    custom_headers=custom_headers,
+                    parse_html_callback=parse_html_callback, timeout=timeout
+                )
+                attempted_urls.append(label)
+                return result[0]
+
             # Strategy 0: Try transformed URLs (for HTML responses)
-            if last_failure_reason in ["html_response", "html_no_pdf_link"]:
+            def _transformed() -> bool:
+                if last_failure_reason not in ["html_response", "html_no_pdf_link"]:
+                    return False
                 transformed_urls = transform_pdf_url(url)
                 # Limit to 2 most promising variants
-                max_transformed = min(2, len(transformed_urls))
-                for i, transformed_url in enumerate(transformed_urls[:max_transformed]):
+                for i, transformed_url in enumerate(transformed_urls[:2]):
                     if len(attempted_urls) >= max_url_attempts:
                         logger.debug(f"Reached max URL attempts limit ({max_url_attempts}), stopping")
                         break
                     logger.debug(f"Trying transformed URL {i+1}: {transformed_url}")
-                    result = self._download_single_attempt(
-                        transformed_url, output_path, attempt_type=f"transformed_{i+1}", 
-                        parse_html_callback=parse_html_callback, timeout=timeout
-                    )
-                    attempted_urls.append(transformed_url)
-
-                    if result[0]:
+                    if _attempt(transformed_url, f"transformed_{i+1}", transformed_url):
                         logger.info(f"Success with transformed URL")
-                        return (True, None, None, attempted_urls)
+                        return True
+                return False
 
             # Strategy 1: Try different User-Agents (limit to 2 attempts)
-            if len(attempted_urls) < max_url_attempts:
+            def _user_agents() -> bool:
                 for user_agent in BROWSER_USER_AGENTS[:2]:  # Try first 2 different User-Agents
                     if len(attempted_urls) >= max_url_attempts:
                         break
                     logger.debug(f"Trying with User-Agent: {user_agent[:50]}...")
-                    result = self._download_single_attempt(
-                        url, output_path, attempt_type="user_agent",
-                        custom_headers={"User-Agent": user_agent},
-                        parse_html_callback=parse_html_callback, timeout=timeout
-                    )
-                    attempted_urls.append(f"{url} (User-Agent: {user_agent[:20]}...)")
-
-                    if result[0]:
-                        return (True, None, None, attempted_urls)
+                    if _attempt(url, "user_agent", f"{url} (User-Agent: {user_agent[:20]}...)",
+                                {"User-Agent": user_agent}):
+                        return True
+                return False
 
             # Strategy 2: Try with minimal headers (no Accept-Language, etc.)
-            if len(attempted_urls) < max_url_attempts:
+            def _minimal() -> bool:
                 logger.debug(f"Trying minimal headers")
-                result = self._download_single_attempt(
-                    url, output_path, attempt_type="minimal",
-                    custom_headers={
-                        "User-Agent": random.choice(BROWSER_USER_AGENTS),
-                        "Accept": "application/pdf,*/*"
-                    },
-                    parse_html_callback=parse_html_callback, timeout=timeout
-                )
-                attempted_urls.append(f"{url} (minimal)")
-
-                if result[0]:
-                    return (True, None, None, attempted_urls)
+                return _attempt(url, "minimal", f"{url} (minimal)", {
+                    "User-Agent": random.choice(BROWSER_USER_AGENTS),
+                    "Accept": "application/pdf,*/*"
+                })
 
             # Strategy 3: Try HEAD request first to check if URL is accessible
-            # Skip if 403 is persistent (already tried multiple User-Agents)
-            if len(attempted_urls) < max_url_attempts and last_failure_reason != "access_denied":
+            def _head() -> bool:
+                # Skip if 403 is persistent (already tried multiple User-Agents)
+                if last_failure_reason == "access_denied":
+                    return False
                 try:
                     logger.debug(f"Trying HEAD request")
-                    head_response = requests.head(
+                    head_response = get_session(self.config).head(
                         url,
                         timeout=timeout,
                         headers={"User-Agent": random.choice(BROWSER_USER_AGENTS)},
@@ -290,63 +517,57 @@ class PDFDownloader:
                     )
                     if head_response.status_code == 200:
                         # HEAD succeeded, try GET again with same User-Agent
-                        result = self._download_single_attempt(
-                            url, output_path, attempt_type="head_ok",
-                            custom_headers={"User-Agent": head_response.request.headers.get("User-Agent", "")},
-                            parse_html_callback=parse_html_callback, timeout=timeout
-                        )
-                        attempted_urls.append(f"{url} (head_ok)")
-
-                        if result[0]:
-                            return (True, None, None, attempted_urls)
+                        return _attempt(url, "head_ok", f"{url} (head_ok)", {
+                            "User-Agent": head_response.request.headers.get("User-Agent", "")
+                        })
                 except Exception as e:
                     logger.debug(f"HEAD failed: {e}")
+                return False
 
             # Strategy 4: Try with referer spoofing (pretend we're coming from Google)
-            if len(attempted_urls) < max_url_attempts:
+            def _referer() -> bool:
                 logger.debug(f"Trying referer spoofing")
-                result = self._download_single_attempt(
-                    url, output_path, attempt_type="referer",
-                    custom_headers={
+                return _attempt(url, "referer", f"{url} (referer)", {
+                    "User-Agent": random.choice(BROWSER_USER_AGENTS),
+                    "Accept": "application/pdf,*/*",
+                    "Accept-Language": "en-US,en;q=0.9",
+                    "Referer": "https://www.google.com/"
+                })
+
+            # Strategy 5: Try academic referers (pretend we're coming from university sites)
+            def _academic_referer() -> bool:
+                # Limit to 1 most promising academic referer
+                referer = "https://scholar.google.com/"
+                logger.debug(f"Trying academic referer: {referer}")
+                return _attempt(
+                    url, "academic_referer",
+                    f"{url} (academic_referer: {referer.split('//')[1].split('/')[0]})",
+                    {
                         "User-Agent": random.choice(BROWSER_USER_AGENTS),
                         "Accept": "application/pdf,*/*",
                         "Accept-Language": "en-US,en;q=0.9",
-                        "Referer": "https://www.google.com/"
-                    },
-                    parse_html_callback=parse_html_callback, timeout=timeout
+                        "Referer": referer
+                    }
                 )
-                attempted_urls.append(f"{url} (referer)")
 
-                if result[0]:
+            strategies = {
+                "transformed": _transformed,
+                "user_agent": _user_agents,
+                "minimal": _minimal,
+                "head_ok": _head,
+                "referer": _referer,
+                "academic_referer": _academic_referer,
+            }
+            # Learned order for this host (pruned strategies are skipped)
+            order = list(strategies)
+            if self.strategy_stats is not None:
+                order = self.strategy_stats.rank_strategies(url, order)
+            for name in order:
+                if len(attempted_urls) >= max_url_attempts:
+                    break
+                if strategies[name]():
                     return (True, None, None, attempted_urls)
 
-            # Strategy 5: Try academic referers (pretend we're coming from university sites)
-            # Limit to 1 most promising academic referer
-            if len(attempted_urls) < max_url_attempts:
-                academic_referers = [
-                    "https://scholar.google.com/",
-                    "https://www.semanticscholar.org/",
-                ]
-
-                for referer in academic_referers[:1]:  # Try first 1 academic referer
-                    if len(attempted_urls) >= max_url_attempts:
-                        break
-                    logger.debug(f"Trying academic referer: {referer}")
-                    result = self._download_single_attempt(
-                        url, output_path, attempt_type="academic_referer",
-                        custom_headers={
-                            "User-Agent": random.choice(BROWSER_USER_AGENTS),
-                            "Accept": "application/pdf,*/*",
-                            "Accept-Language": "en-US,en;q=0.9",
-                            "Referer": referer
-                        },
-                        parse_html_callback=parse_html_callback, timeout=timeout
-                    )
-                    attempted_urls.append(f"{url} (academic_referer: {referer.split('//')[1].split('/')[0]})")
-
-                    if result[0]:
-                        return (True, None, None, attempted_urls)
-
         # If not 403 or all recovery strategies failed, try standard retries
         else:
             # Enhanced retry logic based on failure type
@@ -357,6 +578,12 @@ class PDFDownloader:
                 if len(attempted_urls) >= max_url_attempts:
                     logger.debug(f"Reached max URL attempts limit ({max_url_attempts}), stopping retries")
                     break
+
+                # Skip retries that have never worked for this host
+                strategy = "retry_agent" if last_failure_reason == "access_denied" else "retry"
+                if self.strategy_stats is not None and self.strategy_stats.is_pruned(host_of(url), strategy):
+                    logger.debug(f"Skipping retries: {strategy} has never succeeded for {host_of(url)}")
+                    break
                     
                 delay = self.config.download_retry_delay * (2 ** (attempt - 1))
 
@@ -411,6 +638,33 @@ class PDFDownloader:
         parse_html_callback: Optional[Callable[[bytes, str], List[str]]] = None,
         recursion_depth: int = 0,
         timeout: Optional[float] = None
+    ) -> Tuple[bool, Optional[Exception], Optional[str]]:
+        """Single download attempt, recorded in the strategy statistics.
+
+        See ``_attempt_download`` for the arguments.
+
+        Returns:
+            Tuple of (success, error, failure_reason).
+        """
+        start_time = time.time()
+        result = self._attempt_download(
+            url, output_path, attempt_type=attempt_type, custom_headers=custom_headers,
+            parse_html_callback=parse_html_callback, recursion_depth=recursion_depth,
+            timeout=timeout
+        )
+        if self.strategy_stats is not None:
+            self.strategy_stats.record(url, attempt_type, result[0], time.time() - start_time)
+        return result
+
+    def _attempt_download(
+        self,
+        url: str,
+        output_path: Path,
+        attempt_type: str = "standard",
+        custom_headers: Optional[Dict[str, str]] = None,
+        parse_html_callback: Optional[Callable[[bytes, str], List[str]]] = None,
+        recursion_depth: int = 0,
+        timeout: Optional[float] = None
     ) -> Tuple[bool, Optional[Exception], Optional[str]]:
         """Single download attempt with specific configuration.
 
@@ -440,7 +694,16 @@ class PDFDownloader:
                 "Accept-Language": "en-US,en;q=0.9",
             }
 
-            response = requests.get(
+            partial_path = self.partial_path(output_path)
+            resume_from, partial_meta = self._resumable_partial(output_path, url)
+            if resume_from:
+                headers = dict(headers)
+                headers["Range"] = f"bytes={resume_from}-"
+                headers["If-Range"] = self._if_range(partial_meta)
+                headers["Accept-Encoding"] = "identity"
+                logger.debug(f"Resuming download of {output_path.name} at byte {resume_from}")
+
+            response = get_session(self.config).get(
                 url,
                 stream=True,
                 timeout=timeout,
@@ -448,8 +711,24 @@ class PDFDownloader:
                 allow_redirects=True
             )
 
+            # Partial file no longer matches the resource: start over
+            if resume_from and (
+                response.status_code == 416
+                or (response.status_code == 206
+                    and not self._is_matching_range(response, resume_from, partial_meta))
+            ):
+                response.close()
+                logger.debug(f"Discarding partial download of {output_path.name}: range does not match {url}")
+                self._discard_partial(output_path)
+                return self._attempt_download(
+                    url, output_path, attempt_type=attempt_type, custom_headers=custom_headers,
+                    parse_html_callback=parse_html_callback, recursion_depth=recursion_depth,
+                    timeout=timeout
+                )
+
             # Check for errors
             if response.status_code >= 400:
+                response.close()
                 failure_reason, error_msg = self.categorize_error(
                     Exception(f"HTTP {response.status_code}"),
                     response.status_code,
@@ -457,23 +736,35 @@ class PDFDownloader:
                 )
                 return (False, Exception(error_msg), failure_reason)
 
+            if resume_from and response.status_code != 206:
+                # Resource changed (If-Range failed) or Range was ignored;
+                # the full body follows
+                resume_from = 0
+
             # Verify we got a PDF (or at least something substantial)
             content_type = response.headers.get("Content-Type", "")
-            content_length = response.headers.get("Content-Length")
-
-            # Read first chunk to check for PDF magic bytes and HTML content
-            content_sample = response.content[:2048] if hasattr(response, 'content') else b''
-
-            # Enhanced validation: check both content-type header and actual content
-            is_html_by_header = "text/html" in content_type.lower()
-            is_html_by_content = is_html_content(content_sample)
-            is_pdf_by_content = is_pdf_content(content_sample)
+            chunks = response.iter_content(chunk_size=self.config.download_chunk_size)
+
+            # Sniff the first bytes for PDF magic bytes and HTML content;
+            # a resumed body continues a file already known to be a PDF
+            content_sample = self._read_sample(chunks, SNIFF_BYTES)
+            if resume_from:
+                with open(partial_path, 'rb') as f:
+                    head = f.read(SNIFF_BYTES)
+                is_html_by_header = False
+                is_html_by_content = False
+                is_pdf_by_content = is_pdf_content(head)
+            else:
+                is_html_by_header = "text/html" in content_type.lower()
+                is_html_by_content = is_html_content(content_sample)
+                is_pdf_by_content = is_pdf_content(content_sample)
 
             # If we got HTML instead of PDF, try to extract PDF URLs from the HTML
             if (is_html_by_header or is_html_by_content) and not is_pdf_by_content:
                 # Prevent excessive recursion
                 MAX_RECURSION_DEPTH = 2
                 if recursion_depth >= MAX_RECURSION_DEPTH:
+                    response.close()
                     logger.debug(f"Max recursion depth ({MAX_RECURSION_DEPTH}) reached, skipping HTML parsing")
                     return (False, Exception("HTML received instead of PDF"), "html_response")
                 
@@ -481,7 +772,9 @@ class PDFDownloader:
 
                 # Try to extract PDF URLs from the HTML content if callback provided
                 if parse_html_callback and recursion_depth < MAX_RECURSION_DEPTH:
-                    html_pdf_urls = parse_html_callback(response.content, url)
+                    html_content = self._read_html(content_sample, chunks)
+                    response.close()
+                    html_pdf_urls = parse_html_callback(html_content, url)
 
                     if html_pdf_urls:
                         # Limit attempts to avoid excessive retries
@@ -521,6 +814,7 @@ class PDFDownloader:
                             logger.debug(f"HTML received instead of PDF (no PDF URLs found in HTML)")
                         return (False, Exception("HTML received instead of PDF"), "html_response")
                 else:
+                    response.close()
                     # Only log warning at top level
                     if recursion_depth == 0:
                         logger.debug(f"HTML received instead of PDF (parser not available or max depth reached)")
@@ -528,41 +822,61 @@ class PDFDownloader:
 
             # If content-type suggests PDF but content looks like HTML, also fail
             if not is_html_by_header and is_html_by_content and not is_pdf_by_content:
+                response.close()
                 # Only log warning at top level
                 if recursion_depth == 0:
                     logger.debug(f"Content-Type mismatch: HTML received instead of PDF")
                 return (False, Exception("Content-Type mismatch: HTML received instead of PDF"), "content_mismatch")
 
-            # Write the file
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-
-            # Verify file was written and has content
-            if not output_path.exists() or output_path.stat().st_size == 0:
-                logger.warning(f"Downloaded file is empty: {output_path}")
-                if output_path.exists():
-                    output_path.unlink()
-                return (False, Exception("Downloaded file is empty"), "empty_file")
-
-            # Verify the file actually contains a PDF (check magic bytes)
-            try:
-                with open(output_path, 'rb') as f:
-                    file_header = f.read(4)
-                if not is_pdf_content(file_header):
-                    file_size = output_path.stat().st_size if output_path.exists() else 0
-                    logger.warning(
-                        f"Downloaded file is not a PDF (missing %PDF magic bytes): {output_path} "
-                        f"(size: {file_size} bytes, URL: {url})"
-                    )
-                    output_path.unlink()
-                    return (False, Exception(f"File is not a valid PDF (size: {file_size} bytes)"), "invalid_response")
-            except Exception as e:
-                logger.warning(f"Failed to validate downloaded file: {e} (URL: {url})")
-                if output_path.exists():
-                    output_path.unlink()
-                return (False, e, "validation_error")
+            # Anything that does not start with the PDF magic bytes is rejected
+            # before a single byte is written
+            if not is_pdf_by_content:
+                response.close()
+                if resume_from:
+                    self._discard_partial(output_path)
+                logger.warning(
+                    f"Downloaded file is not a PDF (missing %PDF magic bytes): {output_path} (URL: {url})"
+                )
+                if not content_sample:
+                    return (False, Exception("Downloaded file is empty"), "empty_file")
+                return (False, Exception("File is not a valid PDF"), "invalid_response")
+
+            # Stream the body to the partial file, hashing as it is written
+            digest = hashlib.sha256()
+            if resume_from:
+                with open(partial_path, 'rb') as f:
+                    for block in iter(lambda: f.read(self.config.download_chunk_size), b''):
+                        digest.update(block)
+            written = 0
+            if not resume_from:
+                self._save_partial_meta(output_path, url, response)
+            with open(partial_path, 'ab' if resume_from else 'wb') as f:
+                for chunk in itertools.chain((content_sample,), chunks):
+                    if chunk:
+                        f.write(chunk)
+                        digest.update(chunk)
+                        written += len(chunk)
+                f.flush()
+                os.fsync(f.fileno())
+
+            expected = response.headers.get("Content-Length")
+            if expected and expected.isdigit() and not response.headers.get("Content-Encoding") \
+                    and written < int(expected):
+                # Keep the partial file so the next attempt can resume
+                return (
+                    False,
+                    Exception(f"Incomplete download ({written} of {expected} bytes)"),
+                    "incomplete"
+                )
 
+            # Move the verified file into place atomically
+            os.replace(partial_path, output_path)
+            self.partial_meta_path(output_path).unlink(missing_ok=True)
+            with self._hash_lock:
+                self._content_hashes[str(output_path)] = digest.hexdigest()
+            logger.debug(
+                f"Saved {output_path.name} ({resume_from + written} bytes, sha256 {digest.hexdigest()[:12]})"
+            )
             return (True, None, None)
 
         except requests.exceptions.HTTPError as e:
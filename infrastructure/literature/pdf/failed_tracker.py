@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 import json
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Set
 
-from infrastructure.core.exceptions import FileOperationError
+from infrastructure.core.json_store import JsonJournal, write_json_atomic
 from infrastructure.core.logging_utils import get_logger
 from infrastructure.literature.core.core import DownloadResult
 from infrastructure.literature.core.config import LiteratureConfig
@@ -20,6 +22,13 @@ class FailedDownloadTracker:
     Maintains a JSON file with failed download attempts, including
     metadata needed for retry operations. Supports filtering by
     retriable status (network errors, timeouts).
+    
+    The tracker is thread-safe. Mutations are applied in memory and
+    persisted immediately, or once when the outermost ``batch()`` exits
+    (and every ``failed_tracker_flush_every`` mutations inside a batch).
+    With ``config.failed_tracker_journal`` enabled, flushes append to
+    ``failed_downloads.journal.jsonl`` and the JSON file is only rewritten
+    on compaction. Retriable failures are kept in a maintained index.
     """
     
     def __init__(self, config: LiteratureConfig):
@@ -30,11 +39,25 @@ class FailedDownloadTracker:
         """
         self.config = config
         self.tracker_path = Path(config.download_dir).parent / "failed_downloads.json"
+        self.journal = JsonJournal(
+            self.tracker_path.with_suffix(".journal.jsonl"),
+            "failed downloads",
+            config.failed_tracker_compact_every,
+        )
+        self.journal_path = self.journal.path
+        self.use_journal = config.failed_tracker_journal
+        self.flush_every = max(1, config.failed_tracker_flush_every)
         self._failures: Dict[str, Dict[str, Any]] = {}
+        self._retriable: Set[str] = set()
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._dirty = False
+        self._pending: List[Dict[str, Any]] = []
+        self._mutations = 0
         self._load_tracker()
     
     def _load_tracker(self) -> None:
-        """Load failed downloads from disk if tracker exists."""
+        """Load failed downloads from disk (JSON file plus journal) if tracker exists."""
         if self.tracker_path.exists():
             try:
                 with open(self.tracker_path, 'r', encoding='utf-8') as f:
@@ -44,31 +67,117 @@ class FailedDownloadTracker:
             except (json.JSONDecodeError, KeyError, OSError) as e:
                 logger.warning(f"Failed to load failed downloads tracker: {e}")
                 self._failures = {}
+        self._replay_journal()
+        self._retriable = {
+            key for key, data in self._failures.items() if data.get("retriable", False)
+        }
     
-    def _save_tracker(self) -> None:
-        """Save failed downloads to disk."""
+    def _replay_journal(self) -> int:
+        """Apply journal records on top of the loaded failures.
+        
+        Returns:
+            Number of journal records applied.
+        """
+        def apply(record: Dict[str, Any]) -> None:
+            op = record.get("op")
+            if op == "put":
+                self._failures[record["key"]] = record["failure"]
+            elif op == "delete":
+                self._failures.pop(record["key"], None)
+            elif op == "clear":
+                self._failures = {}
+
+        return self.journal.replay(apply)
+    
+    def _record(self, op: str, citation_key: Optional[str] = None) -> None:
+        """Record a mutation and flush unless coalesced inside a batch.
+        
+        Args:
+            op: "put", "delete" or "clear".
+            citation_key: Affected citation key (None for "clear").
+        """
+        if op == "put" and self._failures[citation_key].get("retriable", False):
+            self._retriable.add(citation_key)
+        elif op == "clear":
+            self._retriable.clear()
+        else:
+            self._retriable.discard(citation_key)
+        if self.use_journal:
+            record: Dict[str, Any] = {"op": op}
+            if citation_key is not None:
+                record["key"] = citation_key
+            if op == "put":
+                record["failure"] = self._failures[citation_key]
+            self._pending.append(record)
+        self._dirty = True
+        self._mutations += 1
+        if self._batch_depth == 0 or self._mutations >= self.flush_every:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Persist pending mutations.
+        
+        Without a journal the JSON file is rewritten atomically and any
+        journal left from journal mode is removed. With a journal, pending
+        records are appended and the journal is compacted once it holds
+        ``failed_tracker_compact_every`` records.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            if self.use_journal:
+                self.journal.append(self._pending)
+                self._pending = []
+                if self.journal.needs_compaction:
+                    self.compact()
+            else:
+                # A journal left from journal mode was replayed on load and
+                # is now folded into failed_downloads.json
+                self._save_tracker()
+                self.journal.remove()
+            self._dirty = False
+            self._mutations = 0
+    
+    def compact(self) -> None:
+        """Fold the journal into failed_downloads.json and remove the journal."""
+        with self._lock:
+            self._pending = []
+            self._save_tracker()
+            self.journal.remove()
+            self._dirty = False
+            self._mutations = 0
+    
+    @contextmanager
+    def batch(self) -> Iterator[FailedDownloadTracker]:
+        """Coalesce mutations and flush once when the outermost batch exits.
+        
+        Batches nest; inside a batch the tracker is also flushed every
+        ``failed_tracker_flush_every`` mutations.
+        
+        Example:
+            >>> with tracker.batch():
+            ...     for key, result in failures:
+            ...         tracker.save_failed(key, result)
+        """
+        with self._lock:
+            self._batch_depth += 1
         try:
-            # Ensure directory exists
-            self.tracker_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            data = {
-                "version": "1.0",
-                "updated": datetime.now().isoformat(),
-                "failures": self._failures
-            }
-            
-            # Write atomically (write to temp, then rename)
-            temp_path = self.tracker_path.with_suffix('.tmp')
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            temp_path.replace(self.tracker_path)
-            
-            logger.debug(f"Saved {len(self._failures)} failed downloads to tracker")
-        except OSError as e:
-            raise FileOperationError(
-                f"Failed to save failed downloads tracker: {e}",
-                context={"path": str(self.tracker_path)}
-            )
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.flush()
+    
+    def _save_tracker(self) -> None:
+        """Save failed downloads to disk atomically (temp file + rename)."""
+        data = {
+            "version": "1.0",
+            "updated": datetime.now().isoformat(),
+            "failures": self._failures
+        }
+        write_json_atomic(self.tracker_path, data, "failed downloads tracker", indent=2, ensure_ascii=False)
+        logger.debug(f"Saved {len(self._failures)} failed downloads to tracker")
     
     def save_failed(
         self,
@@ -106,8 +215,9 @@ class FailedDownloadTracker:
             "retriable": download_result.is_retriable
         }
         
-        self._failures[citation_key] = failure_data
-        self._save_tracker()
+        with self._lock:
+            self._failures[citation_key] = failure_data
+            self._record("put", citation_key)
         logger.debug(f"Tracked failed download: {citation_key} ({download_result.failure_reason})")
     
     def load_failed(self) -> Dict[str, Dict[str, Any]]:
@@ -116,7 +226,20 @@ class FailedDownloadTracker:
         Returns:
             Dictionary mapping citation_key to failure data.
         """
-        return self._failures.copy()
+        with self._lock:
+            return self._failures.copy()
+    
+    def get_failure(self, citation_key: str) -> Optional[Dict[str, Any]]:
+        """Get the failure record of one citation key.
+        
+        Args:
+            citation_key: Citation key to look up.
+        
+        Returns:
+            Failure data, or None if not tracked.
+        """
+        with self._lock:
+            return self._failures.get(citation_key)
     
     def get_retriable_failed(self) -> Dict[str, Dict[str, Any]]:
         """Get only retriable failed downloads.
@@ -124,11 +247,8 @@ class FailedDownloadTracker:
         Returns:
             Dictionary of retriable failures (network_error, timeout).
         """
-        return {
-            key: data
-            for key, data in self._failures.items()
-            if data.get("retriable", False)
-        }
+        with self._lock:
+            return {key: self._failures[key] for key in self._retriable}
     
     def clear_failed(self, citation_keys: Optional[List[str]] = None) -> None:
         """Clear failed downloads from tracker.
@@ -137,13 +257,15 @@ class FailedDownloadTracker:
             citation_keys: Optional list of citation keys to clear.
                           If None, clears all failures.
         """
-        if citation_keys is None:
-            self._failures = {}
-        else:
-            for key in citation_keys:
-                self._failures.pop(key, None)
-        
-        self._save_tracker()
+        with self._lock:
+            if citation_keys is None:
+                self._failures = {}
+                self._record("clear")
+            else:
+                with self.batch():
+                    for key in citation_keys:
+                        if self._failures.pop(key, None) is not None:
+                            self._record("delete", key)
         logger.debug(f"Cleared {len(citation_keys) if citation_keys else 'all'} failed downloads")
     
     def remove_successful(self, citation_key: str) -> None:
@@ -152,10 +274,12 @@ class FailedDownloadTracker:
         Args:
             citation_key: Citation key that successfully downloaded.
         """
-        if citation_key in self._failures:
+        with self._lock:
+            if citation_key not in self._failures:
+                return
             del self._failures[citation_key]
-            self._save_tracker()
-            logger.debug(f"Removed successful download from tracker: {citation_key}")
+            self._record("delete", citation_key)
+        logger.debug(f"Removed successful download from tracker: {citation_key}")
     
     def is_failed(self, citation_key: str) -> bool:
         """Check if a citation key has a failed download.
@@ -190,5 +314,5 @@ class FailedDownloadTracker:
         Returns:
             Number of retriable failures.
         """
-        return len(self.get_retriable_failed())
+        return len(self._retriable)
 
@@ -8,12 +8,15 @@ from infrastructure.core.exceptions import FileOperationError, LiteratureSearchE
 from infrastructure.core.logging_utils import get_logger
 from infrastructure.literature.core.config import LiteratureConfig
 from infrastructure.literature.sources import SearchResult
+from infrastructure.literature.sources.http import get_session
 from infrastructure.literature.pdf.fallbacks import (
     transform_pdf_url,
     doi_to_pdf_urls,
     PDFFallbackStrategies,
 )
+from infrastructure.literature.pdf.content_index import PDFContentIndex
 from infrastructure.literature.pdf.downloader import PDFDownloader
+from infrastructure.literature.pdf.strategy_stats import DownloadStrategyStats
 from infrastructure.literature.pdf.extractor import (
     extract_pdf_urls_from_html,
     extract_citations,
@@ -39,6 +42,17 @@ class PDFHandler:
     3. Unpaywall lookup (open access versions)
     4. arXiv title search (find preprint by title)
     5. bioRxiv/medRxiv DOI lookup (find preprint by DOI)
+    
+    With ``learn_download_strategies`` enabled, candidate URLs and the
+    downloader's recovery strategies are reordered by the success rate and
+    latency recorded per host; with ``download_stats_prune_after`` set, hosts
+    that never served a PDF are skipped until they are due for a retry.
+    
+    With ``race_candidate_urls`` enabled, the top candidates are probed
+    concurrently and the first one serving a PDF is downloaded first.
+    
+    With ``pdf_content_index`` enabled, every PDF is indexed by its content
+    hash and duplicates of an already stored paper are hard-linked to it.
     """
 
     def __init__(self, config: LiteratureConfig, library_index: Optional["LibraryIndex"] = None):
@@ -54,6 +68,17 @@ class PDFHandler:
         # Initialize downloader
         self._downloader = PDFDownloader(config)
         
+        # Learned per-host URL and strategy statistics
+        self._strategy_stats: Optional[DownloadStrategyStats] = None
+        if config.learn_download_strategies:
+            self._strategy_stats = DownloadStrategyStats.from_config(config)
+            self._downloader.strategy_stats = self._strategy_stats
+        
+        # Content hashes of stored PDFs (duplicate detection)
+        self._content_index: Optional[PDFContentIndex] = None
+        if config.pdf_content_index:
+            self._content_index = PDFContentIndex.for_config(config)
+        
         # Initialize fallback strategies
         self._fallbacks = PDFFallbackStrategies(config)
         
@@ -164,6 +189,74 @@ class PDFHandler:
             return extract_pdf_urls_from_html(html_content, base_url)
 
     def download_pdf(
+        self,
+        url: Optional[str],
+        filename: Optional[str] = None,
+        result: Optional[SearchResult] = None,
+        record: bool = True
+    ) -> Path:
+        """Download PDF from URL with enhanced retry logic and fallback strategies.
+
+        With ``record`` (the default) the download is recorded with
+        ``record_download`` before returning. With ``record=False`` only the
+        file itself is written; the caller passes the outcome to
+        ``record_download`` later, e.g. on the download pipeline's single
+        writer thread.
+
+        Args:
+            url: URL to download from.
+            filename: Optional filename (default: derived from result or URL).
+            result: Optional SearchResult for citation key naming.
+            record: Record the download in the library, content index and
+                download statistics.
+
+        Returns:
+            Path to downloaded file.
+
+        Raises:
+            LiteratureSearchError: If all download attempts fail.
+        """
+        output_path: Optional[Path] = None
+        try:
+            output_path = self._download_pdf(url, filename, result)
+            return output_path
+        finally:
+            if record:
+                self.record_download(output_path, result)
+
+    def record_download(self, output_path: Optional[Path], result: Optional[SearchResult] = None) -> None:
+        """Record a finished download and save the download stores.
+
+        A stored PDF gets its path set in the library index (when the
+        download was for a SearchResult) and is indexed by content hash.
+        Learned download statistics and the content index are then saved,
+        also after failed downloads.
+
+        Args:
+            output_path: Downloaded file, or None if the download failed.
+            result: SearchResult the file was downloaded for, if any.
+        """
+        if output_path is not None and output_path.suffix == ".pdf":
+            if result and self._library_index:
+                self._library_index.update_pdf_path(output_path.stem, str(output_path))
+            if self._content_index is not None:
+                try:
+                    self._content_index.register(
+                        output_path.stem, output_path, self._downloader.content_hash(output_path)
+                    )
+                except OSError as e:
+                    logger.warning(f"Could not index PDF content of {output_path.name}: {e}")
+        for store, label in (
+            (self._strategy_stats, "download statistics"),
+            (self._content_index, "PDF content index"),
+        ):
+            if store is not None:
+                try:
+                    store.flush()
+                except FileOperationError as e:
+                    logger.warning(f"Could not save {label}: {e}")
+
+    def _download_pdf(
         self,
         url: Optional[str],
         filename: Optional[str] = None,
@@ -207,10 +300,6 @@ class PDFHandler:
 
         if output_path.exists():
             logger.info(f"PDF already exists: {output_path}")
-            # Update library index with path if available
-            if result and self._library_index:
-                citation_key = filename.replace('.pdf', '')
-                self._library_index.update_pdf_path(citation_key, str(output_path))
             return output_path
 
         # Build list of URLs to try (primary + transformed + Unpaywall fallback)
@@ -276,10 +365,21 @@ class PDFHandler:
         # Prioritize URLs based on source
         urls_to_try = self._prioritize_urls_by_source(urls_to_try, source)
         
+        # Reorder by learned per-host success and drop hosts that never work
+        if self._strategy_stats is not None:
+            urls_to_try = self._strategy_stats.rank_urls(urls_to_try)
+        
         # Get appropriate timeout for this source
         download_timeout = self._get_download_timeout(source)
         logger.debug(f"Using timeout {download_timeout}s for source: {source or 'unknown'}")
 
+        # Race the top candidates and download the first real PDF first
+        if self.config.race_candidate_urls and len(urls_to_try) > 1:
+            candidates = urls_to_try[:max(2, self.config.race_candidate_count)]
+            winner = self._downloader.race_candidates(candidates, timeout=download_timeout)
+            if winner:
+                urls_to_try = [winner] + [u for u in urls_to_try if u != winner]
+
         # Try each URL with enhanced retry logic including 403 error recovery
         primary_urls_failed = False
         if urls_to_try:
@@ -299,11 +399,6 @@ class PDFHandler:
                         logger.info(f"Downloaded: {filename} ({file_size:,} bytes) -> {output_path}")
                     except Exception as e:
                         logger.warning(f"Could not get file size for {output_path}: {e}")
-
-                    # Update library index with path
-                    if result and self._library_index:
-                        citation_key = filename.replace('.pdf', '')
-                        self._library_index.update_pdf_path(citation_key, str(output_path))
                     return output_path
                 else:
                     last_error = download_result[1]
@@ -337,10 +432,6 @@ class PDFHandler:
                         logger.info(f"Downloaded via arXiv fallback: {filename} ({file_size:,} bytes)")
                     except Exception:
                         pass
-                    
-                    if result and self._library_index:
-                        citation_key = filename.replace('.pdf', '')
-                        self._library_index.update_pdf_path(citation_key, str(output_path))
                     return output_path
                 else:
                     last_error = download_result[1]
@@ -365,10 +456,6 @@ class PDFHandler:
                         logger.info(f"Downloaded via bioRxiv fallback: {filename} ({file_size:,} bytes)")
                     except Exception:
                         pass
-                    
-                    if result and self._library_index:
-                        citation_key = filename.replace('.pdf', '')
-                        self._library_index.update_pdf_path(citation_key, str(output_path))
                     return output_path
                 else:
                     last_error = download_result[1]
@@ -386,8 +473,7 @@ class PDFHandler:
             # Try URLs in order until we successfully extract HTML text
             for try_url in urls_to_try[:3]:  # Limit to first 3 URLs to avoid excessive requests
                 try:
-                    import requests
-                    response = requests.get(
+                    response = get_session(self.config).get(
                         try_url,
                         timeout=download_timeout,
                         headers={"User-Agent": self._downloader._get_user_agent()},
@@ -10,6 +10,7 @@ from infrastructure.literature.core.config import LiteratureConfig
 from infrastructure.literature.pdf.handler import PDFHandler
 from infrastructure.literature.pdf.html_extractor import HTMLTextExtractor
 from infrastructure.literature.library.index import LibraryIndex
+from infrastructure.literature.sources.http import get_session
 
 logger = get_logger(__name__)
 
@@ -85,8 +86,7 @@ def check_and_re_extract_incomplete_files(
                     if ieee_doc_urls:
                         logger.info(f"Trying IEEE Xplore URL: {ieee_doc_urls[0]}")
                         try:
-                            import requests
-                            response = requests.get(
+                            response = get_session(config).get(
                                 ieee_doc_urls[0],
                                 timeout=config.pdf_download_timeout,
                                 headers={"User-Agent": handler._downloader._get_user_agent()},
@@ -130,8 +130,7 @@ def check_and_re_extract_incomplete_files(
                 if not re_extracted and entry.url:
                     logger.info(f"Trying original URL: {entry.url}")
                     try:
-                        import requests
-                        response = requests.get(
+                        response = get_session(config).get(
                             entry.url,
                             timeout=config.pdf_download_timeout,
                             headers={"User-Agent": handler._downloader._get_user_agent()},
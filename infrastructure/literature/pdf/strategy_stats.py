@@ -0,0 +1,313 @@
+"""Learned download statistics per host and strategy.
+
+Every download attempt made by ``PDFDownloader`` is recorded with its
+host, strategy (standard request, alternate User-Agent, minimal headers,
+HEAD probe, referer spoofing, retry, ...), outcome and latency. The
+statistics are persisted as JSON and used to:
+
+- rank candidate URLs of a paper by their host's success rate and latency
+- try the 403/HTML recovery strategies that work for a host first
+- optionally (``prune_after`` > 0) skip hosts and strategies that have
+  never worked in enough attempts; a pruned host or strategy is tried
+  again once ``retry_pruned_after`` seconds have passed since its last
+  attempt, so hosts that recover are noticed
+
+When the statistics file is first created, the attempts of failed
+downloads already recorded in ``failed_downloads.json`` are imported as
+``imported`` failures. They lower a host's ranking score but never prune
+it: the failure log has no matching successes, so it only shows which
+hosts failed, not which never work.
+"""
+from __future__ import annotations
+
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+from infrastructure.core.json_store import JsonStore
+from infrastructure.core.logging_utils import get_logger
+from infrastructure.literature.core.config import LiteratureConfig
+
+logger = get_logger(__name__)
+
+# Pseudo-strategy holding the totals of a host
+HOST_TOTAL = "*"
+
+# Strategies that are never pruned (the first request decides the recovery path)
+UNPRUNABLE_STRATEGIES = ("standard",)
+
+# Mean latency (seconds) that halves a host's or strategy's score
+LATENCY_SCALE = 20.0
+
+# Seconds after its last attempt before a pruned host or strategy is retried
+DEFAULT_PRUNE_RETRY_SECONDS = 7 * 24 * 3600.0
+
+# Statistics file format; files of another version are rebuilt
+STATS_VERSION = "2.0"
+
+# attempted_urls annotations written by PDFDownloader, mapped to strategies
+_ANNOTATION_STRATEGIES = [
+    (re.compile(r"^retry \d+, agent"), "retry_agent"),
+    (re.compile(r"^retry \d+"), "retry"),
+    (re.compile(r"^User-Agent"), "user_agent"),
+    (re.compile(r"^academic_referer"), "academic_referer"),
+    (re.compile(r"^(minimal|head_ok|referer)$"), None),
+]
+
+
+def strategy_name(attempt_type: str) -> str:
+    """Normalize a downloader attempt type to a strategy name.
+
+    Numbered variants share statistics, e.g. ``transformed_2`` and
+    ``retry_1_agent`` become ``transformed`` and ``retry_agent``.
+
+    Args:
+        attempt_type: Attempt type passed to ``_download_single_attempt``.
+
+    Returns:
+        Strategy name.
+    """
+    return re.sub(r"_\d+", "", attempt_type)
+
+
+def host_of(url: str) -> str:
+    """Lower-cased host of a URL ('' if it has none)."""
+    return (urlparse(url).hostname or "").lower()
+
+
+def parse_attempted_url(entry: str) -> Optional[tuple]:
+    """Split an ``attempted_urls`` entry into (url, strategy).
+
+    Args:
+        entry: Entry such as ``"https://x.org/a.pdf (minimal)"``.
+
+    Returns:
+        Tuple of (url, strategy), or None for entries without a URL.
+    """
+    entry = re.sub(r"^(arXiv title search|bioRxiv/medRxiv DOI lookup): ", "", entry.strip())
+    match = re.match(r"^(\S+)(?: \((.*)\))?$", entry)
+    if not match or not match.group(1).startswith(("http://", "https://")):
+        return None
+    url, annotation = match.group(1), match.group(2)
+    if not annotation:
+        return url, "standard"
+    for pattern, strategy in _ANNOTATION_STRATEGIES:
+        if pattern.match(annotation):
+            return url, strategy or annotation
+    return url, "standard"
+
+
+class DownloadStrategyStats(JsonStore):
+    """Thread-safe, persisted success statistics by host and strategy.
+
+    Attributes:
+        path: JSON file holding the statistics.
+        prune_after: Recorded attempts without any success after which a
+            host or strategy is skipped (0 disables pruning).
+        retry_pruned_after: Seconds after the last attempt before a pruned
+            host or strategy is tried again.
+    """
+
+    SECTION = "hosts"
+    DESCRIPTION = "download statistics"
+    VERSION = STATS_VERSION
+
+    def __init__(
+        self,
+        path: Path,
+        prune_after: int = 0,
+        failures_path: Optional[Path] = None,
+        retry_pruned_after: float = DEFAULT_PRUNE_RETRY_SECONDS
+    ):
+        """Initialize statistics (loaded lazily on first use).
+
+        Args:
+            path: JSON statistics file.
+            prune_after: Attempts without success before pruning (0 disables pruning).
+            failures_path: Optional failed_downloads.json to import.
+            retry_pruned_after: Seconds before a pruned host or strategy is retried.
+        """
+        super().__init__(path)
+        self.prune_after = prune_after
+        self.retry_pruned_after = retry_pruned_after
+        self.failures_path = Path(failures_path) if failures_path else None
+
+    @classmethod
+    def from_config(cls, config: LiteratureConfig) -> DownloadStrategyStats:
+        """Create statistics at the configured location.
+
+        The default file is ``cache/download_stats.json`` next to the
+        download directory; failures are imported from the
+        ``failed_downloads.json`` kept by FailedDownloadTracker there.
+
+        Args:
+            config: Literature configuration.
+
+        Returns:
+            DownloadStrategyStats instance.
+        """
+        data_dir = Path(config.download_dir).parent
+        path = Path(config.download_stats_file) if config.download_stats_file else (
+            data_dir / "cache" / "download_stats.json"
+        )
+        return cls(
+            path,
+            prune_after=config.download_stats_prune_after,
+            failures_path=data_dir / "failed_downloads.json",
+        )
+
+    def _on_load(self, document: Optional[Dict[str, Any]]) -> None:
+        if document is None:
+            self._import_failures()
+        elif document.get("version") != STATS_VERSION:
+            # Older files counted imported failures as attempts
+            logger.info(f"Rebuilding download statistics (format {document.get('version')})")
+            self._import_failures()
+        else:
+            super()._on_load(document)
+
+    def _import_failures(self) -> None:
+        """Count the attempts of previously recorded failed downloads."""
+        if not self.failures_path or not self.failures_path.exists():
+            return
+        try:
+            with open(self.failures_path, "r", encoding="utf-8") as f:
+                failures = json.load(f).get("failures", {})
+        except (json.JSONDecodeError, OSError) as e:
+            logger.debug(f"Could not import failed downloads: {e}")
+            return
+        for failure in failures.values():
+            for entry in failure.get("attempted_urls", []):
+                parsed = parse_attempted_url(entry)
+                if parsed:
+                    self._add(host_of(parsed[0]), parsed[1], False, None, imported=True)
+        if failures:
+            self._dirty = True
+            logger.debug(f"Imported {len(failures)} failed downloads into download statistics")
+
+    def _add(
+        self,
+        host: str,
+        strategy: str,
+        success: bool,
+        seconds: Optional[float],
+        imported: bool = False
+    ) -> None:
+        if not host:
+            return
+        strategies = self._data.setdefault(host, {})
+        for name in (strategy, HOST_TOTAL):
+            stats = strategies.setdefault(name, {"attempts": 0, "successes": 0, "seconds": 0.0})
+            if imported:
+                stats["imported"] = stats.get("imported", 0) + 1
+                continue
+            stats["attempts"] += 1
+            stats["last_attempt"] = time.time()
+            if success:
+                stats["successes"] += 1
+                if seconds is not None:
+                    stats["seconds"] += seconds
+
+    def record(self, url: str, attempt_type: str, success: bool, seconds: Optional[float] = None) -> None:
+        """Record the outcome of one download attempt.
+
+        Args:
+            url: Requested URL.
+            attempt_type: Downloader attempt type (normalized with strategy_name).
+            success: Whether a PDF was saved.
+            seconds: Duration of the attempt (used for successful attempts).
+        """
+        self._ensure_loaded()
+        with self._lock:
+            self._add(host_of(url), strategy_name(attempt_type), success, seconds)
+            self._dirty = True
+
+    def get(self, host: str, strategy: str = HOST_TOTAL) -> Dict[str, float]:
+        """Raw counts for a host (and strategy).
+
+        Returns:
+            Dictionary with attempts, successes and seconds (zeros if
+            unknown), plus ``imported`` failures and the ``last_attempt``
+            timestamp when present.
+        """
+        self._ensure_loaded()
+        with self._lock:
+            stats = self._data.get(host.lower(), {}).get(strategy)
+            return dict(stats) if stats else {"attempts": 0, "successes": 0, "seconds": 0.0}
+
+    def score(self, host: str, strategy: str = HOST_TOTAL) -> float:
+        """Expected usefulness of a host (or host strategy).
+
+        Laplace-smoothed success rate (0.5 with no data) over recorded and
+        imported attempts, discounted by the mean latency of successful
+        attempts.
+        """
+        stats = self.get(host, strategy)
+        rate = (stats["successes"] + 1) / (stats["attempts"] + stats.get("imported", 0) + 2)
+        mean_seconds = stats["seconds"] / stats["successes"] if stats["successes"] else 0.0
+        return rate / (1.0 + mean_seconds / LATENCY_SCALE)
+
+    def is_pruned(self, host: str, strategy: str = HOST_TOTAL) -> bool:
+        """Whether a host (or host strategy) is currently skipped.
+
+        True if pruning is enabled and the recorded attempts (imported
+        failures do not count) reached ``prune_after`` without a success,
+        unless ``retry_pruned_after`` has passed since the last attempt.
+        """
+        if self.prune_after <= 0 or strategy in UNPRUNABLE_STRATEGIES:
+            return False
+        stats = self.get(host, strategy)
+        if stats["attempts"] < self.prune_after or stats["successes"] > 0:
+            return False
+        return time.time() - stats.get("last_attempt", 0.0) < self.retry_pruned_after
+
+    def rank_urls(self, urls: List[str]) -> List[str]:
+        """Order candidate URLs by host score and drop pruned hosts.
+
+        Ties keep the given (rule-based) order. If every URL is pruned the
+        first one is kept so a recovered host can still be noticed.
+
+        Args:
+            urls: Candidate URLs in rule-based order.
+
+        Returns:
+            Ranked URLs.
+        """
+        kept = [u for u in urls if not self.is_pruned(host_of(u))]
+        if urls and not kept:
+            kept = urls[:1]
+        pruned = len(urls) - len(kept)
+        if pruned:
+            logger.debug(f"Skipping {pruned} candidate URL(s) on hosts that recently never served a PDF")
+        return sorted(kept, key=lambda u: -self.score(host_of(u)))
+
+    def rank_strategies(self, url: str, strategies: Iterable[str]) -> List[str]:
+        """Order strategies for a URL's host and drop pruned ones.
+
+        Args:
+            url: URL being downloaded.
+            strategies: Strategy names in default order.
+
+        Returns:
+            Ranked strategy names.
+        """
+        host = host_of(url)
+        kept = [s for s in strategies if not self.is_pruned(host, s)]
+        return sorted(kept, key=lambda s: -self.score(host, s))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Per-host totals (attempts, successes, success rate)."""
+        self._ensure_loaded()
+        with self._lock:
+            summary = {}
+            for host, strategies in self._data.items():
+                total = strategies.get(HOST_TOTAL, {"attempts": 0, "successes": 0})
+                summary[host] = {
+                    "attempts": total["attempts"],
+                    "successes": total["successes"],
+                    "success_rate": total["successes"] / total["attempts"] if total["attempts"] else 0.0,
+                }
+            return summary
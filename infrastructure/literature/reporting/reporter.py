@@ -92,6 +92,7 @@ class LiteratureReporter:
                 "papers_failed_download": workflow_result.papers_failed_download,
                 "papers_already_existed": workflow_result.papers_already_existed,
                 "papers_newly_downloaded": workflow_result.papers_newly_downloaded,
+                "papers_skipped_complete": workflow_result.papers_skipped_complete,
                 "summaries_generated": workflow_result.summaries_generated,
                 "summaries_failed": workflow_result.summaries_failed,
                 "summaries_skipped": workflow_result.summaries_skipped,
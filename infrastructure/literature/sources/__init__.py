@@ -12,6 +12,9 @@ This module provides unified access to various literature databases:
 - DBLP: Computer science bibliography
 
 All sources implement a common interface for searching and retrieving papers.
+Search responses can be cached on disk via SearchResponseCache, and all
+HTTP requests share pooled keep-alive sessions (see ``get_session``)
+throttled by a process-wide per-host token-bucket rate limiter.
 """
 from infrastructure.literature.sources.base import (
     SearchResult,
@@ -19,6 +22,18 @@ from infrastructure.literature.sources.base import (
     normalize_title,
     title_similarity,
 )
+from infrastructure.literature.sources.cache import SearchResponseCache
+from infrastructure.literature.sources.http import (
+    ConnectionStats,
+    get_connection_stats,
+    get_session,
+)
+from infrastructure.literature.sources.ratelimit import (
+    HostRateLimiter,
+    RateLimitStats,
+    TokenBucket,
+    get_rate_limiter,
+)
 from infrastructure.literature.sources.arxiv import ArxivSource
 from infrastructure.literature.sources.semanticscholar import SemanticScholarSource
 from infrastructure.literature.sources.unpaywall import UnpaywallSource, UnpaywallResult
@@ -35,6 +50,14 @@ __all__ = [
     'LiteratureSource',
     'normalize_title',
     'title_similarity',
+    'SearchResponseCache',
+    'ConnectionStats',
+    'get_connection_stats',
+    'get_session',
+    'HostRateLimiter',
+    'RateLimitStats',
+    'TokenBucket',
+    'get_rate_limiter',
     # Source implementations
     'ArxivSource',
     'SemanticScholarSource',
@@ -9,7 +9,6 @@ Provides access to the arXiv preprint repository with:
 from __future__ import annotations
 
 import re
-import requests
 import xml.etree.ElementTree as ET
 from typing import List, Optional
 
@@ -68,12 +67,13 @@ class ArxivSource(LiteratureSource):
         # Check if it's an arXiv PDF URL
         return bool(re.search(r'arxiv\.org/pdf/(?:\d{4}\.\d{4,5}|\w+-\w+/\d{7})(?:\.pdf)?', url))
 
-    def search(self, query: str, limit: int = 10) -> List[SearchResult]:
+    def search(self, query: str, limit: int = 10, use_cache: bool = True) -> List[SearchResult]:
         """Search arXiv with retry logic and rate limiting.
         
         Args:
             query: Search query string.
             limit: Maximum number of results to return.
+            use_cache: Whether to use the response cache (False for health checks).
             
         Returns:
             List of SearchResult objects.
@@ -93,7 +93,7 @@ class ArxivSource(LiteratureSource):
         def _execute_search():
             # Use source-specific timeout if available
             timeout = self.config.source_configs.get("arxiv", {}).get("timeout", self.config.timeout)
-            response = requests.get(
+            response = self.session.get(
                 self.BASE_URL,
                 params=params,
                 timeout=timeout
@@ -106,7 +106,8 @@ class ArxivSource(LiteratureSource):
             _execute_search,
             "search",
             "arxiv",
-            handle_rate_limit=True
+            handle_rate_limit=True,
+            cache_params={"query": query, "limit": limit} if use_cache else None
         )
         
         # Log detailed statistics
@@ -146,14 +147,14 @@ class ArxivSource(LiteratureSource):
                 "max_results": limit
             }
             
-            response = requests.get(self.BASE_URL, params=params, timeout=timeout)
+            response = self.session.get(self.BASE_URL, params=params, timeout=timeout)
             response.raise_for_status()
             results = self._parse_response(response.text)
             
             if not results:
                 # Try broader search without quotes
                 params["search_query"] = f"ti:{clean_title}"
-                response = requests.get(self.BASE_URL, params=params, timeout=timeout)
+                response = self.session.get(self.BASE_URL, params=params, timeout=timeout)
                 response.raise_for_status()
                 results = self._parse_response(response.text)
             
@@ -11,7 +11,8 @@ from __future__ import annotations
 import abc
 import re
 import time
-from typing import List, Optional, Callable, TypeVar, Any, Dict
+from typing import List, Optional, Callable, TypeVar, Any, Dict, TYPE_CHECKING
+from urllib.parse import urlparse
 from dataclasses import dataclass
 
 import requests
@@ -19,6 +20,11 @@ import requests
 from infrastructure.core.exceptions import APIRateLimitError, LiteratureSearchError
 from infrastructure.core.logging_utils import get_logger
 from infrastructure.literature.core.config import LiteratureConfig
+from infrastructure.literature.sources.http import get_session
+from infrastructure.literature.sources.ratelimit import get_rate_limiter
+
+if TYPE_CHECKING:
+    from infrastructure.literature.sources.cache import SearchResponseCache
 
 logger = get_logger(__name__)
 
@@ -48,18 +54,52 @@ class LiteratureSource(abc.ABC):
     - Rate limit handling
     - Error handling and logging
     - Health checks
+    - Optional persistent response cache (set by LiteratureSearch)
+    - Shared pooled HTTP session (keep-alive connections per host)
     """
 
     def __init__(self, config: LiteratureConfig):
         self.config = config
         self._last_request_time: float = 0.0
         self._consecutive_failures: int = 0
+        self.response_cache: Optional[SearchResponseCache] = None
+
+    @property
+    def session(self) -> requests.Session:
+        """Shared pooled HTTP session for this source's requests."""
+        return get_session(self.config)
 
     @abc.abstractmethod
-    def search(self, query: str, limit: int = 10) -> List[SearchResult]:
-        """Search for papers."""
+    def search(self, query: str, limit: int = 10, use_cache: bool = True) -> List[SearchResult]:
+        """Search for papers.
+
+        Implementations pass ``cache_params`` to ``_execute_with_retry`` only
+        when ``use_cache`` is True.
+        """
         pass
 
+    def _apply_source_delay(self, source_name: str) -> None:
+        """Enforce the configured ``<source>_delay`` between requests.
+        
+        With per-host rate limiting enabled the delay becomes the rate of
+        the source's API host in the shared limiter, which the pooled
+        session applies to every request (thread-safe, across instances).
+        Otherwise this instance sleeps until the delay has passed.
+        
+        Args:
+            source_name: Source name used to look up the delay.
+        """
+        source_delay = getattr(self.config, f"{source_name}_delay", None)
+        if not source_delay:
+            return
+        base_url = getattr(self, "BASE_URL", None)
+        if self.config.rate_limit_hosts and base_url:
+            get_rate_limiter().configure(urlparse(base_url).hostname, rate=1.0 / source_delay, burst=1)
+            return
+        elapsed = time.time() - self._last_request_time
+        if elapsed < source_delay:
+            time.sleep(source_delay - elapsed)
+
     def _execute_with_retry(
         self,
         operation: Callable[[], T],
@@ -67,10 +107,16 @@ class LiteratureSource(abc.ABC):
         source_name: str,
         max_retries: Optional[int] = None,
         base_delay: Optional[float] = None,
-        handle_rate_limit: bool = True
+        handle_rate_limit: bool = True,
+        cache_params: Optional[Dict[str, Any]] = None
     ) -> T:
         """Execute an operation with retry logic and exponential backoff.
         
+        When ``cache_params`` is given and a response cache is attached, a
+        fresh cached result is returned without touching the network or the
+        rate limiter, and successful results are stored for later runs. Only
+        operations returning a list of SearchResult objects may be cached.
+        
         Args:
             operation: Function to execute (should raise exceptions on failure).
             operation_name: Name of operation for logging (e.g., "search", "download").
@@ -78,6 +124,8 @@ class LiteratureSource(abc.ABC):
             max_retries: Maximum retry attempts (default: config.retry_attempts).
             base_delay: Base delay for exponential backoff (default: config.retry_delay).
             handle_rate_limit: Whether to handle 429 rate limit errors specially.
+            cache_params: Request parameters (e.g. query and limit) identifying
+                a cacheable response. None disables caching for this call.
             
         Returns:
             Result of the operation.
@@ -86,6 +134,13 @@ class LiteratureSource(abc.ABC):
             APIRateLimitError: If rate limit exceeded after all retries.
             LiteratureSearchError: If operation fails after all retries.
         """
+        cache = self.response_cache if cache_params is not None else None
+        if cache is not None:
+            cached = cache.get(source_name, operation_name, cache_params)
+            if cached is not None:
+                logger.debug(f"{source_name} {operation_name} served from cache ({len(cached)} results)")
+                return cached
+        
         max_retries = max_retries or self.config.retry_attempts
         base_delay = base_delay or self.config.retry_delay
         last_error = None
@@ -99,11 +154,7 @@ class LiteratureSource(abc.ABC):
                     time.sleep(delay)
                 else:
                     # First attempt - use source-specific delay if configured
-                    source_delay = getattr(self.config, f"{source_name}_delay", None)
-                    if source_delay:
-                        elapsed = time.time() - self._last_request_time
-                        if elapsed < source_delay:
-                            time.sleep(source_delay - elapsed)
+                    self._apply_source_delay(source_name)
                     self._last_request_time = time.time()
                 
                 # Execute operation
@@ -111,6 +162,8 @@ class LiteratureSource(abc.ABC):
                 
                 # Reset failure counter on success
                 self._consecutive_failures = 0
+                if cache is not None:
+                    cache.put(source_name, operation_name, cache_params, result)
                 return result
                 
             except requests.exceptions.HTTPError as e:
@@ -186,7 +239,8 @@ class LiteratureSource(abc.ABC):
         """
         try:
             # Simple health check - try a minimal search
-            results = self.search("test", limit=1)
+            # (a cached response says nothing about current availability)
+            results = self.search("test", limit=1, use_cache=False)
             self._consecutive_failures = 0  # Reset on success
             return True
         except Exception as e:
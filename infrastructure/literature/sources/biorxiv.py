@@ -35,7 +35,7 @@ class BiorxivSource(LiteratureSource):
     BASE_URL = "https://api.biorxiv.org"
     TITLE_SIMILARITY_THRESHOLD = 0.7
     
-    def search(self, query: str, limit: int = 10) -> List[SearchResult]:
+    def search(self, query: str, limit: int = 10, use_cache: bool = True) -> List[SearchResult]:
         """Search bioRxiv/medRxiv for papers matching a query.
         
         Note: bioRxiv API doesn't have direct keyword search, so we use
@@ -45,6 +45,7 @@ class BiorxivSource(LiteratureSource):
         Args:
             query: Search query string (keywords).
             limit: Maximum number of results to return.
+            use_cache: Whether to use the response cache (False for health checks).
             
         Returns:
             List of SearchResult objects matching the query.
@@ -77,7 +78,8 @@ class BiorxivSource(LiteratureSource):
             _execute_search,
             "search",
             "biorxiv",
-            handle_rate_limit=True
+            handle_rate_limit=True,
+            cache_params={"query": query, "limit": limit} if use_cache else None
         )
         
         logger.info(f"Found {len(results)} total results from bioRxiv/medRxiv")
@@ -108,7 +110,7 @@ class BiorxivSource(LiteratureSource):
         results = []
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 url,
                 timeout=self.config.timeout,
                 headers={"User-Agent": self.config.user_agent}
@@ -213,7 +215,7 @@ class BiorxivSource(LiteratureSource):
         url = f"{self.BASE_URL}/pub/{server}/{doi}"
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 url,
                 timeout=self.config.timeout,
                 headers={"User-Agent": self.config.user_agent}
@@ -317,7 +319,7 @@ class BiorxivSource(LiteratureSource):
         url = f"{self.BASE_URL}/details/{server}/{start_date}/{end_date}/0"
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 url,
                 timeout=self.config.timeout,
                 headers={"User-Agent": self.config.user_agent}
@@ -0,0 +1,167 @@
+"""Persistent response cache for literature source searches.
+
+Caches normalized search results on disk so that re-running a pipeline with
+the same keywords does not re-query every source. Entries are keyed by
+source, operation and request parameters (query, limit), stored as
+zlib-compressed JSON in a BlobCache (one SQLite file), expire after a
+per-source TTL, and are evicted least-recently-used once the cache exceeds
+its size bound.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from infrastructure.core.blob_cache import BlobCache
+from infrastructure.core.logging_utils import get_logger
+from infrastructure.core.performance import PerformanceMonitor
+from infrastructure.literature.core.config import LiteratureConfig
+from infrastructure.literature.sources.base import SearchResult
+
+logger = get_logger(__name__)
+
+
+class SearchResponseCache(BlobCache):
+    """SQLite-backed cache of source search results.
+
+    The cache is shared by all sources of a LiteratureSearch instance and is
+    safe to use from the parallel search workers. The database file is only
+    created on first use.
+
+    Attributes:
+        path: Path to the SQLite cache file.
+        default_ttl: Default time-to-live for entries in seconds.
+        max_bytes: Maximum total payload size before LRU eviction.
+        refresh: If True, lookups always miss but fresh results are stored.
+        monitor: PerformanceMonitor receiving cache hit/miss counts.
+    """
+
+    DESCRIPTION = "Search cache"
+
+    def __init__(
+        self,
+        path: Path,
+        default_ttl: float = 86400.0,
+        max_bytes: int = 100 * 1024 * 1024,
+        source_ttls: Optional[Dict[str, float]] = None,
+        refresh: bool = False,
+        monitor: Optional[PerformanceMonitor] = None
+    ):
+        """Initialize the response cache.
+
+        Args:
+            path: Path to the SQLite cache file.
+            default_ttl: Default time-to-live for entries in seconds.
+            max_bytes: Maximum total payload size before LRU eviction.
+            source_ttls: Optional per-source TTL overrides in seconds.
+            refresh: Bypass lookups (always miss) while still storing results.
+            monitor: Optional PerformanceMonitor for hit/miss metrics.
+        """
+        super().__init__(path, max_bytes, monitor=monitor)
+        self.default_ttl = default_ttl
+        self.source_ttls = source_ttls or {}
+        self.refresh = refresh
+
+    @classmethod
+    def from_config(
+        cls,
+        config: LiteratureConfig,
+        monitor: Optional[PerformanceMonitor] = None
+    ) -> SearchResponseCache:
+        """Create a cache from literature configuration.
+
+        The cache file defaults to ``cache/search_cache.sqlite`` next to the
+        download directory. Per-source TTLs are read from the ``cache_ttl``
+        key of ``config.source_configs``.
+
+        Args:
+            config: Literature configuration.
+            monitor: Optional PerformanceMonitor for hit/miss metrics.
+
+        Returns:
+            Configured SearchResponseCache.
+        """
+        path = (
+            Path(config.search_cache_file)
+            if config.search_cache_file
+            else Path(config.download_dir).parent / "cache" / "search_cache.sqlite"
+        )
+        source_ttls = {
+            name: float(cfg["cache_ttl"])
+            for name, cfg in config.source_configs.items()
+            if "cache_ttl" in cfg
+        }
+        return cls(
+            path,
+            default_ttl=config.search_cache_ttl,
+            max_bytes=int(config.search_cache_max_mb * 1024 * 1024),
+            source_ttls=source_ttls,
+            refresh=config.refresh_search_cache,
+            monitor=monitor,
+        )
+
+    @staticmethod
+    def make_key(source: str, operation: str, params: Dict[str, Any]) -> str:
+        """Build a stable cache key for a request.
+
+        Args:
+            source: Source name (e.g., "arxiv").
+            operation: Operation name (e.g., "search").
+            params: Request parameters such as query and limit.
+
+        Returns:
+            Hex SHA-256 digest identifying the request.
+        """
+        raw = json.dumps(
+            {"source": source, "operation": operation, "params": params},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, source: str) -> float:
+        """Get the time-to-live for a source in seconds."""
+        return self.source_ttls.get(source, self.default_ttl)
+
+    def get(self, source: str, operation: str, params: Dict[str, Any]) -> Optional[List[SearchResult]]:
+        """Look up cached search results.
+
+        Args:
+            source: Source name.
+            operation: Operation name.
+            params: Request parameters.
+
+        Returns:
+            List of SearchResult objects, or None on a miss (including
+            unreadable or malformed entries).
+        """
+        if self.refresh:
+            self.monitor.record_cache_miss()
+            return None
+        results = self._load(
+            self.make_key(source, operation, params),
+            lambda data: [SearchResult(**record) for record in json.loads(data.decode("utf-8"))],
+            max_age=self.ttl_for(source),
+        )
+        if results is None:
+            return None
+        logger.debug(f"Search cache hit: {source} {operation} {params}")
+        return results
+
+    def put(self, source: str, operation: str, params: Dict[str, Any], results: List[SearchResult]) -> None:
+        """Store search results and evict old entries if over the size bound.
+
+        Args:
+            source: Source name.
+            operation: Operation name.
+            params: Request parameters.
+            results: List of SearchResult objects to cache.
+        """
+        self._store(
+            self.make_key(source, operation, params),
+            json.dumps([asdict(r) for r in results], ensure_ascii=False).encode("utf-8"),
+            label=source,
+        )
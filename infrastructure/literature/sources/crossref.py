@@ -9,7 +9,6 @@ Provides access to CrossRef database with:
 from __future__ import annotations
 
 import re
-import requests
 from typing import List, Dict, Any
 
 from infrastructure.core.logging_utils import get_logger
@@ -23,12 +22,13 @@ class CrossRefSource(LiteratureSource):
 
     BASE_URL = "https://api.crossref.org/works"
 
-    def search(self, query: str, limit: int = 10) -> List[SearchResult]:
+    def search(self, query: str, limit: int = 10, use_cache: bool = True) -> List[SearchResult]:
         """Search CrossRef with retry logic.
         
         Args:
             query: Search query string.
             limit: Maximum number of results to return.
+            use_cache: Whether to use the response cache (False for health checks).
             
         Returns:
             List of SearchResult objects.
@@ -46,7 +46,7 @@ class CrossRefSource(LiteratureSource):
         }
         
         def _execute_search():
-            response = requests.get(
+            response = self.session.get(
                 self.BASE_URL,
                 params=params,
                 timeout=self.config.timeout,
@@ -64,7 +64,8 @@ class CrossRefSource(LiteratureSource):
             _execute_search,
             "search",
             "crossref",
-            handle_rate_limit=True
+            handle_rate_limit=True,
+            cache_params={"query": query, "limit": limit} if use_cache else None
         )
         
         # Log detailed statistics
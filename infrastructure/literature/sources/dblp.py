@@ -7,7 +7,6 @@ Provides access to DBLP (Digital Bibliography & Library Project) with:
 """
 from __future__ import annotations
 
-import requests
 from typing import List, Dict, Any, Optional
 
 from infrastructure.core.logging_utils import get_logger
@@ -21,12 +20,13 @@ class DBLPSource(LiteratureSource):
 
     BASE_URL = "https://dblp.org/search/publ/api"
 
-    def search(self, query: str, limit: int = 10) -> List[SearchResult]:
+    def search(self, query: str, limit: int = 10, use_cache: bool = True) -> List[SearchResult]:
         """Search DBLP with retry logic.
         
         Args:
             query: Search query string.
             limit: Maximum number of results to return.
+            use_cache: Whether to use the response cache (False for health checks).
             
         Returns:
             List of SearchResult objects.
@@ -44,7 +44,7 @@ class DBLPSource(LiteratureSource):
         }
         
         def _execute_search():
-            response = requests.get(
+            response = self.session.get(
                 self.BASE_URL,
                 params=params,
                 timeout=self.config.timeout,
@@ -59,7 +59,8 @@ class DBLPSource(LiteratureSource):
             _execute_search,
             "search",
             "dblp",
-            handle_rate_limit=True
+            handle_rate_limit=True,
+            cache_params={"query": query, "limit": limit} if use_cache else None
         )
         
         # Log detailed statistics
@@ -8,7 +8,6 @@ Provides access to Europe PMC (European PubMed Central) with:
 """
 from __future__ import annotations
 
-import requests
 from typing import List, Dict, Any
 
 from infrastructure.core.logging_utils import get_logger
@@ -22,12 +21,13 @@ class EuropePMCSource(LiteratureSource):
 
     BASE_URL = "https://www.ebi.ac.uk/europepmc/webservices/rest/search"
 
-    def search(self, query: str, limit: int = 10) -> List[SearchResult]:
+    def search(self, query: str, limit: int = 10, use_cache: bool = True) -> List[SearchResult]:
         """Search Europe PMC with retry logic.
         
         Args:
             query: Search query string.
             limit: Maximum number of results to return.
+            use_cache: Whether to use the response cache (False for health checks).
             
         Returns:
             List of SearchResult objects.
@@ -46,7 +46,7 @@ class EuropePMCSource(LiteratureSource):
         }
         
         def _execute_search():
-            response = requests.get(
+            response = self.session.get(
                 self.BASE_URL,
                 params=params,
                 timeout=self.config.timeout,
@@ -61,7 +61,8 @@ class EuropePMCSource(LiteratureSource):
             _execute_search,
             "search",
             "europepmc",
-            handle_rate_limit=True
+            handle_rate_limit=True,
+            cache_params={"query": query, "limit": limit} if use_cache else None
         )
         
         # Log detailed statistics
@@ -0,0 +1,225 @@
+"""Shared pooled HTTP sessions for literature sources and PDF downloads.
+
+All HTTP traffic of the literature module goes through ``get_session``,
+which returns a process-wide ``requests.Session`` with per-host urllib3
+connection pools. Connections are kept alive between requests, so
+repeated calls to the same API or publisher skip the TCP and TLS
+handshakes. Responses are transparently decompressed (gzip/deflate).
+
+Connection reuse is recorded per host from the urllib3 pool counters and
+can be inspected with ``get_connection_stats``. Unless disabled with
+``rate_limit_hosts``, every request first acquires a slot from the
+process-wide per-host rate limiter (see ``ratelimit.py``).
+"""
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from infrastructure.core.logging_utils import get_logger
+from infrastructure.literature.core.config import LiteratureConfig
+from infrastructure.literature.sources.ratelimit import HostRateLimiter, get_rate_limiter
+
+logger = get_logger(__name__)
+
+# Hosts with cached connection pools when no config is given
+DEFAULT_POOL_HOSTS = 32
+
+
+@dataclass
+class ConnectionStats:
+    """Request and connection counts for one host (or a total).
+
+    Attributes:
+        requests: Requests sent (including redirects).
+        connections: New connections opened (each one a TCP/TLS handshake).
+    """
+    requests: int = 0
+    connections: int = 0
+
+    @property
+    def reused(self) -> int:
+        """Requests served on an already open connection."""
+        return max(0, self.requests - self.connections)
+
+    def since(self, earlier: ConnectionStats) -> ConnectionStats:
+        """Counts accumulated after an earlier snapshot."""
+        return ConnectionStats(
+            requests=self.requests - earlier.requests,
+            connections=self.connections - earlier.connections,
+        )
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convert to dictionary."""
+        return {
+            "requests": self.requests,
+            "connections": self.connections,
+            "reused": self.reused,
+        }
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter with per-host rate limiting and connection statistics.
+
+    urllib3 discards the least recently used host pool once more than
+    ``pool_connections`` hosts are cached; its counts are folded into
+    ``retired`` so statistics survive eviction.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int,
+        pool_maxsize: int,
+        rate_limiter: Optional[HostRateLimiter] = None
+    ):
+        self.retired: Dict[str, ConnectionStats] = {}
+        self._retired_lock = threading.Lock()
+        self.rate_limiter = rate_limiter
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+
+    def send(self, request, **kwargs):
+        """Send a request after acquiring a slot for its host."""
+        host = urlparse(request.url).hostname
+        if self.rate_limiter is None or not host:
+            return super().send(request, **kwargs)
+        self.rate_limiter.acquire(host)
+        response = super().send(request, **kwargs)
+        self.rate_limiter.record_response(host, response.status_code, response.headers.get("Retry-After"))
+        return response
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        pools = self.poolmanager.pools
+        dispose = pools.dispose_func
+
+        def _retire(pool):
+            with self._retired_lock:
+                self._add_pool(self.retired, pool)
+            if dispose:
+                dispose(pool)
+
+        pools.dispose_func = _retire
+
+    @staticmethod
+    def _add_pool(stats: Dict[str, ConnectionStats], pool) -> None:
+        """Add one pool's counters to a per-host statistics dict."""
+        host_stats = stats.setdefault(pool.host, ConnectionStats())
+        host_stats.requests += pool.num_requests
+        host_stats.connections += pool.num_connections
+
+    def connection_stats(self) -> Dict[str, ConnectionStats]:
+        """Per-host counts of live and evicted pools."""
+        with self._retired_lock:
+            stats = {
+                host: ConnectionStats(s.requests, s.connections)
+                for host, s in self.retired.items()
+            }
+        pools = self.poolmanager.pools
+        for key in pools.keys():
+            try:
+                pool = pools[key]
+            except KeyError:
+                continue  # Evicted concurrently; already counted as retired
+            self._add_pool(stats, pool)
+        return stats
+
+
+_sessions: Dict[Tuple[int, int, bool], requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def _session_key(config: Optional[LiteratureConfig]) -> Tuple[int, int, bool]:
+    """Host pool count, per-host connection limit and rate limiting flag."""
+    if config is None:
+        return DEFAULT_POOL_HOSTS, 10, True
+    maxsize = config.http_pool_maxsize or max(
+        config.max_parallel_downloads, config.max_parallel_sources
+    )
+    if config.rate_limit_hosts:
+        get_rate_limiter().set_defaults(config.host_rate_limit, config.host_rate_burst)
+    return config.http_pool_hosts, max(1, maxsize), config.rate_limit_hosts
+
+
+def get_session(config: Optional[LiteratureConfig] = None) -> requests.Session:
+    """Get the shared pooled session for a configuration.
+
+    Sessions are shared by all callers with the same pool sizes and are
+    safe to use from the download and search worker threads.
+
+    Args:
+        config: Literature configuration; pool sizes come from
+            ``http_pool_hosts`` and ``http_pool_maxsize`` (default: the
+            larger of max_parallel_downloads and max_parallel_sources), and
+            ``host_rate_limit``/``host_rate_burst`` set the default per-host
+            rate when ``rate_limit_hosts`` is enabled.
+
+    Returns:
+        Shared requests.Session.
+    """
+    key = _session_key(config)
+    session = _sessions.get(key)
+    if session is not None:
+        return session
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            hosts, maxsize, rate_limited = key
+            session = requests.Session()
+            session.headers["Accept-Encoding"] = "gzip, deflate"
+            adapter = PooledHTTPAdapter(
+                hosts, maxsize, rate_limiter=get_rate_limiter() if rate_limited else None
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[key] = session
+            logger.debug(
+                f"Created pooled HTTP session (hosts={hosts}, per-host connections={maxsize}, "
+                f"rate limited={rate_limited})"
+            )
+    return session
+
+
+def get_connection_stats() -> Dict[str, ConnectionStats]:
+    """Per-host connection statistics summed over all shared sessions.
+
+    Returns:
+        Dictionary mapping host names to ConnectionStats.
+    """
+    stats: Dict[str, ConnectionStats] = {}
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+    for session in sessions:
+        adapters = {id(a): a for a in session.adapters.values() if isinstance(a, PooledHTTPAdapter)}
+        for adapter in adapters.values():
+            for host, host_stats in adapter.connection_stats().items():
+                total = stats.setdefault(host, ConnectionStats())
+                total.requests += host_stats.requests
+                total.connections += host_stats.connections
+    return stats
+
+
+def total_connection_stats() -> ConnectionStats:
+    """Connection statistics summed over all hosts.
+
+    Returns:
+        ConnectionStats totals.
+    """
+    total = ConnectionStats()
+    for host_stats in get_connection_stats().values():
+        total.requests += host_stats.requests
+        total.connections += host_stats.connections
+    return total
+
+
+def close_sessions() -> None:
+    """Close all shared sessions and their pooled connections."""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
@@ -22,12 +22,13 @@ class OpenAlexSource(LiteratureSource):
 
     BASE_URL = "https://api.openalex.org/works"
 
-    def search(self, query: str, limit: int = 10) -> List[SearchResult]:
+    def search(self, query: str, limit: int = 10, use_cache: bool = True) -> List[SearchResult]:
         """Search OpenAlex with retry logic.
         
         Args:
             query: Search query string.
             limit: Maximum number of results to return.
+            use_cache: Whether to use the response cache (False for health checks).
             
         Returns:
             List of SearchResult objects.
@@ -46,7 +47,7 @@ class OpenAlexSource(LiteratureSource):
         
         def _execute_search():
             try:
-                response = requests.get(
+                response = self.session.get(
                     self.BASE_URL,
                     params=params,
                     timeout=self.config.timeout,
@@ -78,7 +79,8 @@ class OpenAlexSource(LiteratureSource):
             _execute_search,
             "search",
             "openalex",
-            handle_rate_limit=True
+            handle_rate_limit=True,
+            cache_params={"query": query, "limit": limit} if use_cache else None
         )
         
         # Log detailed statistics
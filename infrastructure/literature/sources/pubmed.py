@@ -10,7 +10,6 @@ Provides access to PubMed database with:
 from __future__ import annotations
 
 import time
-import requests
 import xml.etree.ElementTree as ET
 from typing import List, Optional
 
@@ -26,12 +25,13 @@ class PubMedSource(LiteratureSource):
     BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
     EUTILS_DELAY = 0.34  # ~3 requests/second max (NCBI requirement)
 
-    def search(self, query: str, limit: int = 10) -> List[SearchResult]:
+    def search(self, query: str, limit: int = 10, use_cache: bool = True) -> List[SearchResult]:
         """Search PubMed with retry logic and rate limiting.
         
         Args:
             query: Search query string.
             limit: Maximum number of results to return.
+            use_cache: Whether to use the response cache (False for health checks).
             
         Returns:
             List of SearchResult objects.
@@ -53,7 +53,7 @@ class PubMedSource(LiteratureSource):
             }
             
             search_url = f"{self.BASE_URL}/esearch.fcgi"
-            search_response = requests.get(
+            search_response = self.session.get(
                 search_url,
                 params=search_params,
                 timeout=self.config.timeout,
@@ -82,7 +82,7 @@ class PubMedSource(LiteratureSource):
             }
             
             fetch_url = f"{self.BASE_URL}/efetch.fcgi"
-            fetch_response = requests.get(
+            fetch_response = self.session.get(
                 fetch_url,
                 params=fetch_params,
                 timeout=self.config.timeout,
@@ -97,7 +97,8 @@ class PubMedSource(LiteratureSource):
             _execute_search,
             "search",
             "pubmed",
-            handle_rate_limit=True
+            handle_rate_limit=True,
+            cache_params={"query": query, "limit": limit} if use_cache else None
         )
         
         # Log detailed statistics
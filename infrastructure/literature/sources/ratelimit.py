@@ -0,0 +1,310 @@
+"""Process-wide per-host token-bucket rate limiting.
+
+Every request sent through the shared HTTP session (see ``http.py``)
+acquires a token from the bucket of its host before it is sent, so
+search threads and parallel PDF downloads hitting the same host are
+throttled together while different hosts proceed independently.
+
+Buckets refill at ``rate`` tokens per second up to ``burst`` tokens.
+Tokens may go negative: concurrent callers reserve successive slots and
+sleep outside the lock, so waiting is FIFO and fair. A 429/503 response
+halves the host's rate and, with a Retry-After header, blocks the host
+until that time; successful responses restore the rate gradually.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from infrastructure.core.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Responses that slow a host down
+THROTTLE_STATUS_CODES = (429, 503)
+
+# Lowest rate adaptive slow-down can reach, as a fraction of the base rate
+MIN_RATE_FRACTION = 0.125
+
+# Fraction of the base rate restored per successful response
+RECOVERY_FRACTION = 0.1
+
+# Longest Retry-After honoured, in seconds
+MAX_RETRY_AFTER = 300.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (seconds or HTTP date).
+
+    Args:
+        value: Header value, or None.
+
+    Returns:
+        Seconds to wait (clamped to 0..MAX_RETRY_AFTER), or None if absent
+        or unparseable.
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+@dataclass
+class RateLimitStats:
+    """Rate limiter metrics for one host (or a total).
+
+    Attributes:
+        requests: Tokens acquired.
+        waited: Total seconds spent waiting for tokens.
+        max_wait: Longest single wait in seconds.
+        throttled: Throttling responses (429/503) received.
+        rate: Current rate in requests per second (0 for totals).
+    """
+    requests: int = 0
+    waited: float = 0.0
+    max_wait: float = 0.0
+    throttled: int = 0
+    rate: float = 0.0
+
+    def since(self, earlier: RateLimitStats) -> RateLimitStats:
+        """Counts accumulated after an earlier snapshot."""
+        return RateLimitStats(
+            requests=self.requests - earlier.requests,
+            waited=self.waited - earlier.waited,
+            max_wait=self.max_wait,
+            throttled=self.throttled - earlier.throttled,
+            rate=self.rate,
+        )
+
+    def to_dict(self) -> Dict[str, float]:
+        """Convert to dictionary."""
+        return {
+            "requests": self.requests,
+            "waited": round(self.waited, 3),
+            "max_wait": round(self.max_wait, 3),
+            "throttled": self.throttled,
+            "rate": round(self.rate, 3),
+        }
+
+
+class TokenBucket:
+    """Thread-safe token bucket with adaptive slow-down.
+
+    Attributes:
+        base_rate: Configured rate in tokens per second.
+        rate: Current (possibly reduced) rate.
+        burst: Bucket capacity.
+        stats: Wait and throttling metrics.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens per second (must be positive).
+            burst: Maximum tokens available at once.
+        """
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.stats = RateLimitStats(rate=rate)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token, returning how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = max(0.0, -self._tokens / self.rate, self._blocked_until - now)
+            self.stats.requests += 1
+            self.stats.waited += wait
+            self.stats.max_wait = max(self.stats.max_wait, wait)
+            return wait
+
+    def acquire(self) -> float:
+        """Take a token, sleeping until it is available.
+
+        Returns:
+            Seconds waited.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def reconfigure(self, rate: float, burst: int) -> None:
+        """Change the base rate and burst size."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.base_rate = self.rate = rate
+            self.burst = max(1, burst)
+            self._tokens = min(self._tokens, self.burst)
+            self.stats.rate = rate
+
+    def throttle(self, retry_after: Optional[float] = None) -> None:
+        """Slow down after a throttling response.
+
+        Args:
+            retry_after: Seconds the server asked to wait, if given.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.base_rate * MIN_RATE_FRACTION, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+            self.stats.throttled += 1
+            self.stats.rate = self.rate
+
+    def recover(self) -> None:
+        """Restore part of the base rate after a successful response."""
+        if self.rate >= self.base_rate:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.base_rate, self.rate + self.base_rate * RECOVERY_FRACTION)
+            self.stats.rate = self.rate
+
+
+class HostRateLimiter:
+    """Registry of per-host token buckets.
+
+    Hosts without an explicit configuration get a bucket with the
+    default rate and burst.
+    """
+
+    def __init__(self, default_rate: float = 2.0, default_burst: int = 4):
+        """Initialize an empty registry.
+
+        Args:
+            default_rate: Requests per second for unconfigured hosts.
+            default_burst: Burst size for unconfigured hosts.
+        """
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._configured: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def set_defaults(self, rate: float, burst: int) -> None:
+        """Change the rate and burst of unconfigured hosts.
+
+        Existing buckets of unconfigured hosts are updated as well.
+        """
+        with self._lock:
+            self.default_rate = rate
+            self.default_burst = burst
+            buckets = [b for h, b in self._buckets.items() if h not in self._configured]
+        for bucket in buckets:
+            if (bucket.base_rate, bucket.burst) != (rate, max(1, burst)):
+                bucket.reconfigure(rate, burst)
+
+    def configure(self, host: str, rate: float, burst: int = 1) -> None:
+        """Set an explicit rate for a host (e.g. a source's API delay).
+
+        Args:
+            host: Host name.
+            rate: Requests per second.
+            burst: Burst size.
+        """
+        host = host.lower()
+        with self._lock:
+            if self._configured.get(host) == (rate, burst):
+                return
+            self._configured[host] = (rate, burst)
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                self._buckets[host] = TokenBucket(rate, burst)
+                return
+        bucket.reconfigure(rate, burst)
+
+    def bucket(self, host: str) -> TokenBucket:
+        """Get (creating if needed) the bucket of a host."""
+        host = host.lower()
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(host)
+                if bucket is None:
+                    bucket = TokenBucket(self.default_rate, self.default_burst)
+                    self._buckets[host] = bucket
+        return bucket
+
+    def acquire(self, host: str) -> float:
+        """Wait for a request slot on a host.
+
+        Args:
+            host: Host name.
+
+        Returns:
+            Seconds waited.
+        """
+        wait = self.bucket(host).acquire()
+        if wait >= 1.0:
+            logger.debug(f"Rate limiter: waited {wait:.1f}s for {host}")
+        return wait
+
+    def record_response(self, host: str, status_code: int, retry_after: Optional[str] = None) -> None:
+        """Adapt a host's rate to a response.
+
+        Args:
+            host: Host name.
+            status_code: HTTP status code.
+            retry_after: Retry-After header value, if any.
+        """
+        bucket = self.bucket(host)
+        if status_code in THROTTLE_STATUS_CODES:
+            seconds = parse_retry_after(retry_after)
+            bucket.throttle(seconds)
+            logger.debug(
+                f"Rate limiter: {host} returned {status_code}, rate now {bucket.rate:.2f}/s"
+                + (f", blocked for {seconds:.1f}s" if seconds else "")
+            )
+        elif status_code < 400:
+            bucket.recover()
+
+    def get_stats(self) -> Dict[str, RateLimitStats]:
+        """Per-host metrics.
+
+        Returns:
+            Dictionary mapping host names to RateLimitStats copies.
+        """
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {host: RateLimitStats(**vars(b.stats)) for host, b in buckets.items()}
+
+    def total_stats(self) -> RateLimitStats:
+        """Metrics summed over all hosts."""
+        total = RateLimitStats()
+        for stats in self.get_stats().values():
+            total.requests += stats.requests
+            total.waited += stats.waited
+            total.max_wait = max(total.max_wait, stats.max_wait)
+            total.throttled += stats.throttled
+        return total
+
+
+_rate_limiter = HostRateLimiter()
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """Get the process-wide host rate limiter."""
+    return _rate_limiter
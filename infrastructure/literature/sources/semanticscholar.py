@@ -8,7 +8,6 @@ Provides access to Semantic Scholar's comprehensive academic database with:
 """
 from __future__ import annotations
 
-import requests
 from typing import List, Dict, Any
 
 from infrastructure.core.logging_utils import get_logger
@@ -22,7 +21,7 @@ class SemanticScholarSource(LiteratureSource):
 
     BASE_URL = "https://api.semanticscholar.org/graph/v1/paper/search"
 
-    def search(self, query: str, limit: int = 10) -> List[SearchResult]:
+    def search(self, query: str, limit: int = 10, use_cache: bool = True) -> List[SearchResult]:
         """Search Semantic Scholar with retry on rate limit.
         
         Uses the standardized retry logic from the base class for consistent
@@ -31,6 +30,7 @@ class SemanticScholarSource(LiteratureSource):
         Args:
             query: Search query string.
             limit: Maximum number of results to return.
+            use_cache: Whether to use the response cache (False for health checks).
             
         Returns:
             List of SearchResult objects.
@@ -52,7 +52,7 @@ class SemanticScholarSource(LiteratureSource):
         }
         
         def _execute_search():
-            response = requests.get(
+            response = self.session.get(
                 self.BASE_URL,
                 params=params,
                 headers=headers,
@@ -68,7 +68,8 @@ class SemanticScholarSource(LiteratureSource):
             _execute_search,
             "search",
             "semanticscholar",
-            handle_rate_limit=True
+            handle_rate_limit=True,
+            cache_params={"query": query, "limit": limit} if use_cache else None
         )
         
         # Log detailed statistics
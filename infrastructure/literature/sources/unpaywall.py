@@ -11,11 +11,14 @@ from __future__ import annotations
 import time
 import requests
 from typing import Dict, Any, Optional
+from urllib.parse import urlparse
 from dataclasses import dataclass
 
 from infrastructure.core.exceptions import APIRateLimitError
 from infrastructure.core.logging_utils import get_logger
 from infrastructure.literature.core.config import LiteratureConfig
+from infrastructure.literature.sources.http import get_session
+from infrastructure.literature.sources.ratelimit import get_rate_limiter
 
 logger = get_logger(__name__)
 
@@ -92,7 +95,15 @@ class UnpaywallSource:
         return bool(re.match(email_pattern, email))
 
     def _rate_limit_delay(self):
-        """Enforce rate limiting between requests."""
+        """Enforce rate limiting between requests.
+
+        With per-host rate limiting enabled the minimum delay is applied by
+        the shared limiter for the Unpaywall API host instead.
+        """
+        if self.config.rate_limit_hosts:
+            get_rate_limiter().configure(urlparse(self.BASE_URL).hostname, rate=1.0 / self._min_delay, burst=1)
+            self._last_request_time = time.time()
+            return
         elapsed = time.time() - self._last_request_time
         if elapsed < self._min_delay:
             delay = self._min_delay - elapsed
@@ -154,7 +165,7 @@ class UnpaywallSource:
                     time.sleep(delay)
 
                 logger.debug(f"Querying Unpaywall for DOI: {clean_doi} (attempt {attempt + 1})")
-                response = requests.get(
+                response = get_session(self.config).get(
                     url,
                     params=params,
                     timeout=self.config.timeout,
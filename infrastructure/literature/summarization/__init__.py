@@ -12,6 +12,7 @@ Classes:
     SummarizationContext: Structured context (internal use)
     ValidationResult: Result of summary validation
     run_summarize: Orchestrator function for summarization workflow
+    BuildPlanner: Computes stale extraction and summary work across the library
 
 The module implements a multi-stage approach:
 1. PDF text extraction with section prioritization
@@ -37,6 +38,7 @@ from infrastructure.literature.summarization.orchestrator import (
     find_papers_needing_extraction,
     get_library_analysis,
 )
+from infrastructure.literature.summarization.planner import BuildPlan, BuildPlanner, PaperPlan
 from infrastructure.literature.summarization.streaming import stream_with_progress
 
 # Backward compatibility aliases
@@ -59,6 +61,10 @@ __all__ = [
     "find_papers_needing_summary",
     "find_papers_needing_extraction",
     "get_library_analysis",
+    # Planning
+    "BuildPlanner",
+    "BuildPlan",
+    "PaperPlan",
     # Streaming
     "stream_with_progress",
 ]
@@ -0,0 +1,155 @@
+"""Concurrent map phase for chunked LLM processing.
+
+Long papers are split by PDFChunker and every chunk is sent to the LLM
+with its own prompt before the results are combined. The chunk prompts
+are independent, so ``map_chunks`` dispatches them from a thread pool
+with at most ``max_in_flight`` requests outstanding:
+
+- results are returned in chunk order, whatever order they complete in,
+  so the reduce step sees the same sequence as a sequential loop
+- a chunk that raises or returns an empty result is failed; only failed
+  chunks are dispatched again, up to ``retries`` more times
+- callers run each chunk in a fresh ``LLMClient.conversation()``;
+  contexts are per-thread, so chunks never see each other's messages
+
+A long paper then takes roughly the time of its slowest chunk plus the
+combine call, provided the server runs requests in parallel. Stock Ollama
+serves one request at a time (OLLAMA_NUM_PARALLEL=1) and queued requests
+count against the client timeout, so concurrency is opt-in: the default
+is 1, and MAX_PARALLEL_SUMMARIES x LITERATURE_CHUNK_CONCURRENCY should
+not exceed the server's OLLAMA_NUM_PARALLEL.
+"""
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Generic, List, Optional, Sequence, TypeVar
+
+from infrastructure.core.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_CHUNK_CONCURRENCY = 1
+DEFAULT_CHUNK_RETRIES = 1
+
+
+def chunk_concurrency_from_env() -> int:
+    """Read the in-flight chunk limit from LITERATURE_CHUNK_CONCURRENCY."""
+    try:
+        return max(1, int(os.environ.get("LITERATURE_CHUNK_CONCURRENCY", DEFAULT_CHUNK_CONCURRENCY)))
+    except ValueError:
+        return DEFAULT_CHUNK_CONCURRENCY
+
+
+def chunk_retries_from_env() -> int:
+    """Read the per-chunk retry count from LITERATURE_CHUNK_RETRIES."""
+    try:
+        return max(0, int(os.environ.get("LITERATURE_CHUNK_RETRIES", DEFAULT_CHUNK_RETRIES)))
+    except ValueError:
+        return DEFAULT_CHUNK_RETRIES
+
+
+@dataclass
+class ChunkMapResult(Generic[R]):
+    """Outcome of a chunk map phase.
+
+    Attributes:
+        results: Result of each chunk in chunk order (None if it failed).
+        errors: Last error message of each failed chunk, by chunk index.
+        attempts: Number of dispatches of each chunk, by chunk index.
+        elapsed: Wall-clock time of the whole phase in seconds.
+    """
+    results: List[Optional[R]]
+    errors: Dict[int, str] = field(default_factory=dict)
+    attempts: Dict[int, int] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def successful(self) -> List[R]:
+        """Results of the successful chunks, in chunk order."""
+        return [r for r in self.results if r is not None]
+
+    @property
+    def failed(self) -> List[int]:
+        """Indices of the chunks that failed every attempt."""
+        return sorted(self.errors)
+
+
+def _is_empty(result: object) -> bool:
+    return result is None or (isinstance(result, str) and not result.strip())
+
+
+def map_chunks(
+    fn: Callable[[int, T], R],
+    chunks: Sequence[T],
+    max_in_flight: int = DEFAULT_CHUNK_CONCURRENCY,
+    retries: int = DEFAULT_CHUNK_RETRIES,
+    on_result: Optional[Callable[[int, Optional[R], Optional[str]], None]] = None,
+    label: str = "chunk"
+) -> ChunkMapResult[R]:
+    """Apply ``fn`` to every chunk with bounded concurrency.
+
+    Args:
+        fn: Called as ``fn(index, chunk)``; returns the chunk's result.
+            Raising, or returning None or blank text, fails the chunk.
+        chunks: Chunks to process.
+        max_in_flight: Maximum chunks processed at once (1 runs them
+            sequentially in the calling thread).
+        retries: Additional attempts for chunks that failed.
+        on_result: Optional callback ``(index, result, error)`` invoked in
+            the calling thread as each attempt completes.
+        label: Name used in log messages (e.g. "[key] chunk").
+
+    Returns:
+        ChunkMapResult with results in chunk order.
+    """
+    start = time.time()
+    outcome: ChunkMapResult[R] = ChunkMapResult(results=[None] * len(chunks))
+    pending = list(range(len(chunks)))
+
+    def run(index: int) -> R:
+        return fn(index, chunks[index])
+
+    def settle(index: int, result: Optional[R], error: Optional[str]) -> None:
+        outcome.attempts[index] = outcome.attempts.get(index, 0) + 1
+        if error is None and _is_empty(result):
+            error = "empty result"
+        if error is None:
+            outcome.results[index] = result
+            outcome.errors.pop(index, None)
+        else:
+            outcome.errors[index] = error
+            logger.warning(f"{label} {index + 1} failed (attempt {outcome.attempts[index]}): {error}")
+        if on_result is not None:
+            on_result(index, outcome.results[index], error)
+
+    for attempt in range(retries + 1):
+        if not pending:
+            break
+        if attempt:
+            logger.info(f"Retrying {len(pending)} failed {label}(s): {[i + 1 for i in pending]}")
+        workers = min(max(1, max_in_flight), len(pending))
+        if workers == 1:
+            for index in pending:
+                try:
+                    settle(index, run(index), None)
+                except Exception as e:
+                    settle(index, None, str(e))
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="chunk-map") as executor:
+                futures = {executor.submit(run, index): index for index in pending}
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        settle(index, future.result(), None)
+                    except Exception as e:
+                        settle(index, None, str(e))
+        pending = outcome.failed
+
+    outcome.elapsed = time.time() - start
+    return outcome
@@ -0,0 +1,257 @@
+"""Single-pass structured extraction of claims, methods and classification.
+
+By default ``SummarizationEngine.summarize_paper`` runs separate
+full-text passes for claims/quotes, methods/tools and classification,
+re-sending the whole paper each time. In combined mode
+(``LITERATURE_COMBINED_EXTRACTION=true``) one ``query_structured`` call
+returns all three as JSON matching ``COMBINED_EXTRACTION_SCHEMA``.
+
+Each field is validated on its own by ``parse_combined_extraction``:
+
+- claims/quotes: at least one claim and at least one quote found
+  verbatim (ignoring whitespace and case) in the paper text; unverified
+  quotes are dropped
+- methods/tools: all five sections present as lists; items whose
+  evidence does not appear in the paper text are dropped
+- classification: same rules as the classification pass
+
+Valid fields are rendered to the markdown the per-task passes produce,
+so saved files look the same either way. Fields that fail validation are
+left as None and the engine runs their per-task pass instead.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from infrastructure.literature.summarization.models import PaperClassification
+
+CATEGORIES = ("core_theory_math", "translation_tool", "applied")
+
+# Fields of a combined extraction, each with its own per-task fallback pass
+FIELDS = ("claims_quotes", "methods_tools", "classification")
+
+# (JSON key, markdown heading) of each methods/tools section, in output order
+METHODS_SECTIONS: Tuple[Tuple[str, str], ...] = (
+    ("algorithms", "Algorithms and Methodologies"),
+    ("frameworks", "Software Frameworks and Libraries"),
+    ("datasets", "Datasets"),
+    ("metrics", "Evaluation Metrics"),
+    ("tools", "Software Tools and Platforms"),
+)
+
+_ITEM_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {"name": {"type": "string"}, "evidence": {"type": "string"}},
+        "required": ["name", "evidence"],
+    },
+}
+
+COMBINED_EXTRACTION_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "claims": {"type": "array", "items": {"type": "string"}},
+        "quotes": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "text": {"type": "string"},
+                    "context": {"type": "string"},
+                    "significance": {"type": "string"},
+                },
+                "required": ["text"],
+            },
+        },
+        "methods": {
+            "type": "object",
+            "properties": {key: _ITEM_SCHEMA for key, _ in METHODS_SECTIONS},
+            "required": [key for key, _ in METHODS_SECTIONS],
+        },
+        "classification": {
+            "type": "object",
+            "properties": {
+                "category": {"type": "string", "enum": list(CATEGORIES)},
+                "domain": {"type": ["string", "null"]},
+                "confidence": {"type": "number", "minimum": 0.0, "maximum": 1.0},
+                "reasoning": {"type": ["string", "null"]},
+            },
+            "required": ["category", "confidence"],
+        },
+    },
+    "required": ["claims", "quotes", "methods", "classification"],
+}
+
+
+@dataclass
+class CombinedExtraction:
+    """Validated fields of a combined extraction response.
+
+    Attributes:
+        claims_quotes_text: Claims and quotes markdown, or None if invalid.
+        methods_tools_text: Methods and tools markdown, or None if invalid.
+        classification: Paper classification, or None if invalid.
+        errors: Validation error of each invalid field, by field name.
+    """
+    claims_quotes_text: Optional[str] = None
+    methods_tools_text: Optional[str] = None
+    classification: Optional[PaperClassification] = None
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether every field passed validation."""
+        return not self.errors
+
+
+def _squash(text: str) -> str:
+    """Lowercase text with all whitespace removed, for verbatim checks."""
+    return re.sub(r"\s+", "", text.lower())
+
+
+def _clean(value: Any) -> str:
+    return value.strip() if isinstance(value, str) else ""
+
+
+def parse_claims_quotes(data: Dict[str, Any], source: str) -> str:
+    """Validate and render the claims and quotes fields.
+
+    Args:
+        data: Parsed combined extraction response.
+        source: Paper text squashed with ``_squash``.
+
+    Returns:
+        Markdown with "Key Claims and Hypotheses" and "Important Quotes".
+
+    Raises:
+        ValueError: If there are no claims or no verifiable quotes.
+    """
+    claims = [_clean(c) for c in data.get("claims") or [] if _clean(c)]
+    if not claims:
+        raise ValueError("no claims")
+    # Keep only quotes that appear verbatim in the paper, once each
+    quotes: Dict[str, Dict[str, Any]] = {}
+    for quote in data.get("quotes") or []:
+        text = _clean(quote.get("text")).strip('"') if isinstance(quote, dict) else ""
+        if text and _squash(text) in source:
+            quotes.setdefault(_squash(text), {**quote, "text": text})
+    if not quotes:
+        raise ValueError("no quotes found verbatim in the paper")
+
+    lines = ["## Key Claims and Hypotheses", ""]
+    lines.extend(f"- {claim}" for claim in dict.fromkeys(claims))
+    lines.extend(["", "## Important Quotes", ""])
+    for quote in quotes.values():
+        text = quote["text"]
+        lines.append(f'**Quote:** "{text}"')
+        if _clean(quote.get("context")):
+            lines.append(f"**Context:** {_clean(quote['context'])}")
+        if _clean(quote.get("significance")):
+            lines.append(f"**Significance:** {_clean(quote['significance'])}")
+        lines.append("")
+    return "\n".join(lines).strip()
+
+
+def parse_methods_tools(data: Dict[str, Any], source: str) -> str:
+    """Validate and render the methods and tools fields.
+
+    Args:
+        data: Parsed combined extraction response.
+        source: Paper text squashed with ``_squash``.
+
+    Returns:
+        Markdown with one section per entry of METHODS_SECTIONS.
+
+    Raises:
+        ValueError: If the methods object or one of its sections is missing.
+    """
+    methods = data.get("methods")
+    if not isinstance(methods, dict):
+        raise ValueError("missing methods object")
+
+    lines: List[str] = []
+    for key, heading in METHODS_SECTIONS:
+        items = methods.get(key)
+        if not isinstance(items, list):
+            raise ValueError(f"missing methods section '{key}'")
+        lines.extend([f"## {heading}", ""])
+        found = [
+            (_clean(item.get("name")), _clean(item.get("evidence")).strip('"'))
+            for item in items
+            if isinstance(item, dict) and _clean(item.get("name"))
+        ]
+        # Only keep items the paper explicitly mentions
+        found = [(name, evidence) for name, evidence in found if evidence and _squash(evidence) in source]
+        if found:
+            lines.extend(f'*   {name} (exact quote from paper) – "{evidence}"' for name, evidence in found)
+        else:
+            lines.append("Not specified in paper")
+        lines.append("")
+    return "\n".join(lines).strip()
+
+
+def parse_classification(data: Dict[str, Any]) -> PaperClassification:
+    """Validate the classification field.
+
+    Args:
+        data: Parsed combined extraction response.
+
+    Returns:
+        PaperClassification (an out-of-range confidence becomes 0.0).
+
+    Raises:
+        ValueError: If the category is invalid or an applied paper has no domain.
+    """
+    classification = data.get("classification")
+    if not isinstance(classification, dict):
+        raise ValueError("missing classification object")
+    category = classification.get("category")
+    if category not in CATEGORIES:
+        raise ValueError(f"invalid category: {category}")
+    domain = classification.get("domain") or None
+    if category == "applied" and not domain:
+        raise ValueError("applied paper missing domain")
+    confidence = classification.get("confidence", 0.0)
+    if not isinstance(confidence, (int, float)) or not 0.0 <= confidence <= 1.0:
+        confidence = 0.0
+    return PaperClassification(
+        category=category,
+        domain=domain,
+        confidence=float(confidence),
+        reasoning=classification.get("reasoning"),
+    )
+
+
+def parse_combined_extraction(data: Any, pdf_text: str) -> CombinedExtraction:
+    """Validate each field of a combined extraction response.
+
+    Args:
+        data: Parsed JSON response of the combined extraction prompt.
+        pdf_text: Paper text the response was generated from.
+
+    Returns:
+        CombinedExtraction with the valid fields set and the errors of the
+        invalid ones.
+    """
+    extraction = CombinedExtraction()
+    if not isinstance(data, dict):
+        extraction.errors = {name: "response is not a JSON object" for name in FIELDS}
+        return extraction
+
+    source = _squash(pdf_text)
+    try:
+        extraction.claims_quotes_text = parse_claims_quotes(data, source)
+    except ValueError as e:
+        extraction.errors["claims_quotes"] = str(e)
+    try:
+        extraction.methods_tools_text = parse_methods_tools(data, source)
+    except ValueError as e:
+        extraction.errors["methods_tools"] = str(e)
+    try:
+        extraction.classification = parse_classification(data)
+    except ValueError as e:
+        extraction.errors["classification"] = str(e)
+    return extraction
@@ -6,6 +6,7 @@ the complete multi-stage summarization workflow.
 from __future__ import annotations
 
 import re
+import threading
 import time
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
@@ -14,6 +15,7 @@ from infrastructure.core.logging_utils import get_logger
 from infrastructure.core.exceptions import LLMConnectionError, FileOperationError, ContextLimitError
 from infrastructure.literature.sources import SearchResult
 from infrastructure.validation.pdf_validator import extract_text_from_pdf, PDFValidationError
+from infrastructure.llm.core.session import LLMSession
 
 from infrastructure.literature.summarization.models import SummarizationResult, SummarizationProgressEvent
 from infrastructure.literature.summarization.context_extractor import ContextExtractor
@@ -22,15 +24,32 @@ from infrastructure.literature.summarization.multi_stage_summarizer import Multi
 from infrastructure.literature.summarization.validator import SummaryQualityValidator
 from infrastructure.literature.summarization.pdf_processor import PDFProcessor, PrioritizedPDFText
 from infrastructure.literature.summarization.extractor import TextExtractor
+from infrastructure.literature.summarization.summary_manifest import SummaryManifest
 from infrastructure.literature.summarization.utils import detect_model_size
-from infrastructure.literature.summarization.chunker import PDFChunker
+from infrastructure.literature.summarization.chunker import ChunkingResult, PDFChunker
+from infrastructure.literature.summarization.chunk_map import ChunkMapResult, map_chunks
+from infrastructure.literature.summarization.combined_extraction import (
+    COMBINED_EXTRACTION_SCHEMA,
+    FIELDS as COMBINED_FIELDS,
+    CombinedExtraction,
+    parse_combined_extraction,
+)
 
 if TYPE_CHECKING:
     from infrastructure.llm.core.client import LLMClient
+    from infrastructure.llm.core.config import GenerationOptions
 
 logger = get_logger(__name__)
 
 
+# Files written by SummarizationEngine.save_summary: (file suffix, title suffix)
+SUMMARY_FILES = (
+    ("_summary.md", ""),
+    ("_claims_quotes.md", " - Key Claims and Quotes"),
+    ("_methods_tools.md", " - Methods and Tools Analysis"),
+)
+
+
 class SummarizationEngine:
     """Main interface for paper summarization with multi-stage generation.
 
@@ -57,7 +76,8 @@ class SummarizationEngine:
         quality_validator: Optional[SummaryQualityValidator] = None,
         context_extractor: Optional[ContextExtractor] = None,
         prompt_builder: Optional[SummarizationPromptBuilder] = None,
-        max_pdf_chars: Optional[int] = None
+        max_pdf_chars: Optional[int] = None,
+        combined_extraction: Optional[bool] = None
     ):
         """Initialize summarization engine.
 
@@ -68,6 +88,9 @@ class SummarizationEngine:
             prompt_builder: Prompt builder instance (created if None).
             max_pdf_chars: Maximum PDF characters to send to LLM.
                           Defaults to 200000 (200K) or LLM_MAX_INPUT_LENGTH env var.
+            combined_extraction: Extract claims/quotes, methods/tools and
+                          classification in one structured query. Defaults to
+                          LITERATURE_COMBINED_EXTRACTION env var (false).
         """
         import os
         
@@ -77,7 +100,8 @@ class SummarizationEngine:
         self.prompt_builder = prompt_builder or SummarizationPromptBuilder(llm_client=llm_client)
         self.pdf_processor = PDFProcessor()
         self.text_extractor = TextExtractor()
-        self._last_ref_info: Optional[Dict[str, Any]] = None  # Store ref_info for metadata
+        # Per-thread state, so worker threads can share one engine
+        self._local = threading.local()
         
         # Get max_pdf_chars from parameter, environment variable, or model-aware default
         if max_pdf_chars is not None:
@@ -92,6 +116,10 @@ class SummarizationEngine:
             else:
                 self.max_pdf_chars = self._get_model_aware_limit()
         
+        if combined_extraction is None:
+            combined_extraction = os.getenv('LITERATURE_COMBINED_EXTRACTION', 'false').lower() in ('true', '1', 'yes')
+        self.combined_extraction = combined_extraction
+        
         # Create multi-stage summarizer (with two-stage support)
         self.multi_stage_summarizer = MultiStageSummarizer(
             llm_client=llm_client,
@@ -104,6 +132,15 @@ class SummarizationEngine:
             two_stage_threshold=None  # Auto-detect from env
         )
 
+    @property
+    def _last_ref_info(self) -> Optional[Dict[str, Any]]:
+        """Reference info of the calling thread's last summary (for metadata)."""
+        return getattr(self._local, "last_ref_info", None)
+
+    @_last_ref_info.setter
+    def _last_ref_info(self, ref_info: Optional[Dict[str, Any]]) -> None:
+        self._local.last_ref_info = ref_info
+
     def summarize_paper(
         self,
         result: SearchResult,
@@ -141,13 +178,55 @@ class SummarizationEngine:
             - Metadata: input/output sizes, generation time, attempts
             
         Note:
+            All LLM requests for the paper run in one ``LLMClient.session()``:
+            the model stays loaded between stages, whose prompts share the
+            paper prefix, and per-stage prompt metrics are logged at the end.
             Summaries are always saved with validation metadata, allowing review
             of rejected summaries. Use save_summary() to persist to disk.
         """
+        with self.llm_client.session() as session:
+            summary_result = self._summarize_paper(result, pdf_path, max_retries, progress_callback)
+        self._log_session(pdf_path.stem, session)
+        return summary_result
+
+    def _log_session(self, citation_key: str, session: LLMSession) -> None:
+        """Log the prompt metrics of a paper's LLM session."""
+        if not session.requests:
+            return
+        stats = session.summary()
+        stages = ", ".join(
+            f"{m.stage or 'query'}={m.prompt_tokens if m.prompt_tokens is not None else '?'} tokens"
+            + (f"/{m.ttft_seconds:.2f}s" if m.ttft_seconds is not None else "")
+            for m in session.requests
+        )
+        logger.debug(
+            f"[{citation_key}] LLM session: {stats['requests']} requests, "
+            f"{stats['prompt_tokens']:,} prompt tokens evaluated ({stages})",
+            extra=stats
+        )
+
+    def _reset_for_stage(self, stage: str) -> None:
+        """Reset the LLM context and label the session's next requests with ``stage``."""
+        self.llm_client.reset()
+        session = self.llm_client.active_session
+        if session is not None:
+            session.stage = stage
+
+    def _summarize_paper(
+        self,
+        result: SearchResult,
+        pdf_path: Path,
+        max_retries: int = 2,
+        progress_callback: Optional[Callable[[SummarizationProgressEvent], None]] = None
+    ) -> SummarizationResult:
+        """Summarize one paper (see ``summarize_paper``)."""
         citation_key = pdf_path.stem
         start_time = time.time()
         
         # CRITICAL: Clear context before processing each paper to prevent cross-paper contamination
+        # (contexts are per thread, so this never affects papers summarized in other workers)
+        # reset() re-adds the system prompt, so every stage sends [system, paper prefix + task]
+        # and shares its leading tokens with the previous stage
         logger.info(
             f"[{citation_key}] Clearing LLM context before summarization",
             extra={
@@ -155,7 +234,7 @@ class SummarizationEngine:
                 "tokens_before": self.llm_client.context.estimated_tokens
             }
         )
-        self.llm_client.context.clear()
+        self.llm_client.reset()
         
         # Helper function to emit progress events
         def emit_progress(stage: str, status: str, message: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None):
@@ -482,7 +561,7 @@ class SummarizationEngine:
                     # The multi_stage_summarizer should handle this automatically, but we'll
                     # ensure it's triggered by clearing context and retrying
                     try:
-                        self.llm_client.context.clear()
+                        self.llm_client.reset()
                         # Retry - the generate_draft method should detect size and use two-stage
                         summary, validation_result, total_attempts = self.multi_stage_summarizer.summarize_with_refinement(
                             context=context,
@@ -625,52 +704,66 @@ class SummarizationEngine:
                 f"below threshold (0.5) - will still be saved"
             )
         
-        # Pass 2: Extract key claims and quotes
-        logger.info(f"[{citation_key}] Starting Pass 2: Claims and quotes extraction")
-        claims_quotes_text = None
-        try:
-            claims_quotes_text = self._extract_claims_and_quotes(
+        # Combined mode: passes 2-4 in one structured query; invalid fields fall back below
+        combined = None
+        if self.combined_extraction:
+            logger.info(f"[{citation_key}] Starting combined extraction (passes 2-4 in one query)")
+            combined = self._extract_combined(
                 pdf_text=pdf_text,
                 result=result,
                 citation_key=citation_key,
                 progress_callback=progress_callback
             )
-            logger.info(f"[{citation_key}] Pass 2 completed: claims/quotes extraction")
-        except Exception as e:
-            logger.warning(f"[{citation_key}] Pass 2 (claims/quotes) failed: {e}")
-            claims_quotes_text = f"## Key Claims and Hypotheses\n\nExtraction failed: {e}\n\n## Important Quotes\n\nExtraction failed."
+        claims_quotes_text = combined.claims_quotes_text if combined else None
+        methods_tools_text = combined.methods_tools_text if combined else None
+        classification = combined.classification if combined else None
+        
+        # Pass 2: Extract key claims and quotes
+        if claims_quotes_text is None:
+            logger.info(f"[{citation_key}] Starting Pass 2: Claims and quotes extraction")
+            try:
+                claims_quotes_text = self._extract_claims_and_quotes(
+                    pdf_text=pdf_text,
+                    result=result,
+                    citation_key=citation_key,
+                    progress_callback=progress_callback
+                )
+                logger.info(f"[{citation_key}] Pass 2 completed: claims/quotes extraction")
+            except Exception as e:
+                logger.warning(f"[{citation_key}] Pass 2 (claims/quotes) failed: {e}")
+                claims_quotes_text = f"## Key Claims and Hypotheses\n\nExtraction failed: {e}\n\n## Important Quotes\n\nExtraction failed."
         
         # Pass 3: Analyze methods and tools
-        logger.info(f"[{citation_key}] Starting Pass 3: Methods and tools analysis")
-        methods_tools_text = None
-        try:
-            methods_tools_text = self._analyze_methods_and_tools(
-                pdf_text=pdf_text,
-                result=result,
-                citation_key=citation_key,
-                progress_callback=progress_callback
-            )
-            logger.info(f"[{citation_key}] Pass 3 completed: methods/tools analysis")
-        except Exception as e:
-            logger.warning(f"[{citation_key}] Pass 3 (methods/tools) failed: {e}")
-            methods_tools_text = f"## Algorithms and Methodologies\n\nAnalysis failed: {e}\n\n## Software Frameworks and Libraries\n\nAnalysis failed.\n\n## Datasets\n\nAnalysis failed.\n\n## Evaluation Metrics\n\nAnalysis failed.\n\n## Software Tools and Platforms\n\nAnalysis failed."
+        if methods_tools_text is None:
+            logger.info(f"[{citation_key}] Starting Pass 3: Methods and tools analysis")
+            try:
+                methods_tools_text = self._analyze_methods_and_tools(
+                    pdf_text=pdf_text,
+                    result=result,
+                    citation_key=citation_key,
+                    progress_callback=progress_callback
+                )
+                logger.info(f"[{citation_key}] Pass 3 completed: methods/tools analysis")
+            except Exception as e:
+                logger.warning(f"[{citation_key}] Pass 3 (methods/tools) failed: {e}")
+                methods_tools_text = f"## Algorithms and Methodologies\n\nAnalysis failed: {e}\n\n## Software Frameworks and Libraries\n\nAnalysis failed.\n\n## Datasets\n\nAnalysis failed.\n\n## Evaluation Metrics\n\nAnalysis failed.\n\n## Software Tools and Platforms\n\nAnalysis failed."
         
         # Pass 4: Classify paper
-        logger.info(f"[{citation_key}] Starting Pass 4: Paper classification")
-        classification = None
-        try:
-            classification = self._classify_paper(
-                pdf_text=pdf_text,
-                result=result,
-                citation_key=citation_key,
-                progress_callback=progress_callback
-            )
-            if classification:
-                logger.info(f"[{citation_key}] Pass 4 completed: classification = {classification.category}")
-            else:
-                logger.warning(f"[{citation_key}] Pass 4 (classification) returned None")
-        except Exception as e:
-            logger.warning(f"[{citation_key}] Pass 4 (classification) failed: {e}")
+        if classification is None:
+            logger.info(f"[{citation_key}] Starting Pass 4: Paper classification")
+            try:
+                classification = self._classify_paper(
+                    pdf_text=pdf_text,
+                    result=result,
+                    citation_key=citation_key,
+                    progress_callback=progress_callback
+                )
+                if classification:
+                    logger.info(f"[{citation_key}] Pass 4 completed: classification = {classification.category}")
+                else:
+                    logger.warning(f"[{citation_key}] Pass 4 (classification) returned None")
+            except Exception as e:
+                logger.warning(f"[{citation_key}] Pass 4 (classification) failed: {e}")
         
         # Always include summary_text even when validation fails (for saving)
         return SummarizationResult(
@@ -1093,6 +1186,100 @@ class SummarizationEngine:
             min_content_preservation=0.6
         )
     
+    def _extract_combined(
+        self,
+        pdf_text: str,
+        result: SearchResult,
+        citation_key: str,
+        progress_callback: Optional[Callable[[SummarizationProgressEvent], None]] = None
+    ) -> Optional[CombinedExtraction]:
+        """Extract claims/quotes, methods/tools and classification in one query.
+        
+        The paper text is sent once instead of once per pass. Each field of
+        the JSON response is validated separately (see combined_extraction.py);
+        fields that fail are left as None for the per-task passes.
+        
+        Args:
+            pdf_text: Full PDF text content.
+            result: Search result with paper metadata.
+            citation_key: Citation key for logging.
+            progress_callback: Optional callback for progress events.
+            
+        Returns:
+            CombinedExtraction, or None if the paper does not fit in context
+            or the query failed.
+        """
+        import json
+        from infrastructure.llm.templates.research import CombinedPaperExtraction
+        from infrastructure.llm.core.config import GenerationOptions
+        
+        def emit_progress(stage: str, status: str, message: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None):
+            if progress_callback:
+                progress_callback(SummarizationProgressEvent(
+                    citation_key=citation_key,
+                    stage=stage,
+                    status=status,
+                    message=message,
+                    metadata=metadata or {}
+                ))
+        
+        emit_progress("combined_extraction", "started", f"Extracting claims, methods and classification for {citation_key}")
+        self._reset_for_stage("combined_extraction")
+        
+        prompt = CombinedPaperExtraction().render(
+            title=result.title,
+            authors=', '.join(result.authors) if result.authors else 'Unknown',
+            year=str(result.year) if result.year else 'Unknown',
+            source=result.source or 'unknown',
+            text=pdf_text
+        )
+        
+        # Chunked papers keep the per-task passes, which process chunks separately
+        estimated_tokens = (len(prompt) + len(json.dumps(COMBINED_EXTRACTION_SCHEMA))) // 4
+        available_tokens = self.llm_client.context.estimate_available_tokens(reserve_percent=0.2)
+        if estimated_tokens > available_tokens:
+            logger.info(
+                f"[{citation_key}] Combined extraction prompt ({estimated_tokens:,} tokens) exceeds context "
+                f"({available_tokens:,} available); using per-task passes"
+            )
+            emit_progress("combined_extraction", "failed", "Paper too large for combined extraction")
+            return None
+        
+        options = GenerationOptions(
+            temperature=0.3,  # Same as the per-task passes
+            max_tokens=6000,  # Room for claims, quotes, methods and classification
+        )
+        
+        extraction_start = time.time()
+        try:
+            data = self.llm_client.query_structured(
+                prompt=prompt,
+                schema=COMBINED_EXTRACTION_SCHEMA,
+                options=options,
+                use_native_json=True
+            )
+        except Exception as e:
+            logger.warning(f"[{citation_key}] Combined extraction failed: {e}; using per-task passes")
+            emit_progress("combined_extraction", "failed", f"Combined extraction failed: {e}")
+            return None
+        extraction_time = time.time() - extraction_start
+        
+        extraction = parse_combined_extraction(data, pdf_text)
+        valid_fields = len(COMBINED_FIELDS) - len(extraction.errors)
+        for field_name, error in extraction.errors.items():
+            logger.warning(f"[{citation_key}] Combined extraction field '{field_name}' invalid ({error}); using per-task pass")
+        logger.info(
+            f"[{citation_key}] Combined extraction completed in {extraction_time:.2f}s: "
+            f"{valid_fields}/{len(COMBINED_FIELDS)} fields valid"
+        )
+        emit_progress(
+            "combined_extraction",
+            "completed",
+            f"Combined extraction: {valid_fields}/{len(COMBINED_FIELDS)} fields valid",
+            {"time": extraction_time, "invalid_fields": dict(extraction.errors)}
+        )
+        return extraction
+    
     def _extract_claims_and_quotes(
         self,
         pdf_text: str,
@@ -1137,7 +1324,7 @@ class SummarizationEngine:
         
         # Clear context before extraction
         logger.info(f"[{citation_key}] Clearing LLM context before claims/quotes extraction")
-        self.llm_client.context.clear()
+        self._reset_for_stage("claims_quotes")
         
         # Check if paper fits in context
         # Estimate tokens: prompt template overhead (~2000 tokens) + paper text
@@ -1364,6 +1551,77 @@ class SummarizationEngine:
         
         return '\n'.join(validated_lines)
     
+    def _map_chunk_prompts(
+        self,
+        template: Any,
+        options: "GenerationOptions",
+        chunking_result: ChunkingResult,
+        result: SearchResult,
+        citation_key: str,
+        stage: str,
+        purpose: str,
+        emit_progress: Callable
+    ) -> ChunkMapResult[str]:
+        """Query the LLM with a template rendered for every chunk, concurrently.
+        
+        Args:
+            template: Research template rendered with the paper metadata and chunk text.
+            options: Generation options for every chunk query.
+            chunking_result: Chunks of the paper text.
+            result: Search result with paper metadata.
+            citation_key: Citation key for logging.
+            stage: Progress event stage name.
+            purpose: Description of the task for log messages.
+            emit_progress: Progress event emitter function.
+            
+        Returns:
+            ChunkMapResult with the response to each chunk in chunk order.
+        """
+        total_chunks = chunking_result.total_chunks
+        # Chunk workers join the paper's session (keep_alive and metrics)
+        session = self.llm_client.active_session
+        
+        def query_chunk(i: int, chunk) -> str:
+            logger.info(
+                f"[{citation_key}] Processing chunk {i + 1}/{total_chunks} "
+                f"for {purpose} ({len(chunk.text):,} chars)..."
+            )
+            chunk_prompt = template.render(
+                title=result.title,
+                authors=', '.join(result.authors) if result.authors else 'Unknown',
+                year=str(result.year) if result.year else 'Unknown',
+                source=result.source or 'unknown',
+                text=chunk.text
+            )
+            # Fresh context per chunk so concurrent chunks stay independent
+            with self.llm_client.use_session(session), self.llm_client.conversation():
+                return self.llm_client.query(chunk_prompt, options=options, reset_context=True)
+        
+        def on_chunk_done(i: int, chunk_result: Optional[str], error: Optional[str]) -> None:
+            if error is None:
+                logger.info(f"[{citation_key}] Chunk {i + 1} processed: {len(chunk_result.split())} words")
+            emit_progress(
+                stage,
+                "in_progress",
+                f"Processed chunk {i + 1}/{total_chunks}" if error is None
+                else f"Chunk {i + 1}/{total_chunks} failed: {error}",
+                {"chunk_index": i + 1, "total_chunks": total_chunks, "error": error}
+            )
+        
+        chunk_map = map_chunks(
+            query_chunk,
+            chunking_result.chunks,
+            max_in_flight=self.multi_stage_summarizer.chunk_concurrency,
+            retries=self.multi_stage_summarizer.chunk_retries,
+            on_result=on_chunk_done,
+            label=f"[{citation_key}] Chunk"
+        )
+        logger.info(
+            f"[{citation_key}] {purpose.capitalize()}: {total_chunks - len(chunk_map.failed)}/{total_chunks} "
+            f"chunks in {chunk_map.elapsed:.2f}s"
+        )
+        return chunk_map
+    
     def _extract_claims_and_quotes_chunked(
         self,
         pdf_text: str,
@@ -1408,63 +1666,20 @@ class SummarizationEngine:
             logger.error(f"[{citation_key}] No chunks created from PDF text")
             return "## Key Claims and Hypotheses\n\nChunking failed: No chunks created.\n\n## Important Quotes\n\nExtraction failed."
         
-        # Process each chunk
-        all_claims_quotes = []
-        successful_chunks = 0
-        failed_chunks = 0
-        
+        # Process chunks concurrently
         template = ClaimsQuotesExtraction()
         options = GenerationOptions(
             temperature=0.3,
             max_tokens=3000,
         )
         
-        for i, chunk in enumerate(chunking_result.chunks):
-            chunk_num = i + 1
-            logger.info(
-                f"[{citation_key}] Processing chunk {chunk_num}/{chunking_result.total_chunks} "
-                f"for claims/quotes extraction ({len(chunk.text):,} chars)..."
-            )
-            
-            emit_progress(
-                "claims_extraction",
-                "in_progress",
-                f"Processing chunk {chunk_num}/{chunking_result.total_chunks}...",
-                {"chunk_index": chunk_num, "total_chunks": chunking_result.total_chunks}
-            )
-            
-            # Build prompt for this chunk
-            chunk_prompt = template.render(
-                title=result.title,
-                authors=', '.join(result.authors) if result.authors else 'Unknown',
-                year=str(result.year) if result.year else 'Unknown',
-                source=result.source or 'unknown',
-                text=chunk.text
-            )
-            
-            try:
-                # Clear context before each chunk to avoid accumulation
-                self.llm_client.context.clear()
-                
-                chunk_start = time.time()
-                chunk_result = self.llm_client.query(chunk_prompt, options=options, reset_context=True)
-                chunk_time = time.time() - chunk_start
-                
-                if chunk_result and chunk_result.strip():
-                    all_claims_quotes.append(chunk_result.strip())
-                    successful_chunks += 1
-                    logger.info(
-                        f"[{citation_key}] Chunk {chunk_num} processed: "
-                        f"{len(chunk_result.split())} words in {chunk_time:.2f}s"
-                    )
-                else:
-                    logger.warning(f"[{citation_key}] Chunk {chunk_num} produced empty result")
-                    failed_chunks += 1
-                    
-            except Exception as e:
-                logger.error(f"[{citation_key}] Failed to process chunk {chunk_num}: {e}")
-                failed_chunks += 1
-                # Continue with other chunks
+        chunk_map = self._map_chunk_prompts(
+            template, options, chunking_result, result, citation_key,
+            "claims_extraction", "claims/quotes extraction", emit_progress
+        )
+        all_claims_quotes = [r.strip() for r in chunk_map.successful]
+        successful_chunks = len(all_claims_quotes)
+        failed_chunks = len(chunk_map.failed)
         
         if not all_claims_quotes:
             error_msg = f"All chunks failed for claims/quotes extraction (processed {chunking_result.total_chunks} chunks)"
@@ -1587,7 +1802,7 @@ class SummarizationEngine:
         
         # Clear context before analysis
         logger.info(f"[{citation_key}] Clearing LLM context before methods/tools analysis")
-        self.llm_client.context.clear()
+        self._reset_for_stage("methods_tools")
         
         # Check if paper fits in context
         # Estimate tokens: prompt template overhead (~2000 tokens) + paper text
@@ -1713,63 +1928,20 @@ class SummarizationEngine:
             logger.error(f"[{citation_key}] No chunks created from PDF text")
             return "## Algorithms and Methodologies\n\nChunking failed: No chunks created.\n\n## Software Frameworks and Libraries\n\nAnalysis failed.\n\n## Datasets\n\nAnalysis failed.\n\n## Evaluation Metrics\n\nAnalysis failed.\n\n## Software Tools and Platforms\n\nAnalysis failed."
         
-        # Process each chunk
-        all_methods_tools = []
-        successful_chunks = 0
-        failed_chunks = 0
-        
+        # Process chunks concurrently
         template = MethodsToolsAnalysis()
         options = GenerationOptions(
             temperature=0.3,
             max_tokens=3000,
         )
         
-        for i, chunk in enumerate(chunking_result.chunks):
-            chunk_num = i + 1
-            logger.info(
-                f"[{citation_key}] Processing chunk {chunk_num}/{chunking_result.total_chunks} "
-                f"for methods/tools analysis ({len(chunk.text):,} chars)..."
-            )
-            
-            emit_progress(
-                "methods_analysis",
-                "in_progress",
-                f"Processing chunk {chunk_num}/{chunking_result.total_chunks}...",
-                {"chunk_index": chunk_num, "total_chunks": chunking_result.total_chunks}
-            )
-            
-            # Build prompt for this chunk
-            chunk_prompt = template.render(
-                title=result.title,
-                authors=', '.join(result.authors) if result.authors else 'Unknown',
-                year=str(result.year) if result.year else 'Unknown',
-                source=result.source or 'unknown',
-                text=chunk.text
-            )
-            
-            try:
-                # Clear context before each chunk to avoid accumulation
-                self.llm_client.context.clear()
-                
-                chunk_start = time.time()
-                chunk_result = self.llm_client.query(chunk_prompt, options=options, reset_context=True)
-                chunk_time = time.time() - chunk_start
-                
-                if chunk_result and chunk_result.strip():
-                    all_methods_tools.append(chunk_result.strip())
-                    successful_chunks += 1
-                    logger.info(
-                        f"[{citation_key}] Chunk {chunk_num} processed: "
-                        f"{len(chunk_result.split())} words in {chunk_time:.2f}s"
-                    )
-                else:
-                    logger.warning(f"[{citation_key}] Chunk {chunk_num} produced empty result")
-                    failed_chunks += 1
-                    
-            except Exception as e:
-                logger.error(f"[{citation_key}] Failed to process chunk {chunk_num}: {e}")
-                failed_chunks += 1
-                # Continue with other chunks
+        chunk_map = self._map_chunk_prompts(
+            template, options, chunking_result, result, citation_key,
+            "methods_analysis", "methods/tools analysis", emit_progress
+        )
+        all_methods_tools = [r.strip() for r in chunk_map.successful]
+        successful_chunks = len(all_methods_tools)
+        failed_chunks = len(chunk_map.failed)
         
         if not all_methods_tools:
             error_msg = f"All chunks failed for methods/tools analysis (processed {chunking_result.total_chunks} chunks)"
@@ -1882,7 +2054,7 @@ class SummarizationEngine:
         
         # Clear context before classification
         logger.info(f"[{citation_key}] Clearing LLM context before classification")
-        self.llm_client.context.clear()
+        self._reset_for_stage("classification")
         
         # Build classification prompt
         template = PaperClassificationTemplate()
@@ -1992,6 +2164,91 @@ class SummarizationEngine:
             emit_progress("classification", "failed", f"Classification failed: {e}")
             return None
     
+    @staticmethod
+    def paper_header(result: SearchResult, citation_key: str, title_suffix: str = "") -> str:
+        """Markdown header with a paper's metadata, as written above saved summaries.
+
+        Args:
+            result: Search result with paper metadata.
+            citation_key: Citation key of the paper (names the linked PDF).
+            title_suffix: Appended to the title heading (e.g. " - Key Claims and Quotes").
+
+        Returns:
+            Header text ending before the ``**Generated:**`` line.
+        """
+        return f"""# {result.title}{title_suffix}
+
+**Authors:** {', '.join(result.authors) if result.authors else 'Unknown'}
+
+**Year:** {result.year or 'Unknown'}
+
+**Source:** {result.source}
+
+**Venue:** {result.venue or 'N/A'}
+
+**DOI:** {result.doi or 'N/A'}
+
+**PDF:** [{citation_key}.pdf](../pdfs/{citation_key}.pdf)
+
+"""
+
+    @staticmethod
+    def reuse_summary_files(
+        result: SearchResult,
+        source_key: str,
+        citation_key: str,
+        output_dir: Path
+    ) -> List[Path]:
+        """Copy the saved summary files of another key to a paper with the same content.
+
+        The summary, claims/quotes and methods/tools files of ``source_key``
+        are copied with their metadata header re-rendered for ``result``
+        and ``citation_key``; the generated content (and its generation
+        time, validation and classification) is kept.
+
+        Args:
+            result: Search result of the paper receiving the files.
+            source_key: Citation key whose files are copied.
+            citation_key: Citation key of the paper receiving the files.
+            output_dir: Directory holding the summary files.
+
+        Returns:
+            Paths of the written files, the summary first.
+
+        Raises:
+            FileOperationError: If the source summary cannot be read or has
+                no metadata header.
+        """
+        saved_paths = []
+        for suffix, title_suffix in SUMMARY_FILES:
+            source_path = output_dir / f"{source_key}{suffix}"
+            if suffix != "_summary.md" and not source_path.exists():
+                continue
+            try:
+                text = source_path.read_text(encoding='utf-8')
+            except OSError as e:
+                raise FileOperationError(
+                    f"Failed to read summary of {source_key}: {e}",
+                    context={"path": str(source_path)}
+                )
+            body_start = text.find("**Generated:**")
+            if body_start < 0:
+                raise FileOperationError(
+                    f"Summary of {source_key} has no metadata header",
+                    context={"path": str(source_path)}
+                )
+            target_path = output_dir / f"{citation_key}{suffix}"
+            header = SummarizationEngine.paper_header(result, citation_key, title_suffix)
+            try:
+                target_path.write_text(header + text[body_start:], encoding='utf-8')
+            except OSError as e:
+                raise FileOperationError(
+                    f"Failed to save summary: {e}",
+                    context={"path": str(target_path)}
+                )
+            saved_paths.append(target_path)
+        return saved_paths
+
     def save_summary(
         self,
         result: SearchResult,
@@ -2074,21 +2331,7 @@ class SummarizationEngine:
 """
 
         # Build markdown content with validation metadata
-        content = f"""# {result.title}
-
-**Authors:** {', '.join(result.authors) if result.authors else 'Unknown'}
-
-**Year:** {result.year or 'Unknown'}
-
-**Source:** {result.source}
-
-**Venue:** {result.venue or 'N/A'}
-
-**DOI:** {result.doi or 'N/A'}
-
-**PDF:** [{citation_key}.pdf](../pdfs/{citation_key}.pdf)
-
-**Generated:** {time.strftime('%Y-%m-%d %H:%M:%S')}
+        content = f"""{self.paper_header(result, citation_key)}**Generated:** {time.strftime('%Y-%m-%d %H:%M:%S')}
 {validation_section}{classification_section}---
 
 {summary_result.summary_text}
@@ -2112,21 +2355,7 @@ class SummarizationEngine:
         if summary_result.claims_quotes_text:
             claims_quotes_path = output_dir / f"{citation_key}_claims_quotes.md"
             try:
-                claims_quotes_content = f"""# {result.title} - Key Claims and Quotes
-
-**Authors:** {', '.join(result.authors) if result.authors else 'Unknown'}
-
-**Year:** {result.year or 'Unknown'}
-
-**Source:** {result.source}
-
-**Venue:** {result.venue or 'N/A'}
-
-**DOI:** {result.doi or 'N/A'}
-
-**PDF:** [{citation_key}.pdf](../pdfs/{citation_key}.pdf)
-
-**Generated:** {time.strftime('%Y-%m-%d %H:%M:%S')}
+                claims_quotes_content = f"""{self.paper_header(result, citation_key, ' - Key Claims and Quotes')}**Generated:** {time.strftime('%Y-%m-%d %H:%M:%S')}
 
 ---
 
@@ -2145,21 +2374,7 @@ class SummarizationEngine:
         if summary_result.methods_tools_text:
             methods_tools_path = output_dir / f"{citation_key}_methods_tools.md"
             try:
-                methods_tools_content = f"""# {result.title} - Methods and Tools Analysis
-
-**Authors:** {', '.join(result.authors) if result.authors else 'Unknown'}
-
-**Year:** {result.year or 'Unknown'}
-
-**Source:** {result.source}
-
-**Venue:** {result.venue or 'N/A'}
-
-**DOI:** {result.doi or 'N/A'}
-
-**PDF:** [{citation_key}.pdf](../pdfs/{citation_key}.pdf)
-
-**Generated:** {time.strftime('%Y-%m-%d %H:%M:%S')}
+                methods_tools_content = f"""{self.paper_header(result, citation_key, ' - Methods and Tools Analysis')}**Generated:** {time.strftime('%Y-%m-%d %H:%M:%S')}
 
 ---
 
@@ -2233,4 +2448,12 @@ class SummarizationEngine:
             except Exception as e:
                 logger.warning(f"[{citation_key}] Failed to update library entry with classification: {e}")
         
+        # Record the extracted text this summary was generated from
+        try:
+            SummaryManifest.for_dir(output_dir).record(
+                citation_key, self.text_extractor.extracted_text_dir / f"{citation_key}.txt"
+            )
+        except FileOperationError as e:
+            logger.warning(f"[{citation_key}] Could not save summary manifest: {e}")
+        
         return saved_paths
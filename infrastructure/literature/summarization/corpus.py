@@ -0,0 +1,384 @@
+"""Packed corpus of extracted texts.
+
+``data/extracted_text`` holds one ``.txt`` file per paper, so bulk
+analytics (``DataAggregator.prepare_text_corpus``, the ``scripts/analyze_*``
+tools) open and read thousands of small files. ``build_corpus`` packs
+them into a single file that ``PackedCorpus`` memory-maps:
+
+    MAGIC | record | record | ... | JSON index | index offset (8 bytes) | MAGIC
+
+Each record is one text compressed on its own (zstd when the optional
+``zstandard`` package is installed, zlib otherwise, or stored raw), so
+any text can be read at random without touching the others. The JSON
+index maps citation keys to record offsets and lengths, the source
+file's size and mtime, and optionally section offsets found by
+``PDFChunker.identify_sections``. Records are written in citation key
+order, so iterating the whole corpus is a single sequential read.
+
+The loose ``.txt`` files stay the source of truth: ``iter_extracted_texts``
+serves a text from the corpus only while its source file is unchanged,
+so texts deleted by cleanup or ``clear`` are no longer returned, and
+``build_corpus`` reuses the compressed records of unchanged files (and
+drops deleted ones) when repacking.
+"""
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from infrastructure.core.exceptions import FileOperationError
+from infrastructure.core.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Errors reading or decoding one text (UnicodeDecodeError is a ValueError)
+_READ_ERRORS: Tuple[type, ...] = (OSError, ValueError, zlib.error)
+if ZSTD_AVAILABLE:
+    _READ_ERRORS += (zstandard.ZstdError,)
+
+MAGIC = b"LTCORPUS"
+FORMAT_VERSION = 1
+CODECS = ("zstd", "zlib", "none")
+DEFAULT_TEXT_DIR = Path("data/extracted_text")
+
+_FOOTER = struct.Struct("<Q")
+
+
+def corpus_path_for(text_dir: Path) -> Path:
+    """Corpus file of a text directory: ``data/extracted_text`` → ``data/extracted_text.corpus``."""
+    text_dir = Path(text_dir)
+    return text_dir.with_name(text_dir.name + ".corpus")
+
+
+def _resolve_codec(codec: str) -> str:
+    if codec == "auto":
+        return "zstd" if ZSTD_AVAILABLE else "zlib"
+    if codec not in CODECS:
+        raise ValueError(f"Unknown corpus codec {codec!r}; expected one of {', '.join(CODECS)} or 'auto'")
+    if codec == "zstd" and not ZSTD_AVAILABLE:
+        raise ValueError("zstd codec requires the zstandard package (pip install zstandard)")
+    return codec
+
+
+def _compress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=6).compress(data)
+    if codec == "zlib":
+        return zlib.compress(data, 6)
+    return data
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == "zlib":
+        return zlib.decompress(data)
+    return data
+
+
+class PackedCorpus:
+    """Read-only, memory-mapped view of a packed corpus file.
+
+    Attributes:
+        path: Corpus file.
+        codec: Record compression ("zstd", "zlib" or "none").
+    """
+
+    def __init__(self, path: Path):
+        """Open and memory-map a corpus file.
+
+        Args:
+            path: Corpus file written by ``build_corpus``.
+
+        Raises:
+            FileOperationError: If the file is missing or not a valid corpus.
+        """
+        self.path = Path(path)
+        try:
+            self._file = open(self.path, 'rb')
+        except OSError as e:
+            raise FileOperationError(f"Failed to open corpus: {e}", context={"path": str(self.path)})
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            size = len(self._map)
+            tail = len(MAGIC) + _FOOTER.size
+            if size < len(MAGIC) + tail or self._map[:len(MAGIC)] != MAGIC or self._map[-len(MAGIC):] != MAGIC:
+                raise ValueError("bad magic")
+            (index_offset,) = _FOOTER.unpack_from(self._map, size - tail)
+            index = json.loads(self._map[index_offset:size - tail].decode('utf-8'))
+            if index.get("format_version") != FORMAT_VERSION:
+                raise ValueError(f"unsupported format version {index.get('format_version')}")
+            self.codec = _resolve_codec(index["codec"])
+        except (ValueError, KeyError, OSError) as e:
+            self.close()
+            raise FileOperationError(f"Invalid corpus file: {e}", context={"path": str(self.path)})
+        self._entries: Dict[str, Dict[str, Any]] = index["entries"]
+
+    def __enter__(self) -> PackedCorpus:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the memory map and file handle."""
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        if getattr(self, "_file", None) is not None:
+            self._file.close()
+            self._file = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, citation_key: str) -> bool:
+        return citation_key in self._entries
+
+    def keys(self) -> List[str]:
+        """Citation keys in file order."""
+        return sorted(self._entries, key=lambda k: self._entries[k]["offset"])
+
+    def entry(self, citation_key: str) -> Optional[Dict[str, Any]]:
+        """Index entry (offset, length, chars, source size/mtime, sections) of a key."""
+        entry = self._entries.get(citation_key)
+        return dict(entry) if entry else None
+
+    def _raw(self, entry: Dict[str, Any]) -> bytes:
+        return self._map[entry["offset"]:entry["offset"] + entry["length"]]
+
+    def _decode(self, entry: Dict[str, Any]) -> str:
+        return _decompress(self.codec, self._raw(entry)).decode('utf-8')
+
+    def get(self, citation_key: str) -> Optional[str]:
+        """Text of a citation key, or None if not in the corpus."""
+        entry = self._entries.get(citation_key)
+        return self._decode(entry) if entry else None
+
+    def get_section(self, citation_key: str, section: str) -> Optional[str]:
+        """Text of one section (e.g. 'abstract') of a citation key, if indexed."""
+        entry = self._entries.get(citation_key)
+        if not entry or section not in entry.get("sections", {}):
+            return None
+        start, end = entry["sections"][section]
+        return self._decode(entry)[start:end]
+
+    def is_current(self, citation_key: str, text_path: Path) -> bool:
+        """Check whether the corpus copy of a text matches its source file.
+
+        A missing source file means the text was deleted, so its corpus
+        copy is not current either.
+        """
+        entry = self._entries.get(citation_key)
+        if not entry:
+            return False
+        try:
+            stat = text_path.stat()
+        except OSError:
+            return False
+        return (stat.st_size, stat.st_mtime_ns) == (entry["source_size"], entry["source_mtime_ns"])
+
+    def iter_texts(self, citation_keys: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, str]]:
+        """Yield (citation_key, text) in file order, i.e. one sequential pass.
+
+        Args:
+            citation_keys: Keys to read (default: all); keys not in the
+                corpus are skipped.
+        """
+        if citation_keys is None:
+            keys = self.keys()
+        else:
+            keys = sorted(
+                (k for k in set(citation_keys) if k in self._entries),
+                key=lambda k: self._entries[k]["offset"]
+            )
+        for key in keys:
+            yield key, self._decode(self._entries[key])
+
+
+def build_corpus(
+    text_dir: Path = DEFAULT_TEXT_DIR,
+    output_path: Optional[Path] = None,
+    codec: str = "auto",
+    with_sections: bool = True
+) -> Dict[str, int]:
+    """Pack every ``{citation_key}.txt`` of a directory into a corpus file.
+
+    Records of files unchanged since the previous corpus (same size and
+    mtime, same codec) are copied without recompressing. The corpus is
+    written to a temporary file and renamed into place.
+
+    Args:
+        text_dir: Directory of extracted texts.
+        output_path: Corpus file to write (default: next to text_dir, see
+            ``corpus_path_for``).
+        codec: "auto" (zstd if available, else zlib), "zstd", "zlib" or "none".
+        with_sections: Index section offsets with ``PDFChunker.identify_sections``.
+
+    Returns:
+        Statistics: texts packed, records reused, corpus size in bytes.
+
+    Raises:
+        ValueError: If the codec is unknown or unavailable.
+        FileOperationError: If the corpus cannot be written.
+    """
+    codec = _resolve_codec(codec)
+    text_dir = Path(text_dir)
+    output_path = Path(output_path) if output_path is not None else corpus_path_for(text_dir)
+
+    previous: Optional[PackedCorpus] = None
+    if output_path.exists():
+        try:
+            previous = PackedCorpus(output_path)
+            if previous.codec != codec:
+                previous.close()
+                previous = None
+        except FileOperationError as e:
+            logger.warning(f"Rebuilding corpus from scratch: {e}")
+
+    chunker = None
+    if with_sections:
+        from infrastructure.literature.summarization.chunker import PDFChunker
+        chunker = PDFChunker()
+
+    entries: Dict[str, Dict[str, Any]] = {}
+    reused = 0
+    temp_path = output_path.with_name(output_path.name + ".tmp")
+    try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temp_path, 'wb') as out:
+            out.write(MAGIC)
+            for text_path in sorted(text_dir.glob("*.txt")):
+                citation_key = text_path.stem
+                stat = text_path.stat()
+                old = previous.entry(citation_key) if previous is not None else None
+                if (
+                    old is not None
+                    and (old["source_size"], old["source_mtime_ns"]) == (stat.st_size, stat.st_mtime_ns)
+                    and ("sections" in old or not with_sections)
+                ):
+                    record = previous._raw(old)
+                    entry = {k: v for k, v in old.items() if k != "offset"}
+                    reused += 1
+                else:
+                    text = text_path.read_text(encoding='utf-8', errors='replace')
+                    record = _compress(codec, text.encode('utf-8'))
+                    entry = {
+                        "length": len(record),
+                        "chars": len(text),
+                        "source_size": stat.st_size,
+                        "source_mtime_ns": stat.st_mtime_ns,
+                    }
+                    if chunker is not None:
+                        entry["sections"] = {
+                            name: [start, end] for name, (start, end) in chunker.identify_sections(text).items()
+                        }
+                entry["offset"] = out.tell()
+                out.write(record)
+                entries[citation_key] = entry
+            index_offset = out.tell()
+            out.write(json.dumps({
+                "format_version": FORMAT_VERSION,
+                "codec": codec,
+                "entries": entries,
+            }, sort_keys=True).encode('utf-8'))
+            out.write(_FOOTER.pack(index_offset))
+            out.write(MAGIC)
+        if previous is not None:
+            previous.close()
+            previous = None
+        os.replace(temp_path, output_path)
+    except OSError as e:
+        raise FileOperationError(f"Failed to write corpus: {e}", context={"path": str(output_path)})
+    finally:
+        if previous is not None:
+            previous.close()
+        temp_path.unlink(missing_ok=True)
+
+    size = output_path.stat().st_size
+    logger.info(
+        f"Packed {len(entries)} texts into {output_path} ({size:,} bytes, {codec}; "
+        f"{reused} unchanged records reused)"
+    )
+    return {"texts": len(entries), "reused": reused, "bytes": size}
+
+
+def open_corpus(path: Path) -> Optional[PackedCorpus]:
+    """Open a corpus file if it exists and is valid, else None."""
+    if not Path(path).exists():
+        return None
+    try:
+        return PackedCorpus(path)
+    except FileOperationError as e:
+        logger.warning(f"Ignoring corpus: {e}")
+        return None
+
+
+def report_to_stderr(citation_key: str, error: Exception) -> None:
+    """Print a per-text error to stderr (``on_error`` handler for scripts).
+
+    Args:
+        citation_key: Text that could not be read or processed.
+        error: The exception raised.
+    """
+    print(f"Error processing {citation_key}: {error}", file=sys.stderr)
+
+
+def iter_extracted_texts(
+    text_dir: Path = DEFAULT_TEXT_DIR,
+    corpus_path: Optional[Path] = None,
+    errors: str = 'strict',
+    on_error: Optional[Callable[[str, Exception], None]] = None
+) -> Iterator[Tuple[str, str]]:
+    """Yield (citation_key, text) for every extracted text, sorted by key.
+
+    Texts whose corpus copy is current are read from the packed corpus in
+    one sequential pass; new or modified ``.txt`` files are read directly.
+
+    Args:
+        text_dir: Directory of extracted texts.
+        corpus_path: Packed corpus file, used if present (default: next to
+            text_dir, see ``corpus_path_for``).
+        errors: Decoding error handler for loose text files.
+        on_error: Called with (citation_key, exception) when a text cannot
+            be read; the text is then skipped (e.g. ``report_to_stderr``).
+            Without it the error is raised.
+    """
+    def read(key: str, load: Callable[[], str]) -> Optional[Tuple[str, str]]:
+        try:
+            return key, load()
+        except _READ_ERRORS as e:
+            if on_error is None:
+                raise
+            on_error(key, e)
+            return None
+
+    text_dir = Path(text_dir)
+    loose = {p.stem: p for p in text_dir.glob("*.txt")} if text_dir.exists() else {}
+    corpus = open_corpus(corpus_path if corpus_path is not None else corpus_path_for(text_dir))
+    with corpus if corpus is not None else nullcontext():
+        current = set()
+        if corpus is not None:
+            current = {k for k in loose if corpus.is_current(k, loose[k])}
+        # Records are stored in key order, so the current ones are read in
+        # one sequential pass, interleaved with the loose files
+        for key in sorted(loose):
+            if key in current:
+                item = read(key, lambda: corpus.get(key))
+            else:
+                item = read(key, lambda: loose[key].read_text(encoding='utf-8', errors=errors))
+            if item is not None:
+                yield item
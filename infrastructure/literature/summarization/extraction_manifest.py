@@ -0,0 +1,158 @@
+"""Manifest of extracted text files.
+
+Every text file in ``data/extracted_text`` gets a record of the PDF it
+was extracted from (SHA-256, size, mtime), the extraction backend and
+``EXTRACTOR_VERSION``, and the text's size and character, word and page
+counts. Freshness checks then need only two ``stat`` calls:
+
+- same extractor version, text file size and PDF size/mtime: fresh
+- PDF size or mtime changed: the PDF is rehashed, and the text is
+  re-extracted only if the content actually changed
+- extractor version changed or text file modified: stale
+
+Text files extracted before the manifest existed have no record; they
+are adopted as current the first time they are seen. The manifest is
+stored as ``manifest.json`` in the text directory and shared by all
+users of that directory through ``ExtractionManifest.for_dir``.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from infrastructure.core.exceptions import FileOperationError
+from infrastructure.core.json_store import JsonStore
+from infrastructure.core.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when extraction output changes (backends, page joining, cleanup)
+EXTRACTOR_VERSION = "1"
+
+MANIFEST_FILENAME = "manifest.json"
+
+
+class ExtractionManifest(JsonStore):
+    """Thread-safe records of extracted text files, keyed by citation key.
+
+    Attributes:
+        path: JSON file holding the manifest.
+    """
+
+    SECTION = "records"
+    DESCRIPTION = "extraction manifest"
+
+    @classmethod
+    def for_dir(cls, text_dir: Path) -> ExtractionManifest:
+        """Get the shared manifest of an extracted text directory.
+
+        Args:
+            text_dir: Directory holding ``{citation_key}.txt`` files.
+
+        Returns:
+            Shared ExtractionManifest for ``text_dir/manifest.json``.
+        """
+        return cls.shared(Path(text_dir) / MANIFEST_FILENAME)
+
+    def get(self, citation_key: str) -> Optional[Dict[str, Any]]:
+        """Record of a citation key's extracted text, or None."""
+        self._ensure_loaded()
+        with self._lock:
+            record = self._data.get(citation_key)
+            return dict(record) if record else None
+
+    def is_fresh(
+        self,
+        citation_key: str,
+        pdf_path: Path,
+        text_path: Path,
+        pdf_hash: Callable[[], Optional[str]]
+    ) -> bool:
+        """Check whether a recorded text file is still valid for its PDF.
+
+        Args:
+            citation_key: Citation key.
+            pdf_path: The key's PDF.
+            text_path: The key's extracted text file.
+            pdf_hash: Computes the PDF's SHA-256; only called when the PDF's
+                size or mtime differ from the record.
+
+        Returns:
+            True if the text was produced by the current extractor from the
+            PDF's current content and has not been modified since.
+        """
+        record = self.get(citation_key)
+        if record is None or record.get("extractor_version") != EXTRACTOR_VERSION:
+            return False
+        try:
+            text_stat = text_path.stat()
+            pdf_stat = pdf_path.stat()
+        except OSError:
+            return False
+        if text_stat.st_size != record.get("text_size"):
+            return False
+        if (pdf_stat.st_size, pdf_stat.st_mtime) == (record.get("pdf_size"), record.get("pdf_mtime")):
+            return True
+        if not record.get("pdf_sha256") or pdf_hash() != record["pdf_sha256"]:
+            return False
+        # Same content, new stat (e.g. touched or re-linked): remember the new stat
+        with self._lock:
+            self._data[citation_key].update(pdf_size=pdf_stat.st_size, pdf_mtime=pdf_stat.st_mtime)
+            try:
+                self._changed()
+            except FileOperationError as e:
+                logger.warning(f"Could not save extraction manifest: {e}")
+        return True
+
+    def record(
+        self,
+        citation_key: str,
+        pdf_path: Path,
+        text_path: Path,
+        pdf_sha256: Optional[str],
+        chars: int,
+        words: int,
+        pages: Optional[int] = None,
+        backend: Optional[str] = None
+    ) -> None:
+        """Record a text file written for a PDF.
+
+        Args:
+            citation_key: Citation key.
+            pdf_path: Source PDF.
+            text_path: Extracted text file.
+            pdf_sha256: SHA-256 of the PDF.
+            chars: Characters of text.
+            words: Words of text.
+            pages: Pages parsed, if known.
+            backend: Extraction backend, if known.
+        """
+        self._ensure_loaded()
+        try:
+            pdf_stat = pdf_path.stat()
+            text_stat = text_path.stat()
+        except OSError as e:
+            logger.debug(f"[{citation_key}] Not recording extraction: {e}")
+            return
+        with self._lock:
+            self._data[citation_key] = {
+                "pdf_sha256": pdf_sha256,
+                "pdf_size": pdf_stat.st_size,
+                "pdf_mtime": pdf_stat.st_mtime,
+                "text_size": text_stat.st_size,
+                "chars": chars,
+                "words": words,
+                "pages": pages,
+                "backend": backend,
+                "extractor_version": EXTRACTOR_VERSION,
+                "extracted_at": datetime.now().isoformat(),
+            }
+            self._changed()
+
+    def forget(self, citation_key: str) -> None:
+        """Remove a citation key's record (e.g. when its text is deleted)."""
+        self._ensure_loaded()
+        with self._lock:
+            if self._data.pop(citation_key, None) is not None:
+                self._changed()
@@ -0,0 +1,196 @@
+"""Multi-process PDF text extraction.
+
+PDF text extraction (pdfplumber/pypdf) is pure-Python, CPU-bound work
+that threads cannot parallelize because of the GIL. ``ExtractionPool``
+runs it in worker processes instead:
+
+- each worker is a long-lived process fed one PDF at a time over a pipe
+- a PDF still running after ``timeout`` seconds gets its worker killed
+  and is reported as failed; a fresh worker takes over the remaining PDFs
+- a worker that crashes (e.g. a parser segfault) fails only its current PDF
+- text is streamed page by page to ``<name>.tmp`` and renamed into
+  place, so an interrupted or killed extraction never leaves a truncated
+  text file
+
+Results are yielded as PDFs complete. See ``TextExtractor.extract_many``.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from infrastructure.core.logging_utils import get_logger
+from infrastructure.validation.pdf_validator import PDFTextInfo, PDFValidationError, write_pdf_text
+
+logger = get_logger(__name__)
+
+# (success, error_message, chars_extracted), as returned by TextExtractor.extract_and_save
+ExtractionOutcome = Tuple[bool, Optional[str], int]
+
+# Extracted texts shorter than this are treated as failed extractions
+MIN_TEXT_CHARS = 100
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    """Write text to ``<path>.tmp`` and rename it over ``path``."""
+    temp_path = path.with_name(path.name + ".tmp")
+    try:
+        temp_path.write_text(text, encoding='utf-8')
+        os.replace(temp_path, path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def extract_text_to_file(pdf_path: Path, output_path: Path) -> Tuple[ExtractionOutcome, Optional[PDFTextInfo]]:
+    """Stream a PDF's full text to a file, renamed into place when complete.
+
+    Args:
+        pdf_path: PDF to extract.
+        output_path: Text file to write.
+
+    Returns:
+        Tuple of ((success, error_message, chars_extracted), extraction
+        details or None on failure).
+    """
+    try:
+        info = write_pdf_text(pdf_path, output_path, min_chars=MIN_TEXT_CHARS)
+        return (True, None, info.chars), info
+    except PDFValidationError as e:
+        return (False, f"PDF extraction failed: {e}", 0), None
+    except OSError as e:
+        return (False, f"Failed to save extracted text: {e}", 0), None
+    except Exception as e:
+        return (False, f"Unexpected error during extraction: {e}", 0), None
+
+
+def _extraction_worker(conn: Connection) -> None:
+    """Worker process loop: extract each (pdf_path, output_path) received."""
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+        pdf_path, output_path = task
+        conn.send(extract_text_to_file(Path(pdf_path), Path(output_path)))
+
+
+class _Worker:
+    """A worker process with its pipe and current task."""
+
+    def __init__(self, context):
+        parent_conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_extraction_worker, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+        self.task: Optional[Tuple[str, Path, Path]] = None
+        self.started = 0.0
+
+    def assign(self, task: Optional[Tuple[str, Path, Path]]) -> None:
+        self.task = task
+        if task is not None:
+            self.started = time.monotonic()
+            self.conn.send((str(task[1]), str(task[2])))
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=1.0)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class ExtractionPool:
+    """Process pool for PDF text extraction with per-file timeouts.
+
+    Attributes:
+        workers: Number of worker processes.
+        timeout: Seconds a single PDF may take before its worker is killed.
+    """
+
+    def __init__(self, workers: int, timeout: float = 300.0):
+        """Initialize pool limits.
+
+        Args:
+            workers: Number of worker processes.
+            timeout: Seconds a single PDF may take before its worker is killed.
+        """
+        self.workers = max(1, workers)
+        self.timeout = timeout
+
+    def run(
+        self,
+        tasks: Sequence[Tuple[str, Path, Path]]
+    ) -> Iterator[Tuple[str, ExtractionOutcome, Optional[PDFTextInfo]]]:
+        """Extract PDFs in worker processes.
+
+        Args:
+            tasks: (citation_key, pdf_path, output_path) per PDF.
+
+        Yields:
+            (citation_key, outcome, info) as each PDF completes, fails or
+            times out; info is None unless the extraction succeeded.
+        """
+        pending = list(reversed(tasks))
+        if not pending:
+            return
+        context = multiprocessing.get_context()
+        workers: List[_Worker] = []
+        try:
+            for _ in range(min(self.workers, len(pending))):
+                worker = _Worker(context)
+                workers.append(worker)
+                worker.assign(pending.pop())
+
+            while True:
+                busy = [w for w in workers if w.task is not None]
+                if not busy:
+                    return
+                deadline = min(w.started for w in busy) + self.timeout
+                ready = wait([w.conn for w in busy], timeout=max(0.0, deadline - time.monotonic()))
+                now = time.monotonic()
+                for worker in busy:
+                    citation_key, _, output_path = worker.task
+                    if worker.conn in ready:
+                        try:
+                            outcome, info = worker.conn.recv()
+                        except (EOFError, OSError):
+                            outcome, info = (False, "Extraction worker exited unexpectedly", 0), None
+                            worker = self._replace(context, workers, worker, output_path)
+                    elif now - worker.started >= self.timeout:
+                        logger.warning(
+                            f"[{citation_key}] Extraction exceeded {self.timeout:.0f}s; killing worker and skipping"
+                        )
+                        outcome, info = (False, f"Extraction timed out after {self.timeout:.0f}s", 0), None
+                        worker = self._replace(context, workers, worker, output_path)
+                    else:
+                        continue
+                    worker.assign(pending.pop() if pending else None)
+                    yield citation_key, outcome, info
+        finally:
+            for worker in workers:
+                worker.stop()
+
+    @staticmethod
+    def _replace(context, workers: List[_Worker], worker: _Worker, output_path: Path) -> _Worker:
+        """Kill a worker, discard its partial output and start a replacement."""
+        worker.kill()
+        output_path.with_name(output_path.name + ".tmp").unlink(missing_ok=True)
+        replacement = _Worker(context)
+        workers[workers.index(worker)] = replacement
+        return replacement
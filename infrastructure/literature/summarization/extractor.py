@@ -6,13 +6,29 @@ to data/extracted_text/ for use in the summarization pipeline.
 from __future__ import annotations
 
 import os
+import shutil
 import time
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Sequence, Tuple, TYPE_CHECKING
 
+from infrastructure.core.exceptions import FileOperationError
 from infrastructure.core.logging_utils import get_logger
+from infrastructure.literature.pdf.content_index import file_sha256
+from infrastructure.literature.summarization.extraction_manifest import (
+    EXTRACTOR_VERSION,
+    ExtractionManifest,
+)
+from infrastructure.literature.summarization.extraction_pool import (
+    ExtractionOutcome,
+    ExtractionPool,
+    MIN_TEXT_CHARS,
+    write_text_atomic,
+)
 from infrastructure.literature.summarization.pdf_processor import PDFProcessor
-from infrastructure.validation.pdf_validator import extract_text_from_pdf, PDFValidationError
+from infrastructure.validation.pdf_validator import PDFTextInfo, PDFValidationError, write_pdf_text
+
+if TYPE_CHECKING:
+    from infrastructure.literature.pdf.content_index import PDFContentIndex
 
 logger = get_logger(__name__)
 
@@ -22,13 +38,27 @@ class TextExtractor:
     
     Handles the first stage of the summarization pipeline:
     PDF → extracted text file → (later) summarization
+    
+    With a content index, a PDF whose content was already extracted under
+    another citation key reuses that text instead of being extracted again.
+    Batches can be extracted in worker processes with ``extract_many``.
+    
+    Each text file is recorded in an ``ExtractionManifest``, so existing
+    texts are skipped after a stat comparison and re-extracted only when
+    the PDF content or the extractor version changes.
     """
     
-    def __init__(self):
-        """Initialize text extractor."""
+    def __init__(self, content_index: Optional[PDFContentIndex] = None):
+        """Initialize text extractor.
+        
+        Args:
+            content_index: Optional PDF content index for duplicate reuse.
+        """
+        self.content_index = content_index
         self.pdf_processor = PDFProcessor()
         self.extracted_text_dir = Path("data/extracted_text")
         self.extracted_text_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest = ExtractionManifest.for_dir(self.extracted_text_dir)
     
     def extract_and_save(
         self,
@@ -56,8 +86,9 @@ class TextExtractor:
         
         extracted_text_path = self.extracted_text_dir / f"{citation_key}.txt"
         
-        # Check if extracted text already exists
-        if extracted_text_path.exists():
+        # Check if up-to-date extracted text already exists
+        existing_chars = self._existing_chars(pdf_path, citation_key, extracted_text_path)
+        if existing_chars is not None:
             existing_size = extracted_text_path.stat().st_size
             abs_path = extracted_text_path.resolve()
             abs_pdf_path = pdf_path.resolve()
@@ -65,22 +96,20 @@ class TextExtractor:
                 f"[{citation_key}] Extracted text already exists: {abs_path} "
                 f"({existing_size:,} bytes) from {abs_pdf_path}. Skipping extraction."
             )
-            # Read existing file to get char count
-            try:
-                existing_text = extracted_text_path.read_text(encoding='utf-8')
-                return True, None, len(existing_text)
-            except Exception as e:
-                logger.warning(
-                    f"[{citation_key}] Failed to read existing extracted text: {e}. "
-                    f"Re-extracting..."
-                )
-                # Continue to extraction below
+            return True, None, existing_chars
+        
+        # Reuse the text of an identical PDF stored under another key
+        reused_chars = self._reuse_duplicate_text(pdf_path, citation_key, extracted_text_path)
+        if reused_chars is not None:
+            return True, None, reused_chars
         
         # Extract text from PDF
         logger.info(f"[{citation_key}] Extracting text from {pdf_path.name}...")
         extraction_start = time.time()
         
+        info = PDFTextInfo()
         try:
+            pdf_text: Optional[str] = None
             if use_prioritization and max_chars:
                 # Use prioritized extraction
                 prioritized_result = self.pdf_processor.extract_prioritized_text(
@@ -95,56 +124,43 @@ class TextExtractor:
                         f"{prioritized_result.final_length:,} chars. "
                         f"Sections: {', '.join(prioritized_result.sections_included)}"
                     )
-            else:
-                # Use full extraction (no truncation)
-                pdf_text = extract_text_from_pdf(pdf_path)
-            
-            extraction_time = time.time() - extraction_start
-            
-            if not pdf_text or len(pdf_text.strip()) < 100:
-                # Gather diagnostic information
-                pdf_size = pdf_path.stat().st_size if pdf_path.exists() else 0
-                pdf_exists = pdf_path.exists()
-                extracted_chars = len(pdf_text) if pdf_text else 0
-                extracted_words = len(pdf_text.split()) if pdf_text else 0
                 
-                error_msg = (
-                    f"Insufficient text extracted from PDF "
-                    f"(less than 100 characters). "
-                    f"Extracted: {extracted_chars} chars, {extracted_words} words. "
-                    f"PDF: {pdf_path.name} ({pdf_size:,} bytes, exists: {pdf_exists})"
-                )
-                logger.warning(f"[{citation_key}] {error_msg}")
-                logger.warning(f"  PDF path: {pdf_path.resolve()}")
-                logger.warning(f"  This may indicate a scanned PDF, corrupted file, or extraction issue")
-                return False, error_msg, 0
+                if not pdf_text or len(pdf_text.strip()) < MIN_TEXT_CHARS:
+                    # Gather diagnostic information
+                    pdf_size = pdf_path.stat().st_size if pdf_path.exists() else 0
+                    pdf_exists = pdf_path.exists()
+                    extracted_chars = len(pdf_text) if pdf_text else 0
+                    extracted_words = len(pdf_text.split()) if pdf_text else 0
+                    
+                    error_msg = (
+                        f"Insufficient text extracted from PDF "
+                        f"(less than {MIN_TEXT_CHARS} characters). "
+                        f"Extracted: {extracted_chars} chars, {extracted_words} words. "
+                        f"PDF: {pdf_path.name} ({pdf_size:,} bytes, exists: {pdf_exists})"
+                    )
+                    logger.warning(f"[{citation_key}] {error_msg}")
+                    logger.warning(f"  PDF path: {pdf_path.resolve()}")
+                    logger.warning(f"  This may indicate a scanned PDF, corrupted file, or extraction issue")
+                    return False, error_msg, 0
             
-            # Save extracted text to file
+            # Save extracted text to file; full extraction streams the pages
+            # straight to the file (too little text raises PDFValidationError)
             try:
-                extracted_text_path.write_text(pdf_text, encoding='utf-8')
-                file_size = extracted_text_path.stat().st_size
-                
-                chars_extracted = len(pdf_text)
-                words_extracted = len(pdf_text.split())
-                
-                abs_extracted_path = extracted_text_path.resolve()
-                abs_pdf_path = pdf_path.resolve()
-                file_size = extracted_text_path.stat().st_size
-                logger.info(
-                    f"[{citation_key}] Extracted and saved text: "
-                    f"{chars_extracted:,} chars, {words_extracted:,} words "
-                    f"({extraction_time:.2f}s, {file_size:,} bytes) -> {abs_extracted_path} (from {abs_pdf_path})"
-                )
-                
-                return True, None, chars_extracted
-                
-            except Exception as e:
+                if pdf_text is None:
+                    info = write_pdf_text(pdf_path, extracted_text_path, min_chars=MIN_TEXT_CHARS)
+                    chars_extracted = info.chars
+                    words_extracted = info.words
+                else:
+                    write_text_atomic(extracted_text_path, pdf_text)
+                    chars_extracted = len(pdf_text)
+                    words_extracted = len(pdf_text.split())
+            except OSError as e:
                 error_msg = f"Failed to save extracted text: {e}"
                 abs_extracted_path = extracted_text_path.resolve()
                 abs_pdf_path = pdf_path.resolve()
                 
                 # Gather diagnostic information
-                text_length = len(pdf_text) if pdf_text else 0
+                text_length = len(pdf_text) if pdf_text else info.chars
                 output_dir_exists = extracted_text_path.parent.exists()
                 output_dir_writable = extracted_text_path.parent.is_dir() and os.access(extracted_text_path.parent, os.W_OK) if output_dir_exists else False
                 
@@ -154,7 +170,24 @@ class TextExtractor:
                 logger.error(f"  Extracted text length: {text_length:,} chars")
                 logger.error(f"  Output directory exists: {output_dir_exists}, writable: {output_dir_writable}")
                 logger.error(f"  Error type: {type(e).__name__}")
-                return False, error_msg, len(pdf_text) if pdf_text else 0
+                return False, error_msg, text_length
+            
+            extraction_time = time.time() - extraction_start
+            self._record(
+                citation_key, pdf_path, extracted_text_path, chars_extracted, words_extracted,
+                pages=info.pages or None, backend=info.backend or None
+            )
+            
+            abs_extracted_path = extracted_text_path.resolve()
+            abs_pdf_path = pdf_path.resolve()
+            file_size = extracted_text_path.stat().st_size
+            logger.info(
+                f"[{citation_key}] Extracted and saved text: "
+                f"{chars_extracted:,} chars, {words_extracted:,} words "
+                f"({extraction_time:.2f}s, {file_size:,} bytes) -> {abs_extracted_path} (from {abs_pdf_path})"
+            )
+            
+            return True, None, chars_extracted
                 
         except PDFValidationError as e:
             extraction_time = time.time() - extraction_start
@@ -192,6 +225,161 @@ class TextExtractor:
             logger.debug(f"Full traceback for {citation_key}:", exc_info=True)
             return False, error_msg, 0
     
+    def extract_many(
+        self,
+        papers: Sequence[Tuple[Path, str]],
+        workers: int = 1,
+        timeout: float = 300.0
+    ) -> Iterator[Tuple[str, Path, ExtractionOutcome]]:
+        """Extract full text for a batch of PDFs, optionally in worker processes.
+        
+        Existing and duplicate texts are resolved in this process; the
+        remaining PDFs are extracted by an ``ExtractionPool`` when
+        ``workers`` > 1, where a PDF exceeding ``timeout`` seconds is skipped.
+        
+        Args:
+            papers: (pdf_path, citation_key) per paper.
+            workers: Worker processes; 1 extracts sequentially in-process.
+            timeout: Per-PDF time limit in seconds for worker processes.
+            
+        Yields:
+            (citation_key, pdf_path, outcome) as each paper completes, with
+            outcome as returned by ``extract_and_save``.
+        """
+        if workers <= 1:
+            for pdf_path, citation_key in papers:
+                yield citation_key, pdf_path, self.extract_and_save(pdf_path, citation_key)
+            return
+        
+        with self.manifest.batch():
+            tasks = []
+            pdf_paths = {}
+            for pdf_path, citation_key in papers:
+                extracted_text_path = self.extracted_text_dir / f"{citation_key}.txt"
+                chars = self._existing_chars(pdf_path, citation_key, extracted_text_path)
+                if chars is None:
+                    chars = self._reuse_duplicate_text(pdf_path, citation_key, extracted_text_path)
+                if chars is not None:
+                    yield citation_key, pdf_path, (True, None, chars)
+                    continue
+                pdf_paths[citation_key] = pdf_path
+                tasks.append((citation_key, pdf_path, extracted_text_path))
+            
+            if not tasks:
+                return
+            logger.info(f"Extracting {len(tasks)} PDFs with {min(workers, len(tasks))} worker processes")
+            for citation_key, outcome, info in ExtractionPool(workers, timeout).run(tasks):
+                pdf_path = pdf_paths[citation_key]
+                if outcome[0] and info is not None:
+                    self._record(
+                        citation_key, pdf_path, self.extracted_text_dir / f"{citation_key}.txt",
+                        info.chars, info.words, pages=info.pages, backend=info.backend
+                    )
+                yield citation_key, pdf_path, outcome
+    
+    def _pdf_hash(self, citation_key: str, pdf_path: Path) -> Optional[str]:
+        """SHA-256 of a PDF, through the content index when available."""
+        try:
+            if self.content_index is not None:
+                return self.content_index.hash_of(citation_key, pdf_path)
+            return file_sha256(pdf_path)
+        except OSError:
+            return None
+    
+    def _record(
+        self,
+        citation_key: str,
+        pdf_path: Path,
+        text_path: Path,
+        chars: int,
+        words: int,
+        pages: Optional[int] = None,
+        backend: Optional[str] = None
+    ) -> None:
+        """Record a written text file in the manifest."""
+        try:
+            self.manifest.record(
+                citation_key, pdf_path, text_path, self._pdf_hash(citation_key, pdf_path),
+                chars, words, pages=pages, backend=backend
+            )
+        except FileOperationError as e:
+            logger.warning(f"[{citation_key}] Could not save extraction manifest: {e}")
+    
+    def _existing_chars(self, pdf_path: Path, citation_key: str, text_path: Path) -> Optional[int]:
+        """Character count of an up-to-date existing text file.
+        
+        Recorded texts are checked against the manifest without being read.
+        Texts without a record (extracted before the manifest existed) are
+        read once and adopted.
+        
+        Returns:
+            Characters of the existing text, or None if it must be (re-)extracted.
+        """
+        if not text_path.exists():
+            return None
+        record = self.manifest.get(citation_key)
+        if record is not None:
+            if self.manifest.is_fresh(
+                citation_key, pdf_path, text_path, lambda: self._pdf_hash(citation_key, pdf_path)
+            ):
+                return record["chars"]
+            logger.info(f"[{citation_key}] PDF or extractor changed since last extraction; re-extracting")
+            return None
+        try:
+            text = text_path.read_text(encoding='utf-8')
+        except Exception as e:
+            logger.warning(
+                f"[{citation_key}] Failed to read existing extracted text: {e}. "
+                f"Re-extracting..."
+            )
+            return None
+        self._record(citation_key, pdf_path, text_path, len(text), len(text.split()))
+        return len(text)
+    
+    def _reuse_duplicate_text(
+        self,
+        pdf_path: Path,
+        citation_key: str,
+        extracted_text_path: Path
+    ) -> Optional[int]:
+        """Copy the extracted text of a duplicate PDF, if one exists.
+        
+        Returns:
+            Characters reused, or None if no duplicate text is available.
+        """
+        if self.content_index is None:
+            return None
+        try:
+            duplicates = self.content_index.duplicates_of(citation_key, pdf_path)
+        except OSError as e:
+            logger.debug(f"[{citation_key}] Could not hash PDF for duplicate lookup: {e}")
+            return None
+        for duplicate_key in duplicates:
+            duplicate_path = self.extracted_text_dir / f"{duplicate_key}.txt"
+            if not duplicate_path.exists():
+                continue
+            record = self.manifest.get(duplicate_key)
+            if record is not None and record.get("extractor_version") != EXTRACTOR_VERSION:
+                continue
+            try:
+                shutil.copyfile(duplicate_path, extracted_text_path)
+                if record is None:
+                    text = extracted_text_path.read_text(encoding='utf-8')
+                    record = {"chars": len(text), "words": len(text.split())}
+            except OSError as e:
+                logger.warning(f"[{citation_key}] Failed to reuse extracted text of {duplicate_key}: {e}")
+                return None
+            self._record(
+                citation_key, pdf_path, extracted_text_path, record["chars"], record["words"],
+                pages=record.get("pages"), backend=record.get("backend")
+            )
+            logger.info(
+                f"[{citation_key}] Same PDF content as {duplicate_key}; "
+                f"reused its extracted text ({record['chars']:,} chars)"
+            )
+            return record["chars"]
+        return None
+    
     def load_extracted_text(self, citation_key: str) -> Optional[str]:
         """Load extracted text from file.
         
@@ -220,6 +408,25 @@ class TextExtractor:
             )
             return None
     
+    def is_up_to_date(self, citation_key: str, pdf_path: Path) -> bool:
+        """Check if extracted text exists and matches the current PDF and extractor.
+        
+        Args:
+            citation_key: Citation key for the paper.
+            pdf_path: Path to the paper's PDF.
+            
+        Returns:
+            True if the text need not be extracted again.
+        """
+        extracted_text_path = self.extracted_text_dir / f"{citation_key}.txt"
+        if not extracted_text_path.exists():
+            return False
+        if self.manifest.get(citation_key) is None:
+            return True
+        return self.manifest.is_fresh(
+            citation_key, pdf_path, extracted_text_path, lambda: self._pdf_hash(citation_key, pdf_path)
+        )
+    
     def has_extracted_text(self, citation_key: str) -> bool:
         """Check if extracted text exists for a citation key.
         
@@ -22,6 +22,11 @@ from infrastructure.literature.summarization.validator import SummaryQualityVali
 from infrastructure.literature.summarization.prompt_builder import SummarizationPromptBuilder
 from infrastructure.literature.summarization.streaming import stream_with_progress
 from infrastructure.literature.summarization.chunker import PDFChunker, ChunkingResult
+from infrastructure.literature.summarization.chunk_map import (
+    chunk_concurrency_from_env,
+    chunk_retries_from_env,
+    map_chunks,
+)
 from infrastructure.literature.summarization.utils import detect_model_size
 
 if TYPE_CHECKING:
@@ -94,7 +99,7 @@ class MultiStageSummarizer:
     - Model-aware generation options (temperature, max_tokens)
     - Post-processing deduplication before validation
     - Fallback refinement strategies (simpler prompts, lower temperature)
-    - Two-stage mode for large texts (chunk → summarize → combine)
+    - Two-stage mode for large texts (chunk → summarize chunks concurrently → combine)
     - Automatic retry with different strategies on failure
     """
     
@@ -107,7 +112,9 @@ class MultiStageSummarizer:
         two_stage_enabled: Optional[bool] = None,
         chunk_size: Optional[int] = None,
         chunk_overlap: Optional[int] = None,
-        two_stage_threshold: Optional[int] = None
+        two_stage_threshold: Optional[int] = None,
+        chunk_concurrency: Optional[int] = None,
+        chunk_retries: Optional[int] = None
     ):
         """Initialize multi-stage summarizer.
         
@@ -120,6 +127,9 @@ class MultiStageSummarizer:
             chunk_size: Target chunk size in chars (default: 15000).
             chunk_overlap: Overlap between chunks in chars (default: 500).
             two_stage_threshold: Text size threshold to trigger two-stage mode (default: 200000).
+            chunk_concurrency: Maximum chunk prompts in flight at once (default:
+                LITERATURE_CHUNK_CONCURRENCY, or 1).
+            chunk_retries: Retries of failed chunks (default: 1).
         """
         import os
         
@@ -153,6 +163,10 @@ class MultiStageSummarizer:
             chunk_overlap=self.chunk_overlap
         )
         
+        # Chunks summarized concurrently in two-stage mode
+        self.chunk_concurrency = chunk_concurrency or chunk_concurrency_from_env()
+        self.chunk_retries = chunk_retries if chunk_retries is not None else chunk_retries_from_env()
+        
         # Auto two-stage fallback configuration
         import os
         auto_two_stage_str = os.environ.get('LITERATURE_AUTO_TWO_STAGE', 'true').lower()
@@ -529,28 +543,17 @@ class MultiStageSummarizer:
                 message=f"Summarizing {chunking_result.total_chunks} chunks..."
             ))
         
-        chunk_summaries = []
-        for i, chunk in enumerate(chunking_result.chunks):
+        total_chunks = chunking_result.total_chunks
+        # Chunk workers join the paper's session (keep_alive and metrics)
+        session = self.llm_client.active_session
+
+        def summarize_chunk(i: int, chunk) -> str:
             chunk_num = i + 1
             logger.info(
-                f"[{citation_key}] Summarizing chunk {chunk_num}/{chunking_result.total_chunks} "
+                f"[{citation_key}] Summarizing chunk {chunk_num}/{total_chunks} "
                 f"({len(chunk.text):,} chars, section: {chunk.section_name or 'unknown'})..."
             )
             
-            if progress_callback:
-                progress_callback(SummarizationProgressEvent(
-                    citation_key=citation_key,
-                    stage="chunk_summarization",
-                    status="in_progress",
-                    message=f"Summarizing chunk {chunk_num}/{chunking_result.total_chunks}...",
-                    metadata={
-                        "chunk_index": chunk_num,
-                        "total_chunks": chunking_result.total_chunks,
-                        "chunk_size": len(chunk.text),
-                        "section_name": chunk.section_name
-                    }
-                ))
-            
             # Create a simplified context for this chunk
             chunk_context = SummarizationContext(
                 title=context.title,
@@ -564,7 +567,7 @@ class MultiStageSummarizer:
             
             # Build prompt for chunk summary
             chunk_metadata = metadata.copy()
-            chunk_metadata['chunk_info'] = f"Chunk {chunk_num} of {chunking_result.total_chunks}"
+            chunk_metadata['chunk_info'] = f"Chunk {chunk_num} of {total_chunks}"
             chunk_prompt = self.prompt_builder.build_draft_prompt(chunk_context, chunk_metadata)
             
             # Get generation options for chunk
@@ -573,9 +576,9 @@ class MultiStageSummarizer:
                 self.llm_client, chunk_metadata, stage="draft", has_repetition_issue=False
             )
             
-            # Summarize chunk
-            try:
-                chunk_summary = stream_with_progress(
+            # Summarize chunk in its own conversation so concurrent chunks stay independent
+            with self.llm_client.use_session(session), self.llm_client.conversation():
+                return stream_with_progress(
                     llm_client=self.llm_client,
                     prompt=chunk_prompt,
                     progress_callback=None,  # Don't emit progress for individual chunks
@@ -584,23 +587,47 @@ class MultiStageSummarizer:
                     update_interval=5.0,
                     options=chunk_gen_options
                 )
-                
-                if chunk_summary and chunk_summary.strip():
-                    chunk_summaries.append(chunk_summary)
-                    logger.info(
-                        f"[{citation_key}] Chunk {chunk_num} summarized: {len(chunk_summary.split())} words"
-                    )
-                else:
-                    logger.warning(f"[{citation_key}] Chunk {chunk_num} produced empty summary")
-            except Exception as e:
-                logger.error(f"[{citation_key}] Failed to summarize chunk {chunk_num}: {e}")
-                # Continue with other chunks
+        
+        def on_chunk_done(i: int, chunk_summary: Optional[str], error: Optional[str]) -> None:
+            chunk = chunking_result.chunks[i]
+            if error is None:
+                logger.info(
+                    f"[{citation_key}] Chunk {i + 1} summarized: {len(chunk_summary.split())} words"
+                )
+            if progress_callback:
+                progress_callback(SummarizationProgressEvent(
+                    citation_key=citation_key,
+                    stage="chunk_summarization",
+                    status="in_progress",
+                    message=(
+                        f"Summarized chunk {i + 1}/{total_chunks}" if error is None
+                        else f"Chunk {i + 1}/{total_chunks} failed: {error}"
+                    ),
+                    metadata={
+                        "chunk_index": i + 1,
+                        "total_chunks": total_chunks,
+                        "chunk_size": len(chunk.text),
+                        "section_name": chunk.section_name,
+                        "error": error
+                    }
+                ))
+        
+        chunk_map = map_chunks(
+            summarize_chunk,
+            chunking_result.chunks,
+            max_in_flight=self.chunk_concurrency,
+            retries=self.chunk_retries,
+            on_result=on_chunk_done,
+            label=f"[{citation_key}] Chunk"
+        )
+        chunk_summaries = chunk_map.successful
         
         if not chunk_summaries:
             raise ValueError(f"No chunk summaries generated for {citation_key}")
         
         logger.info(
-            f"[{citation_key}] Chunk summarization completed: {len(chunk_summaries)}/{chunking_result.total_chunks} chunks summarized"
+            f"[{citation_key}] Chunk summarization completed: {len(chunk_summaries)}/{chunking_result.total_chunks} chunks summarized "
+            f"in {chunk_map.elapsed:.2f}s ({self.chunk_concurrency} in flight)"
         )
         
         if progress_callback:
@@ -779,6 +806,8 @@ class MultiStageSummarizer:
         
         # Generate refined summary using streaming with progress updates
         try:
+            # The prompt already carries the paper and draft; start from a fresh
+            # context so the draft conversation is not sent a second time
             refined = stream_with_progress(
                 llm_client=self.llm_client,
                 prompt=prompt,
@@ -786,7 +815,8 @@ class MultiStageSummarizer:
                 citation_key=citation_key,
                 stage="refinement",
                 update_interval=5.0,
-                options=gen_options
+                options=gen_options,
+                reset_context=True
             )
             refine_time = time.time() - refine_start_time
             
@@ -6,11 +6,14 @@ from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
+from infrastructure.core.exceptions import FileOperationError
 from infrastructure.core.logging_utils import get_logger, log_header, log_success
 from infrastructure.literature.library.index import LibraryEntry
 from infrastructure.literature.sources import SearchResult
 from infrastructure.literature.summarization.core import SummarizationEngine
+from infrastructure.literature.summarization.corpus import build_corpus
 from infrastructure.literature.summarization.extractor import TextExtractor
+from infrastructure.literature.summarization.planner import BuildPlan, BuildPlanner
 
 if TYPE_CHECKING:
     from infrastructure.literature.workflow.workflow import LiteratureWorkflow
@@ -20,113 +23,67 @@ logger = get_logger(__name__)
 MAX_PARALLEL_SUMMARIES = int(os.environ.get("MAX_PARALLEL_SUMMARIES", "1"))
 
 
-def find_papers_needing_extraction(library_entries: List[LibraryEntry]) -> List[Tuple[SearchResult, Path]]:
-    """Find papers that need text extraction (have PDF but no extracted text).
+def _to_search_result(entry: LibraryEntry) -> SearchResult:
+    """Convert a library entry to a search result for the pipeline stages."""
+    # LibraryEntry doesn't have pdf_url; use the one in metadata if available
+    pdf_url = entry.metadata.get("pdf_url") if entry.metadata else None
+    return SearchResult(
+        title=entry.title,
+        authors=entry.authors or [],
+        year=entry.year,
+        doi=entry.doi,
+        url=entry.url,
+        pdf_url=pdf_url,
+        abstract=entry.abstract,
+        source=entry.source or "library"
+    )
+
+
+def find_papers_needing_extraction(
+    library_entries: List[LibraryEntry],
+    plan: Optional[BuildPlan] = None
+) -> List[Tuple[SearchResult, Path]]:
+    """Find papers that need text extraction (have PDF but no up-to-date extracted text).
+    
+    Extracted texts whose PDF content or extractor version changed since
+    extraction (see ExtractionManifest) are extracted again.
+    
+    Args:
+        library_entries: Library entries to check.
+        plan: Build plan of the entries (computed if None).
     
     Returns:
         List of tuples (SearchResult, pdf_path) for papers needing extraction.
     """
-    extractor = TextExtractor()
-    papers_needing_extraction = []
-    
-    for entry in library_entries:
-        # Check if PDF exists
-        pdf_path = None
-        if entry.pdf_path:
-            pdf_path = Path(entry.pdf_path)
-            if not pdf_path.is_absolute():
-                pdf_path = Path("literature") / pdf_path
-            if not pdf_path.exists():
-                pdf_path = None
-        
-        # Check expected location
-        if not pdf_path:
-            expected_pdf = Path("data/pdfs") / f"{entry.citation_key}.pdf"
-            if expected_pdf.exists():
-                pdf_path = expected_pdf
-        
-        if not pdf_path or not pdf_path.exists():
-            continue
-        
-        # Check if extracted text already exists
-        if extractor.has_extracted_text(entry.citation_key):
-            continue
-        
-        # Convert to search result
-        pdf_url = entry.metadata.get("pdf_url") if entry.metadata else None
-        
-        search_result = SearchResult(
-            title=entry.title,
-            authors=entry.authors or [],
-            year=entry.year,
-            doi=entry.doi,
-            url=entry.url,
-            pdf_url=pdf_url,
-            abstract=entry.abstract,
-            source=entry.source or "library"
-        )
-        
-        papers_needing_extraction.append((search_result, pdf_path))
-    
-    return papers_needing_extraction
+    plan = plan or BuildPlanner().plan(library_entries)
+    return [(_to_search_result(p.entry), p.pdf_path) for p in plan.ready("text")]
 
 
-def find_papers_needing_summary(library_entries: List[LibraryEntry]) -> List[Tuple[SearchResult, Path]]:
-    """Find papers that need summaries (have PDF and extracted text but no summary)."""
-    extractor = TextExtractor()
-    papers_needing_summary = []
+def find_papers_needing_summary(
+    library_entries: List[LibraryEntry],
+    plan: Optional[BuildPlan] = None
+) -> List[Tuple[SearchResult, Path]]:
+    """Find papers that need summaries (have PDF and up-to-date extracted text but no current summary).
     
-    for entry in library_entries:
-        # Check if PDF exists
-        pdf_path = None
-        if entry.pdf_path:
-            pdf_path = Path(entry.pdf_path)
-            if not pdf_path.is_absolute():
-                pdf_path = Path("literature") / pdf_path
-            if not pdf_path.exists():
-                pdf_path = None
-        
-        # Check expected location
-        if not pdf_path:
-            expected_pdf = Path("data/pdfs") / f"{entry.citation_key}.pdf"
-            if expected_pdf.exists():
-                pdf_path = expected_pdf
-        
-        if not pdf_path or not pdf_path.exists():
-            continue
-        
-        # Check if extracted text exists (required for summarization)
-        if not extractor.has_extracted_text(entry.citation_key):
+    Summaries whose extracted text or summarizer version changed since they
+    were generated (see SummaryManifest) are generated again. Papers whose
+    text is missing or stale are left for the extraction step.
+    
+    Args:
+        library_entries: Library entries to check.
+        plan: Build plan of the entries (computed if None).
+    
+    Returns:
+        List of tuples (SearchResult, pdf_path) for papers needing summaries.
+    """
+    plan = plan or BuildPlanner().plan(library_entries)
+    for paper in plan.stage("summary"):
+        if paper.stages[0] == "text":
             logger.debug(
-                f"[{entry.citation_key}] Skipping summarization - no extracted text found. "
+                f"[{paper.citation_key}] Skipping summarization - extracted text missing or stale. "
                 f"Run extraction step first."
             )
-            continue
-        
-        # Check if summary exists
-        summary_path = Path("data/summaries") / f"{entry.citation_key}_summary.md"
-        if summary_path.exists():
-            continue
-        
-        # Convert to search result
-        # LibraryEntry doesn't have pdf_url, but we have the PDF file path
-        # Extract pdf_url from metadata if available, otherwise use None
-        pdf_url = entry.metadata.get("pdf_url") if entry.metadata else None
-        
-        search_result = SearchResult(
-            title=entry.title,
-            authors=entry.authors or [],
-            year=entry.year,
-            doi=entry.doi,
-            url=entry.url,
-            pdf_url=pdf_url,
-            abstract=entry.abstract,
-            source=entry.source or "library"
-        )
-        
-        papers_needing_summary.append((search_result, pdf_path))
-    
-    return papers_needing_summary
+    return [(_to_search_result(p.entry), p.pdf_path) for p in plan.ready("summary")]
 
 
 def get_library_analysis(library_entries: List[LibraryEntry]) -> Dict[str, int]:
@@ -212,8 +169,8 @@ def get_library_analysis(library_entries: List[LibraryEntry]) -> Dict[str, int]:
                 pdf_path = expected_pdf
         
         has_pdf = pdf_path is not None and pdf_path.exists()
-        has_extracted_text = (Path("data/extracted_text") / f"{citation_key}.txt").exists()
-        has_summary = (Path("data/summaries") / f"{citation_key}_summary.md").exists()
+        has_extracted_text = citation_key in extracted_text_keys_filesystem
+        has_summary = citation_key in summary_keys_filesystem
         
         # Categorize
         if has_pdf:
@@ -274,12 +231,12 @@ def find_papers_needing_processing(
 ) -> Dict[str, List[LibraryEntry]]:
     """Find papers needing different types of processing."""
     from infrastructure.literature.workflow.operations.download import find_papers_needing_pdf
-    extractor = TextExtractor()
+    plan = BuildPlanner().plan(library_entries)
     
     return {
         'need_pdf': find_papers_needing_pdf(library_entries),
-        'need_extraction': [e for e in library_entries if e.pdf_path and not extractor.has_extracted_text(e.citation_key)],
-        'need_summary': [e for e in library_entries if e.pdf_path and extractor.has_extracted_text(e.citation_key) and not Path(f"data/summaries/{e.citation_key}_summary.md").exists()]
+        'need_extraction': [p.entry for p in plan.ready("text")],
+        'need_summary': [p.entry for p in plan.ready("summary")]
     }
 
 
@@ -325,32 +282,33 @@ def run_extract_text(workflow: "LiteratureWorkflow") -> int:
     logger.info(f"  PDF and extracted text: {analysis['papers_with_extracted_text']}")
     logger.info(f"  Extracted text not in bibliography (orphaned): {analysis['extracted_text_not_in_bibliography']}")
     
-    if analysis['papers_needing_extraction'] == 0:
-        logger.info("All papers with PDFs already have extracted text. Nothing to do.")
-        return 0
+    # Find papers needing extraction (missing or stale text)
+    extractor = TextExtractor(content_index=workflow.content_index)
+    plan = BuildPlanner(extractor).plan(library_entries)
+    papers_needing_extraction = find_papers_needing_extraction(library_entries, plan)
     
-    # Find papers needing extraction
-    papers_needing_extraction = find_papers_needing_extraction(library_entries)
+    if not papers_needing_extraction:
+        logger.info("All papers with PDFs already have up-to-date extracted text. Nothing to do.")
+        return 0
     
     # Extract text
     log_header("EXTRACTING TEXT")
     logger.info(f"Processing {len(papers_needing_extraction)} papers")
     
-    extractor = TextExtractor()
+    config = workflow.literature_search.config
+    workers = config.extraction_workers or os.cpu_count() or 1
     successful = 0
     failed = 0
     skipped = 0
     
-    for search_result, pdf_path in papers_needing_extraction:
-        citation_key = pdf_path.stem
+    # Full text, no truncation; worker processes when extraction_workers > 1
+    papers = [(pdf_path, pdf_path.stem) for _, pdf_path in papers_needing_extraction]
+    for citation_key, pdf_path, outcome in extractor.extract_many(
+        papers, workers=workers, timeout=config.extraction_timeout
+    ):
+        success, error_msg, chars_extracted = outcome
         extracted_path = Path("data/extracted_text") / f"{citation_key}.txt"
         
-        success, error_msg, chars_extracted = extractor.extract_and_save(
-            pdf_path=pdf_path,
-            citation_key=citation_key,
-            use_prioritization=False  # Extract full text, no truncation
-        )
-        
         if success:
             successful += 1
             # Enhanced success logging with absolute paths and file size
@@ -385,6 +343,13 @@ def run_extract_text(workflow: "LiteratureWorkflow") -> int:
     if len(papers_needing_extraction) > 0:
         logger.info(f"Success rate: {(successful / len(papers_needing_extraction)) * 100:.1f}%")
     
+    # Repack the corpus so bulk readers see the new texts
+    if config.pack_extracted_text:
+        try:
+            build_corpus(extractor.extracted_text_dir, codec=config.corpus_codec)
+        except (ValueError, FileOperationError) as e:
+            logger.warning(f"Could not pack extracted texts: {e}")
+    
     log_success("Text extraction complete!")
     return 0 if failed == 0 else 1
 
@@ -437,13 +402,13 @@ def run_summarize(workflow: "LiteratureWorkflow") -> int:
     logger.info(f"  Extracted text not in bibliography (orphaned): {analysis['extracted_text_not_in_bibliography']}")
     logger.info(f"  Summary not in bibliography (orphaned): {analysis['summary_not_in_bibliography']}")
 
-    if analysis['papers_needing_summary'] == 0:
-        logger.info("All papers with PDFs already have summaries. Nothing to do.")
-        return 0
-
-    # Find papers needing summaries
+    # Find papers needing summaries (missing or stale summary)
     papers_needing_summary = find_papers_needing_summary(library_entries)
 
+    if not papers_needing_summary:
+        logger.info("All papers with extracted text already have up-to-date summaries. Nothing to do.")
+        return 0
+
     # Generate summaries
     log_header("GENERATING SUMMARIES")
     logger.info(f"Processing {len(papers_needing_summary)} papers")
@@ -485,6 +450,12 @@ def run_summarize(workflow: "LiteratureWorkflow") -> int:
         logger.info(f"Summaries skipped (already exist): {skipped}")
     logger.info(f"Summary failures: {failed}")
     logger.info(f"Success rate: {(successful / len(papers_needing_summary)) * 100:.1f}%")
+    cache_stats = workflow.summarizer.llm_client.get_cache_stats()
+    if cache_stats:
+        logger.info(
+            f"LLM response cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+            f"({cache_stats['hit_rate']:.0%} hit rate, {cache_stats['entries']} entries)"
+        )
 
     log_success("Summary generation complete!")
     return 0
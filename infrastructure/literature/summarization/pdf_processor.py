@@ -9,10 +9,10 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from infrastructure.core.logging_utils import get_logger
-from infrastructure.validation.pdf_validator import extract_text_from_pdf
+from infrastructure.validation.pdf_validator import extract_text_from_pdf, iter_pdf_pages
 
 logger = get_logger(__name__)
 
@@ -67,6 +67,9 @@ class PDFProcessor:
         ],
     }
     
+    # Header that ends the abstract
+    ABSTRACT_END_PATTERN = r'^\s*(?:1\.?\s+)?(?:Introduction|Background|Keywords|1\.)\s*$'
+    
     # Priority order for sections (higher priority preserved first)
     SECTION_PRIORITY = ['title', 'abstract', 'introduction', 'conclusion']
     
@@ -78,6 +81,14 @@ class PDFProcessor:
         'conclusion': 3000,  # Last 2000 words of conclusion
     }
     
+    @staticmethod
+    def _looks_like_title(line: str) -> bool:
+        """Whether a stripped line is a substantial line that may be the title."""
+        return (
+            10 < len(line) < 200
+            and not line.lower().startswith(('abstract', 'introduction', 'keywords', 'author'))
+        )
+    
     def identify_sections(self, pdf_text: str) -> Dict[str, Tuple[int, int]]:
         """Identify key sections in PDF text.
         
@@ -95,9 +106,7 @@ class PDFProcessor:
         if not sections.get('title'):
             for i, line in enumerate(lines[:20]):  # Check first 20 lines
                 line_stripped = line.strip()
-                if (len(line_stripped) > 10 and 
-                    len(line_stripped) < 200 and
-                    not line_stripped.lower().startswith(('abstract', 'introduction', 'keywords', 'author'))):
+                if self._looks_like_title(line_stripped):
                     # Likely title - take first substantial line
                     start = sum(len(l) + 1 for l in lines[:i])  # +1 for newline
                     end = start + len(line_stripped)
@@ -111,7 +120,7 @@ class PDFProcessor:
                 start = match.end()
                 # Abstract typically ends before Introduction or next major section
                 next_section = re.search(
-                    r'^\s*(?:1\.?\s+)?(?:Introduction|Background|Keywords|1\.)\s*$',
+                    self.ABSTRACT_END_PATTERN,
                     pdf_text[start:],
                     re.IGNORECASE | re.MULTILINE
                 )
@@ -265,6 +274,85 @@ class PDFProcessor:
         
         return final_text, included_sections, excluded_sections
     
+    def extract_sections(
+        self,
+        pdf_path: Path,
+        sections: Sequence[str] = ('title', 'abstract', 'introduction'),
+        max_pages: Optional[int] = None
+    ) -> Dict[str, str]:
+        """Extract leading sections, parsing only as many pages as needed.
+        
+        Pages are parsed one at a time and each new page is scanned once for
+        section headers; parsing stops as soon as every requested section
+        is complete in the text read so far, so e.g. the abstract of a long
+        paper costs one or two pages. ``identify_sections`` then runs once
+        on that text. Sections that run to the end of the paper
+        ('conclusion') require the whole document.
+        
+        Args:
+            pdf_path: Path to PDF file.
+            sections: Section names to extract (see SECTION_PRIORITY).
+            max_pages: Maximum pages to parse (default: until found or end).
+            
+        Returns:
+            Dictionary mapping each section found to its text.
+        """
+        pages: List[str] = []
+        length = 0
+        lines = 0
+        title_found = False
+        # Offset where the body of each leading section starts
+        starts: Dict[str, int] = {}
+        abstract_ended = False
+        pages_read = 0
+        for page_text in iter_pdf_pages(pdf_path, max_pages=max_pages):
+            pages_read += 1
+            if not page_text:
+                continue
+            offset = length + 1 if pages else 0
+            pages.append(page_text)
+            length = offset + len(page_text)
+            page_lines = page_text.split('\n')
+            # The title is the first substantial line of the first 20
+            if not title_found:
+                title_found = any(self._looks_like_title(line.strip()) for line in page_lines[:max(20 - lines, 0)])
+            lines += len(page_lines)
+            
+            for name in ('abstract', 'introduction'):
+                if name in starts:
+                    continue
+                for pattern in self.SECTION_PATTERNS[name]:
+                    match = re.search(pattern, page_text, re.IGNORECASE | re.MULTILINE)
+                    if match:
+                        starts[name] = offset + match.end()
+                        break
+            if 'abstract' in starts and not abstract_ended:
+                search_from = max(starts['abstract'] - offset, 0)
+                abstract_ended = re.search(
+                    self.ABSTRACT_END_PATTERN, page_text[search_from:], re.IGNORECASE | re.MULTILINE
+                ) is not None
+            
+            complete = {
+                'title': title_found,
+                'abstract': 'abstract' in starts and (
+                    abstract_ended or length >= starts['abstract'] + self.SECTION_TARGET_SIZES['abstract']
+                ),
+                'introduction': 'introduction' in starts and (
+                    length >= starts['introduction'] + self.SECTION_TARGET_SIZES['introduction']
+                ),
+            }
+            if all(complete.get(name, False) for name in sections):
+                break
+        
+        text = "\n".join(pages)
+        found = self.identify_sections(text) if text else {}
+        logger.debug(f"Parsed {pages_read} pages of {pdf_path.name} for sections: {', '.join(sections)}")
+        return {
+            name: text[start:end].strip()
+            for name, (start, end) in found.items()
+            if name in sections
+        }
+    
     def extract_prioritized_text(
         self,
         pdf_path: Path,
@@ -0,0 +1,219 @@
+"""Skip-if-fresh planning of the paper processing pipeline.
+
+Each library paper moves through three stages, and every artifact
+records the input it was built from:
+
+- ``pdf``: the downloaded PDF
+- ``text``: ``data/extracted_text/{key}.txt``, built from the PDF's
+  SHA-256 by the current extractor (see ExtractionManifest)
+- ``summary``: ``data/summaries/{key}_summary.md`` and the classification
+  generated with it, built from the text's SHA-256 by the current
+  summarizer (see SummaryManifest)
+
+``BuildPlanner.plan`` lists each stage directory once, then checks every
+paper against those records with ``stat`` calls, hashing only files whose
+size or mtime changed. As in make, staleness propagates downstream: a
+paper whose text must be re-extracted also needs a new summary. On an
+unchanged library the plan is empty.
+"""
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from infrastructure.core.exceptions import FileOperationError
+from infrastructure.core.logging_utils import get_logger
+from infrastructure.literature.library.index import LibraryEntry
+from infrastructure.literature.summarization.extractor import TextExtractor
+from infrastructure.literature.summarization.summary_manifest import SummaryManifest
+
+logger = get_logger(__name__)
+
+STAGES = ("pdf", "text", "summary")
+
+
+@dataclass
+class PaperPlan:
+    """Stale stages of one library paper.
+
+    Attributes:
+        entry: Library entry of the paper.
+        pdf_path: The paper's PDF, or None if it has not been downloaded.
+        stages: Stages to (re)build, in pipeline order.
+        reasons: Why each stage is stale ("missing", "stale" or "upstream").
+    """
+    entry: LibraryEntry
+    pdf_path: Optional[Path]
+    stages: List[str] = field(default_factory=list)
+    reasons: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def citation_key(self) -> str:
+        return self.entry.citation_key
+
+    def add(self, stage: str, reason: str) -> None:
+        self.stages.append(stage)
+        self.reasons[stage] = reason
+
+
+@dataclass
+class BuildPlan:
+    """Stale work across the pipeline.
+
+    Attributes:
+        papers: Papers with at least one stale stage.
+        up_to_date: Number of papers with nothing to do.
+    """
+    papers: List[PaperPlan] = field(default_factory=list)
+    up_to_date: int = 0
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.papers
+
+    def stage(self, name: str) -> List[PaperPlan]:
+        """Papers for which a stage is stale."""
+        return [p for p in self.papers if name in p.stages]
+
+    def ready(self, name: str) -> List[PaperPlan]:
+        """Papers for which a stage is stale and all earlier stages are fresh."""
+        return [p for p in self.papers if p.stages[0] == name]
+
+    def counts(self) -> Dict[str, int]:
+        """Number of papers per stale stage, plus up-to-date papers."""
+        counts = {name: len(self.stage(name)) for name in STAGES}
+        counts["up_to_date"] = self.up_to_date
+        return counts
+
+
+def _list_dir(directory: Path) -> Set[str]:
+    """File names in a directory (empty if it does not exist)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {e.name for e in entries}
+    except OSError:
+        return set()
+
+
+class BuildPlanner:
+    """Computes the minimal stale work for library papers.
+
+    Attributes:
+        extractor: Text extractor (extracted text directory and manifest).
+        pdf_dir: Directory of downloaded PDFs.
+        summaries_dir: Directory of summaries.
+        summary_manifest: Records of the inputs of each summary.
+    """
+
+    def __init__(
+        self,
+        extractor: Optional[TextExtractor] = None,
+        pdf_dir: Path = Path("data/pdfs"),
+        summaries_dir: Path = Path("data/summaries")
+    ):
+        """Initialize the planner.
+
+        Args:
+            extractor: Text extractor (created if None).
+            pdf_dir: Directory of downloaded PDFs.
+            summaries_dir: Directory of summaries.
+        """
+        self.extractor = extractor or TextExtractor()
+        self.pdf_dir = Path(pdf_dir)
+        self.summaries_dir = Path(summaries_dir)
+        self.summary_manifest = SummaryManifest.for_dir(self.summaries_dir)
+
+    def resolve_pdf(self, entry: LibraryEntry, pdf_names: Optional[Set[str]] = None) -> Optional[Path]:
+        """Locate a library entry's PDF.
+
+        Args:
+            entry: Library entry.
+            pdf_names: File names in ``pdf_dir``, if already listed.
+
+        Returns:
+            Path to the PDF, or None if it does not exist.
+        """
+        if entry.pdf_path:
+            pdf_path = Path(entry.pdf_path)
+            if not pdf_path.is_absolute():
+                pdf_path = Path("literature") / pdf_path
+            if pdf_path.exists():
+                return pdf_path
+        name = f"{entry.citation_key}.pdf"
+        exists = name in pdf_names if pdf_names is not None else (self.pdf_dir / name).exists()
+        return self.pdf_dir / name if exists else None
+
+    def plan(self, library_entries: Iterable[LibraryEntry]) -> BuildPlan:
+        """Check every paper's artifacts against their recorded inputs.
+
+        Summaries generated before the summary manifest existed are adopted
+        (recorded against their current text) as a side effect.
+
+        Args:
+            library_entries: Papers to plan.
+
+        Returns:
+            BuildPlan of the stale stages of each paper.
+        """
+        text_dir = self.extractor.extracted_text_dir
+        pdf_names = _list_dir(self.pdf_dir)
+        text_names = _list_dir(text_dir)
+        summary_names = _list_dir(self.summaries_dir)
+
+        build_plan = BuildPlan()
+        try:
+            with self.summary_manifest.batch():
+                for entry in library_entries:
+                    paper = self._plan_paper(entry, pdf_names, text_names, summary_names)
+                    if paper.stages:
+                        build_plan.papers.append(paper)
+                    else:
+                        build_plan.up_to_date += 1
+        except FileOperationError as e:
+            logger.warning(f"Could not save summary manifest: {e}")
+
+        counts = build_plan.counts()
+        logger.info(
+            f"Build plan: {counts['pdf']} PDFs, {counts['text']} extractions, "
+            f"{counts['summary']} summaries to (re)build; {counts['up_to_date']} papers up to date"
+        )
+        return build_plan
+
+    def _plan_paper(
+        self,
+        entry: LibraryEntry,
+        pdf_names: Set[str],
+        text_names: Set[str],
+        summary_names: Set[str]
+    ) -> PaperPlan:
+        key = entry.citation_key
+        text_path = self.extractor.extracted_text_dir / f"{key}.txt"
+        has_text = text_path.name in text_names
+        has_summary = f"{key}_summary.md" in summary_names
+        paper = PaperPlan(entry=entry, pdf_path=self.resolve_pdf(entry, pdf_names))
+
+        if paper.pdf_path is None:
+            # Nothing to check existing artifacts against until the PDF exists
+            paper.add("pdf", "missing")
+            if not has_text:
+                paper.add("text", "missing")
+            if not has_summary:
+                paper.add("summary", "missing")
+            return paper
+
+        if not has_text:
+            paper.add("text", "missing")
+        elif not self.extractor.is_up_to_date(key, paper.pdf_path):
+            paper.add("text", "stale")
+
+        if not has_summary:
+            paper.add("summary", "missing")
+        elif "text" in paper.stages:
+            paper.add("summary", "upstream")
+        elif self.summary_manifest.get(key) is None:
+            self.summary_manifest.record(key, text_path)
+        elif not self.summary_manifest.is_fresh(key, text_path):
+            paper.add("summary", "stale")
+        return paper
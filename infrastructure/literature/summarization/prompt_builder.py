@@ -2,6 +2,11 @@
 
 This module builds improved multi-stage prompts with examples and
 validation checklists to guide the LLM toward better summaries.
+
+Every prompt starts with the shared paper prefix (``render_paper_prefix``:
+title and full paper text) followed by the stage's task, so the draft,
+refinement and extraction stages of a paper share a prompt prefix whose
+KV cache Ollama can reuse (see ``LLMClient.session``).
 """
 from __future__ import annotations
 
@@ -10,6 +15,7 @@ from typing import List, Optional
 
 from infrastructure.literature.summarization.models import SummarizationContext
 from infrastructure.literature.summarization.utils import detect_model_size
+from infrastructure.llm.templates.research import render_paper_prefix
 
 
 class SummarizationPromptBuilder:
@@ -189,12 +195,12 @@ class SummarizationPromptBuilder:
         citation_key = metadata.get('citation_key', 'unknown')
         is_small = self._is_small_model(metadata)
         
-        # Build prompt sections (optimized, ~50% shorter)
+        # Task sections after the shared paper prefix (optimized, ~50% shorter)
         sections = []
         
-        # CRITICAL: Paper isolation warnings at the start
+        # CRITICAL: Paper isolation warnings right after the paper text
         sections.append("=== IMPORTANT: ISOLATE THIS PAPER ===")
-        sections.append("You are summarizing ONLY the paper below. Do NOT reference or use content from any other papers.")
+        sections.append("You are summarizing ONLY the paper above. Do NOT reference or use content from any other papers.")
         sections.append("Do NOT mix information from different papers. Only use information from THIS specific paper.")
         sections.append("")
         sections.append(f"Paper Title: {title}")
@@ -202,7 +208,7 @@ class SummarizationPromptBuilder:
         if authors:
             sections.append(f"Authors: {', '.join(authors[:3])}")
         sections.append("")
-        sections.append("REMEMBER: Extract quotes, claims, and findings ONLY from the paper text provided below.")
+        sections.append("REMEMBER: Extract quotes, claims, and findings ONLY from the paper text provided above.")
         sections.append("")
         
         # Add year if not already included
@@ -219,31 +225,26 @@ class SummarizationPromptBuilder:
             sections.append(f"Key Terms: {', '.join(context.key_terms[:10])}")
             sections.append("")
         
-        # Section 3: Full Paper Text (single mention, concise instructions)
-        sections.append("=== FULL PAPER TEXT ===")
         if not is_small:
-            sections.append("Use this as your PRIMARY source for all information.")
-        sections.append("")
+            sections.append("Use the FULL PAPER TEXT above as your PRIMARY source for all information.")
+            sections.append("")
+        
+        # Section 3: Instructions (consolidated, model-aware)
+        sections.append(self._build_instructions_section(context, is_small))
+        task = "\n".join(sections)
         
         # Truncate full_text if max_chars provided and needed
         full_text = context.full_text
         if max_chars is not None:
-            # Estimate space for other sections
-            other_sections_size = sum(len(s) for s in sections) + 2000  # Buffer for instructions
-            available_for_text = max_chars - other_sections_size
-            
+            available_for_text = max_chars - len(task) - len(render_paper_prefix(title, "")) - 200
             if len(full_text) > available_for_text:
                 full_text = self._truncate_full_text(full_text, available_for_text, context)
-                sections.append("[NOTE: Paper text has been truncated to fit context window. Key sections (abstract, introduction, conclusion) are preserved.]")
-                sections.append("")
-        
-        sections.append(full_text)
-        sections.append("")
-        
-        # Section 4: Instructions (consolidated, model-aware)
-        sections.append(self._build_instructions_section(context, is_small))
+                task = (
+                    "[NOTE: Paper text has been truncated to fit context window. "
+                    "Key sections (abstract, introduction, conclusion) are preserved.]\n\n" + task
+                )
         
-        return "\n".join(sections)
+        return render_paper_prefix(title, full_text) + task
     
     def build_refinement_prompt(
         self,
@@ -270,10 +271,10 @@ class SummarizationPromptBuilder:
         title = context.title
         citation_key = metadata.get('citation_key', 'unknown') if metadata else 'unknown'
         sections.append("=== IMPORTANT: ISOLATE THIS PAPER ===")
-        sections.append("You are revising a summary for ONLY the paper below. Do NOT reference or use content from any other papers.")
+        sections.append("You are revising a summary for ONLY the paper above. Do NOT reference or use content from any other papers.")
         sections.append(f"Paper Title: {title}")
         sections.append(f"Citation Key: {citation_key}")
-        sections.append("REMEMBER: Extract quotes, claims, and findings ONLY from the paper text provided below.")
+        sections.append("REMEMBER: Extract quotes, claims, and findings ONLY from the paper text provided above.")
         sections.append("")
         
         # Issues (concise)
@@ -296,11 +297,6 @@ class SummarizationPromptBuilder:
             sections.append(f"Key terms: {', '.join(context.key_terms[:8])}")
             sections.append("")
         
-        # Full text (single mention)
-        sections.append("=== FULL PAPER TEXT ===")
-        sections.append(context.full_text)
-        sections.append("")
-        
         # Refinement instructions (consolidated)
         sections.append("=== REVISE TO ===")
         sections.append("PROFESSIONAL TONE: Begin directly with content - NO conversational openings like 'Okay, here's...'")
@@ -333,7 +329,8 @@ class SummarizationPromptBuilder:
         sections.append("")
         sections.append("Generate COMPLETE revised summary.")
         
-        return "\n".join(sections)
+        # Full text (single mention) in the shared paper prefix
+        return render_paper_prefix(title, context.full_text) + "\n".join(sections)
     
     def build_simple_refinement_prompt(
         self,
@@ -359,15 +356,13 @@ class SummarizationPromptBuilder:
         sections.append("Current summary:")
         sections.append(draft[:1500] if len(draft) > 1500 else draft)
         sections.append("")
-        sections.append("Paper text:")
-        sections.append(context.full_text[:30000] if len(context.full_text) > 30000 else context.full_text)
-        sections.append("")
         sections.append("Rewrite the summary fixing the issues. Use exact title: " + context.title)
         sections.append("PROFESSIONAL TONE: Begin directly with content - NO conversational openings.")
         sections.append("NO REPETITION. Each sentence must be unique. Vary attribution phrases.")
         sections.append("Extract quotes VERBATIM from paper text - do NOT modify or \"correct\" them.")
         
-        return "\n".join(sections)
+        paper_text = context.full_text[:30000] if len(context.full_text) > 30000 else context.full_text
+        return render_paper_prefix(context.title, paper_text) + "\n".join(sections)
     
     def _build_instructions_section(self, context: SummarizationContext, is_small: bool = False) -> str:
         """Build strong, explicit instructions section requesting specific elements.
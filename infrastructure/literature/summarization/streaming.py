@@ -48,7 +48,8 @@ def stream_with_progress(
                 adds 1s per 1000 chars of prompt (max 1200s). Considers model type
                 and historical performance for better estimates.
         options: Optional generation options (temperature, max_tokens, etc.).
-        reset_context: Whether to clear LLM context before streaming (default: False).
+        reset_context: Whether to reset LLM context (keeping the system prompt)
+            before streaming (default: False).
                       Note: Context is already cleared at the start of each paper.
         
     Returns:
@@ -76,7 +77,12 @@ def stream_with_progress(
                 "tokens_before": tokens_before
             }
         )
-        llm_client.context.clear()
+        llm_client.reset()
+    
+    # Label the requests of an open session with this stage
+    session = llm_client.active_session
+    if session is not None:
+        session.stage = stage
     
     # Read timeout from environment if not provided
     if timeout is None:
@@ -0,0 +1,140 @@
+"""Manifest of generated summaries.
+
+Every summary in ``data/summaries`` gets a record of the extracted text
+it was generated from (SHA-256, size, mtime) and ``SUMMARIZER_VERSION``.
+The paper's classification is produced in the same pass, so the record
+covers it too. A summary is fresh when:
+
+- it exists and was generated by the current summarizer version
+- its extracted text has the recorded size and mtime, or, if those
+  changed, still has the recorded SHA-256
+
+Summaries generated before the manifest existed have no record and are
+treated as fresh; ``BuildPlanner`` adopts them by recording their current
+text. A summary whose text no longer exists is also treated as fresh,
+since there is nothing to compare it against. The manifest is stored as
+``manifest.json`` in the summaries directory and shared through
+``SummaryManifest.for_dir``.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from infrastructure.core.exceptions import FileOperationError
+from infrastructure.core.json_store import JsonStore
+from infrastructure.core.logging_utils import get_logger
+from infrastructure.literature.pdf.content_index import file_sha256
+
+logger = get_logger(__name__)
+
+# Bump when summary output changes (prompts, passes, post-processing)
+SUMMARIZER_VERSION = "1"
+
+MANIFEST_FILENAME = "manifest.json"
+
+
+class SummaryManifest(JsonStore):
+    """Thread-safe records of generated summaries, keyed by citation key.
+
+    Attributes:
+        path: JSON file holding the manifest.
+    """
+
+    SECTION = "records"
+    DESCRIPTION = "summary manifest"
+
+    @classmethod
+    def for_dir(cls, summaries_dir: Path) -> SummaryManifest:
+        """Get the shared manifest of a summaries directory.
+
+        Args:
+            summaries_dir: Directory holding ``{citation_key}_summary.md`` files.
+
+        Returns:
+            Shared SummaryManifest for ``summaries_dir/manifest.json``.
+        """
+        return cls.shared(Path(summaries_dir) / MANIFEST_FILENAME)
+
+    def get(self, citation_key: str) -> Optional[Dict[str, Any]]:
+        """Record of a citation key's summary, or None."""
+        self._ensure_loaded()
+        with self._lock:
+            record = self._data.get(citation_key)
+            return dict(record) if record else None
+
+    def is_fresh(self, citation_key: str, text_path: Path) -> bool:
+        """Check whether a summary is still valid for its extracted text.
+
+        The text is only hashed when its size or mtime differ from the
+        record. Callers check that the summary file exists.
+
+        Args:
+            citation_key: Citation key.
+            text_path: The key's extracted text file.
+
+        Returns:
+            False if the summary was generated by another summarizer version
+            or from different text; True otherwise (including summaries
+            without a record and texts that no longer exist).
+        """
+        record = self.get(citation_key)
+        if record is None:
+            return True
+        if record.get("summarizer_version") != SUMMARIZER_VERSION:
+            return False
+        try:
+            text_stat = text_path.stat()
+        except OSError:
+            return True
+        if (text_stat.st_size, text_stat.st_mtime) == (record.get("text_size"), record.get("text_mtime")):
+            return True
+        try:
+            text_sha256 = file_sha256(text_path)
+        except OSError:
+            return True
+        if text_sha256 != record.get("text_sha256"):
+            return False
+        # Same text, new stat (e.g. rewritten with identical content)
+        with self._lock:
+            self._data[citation_key].update(text_size=text_stat.st_size, text_mtime=text_stat.st_mtime)
+            try:
+                self._changed()
+            except FileOperationError as e:
+                logger.warning(f"Could not save summary manifest: {e}")
+        return True
+
+    def record(self, citation_key: str, text_path: Path) -> None:
+        """Record a summary generated from an extracted text file.
+
+        Nothing is recorded if the text file does not exist (e.g. the text
+        was extracted on the fly); the summary is adopted once it does.
+
+        Args:
+            citation_key: Citation key.
+            text_path: Extracted text the summary was generated from.
+        """
+        self._ensure_loaded()
+        try:
+            text_stat = text_path.stat()
+            text_sha256 = file_sha256(text_path)
+        except OSError as e:
+            logger.debug(f"[{citation_key}] Not recording summary input: {e}")
+            return
+        with self._lock:
+            self._data[citation_key] = {
+                "text_sha256": text_sha256,
+                "text_size": text_stat.st_size,
+                "text_mtime": text_stat.st_mtime,
+                "summarizer_version": SUMMARIZER_VERSION,
+                "summarized_at": datetime.now().isoformat(),
+            }
+            self._changed()
+
+    def forget(self, citation_key: str) -> None:
+        """Remove a citation key's record (e.g. when its summary is deleted)."""
+        self._ensure_loaded()
+        with self._lock:
+            if self._data.pop(citation_key, None) is not None:
+                self._changed()
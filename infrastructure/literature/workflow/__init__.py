@@ -3,6 +3,7 @@ from infrastructure.literature.workflow.workflow import (
     LiteratureWorkflow,
     WorkflowResult,
 )
+from infrastructure.literature.workflow.download_pipeline import AsyncDownloadPipeline
 from infrastructure.literature.workflow.orchestrator import (
     get_keywords_input,
     run_search_only,
@@ -22,6 +23,7 @@ from infrastructure.literature.workflow.progress import (
 __all__ = [
     "LiteratureWorkflow",
     "WorkflowResult",
+    "AsyncDownloadPipeline",
     "get_keywords_input",
     "run_search_only",
     "run_download_only",
@@ -0,0 +1,166 @@
+"""Asyncio download pipeline for batches of papers.
+
+An asyncio event loop schedules the papers of a batch and enforces two
+limits: at most ``max_in_flight`` downloads overall and at most
+``max_per_host`` downloads per host. The loop only schedules; every
+download is a blocking call on a thread pool of ``max_in_flight``
+threads, so concurrency is bounded by that pool. Blocking work runs on
+three executors:
+
+- downloads on the I/O pool, reusing the streaming, resuming PDF
+  download stack and its pooled, rate-limited HTTP session; a download
+  step writes only the PDF file and returns its outcome
+- the prepare and record steps on a single writer thread, which makes
+  every library, PDF content index, download statistics and
+  failed-download tracker write, so none of them is written concurrently
+- an optional consumer (e.g. text extraction), fed downloaded papers
+  through a bounded queue so a slow consumer applies backpressure to
+  downloads instead of buffering without limit
+
+Callers provide the per-paper steps as callables; the pipeline only
+schedules them. See ``LiteratureWorkflow._download_papers_parallel``.
+"""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from infrastructure.core.logging_utils import get_logger
+from infrastructure.literature.core.core import DownloadResult
+from infrastructure.literature.pdf.strategy_stats import host_of
+from infrastructure.literature.sources import SearchResult
+
+logger = get_logger(__name__)
+
+# Prepare a paper on the writer thread: (citation key, result if no download is needed)
+PrepareFn = Callable[[SearchResult], Tuple[str, Optional[DownloadResult]]]
+# Download a paper on an I/O thread (no library, index or statistics writes)
+DownloadFn = Callable[[SearchResult], DownloadResult]
+# Record an outcome on the writer thread (all library, index and statistics writes)
+RecordFn = Callable[[SearchResult, str, DownloadResult], None]
+# Consume a downloaded paper (result, citation key, download result)
+ConsumeFn = Callable[[SearchResult, str, DownloadResult], None]
+
+
+def _run_coroutine(coro):
+    """Run a coroutine to completion, also from code already inside an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="download-loop") as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+class AsyncDownloadPipeline:
+    """Concurrent download scheduler with per-host caps and a single writer.
+
+    Attributes:
+        max_in_flight: Maximum downloads running at once.
+        max_per_host: Maximum downloads running at once per host.
+        queue_size: Capacity of the queue feeding the consumer.
+    """
+
+    def __init__(self, max_in_flight: int, max_per_host: int = 4, queue_size: int = 32):
+        """Initialize pipeline limits.
+
+        Args:
+            max_in_flight: Maximum downloads running at once.
+            max_per_host: Maximum downloads running at once per host.
+            queue_size: Capacity of the queue feeding the consumer.
+        """
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_per_host = max(1, max_per_host)
+        self.queue_size = max(1, queue_size)
+
+    def run(
+        self,
+        results: Sequence[SearchResult],
+        prepare: PrepareFn,
+        download: DownloadFn,
+        record: RecordFn,
+        consume: Optional[ConsumeFn] = None
+    ) -> List[Tuple[str, DownloadResult]]:
+        """Download a batch of papers.
+
+        Args:
+            results: Papers to download.
+            prepare: Writer-thread step returning the citation key and, when
+                no download is needed (e.g. skipped), the final result.
+            download: I/O-thread step performing the download and returning
+                its outcome without recording it.
+            record: Writer-thread step recording each outcome as it completes.
+            consume: Optional step run for every successful download.
+
+        Returns:
+            (citation_key, download_result) per paper, in input order.
+        """
+        if not results:
+            return []
+        return _run_coroutine(self._run(list(results), prepare, download, record, consume))
+
+    async def _run(
+        self,
+        results: List[SearchResult],
+        prepare: PrepareFn,
+        download: DownloadFn,
+        record: RecordFn,
+        consume: Optional[ConsumeFn]
+    ) -> List[Tuple[str, DownloadResult]]:
+        loop = asyncio.get_running_loop()
+        in_flight = asyncio.Semaphore(self.max_in_flight)
+        host_slots: Dict[str, asyncio.Semaphore] = {}
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        outcomes: List[Optional[Tuple[str, DownloadResult]]] = [None] * len(results)
+
+        writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="download-writer")
+        io_pool = ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="download-io")
+        consumer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="download-consumer")
+
+        async def fetch(index: int, result: SearchResult) -> None:
+            citation_key = "unknown"
+            try:
+                citation_key, outcome = await loop.run_in_executor(writer, prepare, result)
+                if outcome is None:
+                    host = host_of(result.pdf_url or result.url or "")
+                    slot = host_slots.setdefault(host, asyncio.Semaphore(self.max_per_host))
+                    async with slot, in_flight:
+                        outcome = await loop.run_in_executor(io_pool, download, result)
+            except Exception as e:
+                logger.error(f"Error processing {result.title[:50]}...: {e}")
+                outcome = DownloadResult(
+                    citation_key=citation_key,
+                    success=False,
+                    failure_reason="exception",
+                    failure_message=str(e),
+                    result=result
+                )
+            outcomes[index] = (citation_key, outcome)
+            try:
+                await loop.run_in_executor(writer, record, result, citation_key, outcome)
+            except Exception as e:
+                logger.error(f"Failed to record download of {citation_key}: {e}")
+            if consume is not None and outcome.success and outcome.pdf_path:
+                await queue.put((result, citation_key, outcome))
+
+        async def drain() -> None:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                try:
+                    await loop.run_in_executor(consumer, consume, *item)
+                except Exception as e:
+                    logger.warning(f"Post-download processing failed for {item[1]}: {e}")
+
+        drainer = asyncio.create_task(drain()) if consume is not None else None
+        try:
+            await asyncio.gather(*(fetch(i, r) for i, r in enumerate(results)))
+        finally:
+            if drainer is not None:
+                await queue.put(None)
+                await drainer
+            for executor in (io_pool, writer, consumer):
+                executor.shutdown(wait=True)
+        return outcomes
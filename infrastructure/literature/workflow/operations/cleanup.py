@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from infrastructure.core.logging_utils import get_logger, log_header, log_success
 from infrastructure.literature.workflow.workflow import LiteratureWorkflow
+from infrastructure.literature.library.clear import forget_pdf_contents
 from infrastructure.literature.library.index import LibraryEntry
+from infrastructure.literature.pdf.content_index import PDFContentIndex
 from infrastructure.literature.workflow.operations.utils import display_file_locations
 
 logger = get_logger(__name__)
@@ -174,11 +176,12 @@ def find_orphaned_files(library_entries: List[LibraryEntry]) -> dict:
     }
 
 
-def delete_orphaned_files(orphaned_files: dict) -> dict:
+def delete_orphaned_files(orphaned_files: dict, content_index: Optional[PDFContentIndex] = None) -> dict:
     """Delete orphaned files with proper error handling and logging.
     
     Args:
         orphaned_files: Dictionary from find_orphaned_files() containing file lists and sizes.
+        content_index: Optional PDF content index to remove deleted PDFs from.
     
     Returns:
         Dictionary with deletion statistics:
@@ -207,11 +210,13 @@ def delete_orphaned_files(orphaned_files: dict) -> dict:
     }
     
     # Delete orphaned PDFs
+    deleted_pdf_keys = []
     for pdf_file in orphaned_files["orphaned_pdfs"]:
         try:
             if pdf_file.exists() and pdf_file.is_file():
                 file_size = pdf_file.stat().st_size
                 pdf_file.unlink()
+                deleted_pdf_keys.append(pdf_file.stem)
                 stats["pdfs_deleted"] += 1
                 stats["pdfs_size_freed_mb"] += file_size / (1024 * 1024)
                 logger.debug(f"  ✓ Deleted orphaned PDF: {pdf_file.name} ({file_size / (1024*1024):.2f} MB)")
@@ -221,6 +226,7 @@ def delete_orphaned_files(orphaned_files: dict) -> dict:
         except Exception as e:
             logger.warning(f"  ✗ Failed to delete orphaned PDF {pdf_file.name}: {e}")
             stats["pdfs_failed"] += 1
+    forget_pdf_contents(content_index, deleted_pdf_keys)
     
     # Delete orphaned summaries
     for summary_file in orphaned_files["orphaned_summaries"]:
@@ -417,7 +423,7 @@ def run_cleanup(workflow: LiteratureWorkflow) -> int:
     
     if orphaned_pdf_count > 0 or orphaned_summary_count > 0 or orphaned_extracted_text_count > 0:
         logger.info(f"\nDeleting {orphaned_pdf_count + orphaned_summary_count + orphaned_extracted_text_count} orphaned files...")
-        orphaned_stats = delete_orphaned_files(orphaned_files)
+        orphaned_stats = delete_orphaned_files(orphaned_files, workflow.content_index)
         
         if orphaned_stats["pdfs_deleted"] > 0:
             logger.info(f"  ✓ Deleted {orphaned_stats['pdfs_deleted']} orphaned PDFs ({orphaned_stats['pdfs_size_freed_mb']:.2f} MB)")
@@ -170,83 +170,85 @@ def run_download_only(workflow: LiteratureWorkflow, retry_failed: bool = False)
     downloaded_count = 0
     failed_count = 0
 
-    # Process regular library entries
-    for i, entry in enumerate(papers_needing_pdf, 1):
-        logger.info(f"[{i}/{total_to_download}] Processing: {entry.title[:60]}...")
-
-        search_result = library_entry_to_search_result(entry)
-        download_result = workflow.literature_search.download_paper_with_result(search_result)
-
-        if download_result.success and download_result.pdf_path:
-            # Enhanced success logging with absolute path and source
-            abs_path = download_result.pdf_path.resolve()
-            file_size = abs_path.stat().st_size if abs_path.exists() else 0
-            source = entry.source or "unknown"
+    # Coalesce failed-tracker writes over the whole batch
+    with workflow.failed_tracker.batch():
+        # Process regular library entries
+        for i, entry in enumerate(papers_needing_pdf, 1):
+            logger.info(f"[{i}/{total_to_download}] Processing: {entry.title[:60]}...")
+
+            search_result = library_entry_to_search_result(entry)
+            download_result = workflow.literature_search.download_paper_with_result(search_result)
+
+            if download_result.success and download_result.pdf_path:
+                # Enhanced success logging with absolute path and source
+                abs_path = download_result.pdf_path.resolve()
+                file_size = abs_path.stat().st_size if abs_path.exists() else 0
+                source = entry.source or "unknown"
             
-            if download_result.already_existed:
-                logger.info(f"✓ Already exists: {abs_path} ({file_size:,} bytes) [Source: {source}]")
+                if download_result.already_existed:
+                    logger.info(f"✓ Already exists: {abs_path} ({file_size:,} bytes) [Source: {source}]")
+                else:
+                    log_success(f"✓ Downloaded: {abs_path} ({file_size:,} bytes) [Source: {source}]")
+                downloaded_count += 1
+            elif download_result.failure_reason == "no_pdf_url":
+                source = entry.source or "unknown"
+                logger.warning(f"✗ No PDF URL available: {entry.title[:50]}... [Source: {source}]")
             else:
-                log_success(f"✓ Downloaded: {abs_path} ({file_size:,} bytes) [Source: {source}]")
-            downloaded_count += 1
-        elif download_result.failure_reason == "no_pdf_url":
-            source = entry.source or "unknown"
-            logger.warning(f"✗ No PDF URL available: {entry.title[:50]}... [Source: {source}]")
-        else:
-            # Save to failed tracker
-            workflow.failed_tracker.save_failed(
-                entry.citation_key, download_result,
-                title=entry.title, source=entry.source
-            )
+                # Save to failed tracker
+                workflow.failed_tracker.save_failed(
+                    entry.citation_key, download_result,
+                    title=entry.title, source=entry.source
+                )
             
-            # Enhanced failure logging with full context
-            error_msg = download_result.failure_message or "Unknown error"
-            expected_path = Path("data/pdfs") / f"{entry.citation_key}.pdf"
-            urls_attempted = download_result.attempted_urls or []
-            source = entry.source or "unknown"
+                # Enhanced failure logging with full context
+                error_msg = download_result.failure_message or "Unknown error"
+                expected_path = Path("data/pdfs") / f"{entry.citation_key}.pdf"
+                urls_attempted = download_result.attempted_urls or []
+                source = entry.source or "unknown"
             
-            logger.error(f"✗ Failed: {entry.citation_key}")
-            logger.error(f"  Title: {entry.title[:80]}...")
-            logger.error(f"  Error: {download_result.failure_reason or 'unknown'}: {error_msg}")
-            logger.error(f"  Expected path: {expected_path.resolve()}")
-            logger.error(f"  Source: {source}")
-            if urls_attempted:
-                logger.error(f"  URLs attempted: {len(urls_attempted)}")
-                for j, url in enumerate(urls_attempted[:3], 1):  # Show first 3
-                    logger.error(f"    {j}. {url[:100]}...")
-                if len(urls_attempted) > 3:
-                    logger.error(f"    ... and {len(urls_attempted) - 3} more")
-            failed_count += 1
+                logger.error(f"✗ Failed: {entry.citation_key}")
+                logger.error(f"  Title: {entry.title[:80]}...")
+                logger.error(f"  Error: {download_result.failure_reason or 'unknown'}: {error_msg}")
+                logger.error(f"  Expected path: {expected_path.resolve()}")
+                logger.error(f"  Source: {source}")
+                if urls_attempted:
+                    logger.error(f"  URLs attempted: {len(urls_attempted)}")
+                    for j, url in enumerate(urls_attempted[:3], 1):  # Show first 3
+                        logger.error(f"    {j}. {url[:100]}...")
+                    if len(urls_attempted) > 3:
+                        logger.error(f"    ... and {len(urls_attempted) - 3} more")
+                failed_count += 1
     
-    # Process failed downloads retry
-    for i, (citation_key, search_result) in enumerate(failed_results, len(papers_needing_pdf) + 1):
-        logger.info(f"[{i}/{total_to_download}] Retrying: {search_result.title[:60]}...")
+        # Process failed downloads retry
+        for i, (citation_key, search_result) in enumerate(failed_results, len(papers_needing_pdf) + 1):
+            logger.info(f"[{i}/{total_to_download}] Retrying: {search_result.title[:60]}...")
 
-        download_result = workflow.literature_search.download_paper_with_result(search_result)
+            download_result = workflow.literature_search.download_paper_with_result(search_result)
 
-        if download_result.success and download_result.pdf_path:
-            abs_path = download_result.pdf_path.resolve()
-            file_size = abs_path.stat().st_size if abs_path.exists() else 0
-            source = search_result.source or "unknown"
+            if download_result.success and download_result.pdf_path:
+                abs_path = download_result.pdf_path.resolve()
+                file_size = abs_path.stat().st_size if abs_path.exists() else 0
+                source = search_result.source or "unknown"
             
-            log_success(f"✓ Retry successful: {abs_path} ({file_size:,} bytes) [Source: {source}]")
-            downloaded_count += 1
-        else:
-            # Save to failed tracker
-            workflow.failed_tracker.save_failed(
-                citation_key, download_result,
-                title=search_result.title, source=search_result.source
-            )
+                log_success(f"✓ Retry successful: {abs_path} ({file_size:,} bytes) [Source: {source}]")
+                downloaded_count += 1
+            else:
+                # Save to failed tracker
+                workflow.failed_tracker.save_failed(
+                    citation_key, download_result,
+                    title=search_result.title, source=search_result.source
+                )
             
-            error_msg = download_result.failure_message or "Unknown error"
-            expected_path = Path("data/pdfs") / f"{citation_key}.pdf"
-            source = search_result.source or "unknown"
+                error_msg = download_result.failure_message or "Unknown error"
+                expected_path = Path("data/pdfs") / f"{citation_key}.pdf"
+                source = search_result.source or "unknown"
             
-            logger.error(f"✗ Retry failed: {citation_key}")
-            logger.error(f"  Title: {search_result.title[:80]}...")
-            logger.error(f"  Error: {download_result.failure_reason or 'unknown'}: {error_msg}")
-            logger.error(f"  Expected path: {expected_path.resolve()}")
-            logger.error(f"  Source: {source}")
-            failed_count += 1
+                logger.error(f"✗ Retry failed: {citation_key}")
+                logger.error(f"  Title: {search_result.title[:80]}...")
+                logger.error(f"  Error: {download_result.failure_reason or 'unknown'}: {error_msg}")
+                logger.error(f"  Expected path: {expected_path.resolve()}")
+                logger.error(f"  Source: {source}")
+                failed_count += 1
 
     # Display summary
     logger.info(f"\n{'=' * 60}")
@@ -55,15 +55,16 @@ def run_llm_operation(workflow: LiteratureWorkflow, operation: str, paper_config
         from infrastructure.literature.llm.selector import PaperSelectionConfig
         selector = PaperSelector(PaperSelectionConfig())
 
-    # Get library entries and apply selection
-    library_entries = workflow.literature_search.library_index.list_entries()
+    # Apply selection through the library index (filters run as SQL with the SQLite backend)
+    library_index = workflow.literature_search.library_index
+    total_papers = library_index.count()
 
-    if not library_entries:
+    if not total_papers:
         logger.warning("Library is empty. Nothing to analyze.")
         logger.warning("Add papers first using --search-only.")
         return 1
 
-    selected_papers = selector.select_papers(library_entries)
+    selected_papers = selector.select_from_index(library_index)
 
     if not selected_papers:
         logger.warning("No papers match the selection criteria.")
@@ -72,7 +73,7 @@ def run_llm_operation(workflow: LiteratureWorkflow, operation: str, paper_config
         return 1
 
     # Display selection summary
-    selection_stats = selector.get_selection_summary(selected_papers, len(library_entries))
+    selection_stats = selector.get_selection_summary(selected_papers, total_papers)
     logger.info(f"\nSelected {selection_stats['selected_papers']} papers from {selection_stats['total_papers']} total")
     logger.info("Papers to analyze:")
     for i, paper in enumerate(selected_papers, 1):
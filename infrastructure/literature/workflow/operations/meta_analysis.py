@@ -154,14 +154,15 @@ def run_meta_analysis(
         added_count = 0
         already_existed_count = 0
         
-        for result in search_results:
-            try:
-                citation_key = workflow.literature_search.add_to_library(result)
-                added_count += 1
-                logger.info(f"Added: {citation_key}")
-            except Exception:
-                already_existed_count += 1
-                logger.debug(f"Already exists: {result.title[:50]}...")
+        with workflow.literature_search.library_index.batch():
+            for result in search_results:
+                try:
+                    citation_key = workflow.literature_search.add_to_library(result)
+                    added_count += 1
+                    logger.info(f"Added: {citation_key}")
+                except Exception:
+                    already_existed_count += 1
+                    logger.debug(f"Already exists: {result.title[:50]}...")
         
         logger.info(f"Papers found: {papers_found}")
         logger.info(f"Papers added to bibliography: {added_count}")
@@ -203,76 +204,78 @@ def run_meta_analysis(
             downloaded_count = 0
             failed_count = 0
             
-            # Process regular library entries
-            for i, entry in enumerate(papers_needing_pdf, 1):
-                logger.info(f"[{i}/{total_to_download}] Processing: {entry.title[:60]}...")
-                search_result = library_entry_to_search_result(entry)
-                download_result = workflow.literature_search.download_paper_with_result(search_result)
+            # Coalesce failed-tracker writes over the whole batch
+            with workflow.failed_tracker.batch():
+                # Process regular library entries
+                for i, entry in enumerate(papers_needing_pdf, 1):
+                    logger.info(f"[{i}/{total_to_download}] Processing: {entry.title[:60]}...")
+                    search_result = library_entry_to_search_result(entry)
+                    download_result = workflow.literature_search.download_paper_with_result(search_result)
                 
-                if download_result.success and download_result.pdf_path:
-                    downloaded_count += 1
-                    # Enhanced logging with full path, file size, and source
-                    abs_path = download_result.pdf_path.resolve()
-                    file_size = abs_path.stat().st_size if abs_path.exists() else 0
-                    source = entry.source or "unknown"
-                    logger.info(f"✓ Downloaded: {abs_path} ({file_size:,} bytes) [Source: {source}]")
-                elif download_result.failure_reason == "no_pdf_url":
-                    source = entry.source or "unknown"
-                    logger.warning(f"✗ No PDF URL available: {entry.title[:50]}... [Source: {source}]")
-                else:
-                    # Save to failed tracker
-                    workflow.failed_tracker.save_failed(
-                        entry.citation_key, download_result,
-                        title=entry.title, source=entry.source
-                    )
+                    if download_result.success and download_result.pdf_path:
+                        downloaded_count += 1
+                        # Enhanced logging with full path, file size, and source
+                        abs_path = download_result.pdf_path.resolve()
+                        file_size = abs_path.stat().st_size if abs_path.exists() else 0
+                        source = entry.source or "unknown"
+                        logger.info(f"✓ Downloaded: {abs_path} ({file_size:,} bytes) [Source: {source}]")
+                    elif download_result.failure_reason == "no_pdf_url":
+                        source = entry.source or "unknown"
+                        logger.warning(f"✗ No PDF URL available: {entry.title[:50]}... [Source: {source}]")
+                    else:
+                        # Save to failed tracker
+                        workflow.failed_tracker.save_failed(
+                            entry.citation_key, download_result,
+                            title=entry.title, source=entry.source
+                        )
                     
-                    failed_count += 1
-                    # Enhanced failure logging with full context
-                    error_details = f"{download_result.failure_reason or 'unknown'}: {download_result.failure_message or 'No error message'}"
-                    urls_attempted = download_result.attempted_urls or []
-                    expected_path = Path("data/pdfs") / f"{entry.citation_key}.pdf"
-                    source = entry.source or "unknown"
+                        failed_count += 1
+                        # Enhanced failure logging with full context
+                        error_details = f"{download_result.failure_reason or 'unknown'}: {download_result.failure_message or 'No error message'}"
+                        urls_attempted = download_result.attempted_urls or []
+                        expected_path = Path("data/pdfs") / f"{entry.citation_key}.pdf"
+                        source = entry.source or "unknown"
                     
-                    logger.error(f"✗ Failed: {entry.citation_key}")
-                    logger.error(f"  Title: {entry.title[:80]}...")
-                    logger.error(f"  Error: {error_details}")
-                    logger.error(f"  Expected path: {expected_path.resolve()}")
-                    logger.error(f"  Source: {source}")
-                    if urls_attempted:
-                        logger.error(f"  URLs attempted: {len(urls_attempted)}")
-                        for j, url in enumerate(urls_attempted[:3], 1):  # Show first 3
-                            logger.error(f"    {j}. {url[:100]}...")
-                        if len(urls_attempted) > 3:
-                            logger.error(f"    ... and {len(urls_attempted) - 3} more")
+                        logger.error(f"✗ Failed: {entry.citation_key}")
+                        logger.error(f"  Title: {entry.title[:80]}...")
+                        logger.error(f"  Error: {error_details}")
+                        logger.error(f"  Expected path: {expected_path.resolve()}")
+                        logger.error(f"  Source: {source}")
+                        if urls_attempted:
+                            logger.error(f"  URLs attempted: {len(urls_attempted)}")
+                            for j, url in enumerate(urls_attempted[:3], 1):  # Show first 3
+                                logger.error(f"    {j}. {url[:100]}...")
+                            if len(urls_attempted) > 3:
+                                logger.error(f"    ... and {len(urls_attempted) - 3} more")
             
-            # Process failed downloads retry
-            for i, (citation_key, search_result) in enumerate(failed_results, len(papers_needing_pdf) + 1):
-                logger.info(f"[{i}/{total_to_download}] Retrying: {search_result.title[:60]}...")
-                download_result = workflow.literature_search.download_paper_with_result(search_result)
+                # Process failed downloads retry
+                for i, (citation_key, search_result) in enumerate(failed_results, len(papers_needing_pdf) + 1):
+                    logger.info(f"[{i}/{total_to_download}] Retrying: {search_result.title[:60]}...")
+                    download_result = workflow.literature_search.download_paper_with_result(search_result)
                 
-                if download_result.success and download_result.pdf_path:
-                    downloaded_count += 1
-                    abs_path = download_result.pdf_path.resolve()
-                    file_size = abs_path.stat().st_size if abs_path.exists() else 0
-                    source = search_result.source or "unknown"
-                    logger.info(f"✓ Retry successful: {abs_path} ({file_size:,} bytes) [Source: {source}]")
-                else:
-                    # Save to failed tracker
-                    workflow.failed_tracker.save_failed(
-                        citation_key, download_result,
-                        title=search_result.title, source=search_result.source
-                    )
+                    if download_result.success and download_result.pdf_path:
+                        downloaded_count += 1
+                        abs_path = download_result.pdf_path.resolve()
+                        file_size = abs_path.stat().st_size if abs_path.exists() else 0
+                        source = search_result.source or "unknown"
+                        logger.info(f"✓ Retry successful: {abs_path} ({file_size:,} bytes) [Source: {source}]")
+                    else:
+                        # Save to failed tracker
+                        workflow.failed_tracker.save_failed(
+                            citation_key, download_result,
+                            title=search_result.title, source=search_result.source
+                        )
                     
-                    failed_count += 1
-                    error_details = f"{download_result.failure_reason or 'unknown'}: {download_result.failure_message or 'No error message'}"
-                    expected_path = Path("data/pdfs") / f"{citation_key}.pdf"
-                    source = search_result.source or "unknown"
+                        failed_count += 1
+                        error_details = f"{download_result.failure_reason or 'unknown'}: {download_result.failure_message or 'No error message'}"
+                        expected_path = Path("data/pdfs") / f"{citation_key}.pdf"
+                        source = search_result.source or "unknown"
                     
-                    logger.error(f"✗ Retry failed: {citation_key}")
-                    logger.error(f"  Title: {search_result.title[:80]}...")
-                    logger.error(f"  Error: {error_details}")
-                    logger.error(f"  Expected path: {expected_path.resolve()}")
-                    logger.error(f"  Source: {source}")
+                        logger.error(f"✗ Retry failed: {citation_key}")
+                        logger.error(f"  Title: {search_result.title[:80]}...")
+                        logger.error(f"  Error: {error_details}")
+                        logger.error(f"  Expected path: {expected_path.resolve()}")
+                        logger.error(f"  Source: {source}")
             
             logger.info(f"PDFs downloaded: {downloaded_count}")
             if failed_count > 0:
@@ -163,14 +163,15 @@ def run_search_only(
         added_count = 0
         already_existed_count = 0
 
-        for result in search_results:
-            try:
-                citation_key = workflow.literature_search.add_to_library(result)
-                added_count += 1
-                logger.info(f"Added: {citation_key}")
-            except Exception:
-                already_existed_count += 1
-                logger.debug(f"Already exists: {result.title[:50]}...")
+        with workflow.literature_search.library_index.batch():
+            for result in search_results:
+                try:
+                    citation_key = workflow.literature_search.add_to_library(result)
+                    added_count += 1
+                    logger.info(f"Added: {citation_key}")
+                except Exception:
+                    already_existed_count += 1
+                    logger.debug(f"Already exists: {result.title[:50]}...")
 
         # Get source information
         source_health = workflow.literature_search.get_source_health_status()
@@ -349,6 +350,8 @@ def run_search(
         logger.info(f"Keywords searched: {', '.join(keywords)}")
         logger.info(f"Sources used: {', '.join(sources)}")
         logger.info(f"Papers found: {stats['search']['papers_found']}")
+        if result.papers_skipped_complete > 0:
+            logger.info(f"Papers skipped (already downloaded and summarized): {result.papers_skipped_complete}")
         logger.info(f"Papers already downloaded: {result.papers_already_existed}")
         logger.info(f"Papers newly downloaded: {result.papers_newly_downloaded}")
         logger.info(f"Download failures: {result.papers_failed_download}")
@@ -22,12 +22,19 @@ from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple, TYPE_CHECKING
 
 from infrastructure.core.logging_utils import get_logger, log_success, log_header
-from infrastructure.core.exceptions import LiteratureSearchError
+from infrastructure.core.exceptions import FileOperationError, LiteratureSearchError
 from infrastructure.literature.sources import SearchResult
+from infrastructure.literature.sources.http import total_connection_stats
+from infrastructure.literature.sources.ratelimit import get_rate_limiter
 from infrastructure.literature.core.core import LiteratureSearch, DownloadResult, SearchStatistics
+from infrastructure.literature.core.dedup import ResultDeduplicator
 from infrastructure.literature.summarization import SummarizationEngine, SummarizationResult
+from infrastructure.literature.summarization.extractor import TextExtractor
 from infrastructure.literature.summarization.models import SummarizationProgressEvent
+from infrastructure.literature.summarization.summary_manifest import SummaryManifest
+from infrastructure.literature.workflow.download_pipeline import AsyncDownloadPipeline
 from infrastructure.literature.workflow.progress import ProgressTracker, SummarizationProgress
+from infrastructure.literature.pdf.content_index import PDFContentIndex
 from infrastructure.literature.pdf.failed_tracker import FailedDownloadTracker
 
 if TYPE_CHECKING:
@@ -50,6 +57,8 @@ class WorkflowResult:
         papers_failed_download: Number of failed downloads.
         papers_already_existed: Number of papers that already existed.
         papers_newly_downloaded: Number of newly downloaded papers.
+        papers_skipped_complete: Search results skipped because the library
+            already has their PDF and summary.
         summaries_generated: Number of successful summaries.
         summaries_failed: Number of failed summaries.
         summaries_skipped: Number of summaries skipped (already exist).
@@ -64,6 +73,7 @@ class WorkflowResult:
     papers_failed_download: int = 0
     papers_already_existed: int = 0
     papers_newly_downloaded: int = 0
+    papers_skipped_complete: int = 0
     summaries_generated: int = 0
     summaries_failed: int = 0
     summaries_skipped: int = 0
@@ -126,6 +136,12 @@ class LiteratureWorkflow:
         self.progress_tracker = progress_tracker
         # Initialize failed download tracker
         self.failed_tracker = FailedDownloadTracker(literature_search.config)
+        # Library new/known counts of the most recent _search_papers run
+        self.last_search_library_stats: Dict[str, int] = {}
+        # Content hashes of PDFs, to reuse work across duplicate papers
+        self.content_index: Optional[PDFContentIndex] = None
+        if literature_search.config.pdf_content_index:
+            self.content_index = PDFContentIndex.for_config(literature_search.config)
 
     def set_summarizer(self, summarizer: SummarizationEngine):
         """Set the summarizer for this workflow."""
@@ -146,6 +162,64 @@ class LiteratureWorkflow:
         """
         return Path("data/summaries") / f"{citation_key}_summary.md"
 
+    def _has_current_summary(self, citation_key: str) -> bool:
+        """Check whether a paper's summary exists and matches its extracted text.
+        
+        Args:
+            citation_key: Citation key for the paper.
+            
+        Returns:
+            True if the summary exists and its extracted text and summarizer
+            version are unchanged since it was generated (see SummaryManifest).
+        """
+        summary_path = self._get_summary_path(citation_key)
+        if not summary_path.exists():
+            return False
+        text_path = Path("data/extracted_text") / f"{citation_key}.txt"
+        if SummaryManifest.for_dir(summary_path.parent).is_fresh(citation_key, text_path):
+            return True
+        logger.info(f"[{citation_key}] Summary is out of date (extracted text or summarizer changed)")
+        return False
+
+    def _reuse_duplicate_summary(self, result: SearchResult, citation_key: str, pdf_path: Path) -> Optional[Path]:
+        """Copy the summary files of an identical PDF stored under another key.
+        
+        The summary, claims/quotes and methods/tools files are copied with
+        their metadata header (title, authors, DOI, venue, source and PDF
+        link) re-rendered for this paper.
+        
+        Args:
+            result: Search result of the paper needing a summary.
+            citation_key: Citation key needing a summary.
+            pdf_path: Path to the paper's PDF.
+            
+        Returns:
+            Path to the reused summary, or None if no duplicate has one.
+        """
+        if self.content_index is None:
+            return None
+        try:
+            duplicates = self.content_index.duplicates_of(citation_key, pdf_path)
+        except OSError as e:
+            logger.debug(f"[{citation_key}] Could not hash PDF for duplicate lookup: {e}")
+            return None
+        summary_path = self._get_summary_path(citation_key)
+        for duplicate_key in duplicates:
+            if self._has_current_summary(duplicate_key):
+                try:
+                    SummarizationEngine.reuse_summary_files(
+                        result, duplicate_key, citation_key, summary_path.parent
+                    )
+                    SummaryManifest.for_dir(summary_path.parent).record(
+                        citation_key, Path("data/extracted_text") / f"{citation_key}.txt"
+                    )
+                except (OSError, FileOperationError) as e:
+                    logger.warning(f"[{citation_key}] Failed to reuse summary of {duplicate_key}: {e}")
+                    return None
+                logger.info(f"[{citation_key}] Same PDF content as {duplicate_key}; reused its summary")
+                return summary_path
+        return None
+
     def execute_search_and_summarize(
         self,
         keywords: List[str],
@@ -203,11 +277,20 @@ class LiteratureWorkflow:
 
             # Search for papers
             log_header("SEARCHING FOR PAPERS")
-            search_results = self._search_papers(keywords, limit_per_keyword, sources=sources)
+            search_results = self._search_papers(
+                keywords, limit_per_keyword, sources=sources, skip_completed=True
+            )
             result.papers_found = len(search_results)
+            result.papers_skipped_complete = self.last_search_library_stats.get("skipped_complete", 0)
 
             if not search_results:
-                logger.warning("No papers found for the given keywords")
+                if result.papers_skipped_complete:
+                    logger.info(
+                        f"All {result.papers_skipped_complete} papers found are already "
+                        f"downloaded and summarized"
+                    )
+                else:
+                    logger.warning("No papers found for the given keywords")
                 result.total_time = time.time() - start_time
                 return result
 
@@ -272,20 +355,30 @@ class LiteratureWorkflow:
         self, 
         keywords: List[str], 
         limit_per_keyword: int,
-        sources: Optional[List[str]] = None
+        sources: Optional[List[str]] = None,
+        skip_completed: bool = False
     ) -> List[SearchResult]:
         """Search for papers across all keywords.
         
+        Each keyword's results are checked against the library index as
+        they arrive; per-keyword new vs already-known counts are logged and
+        stored on the keyword's SearchStatistics and, summed over the run,
+        in ``last_search_library_stats``.
+        
         Args:
             keywords: List of search keywords.
             limit_per_keyword: Maximum results per keyword per source.
             sources: Optional list of sources to use. If None, uses all enabled sources.
+            skip_completed: Drop papers whose PDF and summary already exist
+                before they reach deduplication and the download queue.
         
         Returns:
             Search results and logs comprehensive per-source statistics.
         """
-        all_results = []
+        # Deduplicate incrementally across all keywords of the run
+        deduplicator = ResultDeduplicator()
         all_search_stats: List[SearchStatistics] = []
+        run_stats = {"new": 0, "known": 0, "skipped_complete": 0}
 
         for keyword in keywords:
             log_header(f"Searching: '{keyword}'")
@@ -296,8 +389,16 @@ class LiteratureWorkflow:
                     sources=sources,
                     return_stats=True
                 )
-                logger.info(f"Found {len(results)} papers for '{keyword}'")
-                all_results.extend(results)
+                results = self._filter_known_results(results, search_stats, skip_completed)
+                for name in run_stats:
+                    run_stats[name] += getattr(search_stats, f"{name}_results")
+                new_unique = deduplicator.add(results)
+                logger.info(f"Found {len(results)} papers for '{keyword}' ({new_unique} not seen in earlier keywords)")
+                logger.info(
+                    f"Library: {search_stats.new_results} new, {search_stats.known_results} already known"
+                    + (f" ({search_stats.skipped_complete_results} complete, skipped)"
+                       if search_stats.skipped_complete_results else "")
+                )
                 all_search_stats.append(search_stats)
                 
                 # Display per-source breakdown for this keyword
@@ -307,16 +408,76 @@ class LiteratureWorkflow:
                 logger.error(f"Search failed for '{keyword}': {e}")
                 continue
 
-        # Deduplicate results
-        unique_results = self.literature_search._deduplicate_results(all_results)
+        unique_results = deduplicator.results()
+        self.last_search_library_stats = run_stats
         logger.info(f"Total unique papers after deduplication: {len(unique_results)}")
         
         # Display overall source statistics across all keywords
         if all_search_stats:
             self._display_overall_source_statistics(all_search_stats)
+        self.literature_search.log_search_cache_summary()
 
         return unique_results
     
+    def _filter_known_results(
+        self,
+        results: List[SearchResult],
+        search_stats: SearchStatistics,
+        skip_completed: bool
+    ) -> List[SearchResult]:
+        """Classify results against the library index and drop completed papers.
+        
+        A result is known if the library has an entry with the same DOI,
+        arXiv id or normalized title. It is complete if that entry's PDF
+        and summary both exist on disk.
+        
+        Args:
+            results: Search results for one keyword.
+            search_stats: Statistics of the keyword's search; the new, known
+                and skipped counts are recorded on it.
+            skip_completed: Whether to drop complete papers.
+            
+        Returns:
+            Results to keep (all results unless skip_completed is True).
+        """
+        library_index = self.literature_search.library_index
+        kept = []
+        for result in results:
+            citation_key = library_index.find_existing_key(
+                doi=result.doi,
+                title=result.title,
+                url=result.url,
+                pdf_url=result.pdf_url
+            )
+            if not citation_key:
+                search_stats.new_results += 1
+                kept.append(result)
+                continue
+            
+            search_stats.known_results += 1
+            if skip_completed and self._is_complete_in_library(citation_key):
+                search_stats.skipped_complete_results += 1
+                logger.debug(f"Skipping already downloaded and summarized paper: {citation_key}")
+                continue
+            kept.append(result)
+        return kept
+
+    def _is_complete_in_library(self, citation_key: str) -> bool:
+        """Check whether a library paper has both its PDF and an up-to-date summary.
+        
+        Args:
+            citation_key: Citation key of the library entry.
+            
+        Returns:
+            True if the PDF exists and the summary is current.
+        """
+        if not self._has_current_summary(citation_key):
+            return False
+        entry = self.literature_search.library_index.get_entry(citation_key)
+        if entry and entry.pdf_path and Path(entry.pdf_path).exists():
+            return True
+        return (Path(self.literature_search.config.download_dir) / f"{citation_key}.pdf").exists()
+
     def _display_source_breakdown(self, search_stats: SearchStatistics, keyword: str):
         """Display per-source breakdown for a single search query."""
         if not search_stats.source_stats:
@@ -433,12 +594,29 @@ class LiteratureWorkflow:
             Tuple of (downloaded papers, all download results).
         """
         max_workers = self.literature_search.config.max_parallel_downloads
+        connections_before = total_connection_stats()
+        rate_limit_before = get_rate_limiter().total_stats()
         
-        # Use parallel downloads if configured
-        if max_workers > 1:
-            return self._download_papers_parallel(search_results, max_workers, retry_failed)
-        else:
-            return self._download_papers_sequential(search_results, retry_failed)
+        # Use parallel downloads if configured; tracker writes are coalesced per batch
+        with self.failed_tracker.batch():
+            if max_workers > 1:
+                outcome = self._download_papers_parallel(search_results, max_workers, retry_failed)
+            else:
+                outcome = self._download_papers_sequential(search_results, retry_failed)
+        
+        connections = total_connection_stats().since(connections_before)
+        if connections.requests:
+            logger.info(
+                f"HTTP connections: {connections.requests} requests over "
+                f"{connections.connections} connections ({connections.reused} handshakes saved by keep-alive)"
+            )
+        rate_limit = get_rate_limiter().total_stats().since(rate_limit_before)
+        if rate_limit.waited >= 0.1 or rate_limit.throttled:
+            logger.info(
+                f"Rate limiter: waited {rate_limit.waited:.1f}s in total "
+                f"(longest {rate_limit.max_wait:.1f}s), {rate_limit.throttled} throttled responses"
+            )
+        return outcome
     
     def _download_papers_sequential(
         self, 
@@ -484,7 +662,7 @@ class LiteratureWorkflow:
                     all_results.append(download_result)
                 else:
                     # Skip this download - it previously failed
-                    failure_data = self.failed_tracker.load_failed().get(citation_key, {})
+                    failure_data = (self.failed_tracker.get_failure(citation_key) or {})
                     failure_reason = failure_data.get("failure_reason", "unknown")
                     logger.info(f"[DOWNLOAD {i}/{len(search_results)}] ⊘ Skipping {citation_key}: previously failed ({failure_reason}). Use --retry-failed to retry.")
                     # Create a skipped result
@@ -556,114 +734,113 @@ class LiteratureWorkflow:
         max_workers: int,
         retry_failed: bool = False
     ) -> Tuple[List[Tuple[SearchResult, Path]], List[DownloadResult]]:
-        """Download PDFs using parallel processing."""
+        """Download PDFs concurrently with the asyncio download pipeline.
+
+        Up to ``max_workers`` downloads run at once on a thread pool, at
+        most ``max_downloads_per_host`` per host. Downloads only write the
+        PDF; library, PDF content index, download statistics and
+        failed-download tracker updates run on the pipeline's single writer
+        thread, and with
+        ``extract_text_on_download`` downloaded PDFs are fed to text
+        extraction through a bounded queue.
+        """
         start_time = time.time()
-        logger.info(f"Starting parallel PDF download for {len(search_results)} papers...")
-
-        # Process papers in parallel
-        downloaded = []
-        all_results = []
-        completed_count = 0
+        config = self.literature_search.config
         total_papers = len(search_results)
-
-        processing_mode = "parallel" if max_workers > 1 else "sequential"
+        logger.info(f"Starting parallel PDF download for {total_papers} papers...")
         logger.info(
-            f"Processing {total_papers} paper(s) ({processing_mode} mode, "
-            f"{max_workers} worker(s))"
+            f"Processing {total_papers} paper(s) (async pipeline, {max_workers} in flight, "
+            f"{config.max_downloads_per_host} per host)"
         )
 
-        if max_workers > 1:
-            # Parallel processing
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_result = {
-                    executor.submit(self._download_single_paper, result, retry_failed): result
-                    for result in search_results
-                }
+        completed = [0]
 
-                for future in as_completed(future_to_result):
-                    result = future_to_result[future]
-                    completed_count += 1
-                    progress_indicator = f"[{completed_count}/{total_papers}]"
+        def record(result: SearchResult, citation_key: str, download_result: DownloadResult) -> None:
+            completed[0] += 1
+            self.literature_search.record_download(download_result)
+            self._record_download_outcome(
+                result, citation_key, download_result, f"[{completed[0]}/{total_papers}]"
+            )
 
-                    try:
-                        citation_key, download_result = future.result()
-                        all_results.append(download_result)
+        consume = None
+        if config.extract_text_on_download:
+            extractor = TextExtractor(content_index=self.content_index)
 
-                        if download_result.success and download_result.pdf_path:
-                            # Remove from failed tracker if it was there
-                            self.failed_tracker.remove_successful(citation_key)
-                            
-                            abs_path = download_result.pdf_path.resolve()
-                            file_size = abs_path.stat().st_size if abs_path.exists() else 0
-                            source = result.source or "unknown"
-                            
-                            if download_result.already_existed:
-                                logger.info(
-                                    f"{progress_indicator} ✓ Already exists: {abs_path.name} "
-                                    f"({file_size:,} bytes) [Source: {source}]"
-                                )
-                            else:
-                                log_success(
-                                    f"{progress_indicator} ✓ Downloaded: {abs_path.name} "
-                                    f"({file_size:,} bytes) [Source: {source}]"
-                                )
-                            downloaded.append((result, download_result.pdf_path))
-                        elif download_result.failure_reason == "skipped_previous_failure":
-                            # Skipped due to previous failure
-                            failure_data = self.failed_tracker.load_failed().get(citation_key, {})
-                            failure_reason = failure_data.get("failure_reason", "unknown")
-                            logger.info(
-                                f"{progress_indicator} ⊘ Skipping {citation_key}: previously failed ({failure_reason}). Use --retry-failed to retry."
-                            )
-                        elif download_result.failure_reason == "no_pdf_url":
-                            source = result.source or "unknown"
-                            logger.warning(
-                                f"{progress_indicator} ✗ No PDF URL: {result.title[:50]}... "
-                                f"[Source: {source}]"
-                            )
-                        else:
-                            # Save to failed tracker
-                            self.failed_tracker.save_failed(
-                                citation_key, download_result,
-                                title=result.title, source=result.source
-                            )
-                            
-                            source = result.source or "unknown"
-                            error_msg = download_result.failure_message or "Unknown error"
-                            logger.error(
-                                f"{progress_indicator} ✗ Failed: {citation_key} "
-                                f"({download_result.failure_reason or 'unknown'}) - {error_msg[:60]}..."
-                            )
+            def consume(result: SearchResult, citation_key: str, download_result: DownloadResult) -> None:
+                extractor.extract_and_save(download_result.pdf_path, citation_key)
 
-                    except Exception as e:
-                        completed_count += 1
-                        logger.error(f"{progress_indicator} Error processing {result.title[:50]}...: {e}")
-                        # Create a failed result
-                        try:
-                            citation_key = self.literature_search.library_index.generate_citation_key(
-                                result.title, result.authors, result.year
-                            )
-                        except Exception:
-                            citation_key = "unknown"
-                        
-                        failed_result = DownloadResult(
-                            citation_key=citation_key,
-                            success=False,
-                            failure_reason="exception",
-                            failure_message=str(e),
-                            result=result
-                        )
-                        all_results.append(failed_result)
-                        self.failed_tracker.save_failed(
-                            citation_key, failed_result,
-                            title=result.title, source=result.source
-                        )
-        else:
-            # Sequential fallback
-            return self._download_papers_sequential(search_results, retry_failed)
+        pipeline = AsyncDownloadPipeline(
+            max_in_flight=max_workers,
+            max_per_host=config.max_downloads_per_host,
+            queue_size=config.download_queue_size,
+        )
+        outcomes = pipeline.run(
+            search_results,
+            prepare=lambda result: self._prepare_download(result, retry_failed),
+            download=lambda result: self._download_with_result(result, record=False),
+            record=record,
+            consume=consume,
+        )
 
+        all_results = [download_result for _, download_result in outcomes]
+        downloaded = [
+            (result, download_result.pdf_path)
+            for result, download_result in zip(search_results, all_results)
+            if download_result.success and download_result.pdf_path
+        ]
         return self._finalize_download_stats(downloaded, all_results, start_time, total_papers)
-    
+
+    def _record_download_outcome(
+        self,
+        result: SearchResult,
+        citation_key: str,
+        download_result: DownloadResult,
+        progress_indicator: str
+    ) -> None:
+        """Update the failed-download tracker and log one download outcome."""
+        source = result.source or "unknown"
+        if download_result.success and download_result.pdf_path:
+            # Remove from failed tracker if it was there
+            self.failed_tracker.remove_successful(citation_key)
+
+            abs_path = download_result.pdf_path.resolve()
+            file_size = abs_path.stat().st_size if abs_path.exists() else 0
+
+            if download_result.already_existed:
+                logger.info(
+                    f"{progress_indicator} ✓ Already exists: {abs_path.name} "
+                    f"({file_size:,} bytes) [Source: {source}]"
+                )
+            else:
+                log_success(
+                    f"{progress_indicator} ✓ Downloaded: {abs_path.name} "
+                    f"({file_size:,} bytes) [Source: {source}]"
+                )
+        elif download_result.failure_reason == "skipped_previous_failure":
+            # Skipped due to previous failure
+            failure_data = (self.failed_tracker.get_failure(citation_key) or {})
+            failure_reason = failure_data.get("failure_reason", "unknown")
+            logger.info(
+                f"{progress_indicator} ⊘ Skipping {citation_key}: previously failed ({failure_reason}). Use --retry-failed to retry."
+            )
+        elif download_result.failure_reason == "no_pdf_url":
+            logger.warning(
+                f"{progress_indicator} ✗ No PDF URL: {result.title[:50]}... "
+                f"[Source: {source}]"
+            )
+        else:
+            # Save to failed tracker
+            self.failed_tracker.save_failed(
+                citation_key, download_result,
+                title=result.title, source=result.source
+            )
+
+            error_msg = download_result.failure_message or "Unknown error"
+            logger.error(
+                f"{progress_indicator} ✗ Failed: {citation_key} "
+                f"({download_result.failure_reason or 'unknown'}) - {error_msg[:60]}..."
+            )
+
     def _download_single_paper(self, result: SearchResult, retry_failed: bool = False) -> Tuple[str, DownloadResult]:
         """Download a single paper (for parallel processing).
         
@@ -674,6 +851,26 @@ class LiteratureWorkflow:
         Returns:
             Tuple of (citation_key, download_result).
         """
+        citation_key, download_result = self._prepare_download(result, retry_failed)
+        if download_result is None:
+            download_result = self._download_with_result(result)
+        return citation_key, download_result
+
+    def _prepare_download(
+        self,
+        result: SearchResult,
+        retry_failed: bool = False
+    ) -> Tuple[str, Optional[DownloadResult]]:
+        """Add a paper to the library and check whether it needs downloading.
+        
+        Args:
+            result: Search result to download.
+            retry_failed: If True, retry previously failed downloads.
+        
+        Returns:
+            Tuple of (citation_key, download_result), where download_result
+            is None if the paper still has to be downloaded.
+        """
         # Add to library (BibTeX + JSON index)
         try:
             citation_key = self.literature_search.add_to_library(result)
@@ -709,7 +906,7 @@ class LiteratureWorkflow:
                 )
             else:
                 # Skip this download - it previously failed
-                failure_data = self.failed_tracker.load_failed().get(citation_key, {})
+                failure_data = (self.failed_tracker.get_failure(citation_key) or {})
                 failure_reason = failure_data.get("failure_reason", "unknown")
                 logger.debug(f"Skipping {citation_key}: previously failed ({failure_reason})")
                 return citation_key, DownloadResult(
@@ -720,9 +917,17 @@ class LiteratureWorkflow:
                     result=result
                 )
 
-        # Download PDF with detailed result tracking
-        download_result = self.literature_search.download_paper_with_result(result)
-        return citation_key, download_result
+        return citation_key, None
+
+    def _download_with_result(self, result: SearchResult, record: bool = True) -> DownloadResult:
+        """Download PDF with detailed result tracking.
+
+        Args:
+            result: Search result to download.
+            record: Record the download in the library, PDF content index
+                and download statistics (False leaves this to the caller).
+        """
+        return self.literature_search.download_paper_with_result(result, record=record)
     
     def _finalize_download_stats(
         self,
@@ -817,8 +1022,8 @@ class LiteratureWorkflow:
             citation_key = pdf_path.stem
             summary_path = self._get_summary_path(citation_key)
 
-            # Check if summary file already exists
-            if summary_path.exists():
+            # Check if an up-to-date summary already exists (or can be reused from a duplicate PDF)
+            if self._has_current_summary(citation_key) or self._reuse_duplicate_summary(result, citation_key, pdf_path):
                 skipped_result = SummarizationResult(
                     citation_key=citation_key,
                     success=True,
@@ -1185,7 +1390,7 @@ class LiteratureWorkflow:
         summary_path = self._get_summary_path(citation_key)
 
         # Check if summary already exists (defensive check, should have been filtered earlier)
-        if summary_path.exists():
+        if self._has_current_summary(citation_key) or self._reuse_duplicate_summary(result, citation_key, pdf_path):
             logger.debug(f"[{citation_key}] Summary already exists, skipping: {summary_path.name}")
             # Return success result with existing path
             skipped_result = SummarizationResult(
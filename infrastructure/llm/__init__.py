@@ -33,6 +33,9 @@ from infrastructure.llm.core import (
     GenerationOptions,
     ConversationContext,
     Message,
+    LLMResponseCache,
+    LLMSession,
+    RequestMetrics,
 )
 from infrastructure.llm.templates import (
     ResearchTemplate,
@@ -125,6 +128,10 @@ __all__ = [
     # Context management
     "ConversationContext",
     "Message",
+    # Response cache
+    "LLMResponseCache",
+    "LLMSession",
+    "RequestMetrics",
     # Templates
     "ResearchTemplate",
     "get_template",
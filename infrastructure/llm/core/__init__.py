@@ -2,6 +2,8 @@
 from infrastructure.llm.core.client import LLMClient, ResponseMode, strip_thinking_tags
 from infrastructure.llm.core.config import LLMConfig, GenerationOptions
 from infrastructure.llm.core.context import ConversationContext, Message
+from infrastructure.llm.core.response_cache import LLMResponseCache
+from infrastructure.llm.core.session import LLMSession, RequestMetrics
 
 __all__ = [
     "LLMClient",
@@ -11,6 +13,9 @@ __all__ = [
     "GenerationOptions",
     "ConversationContext",
     "Message",
+    "LLMResponseCache",
+    "LLMSession",
+    "RequestMetrics",
 ]
 
 
@@ -5,6 +5,8 @@ Provides LLMClient for interacting with Ollama local LLMs with:
 - Streaming and non-streaming queries
 - Per-query generation options
 - Context management with system prompt injection
+- Per-thread conversation contexts, so one client can be shared by worker threads
+- Optional persistent cache of reproducible responses (see LLMResponseCache)
 - Template support for research tasks
 
 Note: This class is cohesive - all methods work together and share state
@@ -16,7 +18,9 @@ from __future__ import annotations
 import requests
 import json
 import re
+import threading
 import time
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, Generator, Iterator, Literal, Union, Tuple
@@ -26,6 +30,8 @@ from infrastructure.core.logging_utils import get_logger
 from infrastructure.core.exceptions import LLMConnectionError, LLMError
 from infrastructure.llm.core.config import LLMConfig, GenerationOptions
 from infrastructure.llm.core.context import ConversationContext
+from infrastructure.llm.core.response_cache import DEFAULT_CACHE_FILE, LLMResponseCache, is_cacheable
+from infrastructure.llm.core.session import DEFAULT_SESSION_KEEP_ALIVE, LLMSession, RequestMetrics
 from infrastructure.llm.templates import get_template
 from infrastructure.llm.review.metrics import StreamingMetrics
 
@@ -93,6 +99,11 @@ class LLMClient:
     - query_structured(): JSON-formatted responses
     - stream_*(): Streaming variants of above
     
+    The client is safe to share across threads. Each thread has its own
+    conversation context (``context``), so clearing or resetting the
+    context in one thread never affects queries running in another.
+    ``conversation()`` gives a block its own fresh context.
+    
     Example:
         >>> client = LLMClient()
         >>> 
@@ -117,8 +128,11 @@ class LLMClient:
             config: LLMConfig instance. If None, loads from environment.
         """
         self.config = config or LLMConfig.from_env()
-        self.context = ConversationContext(max_tokens=self.config.context_window)
-        self._system_prompt_injected = False
+        # Conversation context and system prompt state, per thread
+        self._local = threading.local()
+        # Response cache, created on first use when config.response_cache is set
+        self._response_cache: Optional[LLMResponseCache] = None
+        self._cache_lock = threading.Lock()
         
         # Store the default system prompt to detect if user explicitly set it
         default_system_prompt = (
@@ -145,10 +159,171 @@ class LLMClient:
         if self.config.auto_inject_system_prompt and self.config.system_prompt:
             self._inject_system_prompt()
 
+    @property
+    def context(self) -> ConversationContext:
+        """Conversation context of the calling thread.
+        
+        Created on first use in each thread, with the system prompt injected
+        if configured.
+        """
+        context = getattr(self._local, "context", None)
+        if context is None:
+            context = ConversationContext(max_tokens=self.config.context_window)
+            self._local.context = context
+            self._local.system_prompt_injected = False
+            if self.config.auto_inject_system_prompt and self.config.system_prompt:
+                self._inject_system_prompt()
+        return context
+
+    @context.setter
+    def context(self, context: ConversationContext) -> None:
+        self._local.context = context
+
+    @property
+    def _system_prompt_injected(self) -> bool:
+        return getattr(self._local, "system_prompt_injected", False)
+
+    @_system_prompt_injected.setter
+    def _system_prompt_injected(self, injected: bool) -> None:
+        self._local.system_prompt_injected = injected
+
+    @contextmanager
+    def conversation(self) -> Iterator[ConversationContext]:
+        """Run a block with a fresh conversation context in the calling thread.
+        
+        The thread's previous context is restored when the block exits.
+        
+        Example:
+            >>> with client.conversation():
+            ...     client.query("First question")
+            ...     client.query("Follow-up question")
+        
+        Yields:
+            The block's ConversationContext.
+        """
+        saved = (getattr(self._local, "context", None), self._system_prompt_injected)
+        self._local.context = None
+        try:
+            yield self.context
+        finally:
+            self._local.context, self._local.system_prompt_injected = saved
+
+    @property
+    def active_session(self) -> Optional[LLMSession]:
+        """The calling thread's open session, if any."""
+        return getattr(self._local, "session", None)
+
+    @contextmanager
+    def session(self, keep_alive: Optional[str] = None) -> Iterator[LLMSession]:
+        """Run a block of related requests that share a prompt prefix.
+        
+        Every request in the block asks Ollama to keep the model loaded for
+        ``keep_alive``, so the KV cache of the shared prefix (e.g. the paper
+        text) survives between stages, and the prompt metrics of each request
+        are recorded on the yielded LLMSession. Sessions are per thread;
+        worker threads join the session with ``use_session``.
+        
+        Example:
+            >>> with client.session() as session:
+            ...     session.stage = "claims"
+            ...     client.query(paper_prefix + claims_task, reset_context=True)
+            ...     session.stage = "methods"
+            ...     client.query(paper_prefix + methods_task, reset_context=True)
+            >>> session.summary()["later_ttft_seconds"]
+        
+        Args:
+            keep_alive: Ollama keep_alive duration (default: config.keep_alive or "30m").
+            
+        Yields:
+            The block's LLMSession.
+        """
+        session = LLMSession(keep_alive=keep_alive or self.config.keep_alive or DEFAULT_SESSION_KEEP_ALIVE)
+        with self.use_session(session):
+            yield session
+
+    @contextmanager
+    def use_session(self, session: Optional[LLMSession]) -> Iterator[Optional[LLMSession]]:
+        """Make a session (e.g. another thread's) active in the calling thread.
+        
+        Worker threads that make requests on behalf of a session opened in
+        the dispatching thread run inside this block, so their requests
+        carry the session's keep_alive and are recorded on it.
+        
+        Example:
+            >>> session = client.active_session
+            >>> def worker(prompt):
+            ...     with client.use_session(session), client.conversation():
+            ...         return client.query(prompt)
+        
+        Args:
+            session: Session to activate (None runs the block without one).
+            
+        Yields:
+            The active session.
+        """
+        saved = self.active_session
+        self._local.session = session
+        try:
+            yield session
+        finally:
+            self._local.session = saved
+
+    def _prepare_payload(self, payload: Dict[str, Any]) -> None:
+        """Add the session or configured keep_alive to a chat payload."""
+        session = self.active_session
+        keep_alive = session.keep_alive if session else self.config.keep_alive
+        if keep_alive:
+            payload["keep_alive"] = keep_alive
+
+    def _record_metrics(self, payload: Dict[str, Any], data: Dict[str, Any], ttft_seconds: Optional[float] = None) -> None:
+        """Record a response's prompt metrics on the active session."""
+        session = self.active_session
+        if session is None:
+            return
+        messages = payload.get("messages") or [{}]
+        session.record(RequestMetrics.from_response(
+            session.stage, len(messages[-1].get("content", "")), data, ttft_seconds
+        ))
+
+    @property
+    def response_cache(self) -> Optional[LLMResponseCache]:
+        """Response cache, or None unless ``config.response_cache`` is enabled."""
+        if not self.config.response_cache:
+            return None
+        with self._cache_lock:
+            if self._response_cache is None:
+                path = Path(self.config.response_cache_file) if self.config.response_cache_file else DEFAULT_CACHE_FILE
+                self._response_cache = LLMResponseCache(
+                    path, max_bytes=int(self.config.response_cache_max_mb * 1024 * 1024)
+                )
+            return self._response_cache
+
+    def _cached_response(self, payload: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+        """Look up a chat request in the response cache.
+        
+        Args:
+            payload: Ollama ``/api/chat`` payload.
+            
+        Returns:
+            Tuple of (cache key, or None if the request is not cached;
+            cached response text, or None on a miss).
+        """
+        cache = self.response_cache
+        if cache is None or not is_cacheable(payload):
+            return None, None
+        key = cache.make_key(payload)
+        return key, cache.get(key)
+
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Hit/miss statistics of the response cache, or None if disabled."""
+        cache = self.response_cache
+        return cache.get_stats() if cache is not None else None
+
     def _inject_system_prompt(self) -> None:
         """Inject system prompt into context if not already present."""
+        context = self.context
         if not self._system_prompt_injected and self.config.system_prompt:
-            self.context.add_message("system", self.config.system_prompt)
+            context.add_message("system", self.config.system_prompt)
             self._system_prompt_injected = True
 
     def query(
@@ -551,14 +726,16 @@ class LLMClient:
         if schema:
             schema_instruction = f"\n\nReturn valid JSON matching this schema:\n{json.dumps(schema, indent=2)}"
         
+        # The instruction follows the prompt, so prompts that start with the
+        # same content (e.g. a paper) share a cacheable prefix with other queries
         instruction = (
-            "Return your response as valid JSON only, no markdown or extra text. "
-            f"{schema_instruction}\n\n"
+            "\n\nReturn your response as valid JSON only, no markdown or extra text. "
+            f"{schema_instruction}"
         )
         
         # Use raw generation for structured to bypass context issues with JSON
         messages = self.context.get_messages() + [
-            {"role": "user", "content": instruction + prompt}
+            {"role": "user", "content": prompt + instruction}
         ]
         
         response_text = self._generate_response_direct(
@@ -580,7 +757,7 @@ class LLMClient:
         )
         
         # Add to context
-        self.context.add_message("user", instruction + prompt)
+        self.context.add_message("user", prompt + instruction)
         self.context.add_message("assistant", response_text)
         
         # Parse and validate JSON response
@@ -693,6 +870,12 @@ class LLMClient:
         # Add format for native JSON mode
         if opts.format_json:
             payload["format"] = "json"
+        self._prepare_payload(payload)
+        
+        cache_key, cached = self._cached_response(payload)
+        if cached is not None:
+            logger.info(f"Response served from LLM response cache ({model}, {len(cached):,} chars)")
+            return cached
         
         last_error = None
         
@@ -712,6 +895,7 @@ class LLMClient:
                 
                 data = response.json()
                 content = data.get("message", {}).get("content", "")
+                self._record_metrics(payload, data)
                 
                 if not content:
                     logger.warning(f"Empty response from Ollama ({model})")
@@ -729,6 +913,9 @@ class LLMClient:
                 if attempt > 0:
                     logger.info(f"Request succeeded on retry {attempt + 1}")
                 
+                if cache_key is not None and content:
+                    self.response_cache.put(cache_key, model, content)
+                
                 return content
                 
             except requests.exceptions.Timeout as e:
@@ -836,6 +1023,15 @@ class LLMClient:
         
         if opts.format_json:
             payload["format"] = "json"
+        self._prepare_payload(payload)
+        
+        cache_key, cached = self._cached_response(payload)
+        if cached is not None:
+            logger.info(f"Streaming response served from LLM response cache ({model_name}, {len(cached):,} chars)")
+            self.context.add_message("assistant", cached)
+            if cached:
+                yield cached
+            return
         
         full_response = []
         chunk_count = 0
@@ -862,6 +1058,10 @@ class LLMClient:
                             try:
                                 data = json.loads(line)
                                 chunk = data.get("message", {}).get("content", "")
+                                if data.get("done"):
+                                    self._record_metrics(
+                                        payload, data, metrics.first_chunk_time if first_chunk_time is not None else None
+                                    )
                                 
                                 if chunk:
                                     chunk_count += 1
@@ -1070,6 +1270,9 @@ class LLMClient:
         # Add full response to context
         self.context.add_message("assistant", full_response_text)
         
+        if cache_key is not None and full_response_text and error_count == 0:
+            self.response_cache.put(cache_key, model_name, full_response_text)
+        
         # Save response if requested
         if save_response and not partial_saved:
             try:
@@ -1255,7 +1458,7 @@ class LLMClient:
             return (False, error_msg)
 
     def reset(self) -> None:
-        """Reset client state, clearing context and system prompt."""
+        """Reset the calling thread's context and system prompt."""
         self.context.clear()
         self._system_prompt_injected = False
         # Only re-inject if auto_inject is enabled
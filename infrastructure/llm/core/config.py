@@ -106,6 +106,15 @@ class LLMConfig:
     )
     auto_inject_system_prompt: bool = True
     
+    # Response cache settings (see LLMResponseCache)
+    response_cache: bool = False
+    response_cache_file: Optional[str] = None  # Default: data/cache/llm_responses.sqlite
+    response_cache_max_mb: float = 500.0
+    
+    # How long Ollama keeps the model loaded after a request (e.g. "30m");
+    # None uses the server default. LLMClient.session() overrides it.
+    keep_alive: Optional[str] = None
+    
     def __init__(self, *args, **kwargs):
         """Initialize config, supporting num_ctx as alias for context_window."""
         # Handle num_ctx -> context_window mapping
@@ -194,6 +203,20 @@ class LLMConfig:
         if 'OLLAMA_MODEL' in os.environ:
             config_kwargs['default_model'] = os.environ['OLLAMA_MODEL']
         
+        # Response cache
+        if 'LLM_RESPONSE_CACHE' in os.environ:
+            config_kwargs['response_cache'] = os.environ['LLM_RESPONSE_CACHE'].lower() in ('true', '1', 'yes')
+        if os.environ.get('LLM_RESPONSE_CACHE_FILE'):
+            config_kwargs['response_cache_file'] = os.environ['LLM_RESPONSE_CACHE_FILE']
+        if 'LLM_RESPONSE_CACHE_MAX_MB' in os.environ:
+            try:
+                config_kwargs['response_cache_max_mb'] = float(os.environ['LLM_RESPONSE_CACHE_MAX_MB'])
+            except ValueError:
+                pass  # Use default
+        
+        if os.environ.get('LLM_KEEP_ALIVE'):
+            config_kwargs['keep_alive'] = os.environ['LLM_KEEP_ALIVE']
+        
         return cls(**config_kwargs)
     
     def with_overrides(self, **kwargs: Any) -> LLMConfig:
@@ -225,6 +248,10 @@ class LLMConfig:
             "long_min_tokens": self.long_min_tokens,
             "system_prompt": self.system_prompt,
             "auto_inject_system_prompt": self.auto_inject_system_prompt,
+            "response_cache": self.response_cache,
+            "response_cache_file": self.response_cache_file,
+            "response_cache_max_mb": self.response_cache_max_mb,
+            "keep_alive": self.keep_alive,
         }
         
         # Apply overrides
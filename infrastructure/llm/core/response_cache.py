@@ -0,0 +1,116 @@
+"""Persistent, content-addressed cache of LLM responses.
+
+Re-running summarization on an unchanged paper repeats identical
+``/api/chat`` requests. With the cache enabled, LLMClient stores each
+response under a SHA-256 of the request (model, messages, generation
+options including the seed, and output format) and answers repeated
+requests from disk instead of the server.
+
+Only reproducible requests are cached: those with a fixed seed or a
+temperature of 0. Sampling without a seed is expected to vary between
+calls (e.g. retries after a rejected draft), so such requests always go
+to the server.
+
+Responses are stored zlib-compressed in a BlobCache (one SQLite file)
+and evicted least-recently-used once the cache exceeds its size bound.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from infrastructure.core.blob_cache import BlobCache
+from infrastructure.core.performance import PerformanceMonitor
+
+DEFAULT_CACHE_FILE = Path("data/cache/llm_responses.sqlite")
+
+
+def is_cacheable(request: Dict[str, Any]) -> bool:
+    """Check whether a chat request is reproducible enough to cache.
+
+    Args:
+        request: Ollama ``/api/chat`` payload.
+
+    Returns:
+        True if the request fixes a seed or uses temperature 0.
+    """
+    options = request.get("options") or {}
+    return options.get("seed") is not None or options.get("temperature") == 0
+
+
+class LLMResponseCache(BlobCache):
+    """SQLite-backed cache of LLM chat responses.
+
+    Safe to share between threads; the database file is only created on
+    first use.
+
+    Attributes:
+        path: Path to the SQLite cache file.
+        max_bytes: Maximum total payload size before LRU eviction.
+        monitor: PerformanceMonitor receiving cache hit/miss counts.
+    """
+
+    DESCRIPTION = "LLM response cache"
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_CACHE_FILE,
+        max_bytes: int = 500 * 1024 * 1024,
+        monitor: Optional[PerformanceMonitor] = None
+    ):
+        """Initialize the response cache.
+
+        Args:
+            path: Path to the SQLite cache file.
+            max_bytes: Maximum total payload size before LRU eviction.
+            monitor: Optional PerformanceMonitor for hit/miss metrics.
+        """
+        super().__init__(path, max_bytes, monitor=monitor)
+
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> str:
+        """Build the content address of a chat request.
+
+        The ``stream`` flag is ignored, so streamed and non-streamed
+        requests share entries.
+
+        Args:
+            request: Ollama ``/api/chat`` payload.
+
+        Returns:
+            Hex SHA-256 digest identifying the request.
+        """
+        raw = json.dumps(
+            {
+                "model": request.get("model"),
+                "messages": request.get("messages"),
+                "options": request.get("options"),
+                "format": request.get("format"),
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached response.
+
+        Args:
+            key: Request key from ``make_key``.
+
+        Returns:
+            Response text, or None on a miss.
+        """
+        return self._load(key, lambda data: data.decode("utf-8"))
+
+    def put(self, key: str, model: str, text: str) -> None:
+        """Store a response and evict old entries if over the size bound.
+
+        Args:
+            key: Request key from ``make_key``.
+            model: Model that generated the response.
+            text: Response text.
+        """
+        self._store(key, text.encode("utf-8"), label=model)
@@ -0,0 +1,122 @@
+"""Sessions of related LLM requests that share a prompt prefix.
+
+Ollama keeps the KV cache of a model's last prompt and reuses its longest
+common token prefix with the next one, so a request whose prompt starts
+with the same paper text as the previous request only evaluates the new
+tokens. That reuse needs the model to stay loaded between requests, and
+identical leading messages (system prompt, then the paper).
+
+``LLMClient.session()`` opens an ``LLMSession`` for the calling thread
+(worker threads join it with ``LLMClient.use_session()``):
+every request in it carries ``keep_alive`` so the model (and its cache)
+stays loaded between stages, and the prompt-evaluation metrics Ollama
+reports for each request are recorded as ``RequestMetrics``. A stage
+whose prompt reused the prefix shows few ``prompt_tokens`` and a short
+time to first token.
+"""
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+DEFAULT_SESSION_KEEP_ALIVE = "30m"
+
+
+@dataclass
+class RequestMetrics:
+    """Prompt evaluation metrics of one request.
+
+    Attributes:
+        stage: Session stage the request belongs to.
+        prompt_chars: Length of the last user message.
+        prompt_tokens: Prompt tokens evaluated by the server
+            (``prompt_eval_count``; cached prefix tokens are not counted).
+        prompt_eval_seconds: Server time spent evaluating the prompt.
+        load_seconds: Server time spent loading the model.
+        ttft_seconds: Time to first token; measured by the client when
+            streaming, otherwise load plus prompt evaluation time.
+        streaming: Whether the request was streamed.
+    """
+    stage: str
+    prompt_chars: int
+    prompt_tokens: Optional[int] = None
+    prompt_eval_seconds: Optional[float] = None
+    load_seconds: Optional[float] = None
+    ttft_seconds: Optional[float] = None
+    streaming: bool = False
+
+    @classmethod
+    def from_response(
+        cls,
+        stage: str,
+        prompt_chars: int,
+        data: Dict[str, Any],
+        ttft_seconds: Optional[float] = None
+    ) -> RequestMetrics:
+        """Build metrics from the final JSON object of an Ollama chat response.
+
+        Args:
+            stage: Session stage of the request.
+            prompt_chars: Length of the last user message.
+            data: Final response object (durations are in nanoseconds).
+            ttft_seconds: Client-measured time to first token of a streamed
+                request (None for non-streamed requests).
+
+        Returns:
+            RequestMetrics for the request.
+        """
+        def seconds(key: str) -> Optional[float]:
+            value = data.get(key)
+            return value / 1e9 if isinstance(value, (int, float)) else None
+
+        prompt_eval = seconds("prompt_eval_duration")
+        load = seconds("load_duration")
+        streaming = ttft_seconds is not None
+        if not streaming and prompt_eval is not None:
+            ttft_seconds = prompt_eval + (load or 0.0)
+        return cls(
+            stage=stage,
+            prompt_chars=prompt_chars,
+            prompt_tokens=data.get("prompt_eval_count"),
+            prompt_eval_seconds=prompt_eval,
+            load_seconds=load,
+            ttft_seconds=ttft_seconds,
+            streaming=streaming,
+        )
+
+
+@dataclass
+class LLMSession:
+    """Requests made within one ``LLMClient.session()`` block.
+
+    Attributes:
+        keep_alive: Ollama ``keep_alive`` sent with every request.
+        stage: Label recorded with subsequent requests (set by the caller).
+        requests: Metrics of each completed request, in order.
+    """
+    keep_alive: str = DEFAULT_SESSION_KEEP_ALIVE
+    stage: str = ""
+    requests: List[RequestMetrics] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, metrics: RequestMetrics) -> None:
+        """Record a completed request (safe to call from several threads)."""
+        with self._lock:
+            self.requests.append(metrics)
+
+    def summary(self) -> Dict[str, Any]:
+        """Aggregate prompt metrics of the session.
+
+        Returns:
+            Dictionary with requests, prompt_chars, prompt_tokens, the first
+            request's ttft_seconds and the mean ttft_seconds of the rest.
+        """
+        ttfts = [m.ttft_seconds for m in self.requests if m.ttft_seconds is not None]
+        return {
+            "requests": len(self.requests),
+            "prompt_chars": sum(m.prompt_chars for m in self.requests),
+            "prompt_tokens": sum(m.prompt_tokens or 0 for m in self.requests),
+            "first_ttft_seconds": ttfts[0] if ttfts else None,
+            "later_ttft_seconds": sum(ttfts[1:]) / len(ttfts[1:]) if len(ttfts) > 1 else None,
+        }
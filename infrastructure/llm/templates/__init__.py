@@ -20,6 +20,7 @@ from infrastructure.llm.templates.research import (
     CitationNetworkAnalysis,
     ClaimsQuotesExtraction,
     MethodsToolsAnalysis,
+    CombinedPaperExtraction,
 )
 from infrastructure.llm.templates.manuscript import (
     ManuscriptExecutiveSummary,
@@ -68,6 +69,7 @@ TEMPLATES: dict[str, type[ResearchTemplate]] = {
     # Summarization extraction templates
     "claims_quotes_extraction": ClaimsQuotesExtraction,
     "methods_tools_analysis": MethodsToolsAnalysis,
+    "combined_paper_extraction": CombinedPaperExtraction,
 }
 
 
@@ -106,6 +108,7 @@ __all__ = [
     'CitationNetworkAnalysis',
     'ClaimsQuotesExtraction',
     'MethodsToolsAnalysis',
+    'CombinedPaperExtraction',
     # Constants
     'REVIEW_MIN_WORDS',
     'TRANSLATION_LANGUAGES',
@@ -5,6 +5,33 @@ from typing import Optional
 
 from infrastructure.llm.templates.base import ResearchTemplate
 
+# Shared opening of every prompt about one paper. Stages that start with the
+# same rendered prefix let Ollama reuse its KV cache of the paper text, so
+# per-task text (metadata, instructions) goes after it.
+PAPER_PREFIX = """=== PAPER CONTENT ===
+
+Title: ${title}
+
+PAPER TEXT:
+${text}
+
+=== END PAPER CONTENT ===
+
+"""
+
+
+def render_paper_prefix(title: str, text: str) -> str:
+    """Render the shared paper prefix of a prompt.
+    
+    Args:
+        title: Paper title.
+        text: Paper text content.
+        
+    Returns:
+        Rendered prefix, ending with a blank line.
+    """
+    return PAPER_PREFIX.replace("${title}", title).replace("${text}", text)
+
 
 class SummarizeAbstract(ResearchTemplate):
     """Template for summarizing abstracts."""
@@ -432,18 +459,11 @@ class ClaimsQuotesExtraction(ResearchTemplate):
     Identifies main claims, hypotheses, findings, and extracts important direct quotes
     with proper context and attribution.
     """
-    template_str = """=== PAPER CONTENT ===
-
-Title: ${title}
+    template_str = PAPER_PREFIX + """PAPER METADATA:
 Authors: ${authors}
 Year: ${year}
 Source: ${source}
 
-PAPER TEXT:
-${text}
-
-=== END PAPER CONTENT ===
-
 TASK: Extract key claims, hypotheses, findings, and important direct quotes from this research paper.
 
 REQUIREMENTS:
@@ -554,18 +574,11 @@ class MethodsToolsAnalysis(ResearchTemplate):
     - Evaluation metrics
     - Software tools and platforms
     """
-    template_str = """=== PAPER CONTENT ===
-
-Title: ${title}
+    template_str = PAPER_PREFIX + """PAPER METADATA:
 Authors: ${authors}
 Year: ${year}
 Source: ${source}
 
-PAPER TEXT:
-${text}
-
-=== END PAPER CONTENT ===
-
 PROFESSIONAL TONE REQUIREMENTS:
 - Begin directly with the analysis - NO conversational openings
 - Do NOT use phrases like: "Okay, here's...", "Here's the analysis...", 
@@ -732,17 +745,10 @@ Begin analyzing methods and tools now. Remember: ONLY list items that ARE found,
 class PaperClassificationTemplate(ResearchTemplate):
     """Template for classifying papers by research type."""
     
-    template_str = """=== PAPER CONTENT ===
-
-Title: ${title}
+    template_str = PAPER_PREFIX + """PAPER METADATA:
 Authors: ${authors}
 Year: ${year}
 
-FULL PAPER TEXT:
-${full_text}
-
-=== END PAPER CONTENT ===
-
 TASK: Classify this research paper based on its primary contribution and focus.
 
 CLASSIFICATION CATEGORIES:
@@ -789,5 +795,91 @@ OUTPUT FORMAT (JSON):
         """
         return self.template_str.replace("${title}", title).replace(
             "${authors}", authors
-        ).replace("${year}", year).replace("${full_text}", full_text)
+        ).replace("${year}", year).replace("${text}", full_text)
+
+
 
+class CombinedPaperExtraction(ResearchTemplate):
+    """Template for extracting claims, quotes, methods/tools and classification in one pass.
+    
+    Replaces the separate ClaimsQuotesExtraction, MethodsToolsAnalysis and
+    PaperClassificationTemplate passes, so the paper text is processed once.
+    The response is JSON; see summarization/combined_extraction.py.
+    """
+    template_str = PAPER_PREFIX + """PAPER METADATA:
+Authors: ${authors}
+Year: ${year}
+Source: ${source}
+
+TASK: Extract the key claims, important quotes, methods and tools, and the research-type classification of this paper in a single JSON object.
+
+REQUIREMENTS:
+
+1. "claims": 5-15 key claims, hypotheses, findings and conclusions of the paper, one string each.
+   - Cover methodology, results, conclusions and contributions
+   - Do NOT invent claims not present in the paper
+   - Each claim appears only once
+
+2. "quotes": 5-10 of the most important direct quotes, as objects with:
+   - "text": the quote copied VERBATIM from the paper text, without surrounding quotation marks
+   - "context": section or location where it appears (e.g. "Introduction", "Results")
+   - "significance": brief explanation of why it is important
+   - CRITICAL: only quotes that actually appear in the paper text - do NOT modify, paraphrase or invent quotes
+
+3. "methods": an object with the lists "algorithms", "frameworks", "datasets", "metrics" and "tools":
+   - "algorithms": algorithms and methodologies used
+   - "frameworks": software frameworks, programming languages and libraries
+   - "datasets": datasets employed
+   - "metrics": evaluation metrics and statistical tests
+   - "tools": software tools, platforms and computational resources
+   - Each item is an object with "name" and "evidence", where "evidence" is the exact text from the paper that mentions it
+   - ONLY list items EXPLICITLY NAMED in the paper text; never infer tools from the methodology
+   - Use an empty list for a category with no explicitly named items
+
+4. "classification": an object with:
+   - "category": "core_theory_math" (theoretical foundations, proofs, fundamental principles),
+     "translation_tool" (software tools, frameworks or systems that implement research) or
+     "applied" (existing theories, methods or tools applied to a domain problem)
+   - "domain": the application domain (e.g. "Biology", "Medicine") if category is "applied", null otherwise
+   - "confidence": 0.0-1.0
+   - "reasoning": brief explanation
+   - Consider the ENTIRE paper and its PRIMARY contribution
+
+OUTPUT FORMAT (JSON):
+{
+  "claims": ["..."],
+  "quotes": [{"text": "...", "context": "...", "significance": "..."}],
+  "methods": {
+    "algorithms": [{"name": "...", "evidence": "..."}],
+    "frameworks": [],
+    "datasets": [],
+    "metrics": [],
+    "tools": []
+  },
+  "classification": {"category": "...", "domain": null, "confidence": 0.0, "reasoning": "..."}
+}
+"""
+
+    def render(
+        self,
+        title: str,
+        authors: str,
+        year: str,
+        source: str,
+        text: str
+    ) -> str:
+        """Render template for combined extraction.
+        
+        Args:
+            title: Paper title.
+            authors: Author names.
+            year: Publication year.
+            source: Source database.
+            text: Paper text content.
+            
+        Returns:
+            Rendered prompt string.
+        """
+        return self.template_str.replace("${title}", title).replace(
+            "${authors}", authors
+        ).replace("${year}", year).replace("${source}", source).replace("${text}", text)
@@ -5,10 +5,19 @@ by the literature module. It's a minimal subset of the full validation
 module from the template repo.
 """
 
-from .pdf_validator import extract_text_from_pdf, PDFValidationError
+from .pdf_validator import (
+    extract_text_from_pdf,
+    iter_pdf_pages,
+    write_pdf_text,
+    PDFTextInfo,
+    PDFValidationError,
+)
 
 __all__ = [
     "extract_text_from_pdf",
+    "iter_pdf_pages",
+    "write_pdf_text",
+    "PDFTextInfo",
     "PDFValidationError",
 ]
 
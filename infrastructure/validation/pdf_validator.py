@@ -4,11 +4,18 @@ PDF validation module - Minimal version for literature repo.
 This module provides PDF text extraction functionality needed by the
 literature summarization system. It's a minimal subset of the full
 validation module from the template repo.
+
+Pages are parsed one at a time by ``iter_pdf_pages``; a page that fails
+in one backend is retried with the next backend for that page only, and
+callers can stop iterating once they have the pages they need.
 """
 
 from pathlib import Path
 import io
+import os
 import contextlib
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, List, Optional, Tuple
 from infrastructure.core.logging_utils import get_logger
 
 
@@ -17,15 +24,186 @@ class PDFValidationError(Exception):
     pass
 
 
-def extract_text_from_pdf(pdf_path: Path) -> str:
+@dataclass
+class PDFTextInfo:
+    """Details of a text extraction, filled in while pages are parsed.
+
+    Attributes:
+        backend: Library that opened the PDF (pdfplumber, pypdf or PyPDF2).
+        pages: Pages parsed.
+        chars: Characters of text produced.
+        words: Words of text produced.
+    """
+    backend: str = ""
+    pages: int = 0
+    chars: int = 0
+    words: int = 0
+
+
+NO_BACKEND_MESSAGE = (
+    "No PDF parsing library available. Install one of: pdfplumber, pypdf, or PyPDF2.\n"
+    "Installation commands:\n"
+    "  pip install pdfplumber  # Recommended: best quality extraction\n"
+    "  pip install pypdf        # Included in project dependencies\n"
+    "  pip install PyPDF2       # Legacy option\n"
+    "\n"
+    "Note: pypdf>=5.0 should be installed automatically with this project. "
+    "If you see this error, try: pip install -e . or pip install pypdf"
+)
+
+
+def _open_pdfplumber(pdf_path: Path, stack: contextlib.ExitStack) -> Tuple[int, Callable[[int], str]]:
+    import pdfplumber
+
+    pdf = stack.enter_context(pdfplumber.open(pdf_path))
+
+    def page_text(index: int) -> str:
+        page = pdf.pages[index]
+        try:
+            return page.extract_text() or ""
+        finally:
+            # Drop the page's parsed objects so memory stays flat on long papers
+            close = getattr(page, "close", None)
+            if close is not None:
+                close()
+
+    return len(pdf.pages), page_text
+
+
+def _open_pypdf(pdf_path: Path, stack: contextlib.ExitStack) -> Tuple[int, Callable[[int], str]]:
+    from pypdf import PdfReader
+
+    logger = get_logger(__name__)
+    file = stack.enter_context(open(pdf_path, 'rb'))
+
+    def quiet(fn: Callable[[], Any]) -> Any:
+        # Capture stderr to suppress pypdf warnings (e.g., "Ignoring wrong pointing object")
+        # These are harmless and indicate pypdf is gracefully handling malformed PDF objects
+        stderr_capture = io.StringIO()
+        with contextlib.redirect_stderr(stderr_capture):
+            result = fn()
+        # Log suppressed warnings at DEBUG level for troubleshooting
+        captured_warnings = stderr_capture.getvalue().strip()
+        if captured_warnings:
+            logger.debug(f"Suppressed pypdf warnings for {pdf_path.name}: {captured_warnings}")
+        return result
+
+    reader = quiet(lambda: PdfReader(file))
+    return len(reader.pages), lambda index: quiet(lambda: reader.pages[index].extract_text()) or ""
+
+
+def _open_pypdf2(pdf_path: Path, stack: contextlib.ExitStack) -> Tuple[int, Callable[[int], str]]:
+    import PyPDF2
+
+    reader = PyPDF2.PdfReader(stack.enter_context(open(pdf_path, 'rb')))
+    return len(reader.pages), lambda index: reader.pages[index].extract_text() or ""
+
+
+# Backends in order of preference: pdfplumber (best quality) → pypdf → PyPDF2 (legacy)
+_BACKENDS: List[Tuple[str, Callable[[Path, contextlib.ExitStack], Tuple[int, Callable[[int], str]]]]] = [
+    ("pdfplumber", _open_pdfplumber),
+    ("pypdf", _open_pypdf),
+    ("PyPDF2", _open_pypdf2),
+]
+
+
+def iter_pdf_pages(
+    pdf_path: Path,
+    max_pages: Optional[int] = None,
+    info: Optional[PDFTextInfo] = None
+) -> Iterator[str]:
+    """
+    Yield the text of each page of a PDF as it is parsed.
+
+    The first backend that opens the file (pdfplumber → pypdf → PyPDF2)
+    extracts the pages. If a page fails, only that page is retried with
+    the next backends, which are opened on first need; a page no backend
+    can read yields an empty string. Closing the generator early (e.g.
+    ``break``) releases the open files without parsing the rest.
+
+    Args:
+        pdf_path: Path to the PDF file
+        max_pages: Stop after this many pages (default: all pages)
+        info: Optional PDFTextInfo updated with the backend and pages parsed
+
+    Yields:
+        Text of each page (empty string for pages without text)
+
+    Raises:
+        PDFValidationError: If the file doesn't exist or no backend can open it
+    """
+    if not pdf_path.exists():
+        raise PDFValidationError(f"PDF file not found: {pdf_path}")
+
+    logger = get_logger(__name__)
+
+    with contextlib.ExitStack() as stack:
+        # Backends opened so far: name → (page_count, page_text); None if unusable
+        opened: dict = {}
+        errors: List[str] = []
+
+        def backend(index: int) -> Optional[Tuple[int, Callable[[int], str]]]:
+            name, open_backend = _BACKENDS[index]
+            if name not in opened:
+                try:
+                    opened[name] = open_backend(pdf_path, stack)
+                except ImportError:
+                    opened[name] = None
+                except Exception as e:
+                    logger.warning(f"{name} could not open {pdf_path.name}: {e}, trying alternatives...")
+                    errors.append(f"{name}: {e}")
+                    opened[name] = None
+            return opened[name]
+
+        primary = next(
+            (i for i in range(len(_BACKENDS)) if backend(i) is not None),
+            None
+        )
+        if primary is None:
+            if errors:
+                raise PDFValidationError(
+                    f"Failed to extract text from {pdf_path.name}: " + "; ".join(errors)
+                )
+            raise PDFValidationError(NO_BACKEND_MESSAGE)
+
+        page_count = opened[_BACKENDS[primary][0]][0]
+        if info is not None:
+            info.backend = _BACKENDS[primary][0]
+        if max_pages is not None:
+            page_count = min(page_count, max_pages)
+
+        for page_index in range(page_count):
+            text = None
+            for i in range(primary, len(_BACKENDS)):
+                candidate = backend(i)
+                if candidate is None or page_index >= candidate[0]:
+                    continue
+                try:
+                    text = candidate[1](page_index)
+                    break
+                except Exception as e:
+                    logger.warning(
+                        f"{_BACKENDS[i][0]} failed on page {page_index + 1} of {pdf_path.name}: {e}"
+                    )
+            if text is None:
+                logger.warning(f"Skipping unreadable page {page_index + 1} of {pdf_path.name}")
+                text = ""
+            if info is not None:
+                info.pages += 1
+            yield text
+
+
+def extract_text_from_pdf(pdf_path: Path, info: Optional[PDFTextInfo] = None) -> str:
     """
     Extract all text content from a PDF file.
 
     Attempts to extract text using available PDF parsing libraries in order:
-    pdfplumber → pypdf → PyPDF2. Suppresses harmless pypdf warnings.
+    pdfplumber → pypdf → PyPDF2, falling back per page (see ``iter_pdf_pages``).
+    Suppresses harmless pypdf warnings.
 
     Args:
         pdf_path: Path to the PDF file
+        info: Optional PDFTextInfo updated with extraction details
 
     Returns:
         Extracted text as a single string
@@ -33,79 +211,56 @@ def extract_text_from_pdf(pdf_path: Path) -> str:
     Raises:
         PDFValidationError: If file doesn't exist or text extraction fails
     """
-    if not pdf_path.exists():
-        raise PDFValidationError(f"PDF file not found: {pdf_path}")
+    text = '\n'.join(page for page in iter_pdf_pages(pdf_path, info=info) if page)
+    if info is not None:
+        info.chars = len(text)
+        info.words = len(text.split())
+    return text
 
-    logger = get_logger(__name__)
 
-    # Try pdfplumber first (best quality)
-    try:
-        import pdfplumber
-        text_parts = []
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
-        return '\n'.join(text_parts)
-    except ImportError:
-        pass
-    except Exception as e:
-        logger.warning(f"pdfplumber extraction failed: {e}, trying alternatives...")
-
-    # Try pypdf (newer PyPDF2) with warning suppression
-    try:
-        from pypdf import PdfReader
-
-        with open(pdf_path, 'rb') as file:
-            # Capture stderr to suppress pypdf warnings (e.g., "Ignoring wrong pointing object")
-            # These are harmless and indicate pypdf is gracefully handling malformed PDF objects
-            stderr_capture = io.StringIO()
-            with contextlib.redirect_stderr(stderr_capture):
-                pdf_reader = PdfReader(file)
-                text_parts = []
-
-                for page in pdf_reader.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-
-            # Log suppressed warnings at DEBUG level for troubleshooting
-            captured_warnings = stderr_capture.getvalue().strip()
-            if captured_warnings:
-                logger.debug(f"Suppressed pypdf warnings for {pdf_path.name}: {captured_warnings}")
-
-            return '\n'.join(text_parts)
-    except ImportError:
-        pass
-    except Exception as e:
-        logger.warning(f"pypdf extraction failed: {e}, trying PyPDF2...")
-
-    # Try PyPDF2 (legacy)
-    try:
-        import PyPDF2
-        text_parts = []
-        with open(pdf_path, 'rb') as f:
-            pdf_reader = PyPDF2.PdfReader(f)
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
-        return '\n'.join(text_parts)
-    except ImportError:
-        pass
-    except Exception as e:
-        logger.warning(f"PyPDF2 extraction failed: {e}")
-
-    # No PDF library available
-    raise PDFValidationError(
-        "No PDF parsing library available. Install one of: pdfplumber, pypdf, or PyPDF2.\n"
-        "Installation commands:\n"
-        "  pip install pdfplumber  # Recommended: best quality extraction\n"
-        "  pip install pypdf        # Included in project dependencies\n"
-        "  pip install PyPDF2       # Legacy option\n"
-        "\n"
-        "Note: pypdf>=5.0 should be installed automatically with this project. "
-        "If you see this error, try: pip install -e . or pip install pypdf"
-    )
+def write_pdf_text(pdf_path: Path, output_path: Path, min_chars: int = 0) -> PDFTextInfo:
+    """
+    Stream a PDF's text to a file page by page.
+
+    Pages are appended to ``<output_path>.tmp`` as they are parsed, so the
+    full text is never held in memory; the file is renamed into place only
+    when extraction completes.
+
+    Args:
+        pdf_path: Path to the PDF file
+        output_path: Text file to write
+        min_chars: Minimum characters required, not counting whitespace
+            around pages; less text raises PDFValidationError and leaves
+            ``output_path`` untouched
+
+    Returns:
+        PDFTextInfo with the backend, pages, characters and words written
 
+    Raises:
+        PDFValidationError: If extraction fails or yields too little text
+        OSError: If the text file cannot be written
+    """
+    temp_path = output_path.with_name(output_path.name + ".tmp")
+    info = PDFTextInfo()
+    stripped_chars = 0
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for text in iter_pdf_pages(pdf_path, info=info):
+                if not text:
+                    continue
+                if info.chars:
+                    f.write('\n')
+                    info.chars += 1
+                f.write(text)
+                info.chars += len(text)
+                info.words += len(text.split())
+                stripped_chars += len(text.strip())
+        if stripped_chars < min_chars:
+            raise PDFValidationError(
+                f"Insufficient text extracted from PDF (less than {min_chars} characters). "
+                f"Extracted: {info.chars} chars. PDF: {pdf_path.name}"
+            )
+        os.replace(temp_path, output_path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+    return info
@@ -22,6 +22,10 @@ Usage:
     
     # Both operations (search then summarize)
     python3 scripts/07_literature_search.py --search --summarize
+    
+    # Bypass or refresh the on-disk search response cache
+    python3 scripts/07_literature_search.py --search-only --no-cache
+    python3 scripts/07_literature_search.py --search-only --refresh
 
 Output Structure:
     data/
@@ -35,6 +39,7 @@ Output Structure:
 
 Environment Variables:
     LITERATURE_DEFAULT_LIMIT: Results per source per keyword (default: 25)
+    LITERATURE_SEARCH_CACHE: Cache search responses on disk (default: true)
     MAX_PARALLEL_SUMMARIES: Parallel summarization workers (default: 1)
     LLM_SUMMARIZATION_TIMEOUT: Timeout for paper summarization (default: 600)
     LOG_LEVEL: Logging verbosity (0=DEBUG, 1=INFO, 2=WARN, 3=ERROR)
@@ -88,16 +93,43 @@ logger = get_logger(__name__)
 MAX_PARALLEL_SUMMARIES = int(os.environ.get("MAX_PARALLEL_SUMMARIES", "1"))
 
 
-def setup_infrastructure_for_meta_analysis() -> Optional[LiteratureWorkflow]:
+def load_literature_config(no_cache: bool = False, refresh_cache: bool = False) -> LiteratureConfig:
+    """Load literature configuration and apply search cache flags.
+
+    Args:
+        no_cache: Disable the on-disk search response cache.
+        refresh_cache: Ignore cached responses and store fresh ones.
+
+    Returns:
+        LiteratureConfig from environment with cache overrides applied.
+    """
+    lit_config = LiteratureConfig.from_env()
+    if no_cache:
+        lit_config.use_search_cache = False
+        logger.info("Search response cache disabled (--no-cache)")
+    elif refresh_cache:
+        lit_config.refresh_search_cache = True
+        logger.info("Refreshing search response cache (--refresh)")
+    return lit_config
+
+
+def setup_infrastructure_for_meta_analysis(
+    no_cache: bool = False,
+    refresh_cache: bool = False
+) -> Optional[LiteratureWorkflow]:
     """Set up infrastructure components for meta-analysis (no Ollama required).
 
+    Args:
+        no_cache: Disable the on-disk search response cache.
+        refresh_cache: Ignore cached responses and store fresh ones.
+
     Returns:
         Configured LiteratureWorkflow instance, or None if setup fails.
     """
     log_header("Setting up Literature Processing Infrastructure")
     
     # Initialize literature search
-    lit_config = LiteratureConfig.from_env()
+    lit_config = load_literature_config(no_cache, refresh_cache)
     logger.info(f"Search limit: {lit_config.default_limit} results per source per keyword")
     
     # Log Unpaywall status
@@ -115,9 +147,18 @@ def setup_infrastructure_for_meta_analysis() -> Optional[LiteratureWorkflow]:
     return workflow
 
 
-def setup_infrastructure() -> Optional[LiteratureWorkflow]:
+def setup_infrastructure(
+    no_cache: bool = False,
+    refresh_cache: bool = False,
+    llm_cache: bool = False
+) -> Optional[LiteratureWorkflow]:
     """Set up all infrastructure components for literature processing.
 
+    Args:
+        no_cache: Disable the on-disk search response cache.
+        refresh_cache: Ignore cached responses and store fresh ones.
+        llm_cache: Enable the on-disk LLM response cache.
+
     Returns:
         Configured LiteratureWorkflow instance, or None if setup fails.
     """
@@ -137,7 +178,7 @@ def setup_infrastructure() -> Optional[LiteratureWorkflow]:
         return None
 
     # Initialize literature search
-    lit_config = LiteratureConfig.from_env()
+    lit_config = load_literature_config(no_cache, refresh_cache)
     logger.info(f"Search limit: {lit_config.default_limit} results per source per keyword")
 
     # Log Unpaywall status
@@ -153,6 +194,13 @@ def setup_infrastructure() -> Optional[LiteratureWorkflow]:
     llm_config = LLMConfig.from_env()
     llm_config.default_model = model
     llm_config.timeout = float(os.environ.get("LLM_SUMMARIZATION_TIMEOUT", "600"))
+    if llm_cache:
+        llm_config.response_cache = True
+    if llm_config.response_cache:
+        if llm_config.seed is None:
+            logger.info("LLM response cache enabled; set LLM_SEED so responses are reproducible and cached")
+        else:
+            logger.info("LLM response cache enabled")
 
     system_prompt = (
         "You are an expert research paper analyst specializing in scientific literature. "
@@ -296,6 +344,22 @@ Examples:
         action="store_true",
         help="Retry previously failed downloads (default: False, prompts interactively if failures exist)"
     )
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the on-disk search response cache for this run"
+    )
+    cache_group.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached search responses and store fresh ones"
+    )
+    parser.add_argument(
+        "--llm-cache",
+        action="store_true",
+        help="Cache reproducible LLM responses (fixed LLM_SEED or temperature 0) on disk"
+    )
     
     args = parser.parse_args()
     
@@ -336,10 +400,10 @@ Examples:
         # Set up infrastructure
         if args.meta_analysis:
             # Meta-analysis doesn't require Ollama
-            workflow = setup_infrastructure_for_meta_analysis()
+            workflow = setup_infrastructure_for_meta_analysis(args.no_cache, args.refresh)
         else:
             # Other operations require Ollama
-            workflow = setup_infrastructure()
+            workflow = setup_infrastructure(args.no_cache, args.refresh, args.llm_cache)
         
         if workflow is None:
             logger.error("Failed to initialize infrastructure")
@@ -5,10 +5,15 @@ Analyze common tooling and tool co-occurrence patterns across GitHub repositorie
 
 import json
 import re
+import sys
 from pathlib import Path
 from collections import defaultdict, Counter
 from itertools import combinations
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from infrastructure.literature.summarization.corpus import iter_extracted_texts, report_to_stderr
+
 # Pattern to find GitHub URLs
 github_pattern = re.compile(r'https?://(?:www\.)?github\.com/[^\s\)]+|github\.com/[^\s\)]+', re.IGNORECASE)
 
@@ -79,11 +84,9 @@ def extract_data():
         print(f"Error: Directory {extracted_text_dir} does not exist")
         return []
     
-    for txt_file in sorted(extracted_text_dir.glob('*.txt')):
+    for paper_name, content in iter_extracted_texts(extracted_text_dir, errors='ignore', on_error=report_to_stderr):
         try:
-            with open(txt_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                lines = content.split('\n')
+            lines = content.split('\n')
             
             github_urls_raw = github_pattern.findall(content)
             
@@ -95,7 +98,6 @@ def extract_data():
                         cleaned_urls.append(cleaned)
                 
                 code_mentions = find_code_mentions(content, cleaned_urls, lines)
-                paper_name = txt_file.stem
                 
                 if code_mentions:
                     results.append({
@@ -105,7 +107,7 @@ def extract_data():
                         'urls': cleaned_urls
                     })
         except Exception as e:
-            print(f'Error processing {txt_file}: {e}', file=__import__('sys').stderr)
+            report_to_stderr(paper_name, e)
     
     return results
 
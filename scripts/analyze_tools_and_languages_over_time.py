@@ -7,9 +7,14 @@ Creates a single summary document with trends for both.
 import re
 import json
 import csv
+import sys
 from pathlib import Path
 from collections import Counter, defaultdict
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from infrastructure.literature.summarization.corpus import iter_extracted_texts, report_to_stderr
+
 # Pattern to find GitHub URLs
 github_pattern = re.compile(r'https?://(?:www\.)?github\.com/[^\s\)]+|github\.com/[^\s\)]+', re.IGNORECASE)
 
@@ -140,11 +145,9 @@ def extract_data():
         print(f"Error: Directory {extracted_text_dir} does not exist")
         return []
     
-    for txt_file in sorted(extracted_text_dir.glob('*.txt')):
+    for paper_name, content in iter_extracted_texts(extracted_text_dir, errors='ignore', on_error=report_to_stderr):
         try:
-            with open(txt_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                lines = content.split('\n')
+            lines = content.split('\n')
             
             github_urls_raw = github_pattern.findall(content)
             
@@ -157,7 +160,6 @@ def extract_data():
                 
                 languages_found = find_items_in_content(content, languages, cleaned_urls, lines)
                 tools_found = find_items_in_content(content, specific_tools, cleaned_urls, lines)
-                paper_name = txt_file.stem
                 year = extract_year_from_citation_key(paper_name)
                 
                 if year and (languages_found or tools_found):
@@ -169,7 +171,7 @@ def extract_data():
                         'repo_count': len(cleaned_urls)
                     })
         except Exception as e:
-            print(f'Error processing {txt_file}: {e}', file=__import__('sys').stderr)
+            report_to_stderr(paper_name, e)
     
     return results
 
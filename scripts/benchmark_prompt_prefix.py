@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Benchmark prompt-prefix reuse across paper summarization stages.
+
+Sends the full-text prompts of one paper (draft, claims/quotes,
+methods/tools, classification, refinement) to the configured Ollama model
+inside an ``LLMClient.session()``, generating a single token per stage,
+and prints each stage's prompt tokens evaluated and time to first token.
+
+Two layouts are compared:
+
+- shared: the prompts as built, all starting with the same paper prefix
+- nonce:  the same prompts with a unique line before the paper, which
+          defeats Ollama's prefix cache (every stage re-evaluates the paper)
+
+With prefix reuse, stages 2..N of the shared layout evaluate only their
+task suffix and start much sooner than in the nonce layout.
+
+Usage:
+    python3 scripts/benchmark_prompt_prefix.py data/extracted_text/<key>.txt
+    python3 scripts/benchmark_prompt_prefix.py paper.txt --title "Paper title" --runs 2
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from infrastructure.literature.summarization.context_extractor import ContextExtractor
+from infrastructure.literature.summarization.prompt_builder import SummarizationPromptBuilder
+from infrastructure.llm.core.client import LLMClient
+from infrastructure.llm.core.config import GenerationOptions, LLMConfig
+from infrastructure.llm.core.session import LLMSession
+from infrastructure.llm.templates.research import (
+    ClaimsQuotesExtraction,
+    MethodsToolsAnalysis,
+    PaperClassificationTemplate,
+)
+
+
+def build_stage_prompts(client: LLMClient, text: str, title: str) -> List[Tuple[str, str]]:
+    """Build the full-text prompt of each summarization stage, in run order."""
+    context = ContextExtractor().create_summarization_context(pdf_text=text, title=title)
+    builder = SummarizationPromptBuilder(llm_client=client)
+    metadata = {"title": title, "authors": ["Unknown"], "year": "Unknown", "citation_key": "benchmark"}
+    template_args = {"title": title, "authors": "Unknown", "year": "Unknown"}
+    return [
+        ("draft", builder.build_draft_prompt(context, metadata)),
+        ("claims_quotes", ClaimsQuotesExtraction().render(source="benchmark", text=text, **template_args)),
+        ("methods_tools", MethodsToolsAnalysis().render(source="benchmark", text=text, **template_args)),
+        ("classification", PaperClassificationTemplate().render(full_text=text, **template_args)),
+        ("refinement", builder.build_refinement_prompt(
+            "(draft summary)", ["Missing quotes"], context, {"citation_key": "benchmark"}
+        )),
+    ]
+
+
+def run_layout(
+    client: LLMClient,
+    prompts: List[Tuple[str, str]],
+    transform: Callable[[str], str]
+) -> LLMSession:
+    """Send every stage prompt once in a session, generating one token each."""
+    options = GenerationOptions(max_tokens=1, temperature=0.0)
+    with client.session() as session:
+        for stage, prompt in prompts:
+            session.stage = stage
+            client.reset()
+            for _ in client.stream_query(transform(prompt), options=options, log_progress=False):
+                pass
+    return session
+
+
+def print_session(name: str, session: LLMSession) -> None:
+    print(f"\n{name}")
+    print(f"  {'stage':<16}{'prompt chars':>14}{'prompt tokens':>15}{'ttft (s)':>10}")
+    for m in session.requests:
+        tokens = m.prompt_tokens if m.prompt_tokens is not None else "?"
+        ttft = f"{m.ttft_seconds:.2f}" if m.ttft_seconds is not None else "?"
+        print(f"  {m.stage:<16}{m.prompt_chars:>14,}{tokens:>15}{ttft:>10}")
+    stats = session.summary()
+    later = stats["later_ttft_seconds"]
+    print(f"  stages 2..N mean ttft: {later:.2f}s" if later is not None else "  stages 2..N mean ttft: n/a")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("text_file", type=Path, help="Extracted paper text (e.g. data/extracted_text/<key>.txt)")
+    parser.add_argument("--title", help="Paper title (default: file stem)")
+    parser.add_argument("--max-chars", type=int, default=60000, help="Truncate the paper text (default: 60000)")
+    parser.add_argument("--runs", type=int, default=1, help="Repetitions of each layout (default: 1)")
+    args = parser.parse_args()
+
+    text = args.text_file.read_text(encoding="utf-8")[:args.max_chars]
+    title = args.title or args.text_file.stem
+    client = LLMClient(LLMConfig.from_env())
+    if not client.check_connection():
+        print(f"✗ Cannot reach Ollama at {client.config.base_url}")
+        return 1
+
+    prompts = build_stage_prompts(client, text, title)
+    print(f"Model: {client.config.default_model}, paper: {len(text):,} chars, {len(prompts)} stages")
+
+    layouts: Dict[str, Callable[[str], str]] = {
+        "shared": lambda prompt: prompt,
+        "nonce": lambda prompt: f"Request {uuid.uuid4().hex}\n\n{prompt}",
+    }
+    for run in range(1, args.runs + 1):
+        for name, transform in layouts.items():
+            print_session(f"[run {run}] {name} prefix", run_layout(client, prompts, transform))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
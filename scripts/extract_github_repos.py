@@ -6,9 +6,14 @@ Extract GitHub repository URLs and code language information from extracted text
 import re
 import os
 import json
+import sys
 from pathlib import Path
 from collections import defaultdict
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from infrastructure.literature.summarization.corpus import iter_extracted_texts, report_to_stderr
+
 # Pattern to find GitHub URLs
 github_pattern = re.compile(r'https?://(?:www\.)?github\.com/[^\s\)]+|github\.com/[^\s\)]+', re.IGNORECASE)
 
@@ -187,11 +192,9 @@ def extract_github_info():
         print(f"Error: Directory {extracted_text_dir} does not exist")
         return []
     
-    for txt_file in sorted(extracted_text_dir.glob('*.txt')):
+    for paper_name, content in iter_extracted_texts(extracted_text_dir, errors='ignore', on_error=report_to_stderr):
         try:
-            with open(txt_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                lines = content.split('\n')
+            lines = content.split('\n')
             
             # Find GitHub URLs
             github_urls_raw = github_pattern.findall(content)
@@ -207,7 +210,6 @@ def extract_github_info():
                 # Find code mentions
                 code_mentions = find_code_mentions(content, cleaned_urls, lines)
                 
-                paper_name = txt_file.stem
                 
                 # Get paper metadata from library first, then try extracting from text
                 paper_info = library_metadata.get(paper_name, {})
@@ -227,7 +229,7 @@ def extract_github_info():
                     'languages': sorted(code_mentions) if code_mentions else ['Not specified']
                 })
         except Exception as e:
-            print(f'Error processing {txt_file}: {e}', file=os.sys.stderr)
+            report_to_stderr(paper_name, e)
     
     return results
 
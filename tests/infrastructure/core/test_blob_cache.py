@@ -0,0 +1,103 @@
+"""Tests for infrastructure.core.blob_cache module."""
+
+import sqlite3
+import time
+import zlib
+
+from infrastructure.core.blob_cache import BlobCache
+
+
+class _TextCache(BlobCache):
+    DESCRIPTION = "test cache"
+
+    def get(self, key, max_age=None):
+        return self._load(key, lambda data: data.decode("utf-8"), max_age=max_age)
+
+    def put(self, key, text):
+        self._store(key, text.encode("utf-8"), label="test")
+
+
+class TestBlobCache:
+    """Test the BlobCache base class."""
+
+    def test_roundtrip_and_stats(self, tmp_path):
+        cache = _TextCache(tmp_path / "cache.sqlite", max_bytes=1024 * 1024)
+        assert cache.get("a") is None
+        cache.put("a", "hello")
+        assert cache.get("a") == "hello"
+
+        stats = cache.get_stats()
+        assert (stats["entries"], stats["hits"], stats["misses"]) == (1, 1, 1)
+        assert stats["size_bytes"] == len(zlib.compress(b"hello"))
+
+    def test_expired_entry_is_deleted(self, tmp_path):
+        cache = _TextCache(tmp_path / "cache.sqlite", max_bytes=1024 * 1024)
+        cache.put("a", "hello")
+        time.sleep(0.05)
+        assert cache.get("a", max_age=0.01) is None
+        assert cache.get_stats()["entries"] == 0
+
+    def test_replaced_entry_counts_once(self, tmp_path):
+        entry_size = len(zlib.compress(b"x" * 1000))
+        cache = _TextCache(tmp_path / "cache.sqlite", max_bytes=2 * entry_size)
+        cache.put("a", "x" * 1000)
+        cache.put("a", "x" * 1000)
+        cache.put("b", "x" * 1000)
+        assert cache.get("a") is not None
+        assert cache.get("b") is not None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        entry_size = len(zlib.compress(b"x" * 1000))
+        cache = _TextCache(tmp_path / "cache.sqlite", max_bytes=2 * entry_size)
+        cache.put("a", "x" * 1000)
+        cache.put("b", "x" * 1000)
+        cache.get("a")
+        cache.put("c", "x" * 1000)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_put_does_not_rescan_sizes(self, tmp_path):
+        """The total size is read once, then tracked as entries change."""
+        cache = _TextCache(tmp_path / "cache.sqlite", max_bytes=1024 * 1024)
+        statements = []
+        cache.put("a", "hello")
+        cache._conn.set_trace_callback(statements.append)
+        for i in range(5):
+            cache.put(f"k{i}", "hello")
+        assert not any("SUM(size)" in s for s in statements)
+
+    def test_total_read_from_existing_file(self, tmp_path):
+        path = tmp_path / "cache.sqlite"
+        entry_size = len(zlib.compress(b"x" * 1000))
+        first = _TextCache(path, max_bytes=2 * entry_size)
+        first.put("a", "x" * 1000)
+        first.put("b", "x" * 1000)
+        first.close()
+
+        second = _TextCache(path, max_bytes=2 * entry_size)
+        second.put("c", "x" * 1000)
+        assert second.get_stats()["entries"] == 2
+        assert second.get("a") is None
+
+    def test_legacy_table_is_dropped(self, tmp_path):
+        path = tmp_path / "cache.sqlite"
+        conn = sqlite3.connect(str(path))
+        conn.execute("CREATE TABLE responses (key TEXT PRIMARY KEY, model TEXT NOT NULL)")
+        conn.commit()
+        conn.close()
+
+        cache = _TextCache(path, max_bytes=1024)
+        cache.put("a", "hello")
+        tables = {row[0] for row in cache._conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        assert tables == {"blobs"}
+
+    def test_file_created_lazily_and_cleared(self, tmp_path):
+        path = tmp_path / "sub" / "cache.sqlite"
+        cache = _TextCache(path, max_bytes=1024)
+        assert not path.exists()
+        cache.put("a", "hello")
+        assert path.exists()
+        assert cache.clear() == 1
+        assert cache.get_stats()["size_bytes"] == 0
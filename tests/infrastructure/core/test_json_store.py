@@ -0,0 +1,108 @@
+"""Tests for infrastructure.core.json_store module."""
+
+import json
+
+import pytest
+
+from infrastructure.core.exceptions import FileOperationError
+from infrastructure.core.json_store import JsonJournal, JsonStore, write_json_atomic
+
+
+class _Counts(JsonStore):
+    SECTION = "counts"
+    DESCRIPTION = "test counts"
+
+    def add(self, name):
+        self._ensure_loaded()
+        with self._lock:
+            self._data[name] = self._data.get(name, 0) + 1
+            self._changed()
+
+
+class _OtherCounts(_Counts):
+    pass
+
+
+class TestWriteJsonAtomic:
+    """Test write_json_atomic."""
+
+    def test_writes_and_leaves_no_temp_file(self, tmp_path):
+        path = tmp_path / "sub" / "data.json"
+        write_json_atomic(path, {"a": 1}, "test data", fsync=True, indent=1)
+        assert json.loads(path.read_text()) == {"a": 1}
+        assert not path.with_suffix(".tmp").exists()
+
+    def test_failure_raises_file_operation_error(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        with pytest.raises(FileOperationError, match="Failed to save test data"):
+            write_json_atomic(blocker / "data.json", {}, "test data")
+
+
+class TestJsonStore:
+    """Test the JsonStore base class."""
+
+    def test_change_is_written_under_section(self, tmp_path):
+        store = _Counts(tmp_path / "counts.json")
+        store.add("x")
+        data = json.loads((tmp_path / "counts.json").read_text())
+        assert data["version"] == "1.0"
+        assert data["counts"] == {"x": 1}
+
+    def test_batch_writes_once_on_exit(self, tmp_path):
+        path = tmp_path / "counts.json"
+        store = _Counts(path)
+        with store.batch():
+            with store.batch():
+                store.add("x")
+            store.add("x")
+            assert not path.exists()
+        assert json.loads(path.read_text())["counts"] == {"x": 2}
+
+    def test_reload_from_disk(self, tmp_path):
+        path = tmp_path / "counts.json"
+        _Counts(path).add("x")
+        store = _Counts(path)
+        store.add("x")
+        assert store._data == {"x": 2}
+
+    def test_corrupt_file_starts_empty(self, tmp_path):
+        path = tmp_path / "counts.json"
+        path.write_text("{not json")
+        store = _Counts(path)
+        store.add("x")
+        assert json.loads(path.read_text())["counts"] == {"x": 1}
+
+    def test_shared_per_class_and_path(self, tmp_path):
+        path = tmp_path / "counts.json"
+        assert _Counts.shared(path) is _Counts.shared(tmp_path / "." / "counts.json")
+        assert _OtherCounts.shared(path) is not _Counts.shared(path)
+        assert isinstance(_OtherCounts.shared(path), _OtherCounts)
+
+
+class TestJsonJournal:
+    """Test the JsonJournal helper."""
+
+    def test_append_replay_and_compaction(self, tmp_path):
+        journal = JsonJournal(tmp_path / "data.journal.jsonl", "test", compact_every=3)
+        journal.append([{"op": "put", "key": "a"}, {"op": "put", "key": "b"}])
+        journal.append([])
+        assert not journal.needs_compaction
+
+        replayed = []
+        reopened = JsonJournal(journal.path, "test", compact_every=3)
+        assert reopened.replay(replayed.append) == 2
+        assert [r["key"] for r in replayed] == ["a", "b"]
+
+        reopened.append([{"op": "delete", "key": "a"}])
+        assert reopened.needs_compaction
+        reopened.remove()
+        assert not journal.path.exists()
+        assert reopened.records == 0
+
+    def test_replay_skips_truncated_line(self, tmp_path):
+        path = tmp_path / "data.journal.jsonl"
+        path.write_text('{"op": "put", "key": "a"}\n{"op": "pu')
+        replayed = []
+        assert JsonJournal(path, "test", compact_every=10).replay(replayed.append) == 1
+        assert replayed == [{"op": "put", "key": "a"}]
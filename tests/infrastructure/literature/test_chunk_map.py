@@ -0,0 +1,82 @@
+"""Tests for infrastructure/literature/summarization/chunk_map.py"""
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from infrastructure.literature.summarization.chunk_map import map_chunks
+from infrastructure.llm.core.client import LLMClient
+from infrastructure.llm.core.config import LLMConfig
+
+
+class TestMapChunks:
+    """Tests for ordering, concurrency bounds and retries."""
+
+    def test_results_keep_chunk_order(self):
+        def slow_first(i, chunk):
+            time.sleep(0.05 if i == 0 else 0)
+            return chunk.upper()
+
+        outcome = map_chunks(slow_first, ["a", "b", "c"], max_in_flight=3)
+
+        assert outcome.results == ["A", "B", "C"]
+        assert outcome.failed == []
+
+    def test_in_flight_limit(self):
+        lock = threading.Lock()
+        active, peak = [0], [0]
+
+        def track(i, chunk):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return chunk
+
+        outcome = map_chunks(track, [str(i) for i in range(8)], max_in_flight=2)
+
+        assert len(outcome.successful) == 8
+        assert peak[0] == 2
+
+    def test_only_failed_chunks_are_retried(self):
+        calls = []
+
+        def flaky(i, chunk):
+            calls.append(i)
+            if i == 1 and calls.count(1) == 1:
+                raise RuntimeError("timeout")
+            return "" if i == 2 else chunk
+
+        seen = []
+        outcome = map_chunks(flaky, ["a", "b", "c"], max_in_flight=3, retries=1,
+                             on_result=lambda i, r, e: seen.append((i, e)))
+
+        assert sorted(calls) == [0, 1, 1, 2, 2]
+        assert outcome.results == ["a", "b", None]
+        assert outcome.successful == ["a", "b"]
+        assert outcome.errors == {2: "empty result"}
+        assert outcome.attempts == {0: 1, 1: 2, 2: 2}
+        assert (1, "timeout") in seen
+
+
+def test_concurrent_chunks_use_separate_conversations():
+    """Test each chunk query is sent without other chunks' messages."""
+    client = LLMClient(LLMConfig(auto_inject_system_prompt=False))
+    sent = []
+
+    def post(url, json, **kwargs):
+        sent.append(json["messages"])
+        response = MagicMock()
+        response.json.return_value = {"message": {"content": f"reply to {json['messages'][-1]['content']}"}}
+        return response
+
+    def query_chunk(i, chunk):
+        with client.conversation():
+            return client.query(chunk)
+
+    with patch("infrastructure.llm.core.client.requests.post", side_effect=post):
+        outcome = map_chunks(query_chunk, ["c1", "c2", "c3", "c4"], max_in_flight=2)
+
+    assert outcome.results == ["reply to c1", "reply to c2", "reply to c3", "reply to c4"]
+    assert all(len(messages) == 1 for messages in sent)
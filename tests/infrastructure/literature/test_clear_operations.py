@@ -92,6 +92,29 @@ class TestClearPdfs:
         assert not pdf2.exists()
         assert mock_library_index.update_pdf_path.called
 
+    def test_clear_pdfs_forgets_content_index(self, tmp_path):
+        """Test deleted PDFs are removed from the PDF content index."""
+        pdf_dir = tmp_path / "pdfs"
+        pdf_dir.mkdir()
+        (pdf_dir / "paper1.pdf").write_bytes(b"%PDF-1.4")
+        (pdf_dir / "paper2.pdf.part").write_bytes(b"%PDF")
+
+        def mock_path(path_str):
+            if path_str == "data/pdfs":
+                return pdf_dir
+            return Path(path_str)
+
+        content_index = Mock()
+        with patch('infrastructure.literature.library.clear.Path', side_effect=mock_path):
+            with patch('infrastructure.literature.library.clear.LiteratureConfig'):
+                with patch('infrastructure.literature.library.clear.LibraryIndex'):
+                    with patch('infrastructure.literature.library.clear.PDFContentIndex') as index_cls:
+                        index_cls.for_config.return_value = content_index
+                        clear_pdfs(confirm=False)
+
+        content_index.forget.assert_called_once_with("paper1")
+        content_index.flush.assert_called_once()
+
     def test_clear_pdfs_interactive_cancelled(self, tmp_path, monkeypatch):
         """Test interactive mode with cancellation."""
         pdf_dir = tmp_path / "pdfs"
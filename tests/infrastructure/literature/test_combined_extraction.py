@@ -0,0 +1,86 @@
+"""Tests for infrastructure/literature/summarization/combined_extraction.py"""
+import json
+from unittest.mock import MagicMock, patch
+
+from infrastructure.literature.sources import SearchResult
+from infrastructure.literature.summarization import SummarizationEngine
+from infrastructure.literature.summarization.combined_extraction import parse_combined_extraction
+from infrastructure.llm.core.client import LLMClient
+from infrastructure.llm.core.config import LLMConfig
+
+PAPER = (
+    "We propose a sparse   attention model trained with PyTorch 2.1.\n"
+    "Experiments on ImageNet show a 3% accuracy gain over dense baselines."
+)
+
+
+def response(**overrides):
+    data = {
+        "claims": ["Sparse attention improves accuracy", "Sparse attention improves accuracy"],
+        "quotes": [
+            {"text": "We propose a sparse attention model", "context": "Abstract", "significance": "Main contribution"},
+            {"text": "Our model is the best ever built", "context": "Abstract"},
+        ],
+        "methods": {
+            "algorithms": [{"name": "Sparse attention", "evidence": "sparse attention model"}],
+            "frameworks": [
+                {"name": "PyTorch", "evidence": "PyTorch 2.1"},
+                {"name": "TensorFlow", "evidence": "TensorFlow 2"},
+            ],
+            "datasets": [{"name": "ImageNet", "evidence": "Experiments on ImageNet"}],
+            "metrics": [],
+            "tools": [],
+        },
+        "classification": {"category": "core_theory_math", "domain": None, "confidence": 0.8, "reasoning": "Model"},
+    }
+    data.update(overrides)
+    return data
+
+
+class TestParseCombinedExtraction:
+    """Tests for per-field validation and rendering."""
+
+    def test_valid_response(self):
+        extraction = parse_combined_extraction(response(), PAPER)
+
+        assert extraction.is_complete
+        assert extraction.claims_quotes_text.count("Sparse attention improves accuracy") == 1
+        assert '**Quote:** "We propose a sparse attention model"' in extraction.claims_quotes_text
+        assert "best ever built" not in extraction.claims_quotes_text
+        assert "PyTorch" in extraction.methods_tools_text
+        assert "TensorFlow" not in extraction.methods_tools_text
+        assert "## Evaluation Metrics\n\nNot specified in paper" in extraction.methods_tools_text
+        assert extraction.classification.category == "core_theory_math"
+
+    def test_invalid_fields_are_reported_separately(self):
+        data = response(
+            quotes=[{"text": "A sentence the paper never contains"}],
+            classification={"category": "applied", "confidence": 0.9},
+        )
+
+        extraction = parse_combined_extraction(data, PAPER)
+
+        assert extraction.claims_quotes_text is None
+        assert extraction.methods_tools_text is not None
+        assert extraction.classification is None
+        assert set(extraction.errors) == {"claims_quotes", "classification"}
+
+    def test_non_object_response(self):
+        extraction = parse_combined_extraction(["not", "an", "object"], PAPER)
+        assert len(extraction.errors) == 3
+
+
+def test_engine_extracts_all_fields_in_one_query():
+    """Test combined mode sends the paper once and validates the reply."""
+    client = LLMClient(LLMConfig(auto_inject_system_prompt=False))
+    engine = SummarizationEngine(client, combined_extraction=True)
+    paper = SearchResult(title="Sparse attention", authors=["A. Author"], year=2024, abstract="", url="", source="arxiv")
+    reply = MagicMock()
+    reply.json.return_value = {"message": {"content": json.dumps(response())}}
+
+    with patch("infrastructure.llm.core.client.requests.post", return_value=reply) as post:
+        extraction = engine._extract_combined(PAPER, paper, "sparse2024")
+
+    assert post.call_count == 1
+    assert post.call_args.kwargs["json"]["format"] == "json"
+    assert extraction.is_complete
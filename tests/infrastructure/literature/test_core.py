@@ -1,7 +1,10 @@
+import time
+
 import pytest
 from pathlib import Path
+from infrastructure.core.exceptions import LiteratureSearchError
 from infrastructure.literature.core import LiteratureSearch
-from infrastructure.literature.sources import SearchResult
+from infrastructure.literature.sources import LiteratureSource, SearchResult
 from infrastructure.literature.library import LibraryIndex
 from infrastructure.literature.library import ReferenceManager
 
@@ -179,3 +182,82 @@ class TestHealthStatus:
         assert "healthy" in health_status["mock_source"]
         assert health_status["mock_source"]["healthy"] is True  # Default assumption
 
+
+
+class _SlowSource(LiteratureSource):
+    """Local source that sleeps to simulate network latency."""
+
+    def __init__(self, config, name, delay, fail=False):
+        super().__init__(config)
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+
+    def search(self, query, limit=10, use_cache=True):
+        time.sleep(self.delay)
+        if self.fail:
+            raise LiteratureSearchError(f"{self.name} unavailable")
+        return [
+            SearchResult(
+                title=f"{self.name} paper {i} about {query}",
+                authors=["Author"],
+                year=2024,
+                abstract="",
+                url=f"https://example.com/{self.name}/{i}",
+                doi=f"10.1234/{self.name}.{i}",
+                source=self.name,
+            )
+            for i in range(limit)
+        ]
+
+
+class TestParallelSearch:
+    """Tests for concurrent fan-out across sources in LiteratureSearch.search."""
+
+    def _searcher(self, mock_config, parallel):
+        mock_config.parallel_search = parallel
+        searcher = LiteratureSearch(mock_config)
+        searcher.sources = {
+            "a": _SlowSource(mock_config, "a", 0.3),
+            "b": _SlowSource(mock_config, "b", 0.3),
+            "c": _SlowSource(mock_config, "c", 0.3),
+        }
+        return searcher
+
+    def test_parallel_latency_is_slowest_source(self, mock_config):
+        """Total time tracks the slowest source, not the sum."""
+        searcher = self._searcher(mock_config, parallel=True)
+
+        start = time.time()
+        results, stats = searcher.search("q", limit=2, sources=["a", "b", "c"], return_stats=True)
+        elapsed = time.time() - start
+
+        assert len(results) == 6
+        assert elapsed < 0.8
+        for name in ("a", "b", "c"):
+            assert stats.source_stats[name].results_found == 2
+            assert stats.source_stats[name].time_taken >= 0.3
+
+    def test_parallel_matches_sequential(self, mock_config):
+        """Parallel mode returns the same results and source order as sequential."""
+        parallel = self._searcher(mock_config, parallel=True)
+        sequential = self._searcher(mock_config, parallel=False)
+
+        p_results, p_stats = parallel.search("q", limit=2, sources=["c", "a", "b"], return_stats=True)
+        s_results, s_stats = sequential.search("q", limit=2, sources=["c", "a", "b"], return_stats=True)
+
+        assert [r.doi for r in p_results] == [r.doi for r in s_results]
+        assert list(p_stats.source_stats) == ["c", "a", "b"]
+        assert list(s_stats.source_stats) == ["c", "a", "b"]
+
+    def test_parallel_failure_is_isolated(self, mock_config):
+        """A failing source is reported in stats without affecting the others."""
+        searcher = self._searcher(mock_config, parallel=True)
+        searcher.sources["b"] = _SlowSource(mock_config, "b", 0.05, fail=True)
+
+        results, stats = searcher.search("q", limit=1, sources=["a", "b", "unknown"], return_stats=True)
+
+        assert [r.source for r in results] == ["a"]
+        assert stats.source_stats["b"].errors == 1
+        assert stats.source_stats["b"].healthy is False
+        assert stats.source_stats["unknown"].skipped is True
@@ -0,0 +1,99 @@
+"""Tests for infrastructure/literature/summarization/corpus.py"""
+import os
+
+import pytest
+
+from infrastructure.core.exceptions import FileOperationError
+from infrastructure.literature.summarization.corpus import (
+    PackedCorpus,
+    build_corpus,
+    corpus_path_for,
+    iter_extracted_texts,
+    report_to_stderr,
+)
+
+PAPER = "Deep Models\nAbstract\nWe study models.\nIntroduction\nModels are useful. " + "Text. " * 50
+
+
+@pytest.fixture
+def text_dir(tmp_path):
+    directory = tmp_path / "extracted_text"
+    directory.mkdir()
+    (directory / "b2021.txt").write_text(PAPER, encoding="utf-8")
+    (directory / "a2020.txt").write_text("Short paper été", encoding="utf-8")
+    return directory
+
+
+class TestPackedCorpus:
+    """Tests for building, random access and iteration."""
+
+    @pytest.mark.parametrize("codec", ["zlib", "none"])
+    def test_round_trip(self, text_dir, codec):
+        stats = build_corpus(text_dir, codec=codec)
+        assert stats["texts"] == 2 and stats["reused"] == 0
+
+        with PackedCorpus(corpus_path_for(text_dir)) as corpus:
+            assert corpus.codec == codec
+            assert corpus.keys() == ["a2020", "b2021"]
+            assert corpus.get("a2020") == "Short paper été"
+            assert corpus.get("missing") is None
+            assert list(corpus.iter_texts(["b2021", "missing"])) == [("b2021", PAPER)]
+            assert corpus.get_section("b2021", "abstract").strip() == "We study models."
+
+    def test_rebuild_reuses_unchanged_records(self, text_dir):
+        build_corpus(text_dir)
+        (text_dir / "c2022.txt").write_text("New paper", encoding="utf-8")
+
+        stats = build_corpus(text_dir)
+        assert stats == {"texts": 3, "reused": 2, "bytes": corpus_path_for(text_dir).stat().st_size}
+        with PackedCorpus(corpus_path_for(text_dir)) as corpus:
+            assert corpus.get("c2022") == "New paper"
+
+    def test_invalid_file(self, tmp_path):
+        bad = tmp_path / "bad.corpus"
+        bad.write_bytes(b"not a corpus")
+        with pytest.raises(FileOperationError):
+            PackedCorpus(bad)
+        with pytest.raises(ValueError):
+            build_corpus(tmp_path, codec="lzma")
+
+
+def test_iter_extracted_texts_prefers_current_files(text_dir):
+    """Test changed and new files override the corpus, deleted ones are gone."""
+    build_corpus(text_dir)
+    (text_dir / "a2020.txt").unlink()
+    changed = text_dir / "b2021.txt"
+    changed.write_text("Edited", encoding="utf-8")
+    os.utime(changed, ns=(1, 1))
+    (text_dir / "c2022.txt").write_text("New paper", encoding="utf-8")
+
+    assert list(iter_extracted_texts(text_dir)) == [
+        ("b2021", "Edited"),
+        ("c2022", "New paper"),
+    ]
+
+
+def test_iter_extracted_texts_without_corpus(text_dir):
+    assert [key for key, _ in iter_extracted_texts(text_dir)] == ["a2020", "b2021"]
+
+
+def test_iter_extracted_texts_reports_unreadable_texts(text_dir):
+    """Test on_error is called for a text that cannot be read, and it is skipped."""
+    (text_dir / "c2022.txt").mkdir()
+    failed = []
+
+    texts = list(iter_extracted_texts(text_dir, on_error=lambda key, e: failed.append(key)))
+
+    assert [key for key, _ in texts] == ["a2020", "b2021"]
+    assert failed == ["c2022"]
+    with pytest.raises(OSError):
+        list(iter_extracted_texts(text_dir))
+
+
+def test_report_to_stderr(text_dir, capsys):
+    """Test the stderr reporter names the unreadable text."""
+    (text_dir / "c2022.txt").mkdir()
+
+    list(iter_extracted_texts(text_dir, on_error=report_to_stderr))
+
+    assert capsys.readouterr().err.startswith("Error processing c2022: ")
@@ -0,0 +1,94 @@
+"""Tests for infrastructure/literature/core/dedup.py"""
+import random
+
+from infrastructure.literature.core import ResultDeduplicator
+from infrastructure.literature.sources import SearchResult
+from infrastructure.literature.sources.base import normalize_title, title_similarity
+
+
+def _result(title, doi=None, citations=None, abstract="Abstract"):
+    return SearchResult(
+        title=title, authors=["Author"], year=2020, abstract=abstract,
+        url="http://example.com", doi=doi, citation_count=citations
+    )
+
+
+def _brute_force_unique_titles(results, threshold=0.85):
+    """Reference: compare every DOI-less title with every kept title."""
+    kept = []
+    for r in results:
+        if r.doi:
+            continue
+        norm = normalize_title(r.title)
+        if not any(norm == k or title_similarity(norm, k) >= threshold for k in kept):
+            kept.append(norm)
+    return kept
+
+
+class TestResultDeduplicator:
+    """Tests for the blocking-indexed incremental deduplicator."""
+
+    def test_doi_duplicates_keep_first(self):
+        """Test exact DOI duplicates are dropped case-insensitively."""
+        dedup = ResultDeduplicator()
+        first = _result("Paper A", doi="10.1/ABC")
+        assert dedup.add_result(first) is True
+        assert dedup.add_result(_result("Paper A (v2)", doi="10.1/abc ")) is False
+        assert dedup.results() == [first]
+
+    def test_fuzzy_duplicate_replaced_by_better(self):
+        """Test a near-identical title is merged and the better result kept."""
+        dedup = ResultDeduplicator()
+        dedup.add_result(_result("Deep learning for protein structure prediction at scale", citations=1))
+        better = _result("Deep learning for protein structure prediction at scale!", citations=50)
+        # One extra word: Jaccard 8/9 is above the threshold
+        dedup.add_result(_result("Deep learning for protein structure prediction at scale revisited", citations=10))
+        dedup.add_result(better)
+        assert len(dedup) == 1
+        assert dedup.results()[0].citation_count == 50
+
+    def test_dissimilar_titles_kept(self):
+        """Test titles below the threshold are not merged."""
+        dedup = ResultDeduplicator()
+        added = dedup.add([
+            _result("Active inference and the free energy principle"),
+            _result("Active inference in robotics"),
+        ])
+        assert added == 2
+
+    def test_matches_brute_force(self):
+        """Test blocking finds exactly the duplicates a full scan finds."""
+        rng = random.Random(7)
+        vocab = [f"w{i}" for i in range(15)]
+        results = [
+            _result(" ".join(rng.choice(vocab) for _ in range(rng.randint(1, 10))))
+            for _ in range(300)
+        ]
+        dedup = ResultDeduplicator()
+        dedup.add(results)
+        expected = _brute_force_unique_titles(results)
+        assert len(dedup) == len(expected)
+
+    def test_blocking_limits_comparisons(self):
+        """Test unrelated titles are never compared."""
+        dedup = ResultDeduplicator()
+        dedup.add(_result(f"topic{i} alpha{i} beta{i} gamma{i}") for i in range(500))
+        assert len(dedup) == 500
+        assert dedup.comparisons == 0
+
+    def test_incremental_equals_batch(self):
+        """Test feeding keywords one by one equals one deduplication pass."""
+        batches = [
+            [_result("Graph neural networks"), _result("Transformers for vision", doi="10.1/t")],
+            [_result("Graph neural networks."), _result("Transformers for vision", doi="10.1/T")],
+            [_result("Bayesian optimisation of hyperparameters")],
+        ]
+        incremental = ResultDeduplicator()
+        for batch in batches:
+            incremental.add(batch)
+        single = ResultDeduplicator()
+        single.add([r for batch in batches for r in batch])
+
+        assert incremental.results() == single.results()
+        assert incremental.total_added == 5
+        assert len(incremental) == 3
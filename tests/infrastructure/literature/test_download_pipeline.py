@@ -0,0 +1,119 @@
+"""Tests for infrastructure/literature/workflow/download_pipeline.py"""
+import asyncio
+import threading
+import time
+from collections import Counter
+
+from infrastructure.literature.core.core import DownloadResult
+from infrastructure.literature.sources import SearchResult
+from infrastructure.literature.workflow.download_pipeline import AsyncDownloadPipeline
+
+
+def make_result(i, host):
+    return SearchResult(f"Paper {i}", ["Author"], 2024, "Abstract", f"https://{host}/{i}",
+                        pdf_url=f"https://{host}/{i}.pdf")
+
+
+class _Recorder:
+    """Download/record steps tracking concurrency and threads."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = Counter()
+        self.peak = Counter()
+        self.writer_threads = set()
+        self.recorded = []
+
+    def prepare(self, result):
+        self.writer_threads.add(threading.get_ident())
+        return result.title.replace(" ", "").lower(), None
+
+    def download(self, result):
+        host = result.pdf_url.split("/")[2]
+        with self.lock:
+            self.active[host] += 1
+            self.active["*"] += 1
+            self.peak[host] = max(self.peak[host], self.active[host])
+            self.peak["*"] = max(self.peak["*"], self.active["*"])
+        time.sleep(self.delay)
+        with self.lock:
+            self.active[host] -= 1
+            self.active["*"] -= 1
+        if "fail" in result.pdf_url:
+            raise RuntimeError("boom")
+        return DownloadResult(citation_key="", success=True, pdf_path=result.pdf_url, result=result)
+
+    def record(self, result, citation_key, download_result):
+        self.writer_threads.add(threading.get_ident())
+        self.recorded.append(citation_key)
+
+
+class TestAsyncDownloadPipeline:
+    """Tests for scheduling limits and the single writer."""
+
+    def test_limits_and_order(self):
+        """Test global and per-host caps, input order and a single writer thread."""
+        results = [make_result(i, "slow.org" if i % 2 else f"h{i}.org") for i in range(12)]
+        steps = _Recorder()
+
+        outcomes = AsyncDownloadPipeline(max_in_flight=4, max_per_host=2).run(
+            results, steps.prepare, steps.download, steps.record
+        )
+
+        assert [key for key, _ in outcomes] == [f"paper{i}" for i in range(12)]
+        assert all(outcome.success for _, outcome in outcomes)
+        assert steps.peak["*"] <= 4
+        assert steps.peak["slow.org"] <= 2
+        assert len(steps.writer_threads) == 1
+        assert sorted(steps.recorded) == sorted(key for key, _ in outcomes)
+
+    def test_skipped_papers_are_not_downloaded(self):
+        steps = _Recorder()
+        skipped = DownloadResult(citation_key="skip", success=False, failure_reason="skipped_previous_failure")
+
+        outcomes = AsyncDownloadPipeline(max_in_flight=2).run(
+            [make_result(1, "a.org")], lambda r: ("skip", skipped), steps.download, steps.record
+        )
+
+        assert outcomes == [("skip", skipped)]
+        assert steps.peak["*"] == 0
+        assert steps.recorded == ["skip"]
+
+    def test_download_exception_becomes_failure(self):
+        steps = _Recorder(delay=0)
+        outcomes = AsyncDownloadPipeline(max_in_flight=2).run(
+            [make_result(1, "fail.org")], steps.prepare, steps.download, steps.record
+        )
+
+        key, outcome = outcomes[0]
+        assert key == "paper1"
+        assert outcome.failure_reason == "exception"
+        assert "boom" in outcome.failure_message
+
+    def test_consumer_receives_downloads(self):
+        """Test successful downloads are fed to the consumer through the queue."""
+        steps = _Recorder(delay=0)
+        consumed = []
+
+        def consume(result, citation_key, download_result):
+            time.sleep(0.01)
+            consumed.append(citation_key)
+
+        AsyncDownloadPipeline(max_in_flight=8, queue_size=1).run(
+            [make_result(i, "a.org") for i in range(5)] + [make_result(9, "fail.org")],
+            steps.prepare, steps.download, steps.record, consume=consume
+        )
+
+        assert sorted(consumed) == [f"paper{i}" for i in range(5)]
+
+    def test_runs_inside_event_loop(self):
+        """Test the pipeline can be called from code already running an event loop."""
+        steps = _Recorder(delay=0)
+
+        async def caller():
+            return AsyncDownloadPipeline(max_in_flight=2).run(
+                [make_result(1, "a.org")], steps.prepare, steps.download, steps.record
+            )
+
+        assert asyncio.run(caller())[0][1].success
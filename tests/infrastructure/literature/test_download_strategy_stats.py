@@ -0,0 +1,191 @@
+"""Tests for infrastructure/literature/pdf/strategy_stats.py"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from infrastructure.literature.core import LiteratureConfig
+from infrastructure.literature.pdf.downloader import PDFDownloader
+from infrastructure.literature.pdf.strategy_stats import (
+    DownloadStrategyStats,
+    parse_attempted_url,
+    strategy_name,
+)
+
+
+@pytest.fixture
+def stats(tmp_path):
+    """Empty statistics in a temporary directory."""
+    return DownloadStrategyStats(tmp_path / "download_stats.json", prune_after=3)
+
+
+class TestParsing:
+    """Tests for attempt type and attempted_urls parsing."""
+
+    def test_strategy_name(self):
+        assert strategy_name("transformed_2") == "transformed"
+        assert strategy_name("retry_1_agent") == "retry_agent"
+        assert strategy_name("standard") == "standard"
+
+    def test_parse_attempted_url(self):
+        assert parse_attempted_url("https://x.org/a.pdf") == ("https://x.org/a.pdf", "standard")
+        assert parse_attempted_url("https://x.org/a.pdf (minimal)") == ("https://x.org/a.pdf", "minimal")
+        assert parse_attempted_url("https://x.org/a.pdf (retry 2, agent 1)") == (
+            "https://x.org/a.pdf", "retry_agent"
+        )
+        assert parse_attempted_url("https://x.org/a.pdf (User-Agent 3)") == ("https://x.org/a.pdf", "user_agent")
+        assert parse_attempted_url("arXiv title search: https://arxiv.org/pdf/1.pdf") == (
+            "https://arxiv.org/pdf/1.pdf", "standard"
+        )
+        assert parse_attempted_url("Unpaywall lookup failed") is None
+
+
+class TestRanking:
+    """Tests for scoring, ranking and pruning."""
+
+    def test_rank_urls_by_success(self, stats):
+        """Test hosts that serve PDFs move ahead of hosts that do not."""
+        for _ in range(2):
+            stats.record("https://bad.org/a.pdf", "standard", False)
+            stats.record("https://good.org/a.pdf", "standard", True, 1.0)
+
+        ranked = stats.rank_urls(["https://bad.org/x.pdf", "https://new.org/x.pdf", "https://good.org/x.pdf"])
+        assert ranked == ["https://good.org/x.pdf", "https://new.org/x.pdf", "https://bad.org/x.pdf"]
+
+    def test_latency_breaks_ties(self, stats):
+        """Test faster hosts rank first at equal success rates."""
+        stats.record("https://slow.org/a.pdf", "standard", True, 60.0)
+        stats.record("https://fast.org/a.pdf", "standard", True, 1.0)
+        assert stats.rank_urls(["https://slow.org/a", "https://fast.org/a"])[0] == "https://fast.org/a"
+
+    def test_pruning_keeps_one_url(self, stats):
+        """Test hosts that always fail are dropped, but never every URL."""
+        for _ in range(3):
+            stats.record("https://dead.org/a.pdf", "standard", False)
+            stats.record("https://gone.org/a.pdf", "standard", False)
+
+        assert stats.rank_urls(["https://dead.org/1", "https://ok.org/1"]) == ["https://ok.org/1"]
+        assert stats.rank_urls(["https://dead.org/1", "https://gone.org/1"]) == ["https://dead.org/1"]
+
+    def test_pruning_is_opt_in(self, tmp_path):
+        """Test hosts are never skipped with the default prune_after."""
+        stats = DownloadStrategyStats(tmp_path / "stats.json")
+        for _ in range(10):
+            stats.record("https://dead.org/a.pdf", "standard", False)
+
+        assert not stats.is_pruned("dead.org")
+        assert stats.rank_urls(["https://dead.org/1", "https://ok.org/1"]) == [
+            "https://ok.org/1", "https://dead.org/1"
+        ]
+
+    def test_pruned_host_is_retried(self, tmp_path):
+        """Test a pruned host is tried again after retry_pruned_after."""
+        stats = DownloadStrategyStats(tmp_path / "stats.json", prune_after=2, retry_pruned_after=0.05)
+        for _ in range(2):
+            stats.record("https://dead.org/a.pdf", "standard", False)
+        assert stats.is_pruned("dead.org")
+
+        time.sleep(0.1)
+        assert not stats.is_pruned("dead.org")
+        stats.record("https://dead.org/a.pdf", "standard", False)
+        assert stats.is_pruned("dead.org")
+
+    def test_rank_strategies(self, stats):
+        """Test recovery strategies are ordered and pruned per host."""
+        for _ in range(3):
+            stats.record("https://pub.org/a", "user_agent", False)
+        stats.record("https://pub.org/a", "referer", True, 2.0)
+
+        ranked = stats.rank_strategies("https://pub.org/b", ["user_agent", "minimal", "referer"])
+        assert ranked == ["referer", "minimal"]
+
+
+class TestPersistence:
+    """Tests for saving and importing statistics."""
+
+    def test_flush_and_reload(self, stats):
+        stats.record("https://good.org/a.pdf", "standard", True, 2.0)
+        stats.flush()
+
+        reloaded = DownloadStrategyStats(stats.path)
+        assert reloaded.get("good.org") == stats.get("good.org")
+        assert reloaded.get("good.org")["attempts"] == 1
+        assert reloaded.get("good.org")["seconds"] == 2.0
+        assert reloaded.to_dict()["good.org"]["success_rate"] == 1.0
+
+    def test_imports_failed_downloads_once(self, tmp_path):
+        """Test attempts of tracked failures seed ranking but never prune."""
+        failures_path = tmp_path / "failed_downloads.json"
+        failures_path.write_text(json.dumps({"failures": {"key1": {"attempted_urls": [
+            "https://blocked.org/a.pdf",
+            "https://blocked.org/a.pdf (minimal)",
+        ]}}}))
+        stats = DownloadStrategyStats(tmp_path / "stats.json", prune_after=1, failures_path=failures_path)
+
+        assert stats.get("blocked.org")["imported"] == 2
+        assert stats.get("blocked.org")["attempts"] == 0
+        assert stats.get("blocked.org", "minimal")["imported"] == 1
+        assert not stats.is_pruned("blocked.org")
+        assert stats.rank_urls(["https://blocked.org/1", "https://new.org/1"])[0] == "https://new.org/1"
+        stats.flush()
+
+        failures_path.write_text(json.dumps({"failures": {}}))
+        assert DownloadStrategyStats(stats.path, failures_path=failures_path).get("blocked.org")["imported"] == 2
+
+    def test_old_format_is_rebuilt(self, tmp_path):
+        """Test statistics that counted imported failures as attempts are discarded."""
+        path = tmp_path / "stats.json"
+        path.write_text(json.dumps({"version": "1.0", "hosts": {"arxiv.org": {"*": {
+            "attempts": 9, "successes": 0, "seconds": 0.0
+        }}}}))
+        stats = DownloadStrategyStats(path, prune_after=5)
+
+        assert stats.get("arxiv.org")["attempts"] == 0
+        assert not stats.is_pruned("arxiv.org")
+
+    def test_from_config_default_path(self, tmp_path):
+        config = LiteratureConfig(download_dir=str(tmp_path / "pdfs"), download_stats_prune_after=7)
+        stats = DownloadStrategyStats.from_config(config)
+        assert stats.path == tmp_path / "cache" / "download_stats.json"
+        assert stats.prune_after == 7
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"%PDF-1.4\n" + b"0" * 4096 + b"\n%%EOF"
+        status = 200 if self.path == "/paper.pdf" else 404
+        self.send_response(status)
+        self.send_header("Content-Type", "application/pdf")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_downloader_records_attempts(tmp_path):
+    """Test every downloader attempt is recorded with its outcome."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    try:
+        config = LiteratureConfig(download_dir=str(tmp_path), rate_limit_hosts=False)
+        downloader = PDFDownloader(config)
+        downloader.strategy_stats = DownloadStrategyStats(tmp_path / "stats.json")
+
+        success, _, _ = downloader._download_single_attempt(f"{base_url}/paper.pdf", tmp_path / "a.pdf")
+        assert success
+        success, _, _ = downloader._download_single_attempt(f"{base_url}/missing.pdf", tmp_path / "b.pdf")
+        assert not success
+
+        recorded = downloader.strategy_stats.get("127.0.0.1", "standard")
+        assert recorded["attempts"] == 2
+        assert recorded["successes"] == 1
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
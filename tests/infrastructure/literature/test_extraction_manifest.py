@@ -0,0 +1,97 @@
+"""Tests for infrastructure/literature/summarization/extraction_manifest.py"""
+import json
+import os
+
+import pytest
+
+from infrastructure.literature.summarization import extraction_manifest
+from infrastructure.literature.summarization.extraction_manifest import ExtractionManifest
+from infrastructure.literature.summarization.extractor import TextExtractor
+
+
+@pytest.fixture
+def files(tmp_path):
+    pdf_path = tmp_path / "paper.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4 content")
+    text_path = tmp_path / "paper.txt"
+    text_path.write_text("extracted words here", encoding="utf-8")
+    return pdf_path, text_path
+
+
+class TestExtractionManifest:
+    """Tests for records, freshness checks and persistence."""
+
+    def test_fresh_without_hashing(self, tmp_path, files):
+        pdf_path, text_path = files
+        manifest = ExtractionManifest(tmp_path / "manifest.json")
+        manifest.record("paper", pdf_path, text_path, "abc", 20, 3, pages=1, backend="pypdf")
+
+        def fail_hash():
+            raise AssertionError("hash computed for unchanged PDF")
+
+        assert manifest.is_fresh("paper", pdf_path, text_path, fail_hash)
+        assert not manifest.is_fresh("other", pdf_path, text_path, fail_hash)
+
+    def test_touched_pdf_rehashed(self, tmp_path, files):
+        """Test a PDF with a new mtime but the same content stays fresh."""
+        pdf_path, text_path = files
+        manifest = ExtractionManifest(tmp_path / "manifest.json")
+        manifest.record("paper", pdf_path, text_path, "abc", 20, 3)
+        os.utime(pdf_path, (1, 1))
+
+        assert manifest.is_fresh("paper", pdf_path, text_path, lambda: "abc")
+        assert manifest.get("paper")["pdf_mtime"] == 1
+        os.utime(pdf_path, (2, 2))
+        assert not manifest.is_fresh("paper", pdf_path, text_path, lambda: "changed")
+
+    def test_stale_on_version_or_text_change(self, tmp_path, files, monkeypatch):
+        pdf_path, text_path = files
+        manifest = ExtractionManifest(tmp_path / "manifest.json")
+        manifest.record("paper", pdf_path, text_path, "abc", 20, 3)
+
+        text_path.write_text("edited", encoding="utf-8")
+        assert not manifest.is_fresh("paper", pdf_path, text_path, lambda: "abc")
+
+        manifest.record("paper", pdf_path, text_path, "abc", 6, 1)
+        monkeypatch.setattr(extraction_manifest, "EXTRACTOR_VERSION", "next")
+        assert not manifest.is_fresh("paper", pdf_path, text_path, lambda: "abc")
+
+    def test_batch_defers_writes(self, tmp_path, files):
+        pdf_path, text_path = files
+        manifest = ExtractionManifest(tmp_path / "manifest.json")
+        with manifest.batch():
+            manifest.record("paper", pdf_path, text_path, "abc", 20, 3)
+            assert not manifest.path.exists()
+
+        data = json.loads(manifest.path.read_text())
+        assert data["records"]["paper"]["chars"] == 20
+        assert ExtractionManifest(manifest.path).get("paper")["words"] == 3
+
+
+def test_extractor_skips_and_reextracts(tmp_path, monkeypatch, real_pdf_file):
+    """Test TextExtractor reuses recorded text and re-extracts a changed PDF."""
+    monkeypatch.chdir(tmp_path)
+    extractor = TextExtractor()
+    success, _, chars = extractor.extract_and_save(real_pdf_file, "paper")
+    assert success
+    record = extractor.manifest.get("paper")
+    assert record["chars"] == chars and record["pages"] == 1 and record["backend"]
+    assert extractor.is_up_to_date("paper", real_pdf_file)
+
+    # Skipped without reading the text: the recorded count is returned
+    assert extractor.extract_and_save(real_pdf_file, "paper") == (True, None, chars)
+
+    real_pdf_file.write_bytes(real_pdf_file.read_bytes() + b"\n% changed\n")
+    assert not extractor.is_up_to_date("paper", real_pdf_file)
+    assert extractor.extract_and_save(real_pdf_file, "paper")[0]
+    assert extractor.is_up_to_date("paper", real_pdf_file)
+
+
+def test_extractor_adopts_legacy_text(tmp_path, monkeypatch, real_pdf_file):
+    monkeypatch.chdir(tmp_path)
+    extractor = TextExtractor()
+    (extractor.extracted_text_dir / "old.txt").write_text("legacy text", encoding="utf-8")
+
+    assert extractor.is_up_to_date("old", real_pdf_file)
+    assert extractor.extract_and_save(real_pdf_file, "old") == (True, None, len("legacy text"))
+    assert extractor.manifest.get("old")["words"] == 2
@@ -0,0 +1,73 @@
+"""Tests for infrastructure/literature/summarization/extraction_pool.py"""
+import os
+import shutil
+
+import pytest
+
+from infrastructure.literature.summarization.extraction_pool import ExtractionPool, write_text_atomic
+from infrastructure.literature.summarization.extractor import TextExtractor
+
+
+def test_write_text_atomic(tmp_path):
+    path = tmp_path / "a.txt"
+    write_text_atomic(path, "first")
+    write_text_atomic(path, "second")
+    assert path.read_text() == "second"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+class TestExtractionPool:
+    """Tests for worker processes, failures and timeouts."""
+
+    def test_extracts_in_workers(self, tmp_path, real_pdf_file):
+        pdfs = [real_pdf_file]
+        for i in range(3):
+            pdfs.append(shutil.copy(real_pdf_file, tmp_path / f"copy{i}.pdf"))
+        tasks = [(f"k{i}", pdf, tmp_path / f"k{i}.txt") for i, pdf in enumerate(pdfs)]
+
+        results = list(ExtractionPool(workers=2).run(tasks))
+        outcomes = {key: outcome for key, outcome, _ in results}
+        assert all(info.pages == 1 for _, _, info in results)
+
+        assert sorted(outcomes) == ["k0", "k1", "k2", "k3"]
+        for key, (success, error, chars) in outcomes.items():
+            assert success and error is None
+            assert chars == len((tmp_path / f"{key}.txt").read_text())
+            assert "Machine Learning" in (tmp_path / f"{key}.txt").read_text()
+
+    def test_missing_pdf_fails(self, tmp_path):
+        outcomes = list(ExtractionPool(workers=2).run([("gone", tmp_path / "gone.pdf", tmp_path / "gone.txt")]))
+        key, (success, error, chars), info = outcomes[0]
+        assert key == "gone" and not success and chars == 0
+        assert "not found" in error and info is None
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires named pipes")
+    def test_hanging_pdf_is_killed(self, tmp_path, real_pdf_file):
+        """Test a PDF that never finishes is skipped and the next PDF still runs."""
+        hanging = tmp_path / "hang.pdf"
+        os.mkfifo(hanging)  # Opening a FIFO without a writer blocks forever
+        tasks = [
+            ("hang", hanging, tmp_path / "hang.txt"),
+            ("ok", real_pdf_file, tmp_path / "ok.txt"),
+        ]
+
+        outcomes = {key: outcome for key, outcome, _ in ExtractionPool(workers=1, timeout=1.0).run(tasks)}
+
+        assert outcomes["hang"] == (False, "Extraction timed out after 1s", 0)
+        assert outcomes["ok"][0]
+        assert not (tmp_path / "hang.txt").exists()
+
+
+def test_extract_many_skips_existing(tmp_path, monkeypatch, real_pdf_file):
+    """Test existing texts are reported without being extracted again."""
+    monkeypatch.chdir(tmp_path)
+    extractor = TextExtractor()
+    (extractor.extracted_text_dir / "done.txt").write_text("existing", encoding="utf-8")
+
+    outcomes = {key: outcome for key, _, outcome in extractor.extract_many(
+        [(real_pdf_file, "done"), (real_pdf_file, "new")], workers=2
+    )}
+
+    assert outcomes["done"] == (True, None, len("existing"))
+    assert outcomes["new"][0]
+    assert extractor.load_extracted_text("new")
@@ -0,0 +1,105 @@
+"""Tests for infrastructure/literature/pdf/failed_tracker.py"""
+import json
+import threading
+
+import pytest
+
+from infrastructure.literature.core import LiteratureConfig
+from infrastructure.literature.core.core import DownloadResult
+from infrastructure.literature.pdf.failed_tracker import FailedDownloadTracker
+
+
+def failure(key, reason="network_error"):
+    return DownloadResult(citation_key=key, success=False, failure_reason=reason, failure_message="x")
+
+
+@pytest.fixture
+def config(tmp_path):
+    return LiteratureConfig(download_dir=str(tmp_path / "pdfs"), failed_tracker_flush_every=3)
+
+
+class TestFailedDownloadTracker:
+    """Tests for coalesced writes, the journal and the retriable index."""
+
+    def test_writes_immediately_outside_batch(self, config):
+        tracker = FailedDownloadTracker(config)
+        tracker.save_failed("a", failure("a"))
+
+        data = json.loads(tracker.tracker_path.read_text())
+        assert list(data["failures"]) == ["a"]
+
+    def test_batch_coalesces_writes(self, config):
+        """Test a batch flushes every flush_every mutations and at its end."""
+        tracker = FailedDownloadTracker(config)
+        with tracker.batch():
+            tracker.save_failed("a", failure("a"))
+            tracker.save_failed("b", failure("b"))
+            assert not tracker.tracker_path.exists()
+            tracker.save_failed("c", failure("c"))
+            assert tracker.tracker_path.exists()
+            tracker.remove_successful("a")
+
+        reloaded = FailedDownloadTracker(config)
+        assert sorted(reloaded.load_failed()) == ["b", "c"]
+
+    def test_retriable_index(self, config):
+        tracker = FailedDownloadTracker(config)
+        tracker.save_failed("net", failure("net"))
+        tracker.save_failed("denied", failure("denied", "access_denied"))
+        assert tracker.count_retriable() == 1
+        assert list(tracker.get_retriable_failed()) == ["net"]
+
+        tracker.save_failed("net", failure("net", "not_found"))
+        assert tracker.count_retriable() == 0
+        tracker.save_failed("net2", failure("net2", "timeout"))
+        assert FailedDownloadTracker(config).count_retriable() == 1
+
+        tracker.clear_failed()
+        assert tracker.count_retriable() == 0
+        assert tracker.get_failure("net2") is None
+
+    def test_journal_replay_and_compaction(self, tmp_path):
+        """Test journal mode appends records, replays them and compacts."""
+        config = LiteratureConfig(
+            download_dir=str(tmp_path / "pdfs"), failed_tracker_journal=True, failed_tracker_compact_every=4
+        )
+        tracker = FailedDownloadTracker(config)
+        tracker.save_failed("a", failure("a"))
+        tracker.save_failed("b", failure("b"))
+        tracker.remove_successful("a")
+
+        assert not tracker.tracker_path.exists()
+        assert len(tracker.journal_path.read_text().splitlines()) == 3
+        assert sorted(FailedDownloadTracker(config).load_failed()) == ["b"]
+
+        tracker.clear_failed(["b"])
+        assert not tracker.journal_path.exists()
+        assert json.loads(tracker.tracker_path.read_text())["failures"] == {}
+
+    def test_journal_folded_in_after_journal_mode_is_disabled(self, config):
+        """Test a leftover journal cannot resurrect failures removed without journaling."""
+        config.failed_tracker_journal = True
+        FailedDownloadTracker(config).save_failed("k1", failure("k1"))
+
+        config.failed_tracker_journal = False
+        tracker = FailedDownloadTracker(config)
+        tracker.remove_successful("k1")
+
+        assert not tracker.journal_path.exists()
+        reloaded = FailedDownloadTracker(config)
+        assert reloaded.load_failed() == {}
+        assert reloaded.get_retriable_failed() == {}
+
+    def test_concurrent_saves(self, config):
+        tracker = FailedDownloadTracker(config)
+        threads = [
+            threading.Thread(target=tracker.save_failed, args=(f"k{i}", failure(f"k{i}")))
+            for i in range(20)
+        ]
+        with tracker.batch():
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert FailedDownloadTracker(config).count_failures() == 20
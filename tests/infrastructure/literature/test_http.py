@@ -0,0 +1,124 @@
+"""Tests for infrastructure/literature/sources/http.py"""
+import gzip
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from infrastructure.literature.core import LiteratureConfig
+from infrastructure.literature.sources.ratelimit import HostRateLimiter
+from infrastructure.literature.sources.http import (
+    PooledHTTPAdapter,
+    close_sessions,
+    get_connection_stats,
+    get_session,
+    total_connection_stats,
+)
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 handler returning a gzip-compressed body."""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/busy":
+            self.send_response(429)
+            self.send_header("Retry-After", "1")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = gzip.compress(b"hello pooled world")
+        self.send_response(200)
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Local keep-alive HTTP server."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fresh_sessions():
+    """Start and end every test without shared sessions."""
+    close_sessions()
+    yield
+    close_sessions()
+
+
+class TestGetSession:
+    """Tests for the shared session factory."""
+
+    def test_shared_per_pool_size(self):
+        """Test configs with equal pool sizes share one session."""
+        config = LiteratureConfig(max_parallel_downloads=6)
+        assert get_session(config) is get_session(LiteratureConfig(max_parallel_downloads=6))
+        assert get_session(config) is not get_session(LiteratureConfig(http_pool_maxsize=2))
+
+    def test_pool_size_follows_parallel_downloads(self):
+        """Test the per-host pool size defaults to the worker count."""
+        config = LiteratureConfig(max_parallel_downloads=12, max_parallel_sources=8)
+        adapter = get_session(config).get_adapter("https://example.org")
+        assert adapter._pool_maxsize == 12
+        assert adapter._pool_connections == config.http_pool_hosts
+
+
+class TestConnectionStats:
+    """Tests for keep-alive reuse statistics."""
+
+    def test_reuse_and_gzip(self, server):
+        """Test repeated requests reuse one connection and bodies are decoded."""
+        session = get_session(LiteratureConfig())
+        before = total_connection_stats()
+        for _ in range(3):
+            response = session.get(f"http://127.0.0.1:{server}/", timeout=5)
+            assert response.text == "hello pooled world"
+
+        stats = total_connection_stats().since(before)
+        assert stats.requests == 3
+        assert stats.connections == 1
+        assert stats.reused == 2
+        assert get_connection_stats()["127.0.0.1"].to_dict() == {"requests": 3, "connections": 1, "reused": 2}
+
+    def test_stats_survive_pool_eviction(self, server):
+        """Test counts of evicted host pools are kept."""
+        session = get_session(LiteratureConfig(http_pool_hosts=1))
+        session.get(f"http://127.0.0.1:{server}/", timeout=5)
+        session.get(f"http://localhost:{server}/", timeout=5)
+
+        stats = get_connection_stats()
+        assert stats["127.0.0.1"].requests == 1
+        assert stats["localhost"].requests == 1
+
+
+class TestRateLimitedAdapter:
+    """Tests for rate limiting in the pooled adapter."""
+
+    def test_retry_after_blocks_host(self, server):
+        """Test a 429 with Retry-After delays the next request to that host."""
+        limiter = HostRateLimiter(default_rate=100.0, default_burst=10)
+        session = requests.Session()
+        session.mount("http://", PooledHTTPAdapter(4, 4, rate_limiter=limiter))
+
+        assert session.get(f"http://127.0.0.1:{server}/busy", timeout=5).status_code == 429
+        start = time.monotonic()
+        session.get(f"http://127.0.0.1:{server}/", timeout=5)
+
+        assert time.monotonic() - start >= 0.9
+        stats = limiter.get_stats()["127.0.0.1"]
+        assert stats.throttled == 1
+        assert stats.requests == 2
+        session.close()
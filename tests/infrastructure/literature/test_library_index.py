@@ -454,6 +454,68 @@ class TestLibraryIndex:
         assert key1 != key2
         assert len(index.list_entries()) == 2
 
+    def test_add_entry_deduplicates_by_normalized_doi(self, mock_config):
+        """Test DOI matching ignores case and resolver prefix."""
+        index = LibraryIndex(mock_config)
+        key1 = index.add_entry(title="Paper One", authors=["Smith"], year=2024, doi="10.1234/ABC")
+        key2 = index.add_entry(
+            title="Paper One (Revised)", authors=["Smith"], year=2024,
+            doi="https://doi.org/10.1234/abc"
+        )
+        assert key1 == key2
+        assert index.has_paper(doi="doi:10.1234/Abc")
+
+    def test_add_entry_deduplicates_by_normalized_title(self, mock_config):
+        """Test title matching ignores punctuation and case."""
+        index = LibraryIndex(mock_config)
+        key1 = index.add_entry(title="Active Inference: A Review", authors=["Smith"], year=2024)
+        key2 = index.add_entry(title="active inference a review", authors=["Smith"], year=2024)
+        assert key1 == key2
+        assert len(index.list_entries()) == 1
+
+    def test_add_entry_deduplicates_by_arxiv_id(self, mock_config):
+        """Test arXiv versions of the same paper map to one entry."""
+        index = LibraryIndex(mock_config)
+        key1 = index.add_entry(
+            title="Preprint Title", authors=["Smith"], year=2023,
+            url="https://arxiv.org/abs/2301.00001v1"
+        )
+        key2 = index.add_entry(
+            title="Published Title", authors=["Smith"], year=2024,
+            doi="10.48550/arXiv.2301.00001"
+        )
+        assert key1 == key2
+        assert index.find_by_arxiv_id("2301.00001v3") == key1
+        assert index.has_paper(arxiv_id="2301.00001")
+
+    def test_lookup_indexes_follow_remove_and_reload(self, mock_config):
+        """Test secondary indexes are maintained on remove and reload."""
+        index = LibraryIndex(mock_config)
+        key = index.add_entry(title="Indexed Paper", authors=["Smith"], year=2024, doi="10.1/x")
+        assert index.find_by_doi("10.1/X") == key
+
+        index.remove_entry(key)
+        assert index.find_by_doi("10.1/x") is None
+        assert not index.has_paper(title="Indexed Paper")
+
+        other = LibraryIndex(mock_config)
+        other.add_entry(title="Indexed Paper", authors=["Smith"], year=2024, doi="10.1/x")
+        index.reload()
+        assert index.find_by_title("Indexed Paper") == key
+
+    def test_generate_citation_key_returns_suffixed_existing_key(self, mock_config):
+        """Test key generation reuses the suffixed key of the same paper."""
+        index = LibraryIndex(mock_config)
+        index.add_entry(title="Machine Learning Paper", authors=["Smith"], year=2024)
+        key2 = index.add_entry(title="Machine Intelligence Paper", authors=["Smith"], year=2024)
+        assert key2 == "smith2024machine2"
+        assert index.generate_citation_key(
+            "Machine Intelligence Paper", ["Smith"], 2024
+        ) == "smith2024machine2"
+        assert index.generate_citation_key(
+            "Machine Vision Paper", ["Smith"], 2024
+        ) == "smith2024machine3"
+
 
 class TestLibraryIndexIntegration:
     """Integration tests for library index with other components."""
@@ -510,3 +572,104 @@ class TestLibraryIndexIntegration:
 
 
 
+
+
+class TestLibraryIndexPersistence:
+    """Tests for batched writes, the mutation journal and atomic saves."""
+
+    def test_batch_coalesces_saves(self, mock_config, monkeypatch):
+        """Test a batch writes the index once on exit."""
+        index = LibraryIndex(mock_config)
+        saves = []
+        original_save = index._save_index
+        monkeypatch.setattr(index, "_save_index", lambda: (saves.append(1), original_save()))
+
+        with index.batch():
+            for i in range(5):
+                index.add_entry(title=f"Batched Paper {i}", authors=["Smith"], year=2024)
+            with index.batch():
+                index.update_pdf_path(index.list_entries()[0].citation_key, "data/pdfs/x.pdf")
+            assert saves == []
+
+        assert len(saves) == 1
+        assert len(LibraryIndex(mock_config).list_entries()) == 5
+
+    def test_batch_flushes_on_exception(self, mock_config):
+        """Test mutations made before an exception are persisted."""
+        index = LibraryIndex(mock_config)
+        with pytest.raises(RuntimeError):
+            with index.batch():
+                index.add_entry(title="Survivor", authors=["Smith"], year=2024)
+                raise RuntimeError("boom")
+        assert LibraryIndex(mock_config).has_paper(title="Survivor")
+
+    def test_journal_appends_and_replays(self, mock_config):
+        """Test journal mode appends records and replays them on load."""
+        mock_config.library_journal = True
+        index = LibraryIndex(mock_config)
+        key = index.add_entry(title="Journaled Paper", authors=["Smith"], year=2024)
+        index.update_pdf_path(key, "data/pdfs/journaled.pdf")
+        other = index.add_entry(title="Removed Paper", authors=["Doe"], year=2024)
+        index.remove_entry(other)
+
+        assert not Path(mock_config.library_index_file).exists()
+        records = index.journal_path.read_text().splitlines()
+        assert [json.loads(r)["op"] for r in records] == ["put", "put", "put", "delete"]
+
+        reloaded = LibraryIndex(mock_config)
+        assert [e.citation_key for e in reloaded.list_entries()] == [key]
+        assert reloaded.get_entry(key).pdf_path == "data/pdfs/journaled.pdf"
+
+    def test_journal_ignores_truncated_record(self, mock_config):
+        """Test a partially written final journal line is skipped."""
+        mock_config.library_journal = True
+        index = LibraryIndex(mock_config)
+        index.add_entry(title="Complete Record", authors=["Smith"], year=2024)
+        with open(index.journal_path, "a", encoding="utf-8") as f:
+            f.write('{"op": "put", "key": "trunc')
+
+        reloaded = LibraryIndex(mock_config)
+        assert len(reloaded.list_entries()) == 1
+
+    def test_journal_compaction(self, mock_config):
+        """Test the journal is folded into library.json after the threshold."""
+        mock_config.library_journal = True
+        mock_config.library_journal_compact_every = 3
+        index = LibraryIndex(mock_config)
+        for i in range(3):
+            index.add_entry(title=f"Compacted Paper {i}", authors=["Smith"], year=2024)
+
+        assert not index.journal_path.exists()
+        with open(mock_config.library_index_file, encoding="utf-8") as f:
+            assert json.load(f)["count"] == 3
+
+        index.add_entry(title="After Compaction", authors=["Smith"], year=2024)
+        assert index.journal_path.exists()
+        assert len(LibraryIndex(mock_config).list_entries()) == 4
+
+    def test_journal_folded_in_after_journal_mode_is_disabled(self, mock_config):
+        """Test a leftover journal cannot resurrect entries removed without journaling."""
+        mock_config.library_journal = True
+        key = LibraryIndex(mock_config).add_entry(title="Journaled Paper", authors=["Smith"], year=2024)
+
+        mock_config.library_journal = False
+        index = LibraryIndex(mock_config)
+        assert index.remove_entry(key)
+
+        assert not index.journal_path.exists()
+        assert LibraryIndex(mock_config).list_entries() == []
+
+    def test_save_is_atomic(self, mock_config, monkeypatch):
+        """Test a failed write leaves the previous index intact."""
+        index = LibraryIndex(mock_config)
+        index.add_entry(title="Original Paper", authors=["Smith"], year=2024)
+        original = Path(mock_config.library_index_file).read_text()
+
+        def failing_dump(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("infrastructure.literature.library.index.json.dump", failing_dump)
+        with pytest.raises(Exception):
+            index.add_entry(title="Lost Paper", authors=["Doe"], year=2024)
+
+        assert Path(mock_config.library_index_file).read_text() == original
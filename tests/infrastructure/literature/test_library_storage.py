@@ -0,0 +1,219 @@
+"""Tests for infrastructure/literature/library/storage.py"""
+import json
+from pathlib import Path
+
+import pytest
+
+from infrastructure.literature.library import LibraryIndex, LibraryStore, SQLiteLibraryStore, create_library_store
+from infrastructure.literature.llm import PaperSelector, PaperSelectionConfig
+
+
+@pytest.fixture
+def sqlite_config(mock_config):
+    """Configuration using the SQLite library backend."""
+    mock_config.library_backend = "sqlite"
+    return mock_config
+
+
+def _populate(index):
+    """Add a small mixed library and return the citation keys."""
+    keys = [
+        index.add_entry(
+            title="Active Inference and Learning", authors=["Friston"], year=2016,
+            source="arxiv", abstract="Free energy minimization in the brain",
+            doi="10.1000/AI.1"
+        ),
+        index.add_entry(
+            title="Deep Networks for Vision", authors=["Lecun"], year=2015,
+            source="semanticscholar", abstract="Convolutional architectures"
+        ),
+        index.add_entry(
+            title="Predictive Coding Review", authors=["Rao"], year=None,
+            source="arxiv", abstract="Hierarchical inference",
+            url="https://arxiv.org/abs/1901.00001v2"
+        ),
+    ]
+    return keys
+
+
+class TestCreateLibraryStore:
+    """Tests for backend selection."""
+
+    def test_json_backend_has_no_store(self, mock_config):
+        """Test the default JSON backend is handled by LibraryIndex itself."""
+        assert create_library_store(mock_config) is None
+
+    def test_sqlite_backend_default_path(self, sqlite_config):
+        """Test the database defaults to the index path with .sqlite suffix."""
+        store = create_library_store(sqlite_config)
+        assert isinstance(store, SQLiteLibraryStore)
+        assert store.path == Path(sqlite_config.library_index_file).with_suffix(".sqlite")
+        store.close()
+
+    def test_unknown_backend(self, mock_config):
+        """Test an unknown backend name is rejected."""
+        mock_config.library_backend = "postgres"
+        with pytest.raises(ValueError):
+            create_library_store(mock_config)
+
+    def test_incomplete_backend_fails_on_creation(self):
+        """Test a store missing abstract methods cannot be instantiated."""
+        class PartialStore(LibraryStore):
+            def load_all(self):
+                return {}
+
+        with pytest.raises(TypeError):
+            PartialStore()
+
+
+class TestSQLiteLibraryIndex:
+    """Tests for LibraryIndex on the SQLite backend."""
+
+    def test_persists_without_json(self, sqlite_config):
+        """Test entries are stored in the database, not library.json."""
+        index = LibraryIndex(sqlite_config)
+        keys = _populate(index)
+        index.update_pdf_path(keys[0], "data/pdfs/a.pdf")
+
+        assert not Path(sqlite_config.library_index_file).exists()
+        reopened = LibraryIndex(sqlite_config)
+        assert reopened.count() == 3
+        assert reopened.get_entry(keys[0]).pdf_path == "data/pdfs/a.pdf"
+        assert [e.citation_key for e in reopened.list_entries()] == keys
+
+    def test_lookups_do_not_load_entries(self, sqlite_config):
+        """Test DOI/title/arXiv lookups are answered by SQL."""
+        keys = _populate(LibraryIndex(sqlite_config))
+        index = LibraryIndex(sqlite_config)
+
+        assert index.find_by_doi("https://doi.org/10.1000/ai.1") == keys[0]
+        assert index.find_by_title("deep networks for vision") == keys[1]
+        assert index.find_by_arxiv_id("1901.00001") == keys[2]
+        assert index._entry_cache is None
+
+    def test_mutations_do_not_load_entries(self, sqlite_config, monkeypatch):
+        """Test add, PDF update and removal touch single rows, also inside a batch."""
+        keys = _populate(LibraryIndex(sqlite_config))
+        index = LibraryIndex(sqlite_config)
+
+        def fail_load_all():
+            raise AssertionError("load_all called")
+
+        monkeypatch.setattr(index.store, "load_all", fail_load_all)
+        new_key = index.add_entry(title="A New Paper", authors=["Friston"], year=2016)
+        index.update_pdf_path(keys[0], "data/pdfs/a.pdf")
+        with index.batch():
+            batched = index.add_entry(title="Batched Paper", authors=["Rao"], year=2020)
+            assert index.add_entry(title="Batched Paper", authors=["Rao"], year=2020) == batched
+            index.update_pdf_path(batched, "data/pdfs/b.pdf")
+            assert index.get_entry(batched).pdf_path == "data/pdfs/b.pdf"
+            assert index.remove_entry(keys[1])
+            assert index.get_entry(keys[1]) is None
+        assert index._entry_cache is None
+
+        monkeypatch.undo()
+        reopened = LibraryIndex(sqlite_config)
+        assert [e.citation_key for e in reopened.list_entries()] == [keys[0], keys[2], new_key, batched]
+        assert reopened.get_entry(keys[0]).pdf_path == "data/pdfs/a.pdf"
+        assert reopened.get_entry(batched).pdf_path == "data/pdfs/b.pdf"
+
+    def test_pending_mutations_visible_after_loading(self, sqlite_config):
+        """Test entries loaded inside a batch include the unflushed mutations."""
+        keys = _populate(LibraryIndex(sqlite_config))
+        index = LibraryIndex(sqlite_config)
+        with index.batch():
+            new_key = index.add_entry(title="Pending Paper", authors=["Doe"], year=2024)
+            index.remove_entry(keys[0])
+            assert index.count() == 3
+            assert [e.citation_key for e in index.list_entries()] == [keys[1], keys[2], new_key]
+
+    def test_migrates_existing_json_once(self, mock_config, sqlite_config):
+        """Test library.json is imported into an empty database once."""
+        mock_config.library_backend = "json"
+        keys = _populate(LibraryIndex(mock_config))
+
+        mock_config.library_backend = "sqlite"
+        index = LibraryIndex(mock_config)
+        assert index.count() == 3
+        index.remove_entry(keys[1])
+
+        # Removing from the database must not trigger a second migration
+        assert LibraryIndex(mock_config).count() == 2
+
+    def test_get_stats_matches_json_backend(self, mock_config, tmp_path):
+        """Test SQL-aggregated statistics equal the in-memory statistics."""
+        mock_config.library_backend = "json"
+        json_index = LibraryIndex(mock_config)
+        _populate(json_index)
+        expected = json_index.get_stats()
+
+        sqlite_index = LibraryIndex(mock_config.__class__(
+            library_index_file=str(tmp_path / "other" / "library.json"),
+            library_backend="sqlite",
+        ))
+        _populate(sqlite_index)
+        fresh = LibraryIndex(sqlite_index.config)
+        stats = fresh.get_stats()
+
+        assert fresh._entry_cache is None
+        for field in ("total_entries", "downloaded_pdfs", "summaries_generated", "sources", "years"):
+            assert stats[field] == expected[field]
+        assert len(stats["recent_additions"]) == 3
+
+    def test_get_entries_without_pdf(self, sqlite_config, tmp_path):
+        """Test entries without a stored or existing PDF are returned in order."""
+        index = LibraryIndex(sqlite_config)
+        keys = _populate(index)
+        existing_pdf = tmp_path / "exists.pdf"
+        existing_pdf.write_bytes(b"%PDF")
+        index.update_pdf_path(keys[0], str(existing_pdf))
+        index.update_pdf_path(keys[1], str(tmp_path / "missing.pdf"))
+
+        fresh = LibraryIndex(sqlite_config)
+        missing = fresh.get_entries_without_pdf()
+        assert [e.citation_key for e in missing] == [keys[1], keys[2]]
+        assert fresh._entry_cache is None
+
+    def test_query_entries_filters(self, sqlite_config):
+        """Test structured filters and FTS pre-filtering in SQL."""
+        keys = _populate(LibraryIndex(sqlite_config))
+        index = LibraryIndex(sqlite_config)
+
+        assert [e.citation_key for e in index.query_entries(sources=["arxiv"])] == [keys[0], keys[2]]
+        assert [e.citation_key for e in index.query_entries(year_range=(2016, None))] == [keys[0]]
+        assert [e.citation_key for e in index.query_entries(year_range=(None, None))] == keys[:2]
+        assert [e.citation_key for e in index.query_entries(text_terms=["infer"])] == [keys[0], keys[2]]
+        assert [e.citation_key for e in index.query_entries(text_terms=["energy", "brain"])] == [keys[0]]
+        assert [e.citation_key for e in index.query_entries(citation_keys=[keys[1]])] == [keys[1]]
+        assert len(index.query_entries(limit=2)) == 2
+
+    def test_batch_applies_in_one_transaction(self, sqlite_config):
+        """Test batched mutations reach the database when the batch exits."""
+        index = LibraryIndex(sqlite_config)
+        with index.batch():
+            _populate(index)
+            assert index.store.count() == 0
+        assert index.store.count() == 3
+
+
+class TestSelectFromIndex:
+    """Tests for PaperSelector.select_from_index on both backends."""
+
+    @pytest.mark.parametrize("backend", ["json", "sqlite"])
+    def test_matches_select_papers(self, mock_config, backend):
+        """Test pushed-down selection equals in-memory selection."""
+        mock_config.library_backend = backend
+        index = LibraryIndex(mock_config)
+        _populate(index)
+
+        for config in (
+            PaperSelectionConfig(sources=["arxiv"], keywords=["inference"]),
+            PaperSelectionConfig(years={"min": 2015, "max": 2015}),
+            PaperSelectionConfig(keywords=["learn"], limit=1),
+            PaperSelectionConfig(limit=2),
+        ):
+            selector = PaperSelector(config)
+            expected = selector.select_papers(index.list_entries())
+            fresh = LibraryIndex(mock_config)
+            actual = selector.select_from_index(fresh)
+            assert [e.citation_key for e in actual] == [e.citation_key for e in expected]
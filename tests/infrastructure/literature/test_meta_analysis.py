@@ -184,6 +184,27 @@ class TestDataAggregator:
         assert len(corpus.texts) > 0
         assert len(corpus.titles) > 0
 
+    def test_prepare_text_corpus_from_packed_corpus(self, aggregator, tmp_path):
+        """Test texts come from the packed corpus unless the text file changed or was deleted."""
+        from infrastructure.literature.summarization.corpus import build_corpus
+
+        extracted_dir = tmp_path / "extracted_text"
+        extracted_dir.mkdir()
+        text_file = extracted_dir / "test2020a.txt"
+        text_file.write_text("Packed text for test2020a")
+        build_corpus(extracted_dir, with_sections=False)
+
+        corpus = aggregator.prepare_text_corpus(extracted_text_dir=extracted_dir)
+        assert corpus.texts[corpus.citation_keys.index("test2020a")] == "Packed text for test2020a"
+
+        text_file.write_text("Updated text for test2020a")
+        corpus = aggregator.prepare_text_corpus(extracted_text_dir=extracted_dir)
+        assert corpus.texts[corpus.citation_keys.index("test2020a")] == "Updated text for test2020a"
+
+        text_file.unlink()
+        corpus = aggregator.prepare_text_corpus(extracted_text_dir=extracted_dir)
+        assert "test2020a" not in corpus.texts[corpus.citation_keys.index("test2020a")]
+
 
 class TestTemporalAnalysis:
     """Tests for temporal analysis."""
@@ -0,0 +1,86 @@
+"""Tests for infrastructure/literature/pdf/content_index.py"""
+import os
+
+import pytest
+
+from infrastructure.literature.core import LiteratureConfig
+from infrastructure.literature.pdf.content_index import PDFContentIndex, file_sha256
+from infrastructure.literature.summarization.extractor import TextExtractor
+
+
+def write_pdf(path, body=b"paper"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"%PDF-1.4\n" + body + b"\n%%EOF")
+    return path
+
+
+@pytest.fixture
+def index(tmp_path):
+    return PDFContentIndex(tmp_path / "cache" / "pdf_content.json")
+
+
+class TestPDFContentIndex:
+    """Tests for hashing, duplicate detection and persistence."""
+
+    def test_register_links_duplicates(self, tmp_path, index):
+        """Test a duplicate is detected and hard-linked to the first copy."""
+        first = write_pdf(tmp_path / "pdfs" / "smith2020preprint.pdf")
+        second = write_pdf(tmp_path / "pdfs" / "smith2021paper.pdf")
+
+        assert index.register("smith2020preprint", first) is None
+        assert index.register("smith2021paper", second, file_sha256(second)) == "smith2020preprint"
+        assert os.path.samefile(first, second)
+        assert index.duplicates_of("smith2021paper", second) == ["smith2020preprint"]
+        assert index.get_stats() == {"pdfs": 2, "unique_contents": 1, "duplicates": 1}
+
+    def test_no_link_when_disabled(self, tmp_path):
+        index = PDFContentIndex(tmp_path / "index.json", link_duplicates=False)
+        first = write_pdf(tmp_path / "a.pdf")
+        second = write_pdf(tmp_path / "b.pdf")
+        index.register("a", first)
+
+        assert index.register("b", second) == "a"
+        assert not os.path.samefile(first, second)
+
+    def test_changed_file_is_rehashed(self, tmp_path, index):
+        """Test the cached hash is dropped when size or mtime change."""
+        pdf = write_pdf(tmp_path / "a.pdf")
+        original = index.hash_of("a", pdf)
+
+        write_pdf(pdf, b"revised paper")
+        assert index.hash_of("a", pdf) == file_sha256(pdf) != original
+        assert index.hash_of("missing", tmp_path / "missing.pdf") is None
+
+    def test_flush_and_reload(self, tmp_path, index):
+        write_pdf(tmp_path / "a.pdf")
+        write_pdf(tmp_path / "b.pdf")
+        index.register("a", tmp_path / "a.pdf")
+        index.register("b", tmp_path / "b.pdf")
+        index.flush()
+
+        reloaded = PDFContentIndex(index.path)
+        assert reloaded.duplicates_of("a", tmp_path / "a.pdf") == ["b"]
+        reloaded.forget("b")
+        assert reloaded.duplicates_of("a", tmp_path / "a.pdf") == []
+
+    def test_for_config_shares_instance(self, tmp_path):
+        config = LiteratureConfig(download_dir=str(tmp_path / "pdfs"))
+        index = PDFContentIndex.for_config(config)
+        assert index is PDFContentIndex.for_config(config)
+        assert index.path == tmp_path / "cache" / "pdf_content.json"
+
+
+def test_extractor_reuses_duplicate_text(tmp_path, monkeypatch, index):
+    """Test text extracted for one key is copied for an identical PDF."""
+    monkeypatch.chdir(tmp_path)
+    first = write_pdf(tmp_path / "pdfs" / "a.pdf")
+    second = write_pdf(tmp_path / "pdfs" / "b.pdf")
+    index.register("a", first)
+    index.register("b", second)
+
+    extractor = TextExtractor(content_index=index)
+    (extractor.extracted_text_dir / "a.txt").write_text("extracted text", encoding="utf-8")
+
+    success, error, chars = extractor.extract_and_save(second, "b")
+    assert (success, error, chars) == (True, None, len("extracted text"))
+    assert extractor.load_extracted_text("b") == "extracted text"
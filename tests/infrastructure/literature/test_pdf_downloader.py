@@ -0,0 +1,233 @@
+"""Tests for streaming downloads in infrastructure/literature/pdf/downloader.py"""
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from infrastructure.literature.core import LiteratureConfig
+from infrastructure.literature.pdf.downloader import PDFDownloader
+
+PDF_BODY = b"%PDF-1.4\n" + bytes(range(256)) * 800 + b"\n%%EOF"
+
+
+class _PDFHandler(BaseHTTPRequestHandler):
+    """Serves a PDF (with Range support), an HTML page, a truncated and a slow PDF."""
+    protocol_version = "HTTP/1.1"
+    range_headers = []
+    etag = '"v1"'
+
+    def do_GET(self):
+        if self.path == "/page":
+            body = b"<!DOCTYPE html><html><body>No PDF here</body></html>"
+            self._send(200, body, "text/html")
+            return
+        if self.path == "/slow.pdf":
+            time.sleep(2)
+            self._send(200, PDF_BODY, "application/pdf")
+            return
+        if self.path == "/truncated":
+            self.send_response(200)
+            self.send_header("Content-Type", "application/pdf")
+            self.send_header("Content-Length", str(len(PDF_BODY)))
+            self.end_headers()
+            self.wfile.write(PDF_BODY[:10000])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+
+        requested = self.headers.get("Range")
+        type(self).range_headers.append(requested)
+        if_range = self.headers.get("If-Range")
+        if requested and self.path == "/paper.pdf" and if_range in (None, self.etag):
+            start = int(requested.split("=")[1].split("-")[0])
+            self.send_response(206)
+            self.send_header("ETag", self.etag)
+            self.send_header("Content-Range", f"bytes {start}-{len(PDF_BODY) - 1}/{len(PDF_BODY)}")
+            body = PDF_BODY[start:]
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if self.path == "/paper.pdf":
+            # Full body, also when If-Range no longer matches
+            self.send_response(200)
+            self.send_header("ETag", self.etag)
+            self.send_header("Content-Type", "application/pdf")
+            self.send_header("Content-Length", str(len(PDF_BODY)))
+            self.end_headers()
+            self.wfile.write(PDF_BODY)
+            return
+        # /no-range.pdf ignores Range headers
+        self._send(200, PDF_BODY, "application/pdf")
+
+    def _send(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _write_partial(output, url, etag='"v1"', total=len(PDF_BODY), size=50000):
+    """Leave a partial download of ``url`` with its metadata."""
+    PDFDownloader.partial_path(output).write_bytes(PDF_BODY[:size])
+    PDFDownloader.partial_meta_path(output).write_text(
+        json.dumps({"url": url, "etag": etag, "last_modified": None, "total": total})
+    )
+
+
+@pytest.fixture
+def base_url():
+    """Local HTTP server serving test PDFs."""
+    _PDFHandler.range_headers = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _PDFHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def downloader(tmp_path):
+    """Downloader writing to a temporary directory."""
+    config = LiteratureConfig(download_dir=str(tmp_path), rate_limit_hosts=False, download_chunk_size=4096)
+    return PDFDownloader(config)
+
+
+class TestStreamingDownload:
+    """Tests for chunked, atomic and resumable downloads."""
+
+    def test_streams_to_final_path_with_hash(self, downloader, base_url, tmp_path):
+        """Test a complete download is renamed into place and hashed."""
+        output = tmp_path / "paper.pdf"
+        success, error, reason = downloader._download_single_attempt(f"{base_url}/paper.pdf", output)
+
+        assert success, error
+        assert output.read_bytes() == PDF_BODY
+        assert not PDFDownloader.partial_path(output).exists()
+        assert downloader.content_hash(output) == hashlib.sha256(PDF_BODY).hexdigest()
+
+    def test_resumes_partial_download(self, downloader, base_url, tmp_path):
+        """Test an existing .part file is continued with a Range request."""
+        output = tmp_path / "paper.pdf"
+        _write_partial(output, f"{base_url}/paper.pdf")
+
+        success, _, _ = downloader._download_single_attempt(f"{base_url}/paper.pdf", output)
+
+        assert success
+        assert _PDFHandler.range_headers == ["bytes=50000-"]
+        assert output.read_bytes() == PDF_BODY
+        assert downloader.content_hash(output) == hashlib.sha256(PDF_BODY).hexdigest()
+        assert not PDFDownloader.partial_meta_path(output).exists()
+
+    def test_partial_from_other_url_is_discarded(self, downloader, base_url, tmp_path):
+        """Test a partial of another candidate URL is never continued."""
+        output = tmp_path / "paper.pdf"
+        _write_partial(output, f"{base_url}/other.pdf")
+
+        success, _, _ = downloader._download_single_attempt(f"{base_url}/paper.pdf", output)
+
+        assert success
+        assert _PDFHandler.range_headers == [None]
+        assert output.read_bytes() == PDF_BODY
+
+    def test_partial_without_validator_is_discarded(self, downloader, base_url, tmp_path):
+        """Test a partial whose resource cannot be verified is not resumed."""
+        output = tmp_path / "paper.pdf"
+        _write_partial(output, f"{base_url}/paper.pdf", etag=None)
+
+        downloader._download_single_attempt(f"{base_url}/paper.pdf", output)
+
+        assert _PDFHandler.range_headers == [None]
+        assert output.read_bytes() == PDF_BODY
+
+    def test_changed_resource_restarts(self, downloader, base_url, tmp_path):
+        """Test a failed If-Range replaces the partial file with the full body."""
+        output = tmp_path / "paper.pdf"
+        _write_partial(output, f"{base_url}/paper.pdf", etag='"v0"')
+
+        success, _, _ = downloader._download_single_attempt(f"{base_url}/paper.pdf", output)
+
+        assert success
+        assert _PDFHandler.range_headers == ["bytes=50000-"]
+        assert output.read_bytes() == PDF_BODY
+
+    def test_wrong_total_length_restarts(self, downloader, base_url, tmp_path):
+        """Test a Content-Range with another total length discards the partial."""
+        output = tmp_path / "paper.pdf"
+        _write_partial(output, f"{base_url}/paper.pdf", total=len(PDF_BODY) + 10)
+
+        success, _, _ = downloader._download_single_attempt(f"{base_url}/paper.pdf", output)
+
+        assert success
+        assert _PDFHandler.range_headers == ["bytes=50000-", None]
+        assert output.read_bytes() == PDF_BODY
+
+    def test_server_ignoring_range_restarts(self, downloader, base_url, tmp_path):
+        """Test a 200 reply to a Range request replaces the partial file."""
+        output = tmp_path / "paper.pdf"
+        PDFDownloader.partial_path(output).write_bytes(b"%PDF-stale-bytes")
+
+        success, _, _ = downloader._download_single_attempt(f"{base_url}/no-range.pdf", output)
+
+        assert success
+        assert output.read_bytes() == PDF_BODY
+
+    def test_interrupted_download_keeps_partial(self, downloader, base_url, tmp_path):
+        """Test a truncated body leaves a resumable .part file and no PDF."""
+        output = tmp_path / "paper.pdf"
+        success, _, _ = downloader._download_single_attempt(f"{base_url}/truncated", output)
+
+        assert not success
+        assert not output.exists()
+        partial = PDFDownloader.partial_path(output).read_bytes()
+        assert partial and PDF_BODY.startswith(partial)
+        meta = json.loads(PDFDownloader.partial_meta_path(output).read_text())
+        assert meta["url"] == f"{base_url}/truncated"
+        assert meta["total"] == len(PDF_BODY)
+
+    def test_html_response_writes_nothing(self, downloader, base_url, tmp_path):
+        """Test HTML pages are rejected from the sniffed bytes."""
+        output = tmp_path / "paper.pdf"
+        success, _, reason = downloader._download_single_attempt(f"{base_url}/page", output)
+
+        assert not success
+        assert reason == "html_response"
+        assert list(tmp_path.iterdir()) == []
+
+    def test_resume_disabled_discards_partial(self, tmp_path, base_url):
+        """Test partial files are not resumed when resuming is disabled."""
+        config = LiteratureConfig(download_dir=str(tmp_path), rate_limit_hosts=False, resume_downloads=False)
+        output = tmp_path / "paper.pdf"
+        _write_partial(output, f"{base_url}/paper.pdf")
+
+        success, _, _ = PDFDownloader(config)._download_single_attempt(f"{base_url}/paper.pdf", output)
+
+        assert success
+        assert _PDFHandler.range_headers == [None]
+        assert output.read_bytes() == PDF_BODY
+
+
+class TestCandidateRace:
+    """Tests for concurrent probing of candidate URLs."""
+
+    def test_first_pdf_wins(self, downloader, base_url):
+        """Test the race returns the PDF without waiting for slow candidates."""
+        start = time.monotonic()
+        winner = downloader.race_candidates(
+            [f"{base_url}/slow.pdf", f"{base_url}/page", f"{base_url}/no-range.pdf"], timeout=5
+        )
+
+        assert winner == f"{base_url}/no-range.pdf"
+        assert time.monotonic() - start < 1.5
+
+    def test_no_pdf_candidates(self, downloader, base_url):
+        assert downloader.race_candidates([f"{base_url}/page"], timeout=5) is None
+        assert downloader.race_candidates([]) is None
@@ -5,6 +5,7 @@ and bioRxiv/medRxiv DOI lookup fallback features.
 """
 import pytest
 from pathlib import Path
+from unittest.mock import MagicMock
 
 from infrastructure.literature.core import LiteratureConfig
 from infrastructure.literature.sources import (
@@ -337,6 +338,32 @@ class TestPDFHandlerFallbackIntegration:
         
         assert path == existing_pdf
 
+    def test_record_false_defers_library_update(self, tmp_path):
+        """Test download_pdf(record=False) leaves library writes to record_download."""
+        pdfs_dir = tmp_path / "pdfs"
+        pdfs_dir.mkdir()
+        existing_pdf = pdfs_dir / "test2024paper.pdf"
+        existing_pdf.write_bytes(b'%PDF-1.4 test content')
+        config = LiteratureConfig(
+            download_dir=str(pdfs_dir),
+            bibtex_file=str(tmp_path / "refs.bib"),
+            library_index_file=str(tmp_path / "library.json")
+        )
+        library_index = MagicMock()
+        handler = PDFHandler(config, library_index=library_index)
+        result = SearchResult(
+            title="Paper", authors=["Test"], year=2024, abstract="",
+            url="https://example.com", pdf_url="https://example.com/fake.pdf"
+        )
+
+        path = handler.download_pdf(
+            url=result.pdf_url, filename="test2024paper.pdf", result=result, record=False
+        )
+        library_index.update_pdf_path.assert_not_called()
+
+        handler.record_download(path, result)
+        library_index.update_pdf_path.assert_called_once_with("test2024paper", str(existing_pdf))
+
 
 class TestTransformPdfUrlMultiplePatterns:
     """Additional tests for URL transformation edge cases."""
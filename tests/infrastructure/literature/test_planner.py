@@ -0,0 +1,99 @@
+"""Tests for infrastructure/literature/summarization/planner.py and summary_manifest.py"""
+import os
+from pathlib import Path
+
+import pytest
+
+from infrastructure.literature.library.index import LibraryEntry
+from infrastructure.literature.summarization import summary_manifest
+from infrastructure.literature.summarization.orchestrator import (
+    find_papers_needing_extraction,
+    find_papers_needing_summary,
+)
+from infrastructure.literature.summarization.planner import BuildPlanner
+from infrastructure.literature.summarization.summary_manifest import SummaryManifest
+
+
+@pytest.fixture
+def library(tmp_path, monkeypatch):
+    """Three papers: complete, missing summary, and missing PDF."""
+    monkeypatch.chdir(tmp_path)
+    for directory in ("data/pdfs", "data/extracted_text", "data/summaries"):
+        Path(directory).mkdir(parents=True)
+    for key in ("done", "nosummary"):
+        Path(f"data/pdfs/{key}.pdf").write_bytes(b"%PDF-1.4 " + key.encode())
+        Path(f"data/extracted_text/{key}.txt").write_text(f"text of {key}", encoding="utf-8")
+    Path("data/summaries/done_summary.md").write_text("summary", encoding="utf-8")
+    return [LibraryEntry(citation_key=key, title=key, authors=[]) for key in ("done", "nosummary", "nopdf")]
+
+
+class TestSummaryManifest:
+    """Tests for summary input records."""
+
+    def test_fresh_until_text_changes(self, tmp_path):
+        text_path = tmp_path / "paper.txt"
+        text_path.write_text("extracted", encoding="utf-8")
+        manifest = SummaryManifest(tmp_path / "manifest.json")
+        assert manifest.is_fresh("paper", text_path)  # no record yet
+
+        manifest.record("paper", text_path)
+        os.utime(text_path, (1, 1))
+        assert manifest.is_fresh("paper", text_path)  # same content, rehashed
+        assert manifest.get("paper")["text_mtime"] == 1
+
+        text_path.write_text("re-extracted", encoding="utf-8")
+        assert not manifest.is_fresh("paper", text_path)
+
+    def test_version_change_is_stale(self, tmp_path, monkeypatch):
+        text_path = tmp_path / "paper.txt"
+        text_path.write_text("extracted", encoding="utf-8")
+        manifest = SummaryManifest(tmp_path / "manifest.json")
+        manifest.record("paper", text_path)
+
+        assert SummaryManifest(manifest.path).is_fresh("paper", text_path)
+        monkeypatch.setattr(summary_manifest, "SUMMARIZER_VERSION", "next")
+        assert not manifest.is_fresh("paper", text_path)
+
+
+class TestBuildPlanner:
+    """Tests for stale-stage detection across the pipeline."""
+
+    def test_plan_stages(self, library):
+        plan = BuildPlanner().plan(library)
+
+        stages = {p.citation_key: p.stages for p in plan.papers}
+        assert stages == {"nosummary": ["summary"], "nopdf": ["pdf", "text", "summary"]}
+        assert plan.up_to_date == 1
+        assert [p.citation_key for p in plan.ready("summary")] == ["nosummary"]
+        assert plan.counts() == {"pdf": 1, "text": 1, "summary": 2, "up_to_date": 1}
+
+    def test_unchanged_library_plans_nothing(self, library):
+        Path("data/summaries/nosummary_summary.md").write_text("summary", encoding="utf-8")
+        entries = library[:2]
+
+        assert BuildPlanner().plan(entries).is_empty
+        assert find_papers_needing_extraction(entries) == []
+        assert find_papers_needing_summary(entries) == []
+
+    def test_changed_text_makes_summary_stale(self, library):
+        planner = BuildPlanner()
+        planner.plan(library)  # adopts the existing summary
+
+        Path("data/extracted_text/done.txt").write_text("new text of done", encoding="utf-8")
+        plan = planner.plan(library[:1])
+
+        assert [(p.citation_key, p.reasons) for p in plan.papers] == [("done", {"summary": "stale"})]
+        assert [r.title for r, _ in find_papers_needing_summary(library[:1], plan)] == ["done"]
+
+    def test_stale_text_propagates_downstream(self, library):
+        planner = BuildPlanner()
+        planner.extractor.manifest.record(
+            "done", Path("data/pdfs/done.pdf"), Path("data/extracted_text/done.txt"), "old-hash", 11, 3
+        )
+        Path("data/pdfs/done.pdf").write_bytes(b"%PDF-1.4 revised paper")
+
+        plan = planner.plan(library[:1])
+
+        assert plan.papers[0].reasons == {"text": "stale", "summary": "upstream"}
+        assert [pdf for _, pdf in find_papers_needing_extraction(library[:1], plan)] == [Path("data/pdfs/done.pdf")]
+        assert find_papers_needing_summary(library[:1], plan) == []
@@ -306,3 +306,23 @@ class TestPromptBuilder:
         assert "vary attribution" in instructions.lower() or "attribution phrases" in instructions.lower()
 
 
+
+    def test_stage_prompts_share_paper_prefix(self, builder, sample_context, sample_metadata):
+        """Test that draft, refinement and extraction prompts start with the same paper prefix."""
+        from infrastructure.llm.templates.research import (
+            ClaimsQuotesExtraction,
+            PaperClassificationTemplate,
+            render_paper_prefix,
+        )
+        prefix = render_paper_prefix(sample_context.title, sample_context.full_text)
+        template_args = {"title": sample_context.title, "authors": "Author One", "year": "2024"}
+        prompts = [
+            builder.build_draft_prompt(sample_context, sample_metadata),
+            builder.build_refinement_prompt("Draft", ["Missing quotes"], sample_context),
+            builder.build_simple_refinement_prompt("Draft", ["Missing quotes"], sample_context),
+            ClaimsQuotesExtraction().render(source="test", text=sample_context.full_text, **template_args),
+            PaperClassificationTemplate().render(full_text=sample_context.full_text, **template_args),
+        ]
+        
+        assert all(prompt.startswith(prefix) for prompt in prompts)
+        assert all(prompt.count(sample_context.full_text) == 1 for prompt in prompts)
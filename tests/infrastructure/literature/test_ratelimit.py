@@ -0,0 +1,107 @@
+"""Tests for infrastructure/literature/sources/ratelimit.py"""
+import threading
+import time
+from email.utils import formatdate
+
+import pytest
+
+from infrastructure.literature.sources.ratelimit import (
+    HostRateLimiter,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After header parsing."""
+
+    def test_seconds(self):
+        assert parse_retry_after("7") == 7.0
+
+    def test_http_date(self):
+        assert 25 < parse_retry_after(formatdate(time.time() + 30, usegmt=True)) <= 30
+
+    def test_missing_or_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestTokenBucket:
+    """Tests for the token bucket."""
+
+    def test_burst_then_rate(self):
+        """Test burst tokens are free and later ones are spaced by 1/rate."""
+        bucket = TokenBucket(rate=10.0, burst=2)
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.02)
+        assert bucket.reserve() == pytest.approx(0.2, abs=0.02)
+        assert bucket.stats.requests == 4
+        assert bucket.stats.max_wait == pytest.approx(0.2, abs=0.02)
+
+    def test_throttle_and_recover(self):
+        """Test 429 handling halves the rate, blocks, then recovers."""
+        bucket = TokenBucket(rate=8.0, burst=4)
+        bucket.throttle(retry_after=0.5)
+        assert bucket.rate == 4.0
+        assert bucket.reserve() >= 0.45
+        assert bucket.stats.throttled == 1
+
+        for _ in range(20):
+            bucket.recover()
+        assert bucket.rate == 8.0
+
+    def test_rate_has_floor(self):
+        """Test repeated throttling cannot stop a host completely."""
+        bucket = TokenBucket(rate=8.0)
+        for _ in range(10):
+            bucket.throttle()
+        assert bucket.rate == 1.0
+
+    def test_threads_share_bucket(self):
+        """Test concurrent callers are spaced out by the rate."""
+        bucket = TokenBucket(rate=20.0, burst=1)
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(4)]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert time.monotonic() - start >= 0.13
+        assert bucket.stats.requests == 4
+
+
+class TestHostRateLimiter:
+    """Tests for the per-host registry."""
+
+    def test_hosts_are_independent(self):
+        """Test each host has its own bucket."""
+        limiter = HostRateLimiter(default_rate=5.0, default_burst=1)
+        assert limiter.bucket("a.org").reserve() == 0
+        assert limiter.bucket("b.org").reserve() == 0
+        assert limiter.bucket("A.org").reserve() > 0
+
+    def test_configure_overrides_defaults(self):
+        """Test configured hosts keep their rate when defaults change."""
+        limiter = HostRateLimiter()
+        limiter.configure("export.arxiv.org", rate=1 / 3.0, burst=1)
+        limiter.bucket("example.org")
+        limiter.set_defaults(rate=10.0, burst=2)
+
+        assert limiter.bucket("export.arxiv.org").base_rate == pytest.approx(1 / 3.0)
+        assert limiter.bucket("example.org").base_rate == 10.0
+
+    def test_record_response_and_stats(self):
+        """Test throttling responses are counted per host and in totals."""
+        limiter = HostRateLimiter(default_rate=4.0)
+        limiter.acquire("api.example.org")
+        limiter.record_response("api.example.org", 429, "1")
+        limiter.record_response("api.example.org", 200)
+        limiter.record_response("other.org", 503)
+
+        stats = limiter.get_stats()
+        assert stats["api.example.org"].throttled == 1
+        assert stats["api.example.org"].rate == pytest.approx(2.4)
+        total = limiter.total_stats()
+        assert total.throttled == 2
+        assert total.requests == 1
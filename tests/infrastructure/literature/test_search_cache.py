@@ -0,0 +1,196 @@
+"""Tests for the persistent search response cache."""
+import json
+import time
+import zlib
+
+import pytest
+
+from infrastructure.core.performance import PerformanceMonitor
+from infrastructure.literature.core import LiteratureConfig, LiteratureSearch
+from infrastructure.literature.sources import LiteratureSource, SearchResponseCache, SearchResult
+
+
+def _result(i: int, source: str = "test") -> SearchResult:
+    return SearchResult(
+        title=f"Paper {i}",
+        authors=["Author A", "Author B"],
+        year=2020 + i,
+        abstract="Abstract text",
+        url=f"https://example.com/{i}",
+        doi=f"10.1234/{i}",
+        source=source,
+        citation_count=i,
+    )
+
+
+class CountingSource(LiteratureSource):
+    """Source that counts how often it actually hits the 'network'."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.calls = 0
+
+    def search(self, query, limit=10, use_cache=True):
+        def _execute_search():
+            self.calls += 1
+            return [_result(i, "counting") for i in range(limit)]
+
+        return self._execute_with_retry(
+            _execute_search,
+            "search",
+            "counting",
+            cache_params={"query": query, "limit": limit} if use_cache else None
+        )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SearchResponseCache(tmp_path / "cache.sqlite")
+
+
+class TestSearchResponseCache:
+    """Tests for SearchResponseCache storage, expiry and eviction."""
+
+    def test_roundtrip(self, cache):
+        """Stored results come back as equal SearchResult objects."""
+        results = [_result(1), _result(2)]
+        cache.put("arxiv", "search", {"query": "q", "limit": 2}, results)
+
+        assert cache.get("arxiv", "search", {"query": "q", "limit": 2}) == results
+        assert cache.get("arxiv", "search", {"query": "q", "limit": 3}) is None
+        assert cache.get("crossref", "search", {"query": "q", "limit": 2}) is None
+
+    def test_hit_miss_feed_monitor(self, tmp_path):
+        """Hits and misses are recorded on the PerformanceMonitor."""
+        monitor = PerformanceMonitor()
+        monitor.start()
+        cache = SearchResponseCache(tmp_path / "cache.sqlite", monitor=monitor)
+
+        cache.get("arxiv", "search", {"query": "q"})
+        cache.put("arxiv", "search", {"query": "q"}, [_result(1)])
+        cache.get("arxiv", "search", {"query": "q"})
+
+        metrics = monitor.stop()
+        assert metrics.cache_hits == 1
+        assert metrics.cache_misses == 1
+        assert cache.get_stats()["hit_rate"] == 0.5
+
+    def test_per_source_ttl(self, tmp_path):
+        """Entries expire according to the source's own TTL."""
+        cache = SearchResponseCache(
+            tmp_path / "cache.sqlite", default_ttl=3600, source_ttls={"arxiv": 0.05}
+        )
+        cache.put("arxiv", "search", {"query": "q"}, [_result(1)])
+        cache.put("crossref", "search", {"query": "q"}, [_result(1)])
+
+        time.sleep(0.1)
+
+        assert cache.get("arxiv", "search", {"query": "q"}) is None
+        assert cache.get("crossref", "search", {"query": "q"}) is not None
+        assert cache.get_stats()["entries"] == 1
+
+    def test_lru_eviction(self, tmp_path):
+        """Least-recently-used entries are evicted past the size bound."""
+        cache = SearchResponseCache(tmp_path / "cache.sqlite")
+        cache.put("a", "search", {"query": "1"}, [_result(i) for i in range(20)])
+        entry_size = cache.get_stats()["size_bytes"]
+        cache.max_bytes = entry_size * 2
+
+        cache.put("a", "search", {"query": "2"}, [_result(i) for i in range(20)])
+        cache.get("a", "search", {"query": "1"})  # touch 1 so 2 is the LRU entry
+        cache.put("a", "search", {"query": "3"}, [_result(i) for i in range(20)])
+
+        assert cache.get("a", "search", {"query": "1"}) is not None
+        assert cache.get("a", "search", {"query": "2"}) is None
+        assert cache.get("a", "search", {"query": "3"}) is not None
+
+    def test_refresh_mode_skips_reads(self, cache):
+        """Refresh mode always misses but still stores results."""
+        cache.put("arxiv", "search", {"query": "q"}, [_result(1)])
+        cache.refresh = True
+        assert cache.get("arxiv", "search", {"query": "q"}) is None
+
+        cache.put("arxiv", "search", {"query": "q"}, [_result(2)])
+        cache.refresh = False
+        assert cache.get("arxiv", "search", {"query": "q"}) == [_result(2)]
+
+    def test_malformed_entry_is_a_miss(self, cache):
+        """A cached row that no longer matches SearchResult counts as a miss."""
+        key = cache.make_key("arxiv", "search", {"query": "q"})
+        cache.put("arxiv", "search", {"query": "q"}, [_result(1)])
+        payload = zlib.compress(json.dumps([{"title": "T", "unknown_field": 1}]).encode("utf-8"))
+        with cache._lock:
+            cache._connect().execute("UPDATE blobs SET payload = ? WHERE key = ?", (payload, key))
+
+        assert cache.get("arxiv", "search", {"query": "q"}) is None
+        assert cache.get_stats()["misses"] == 1
+
+    def test_file_created_lazily(self, tmp_path):
+        """No database file is created until the cache is used."""
+        path = tmp_path / "sub" / "cache.sqlite"
+        cache = SearchResponseCache(path)
+        assert not path.exists()
+        cache.put("a", "search", {"query": "q"}, [])
+        assert path.exists()
+
+
+class TestSourceCaching:
+    """Tests for caching inside LiteratureSource._execute_with_retry."""
+
+    def test_second_search_served_from_cache(self, mock_config, tmp_path):
+        """Repeated identical searches hit the network once."""
+        source = CountingSource(mock_config)
+        source.response_cache = SearchResponseCache(tmp_path / "cache.sqlite")
+
+        first = source.search("free energy", limit=3)
+        second = source.search("free energy", limit=3)
+        source.search("free energy", limit=4)
+
+        assert first == second
+        assert source.calls == 2
+
+    def test_health_check_bypasses_cache(self, mock_config, tmp_path):
+        """Health checks always query the source and leave the cache attached."""
+        source = CountingSource(mock_config)
+        source.response_cache = SearchResponseCache(tmp_path / "cache.sqlite")
+        source.search("test", limit=1)
+
+        assert source.check_health()
+        assert source.calls == 2
+        assert source.response_cache is not None
+
+    def test_no_cache_attached(self, mock_config):
+        """Without a cache every search goes to the network."""
+        source = CountingSource(mock_config)
+        source.search("q", limit=1)
+        source.search("q", limit=1)
+        assert source.calls == 2
+
+    def test_literature_search_shares_cache(self, mock_config):
+        """LiteratureSearch attaches one cache next to the download dir."""
+        searcher = LiteratureSearch(mock_config)
+        assert searcher.search_cache is not None
+        assert all(s.response_cache is searcher.search_cache for s in searcher.sources.values())
+        assert searcher.search_cache.path.parent.name == "cache"
+        assert searcher.search_cache.ttl_for("arxiv") < searcher.search_cache.ttl_for("crossref")
+
+    def test_literature_search_cache_disabled(self, mock_config):
+        """use_search_cache=False leaves sources uncached."""
+        mock_config.use_search_cache = False
+        searcher = LiteratureSearch(mock_config)
+        assert searcher.search_cache is None
+        assert all(s.response_cache is None for s in searcher.sources.values())
+
+    def test_config_from_env(self, monkeypatch, tmp_path):
+        """Cache settings are read from the environment."""
+        monkeypatch.setenv("LITERATURE_SEARCH_CACHE", "false")
+        monkeypatch.setenv("LITERATURE_SEARCH_CACHE_REFRESH", "true")
+        monkeypatch.setenv("LITERATURE_SEARCH_CACHE_FILE", str(tmp_path / "c.sqlite"))
+        monkeypatch.setenv("LITERATURE_SEARCH_CACHE_TTL", "60")
+
+        config = LiteratureConfig.from_env()
+
+        assert config.use_search_cache is False
+        assert config.refresh_search_cache is True
+        assert SearchResponseCache.from_config(config).path == tmp_path / "c.sqlite"
+        assert config.search_cache_ttl == 60.0
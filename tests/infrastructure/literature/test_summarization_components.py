@@ -430,6 +430,41 @@ class TestSummarizationComponents:
         # Should identify at least some sections
         assert len(sections) >= 0
     
+    def test_pdf_processor_extract_sections_stops_early(self, tmp_path, monkeypatch):
+        """Test leading sections are extracted without parsing the whole PDF."""
+        from infrastructure.literature.summarization import pdf_processor
+        from infrastructure.literature.summarization.pdf_processor import PDFProcessor
+
+        pages = [
+            "Deep Learning for Protein Folding\nAbstract\nWe fold proteins.\nIntroduction\n"
+            + "Proteins matter. " * 400,
+        ] + [f"Body page {i}" for i in range(20)]
+        parsed = []
+
+        def fake_iter_pdf_pages(pdf_path, max_pages=None):
+            for page in pages[:max_pages]:
+                parsed.append(page)
+                yield page
+
+        monkeypatch.setattr(pdf_processor, "iter_pdf_pages", fake_iter_pdf_pages)
+        identify_calls = []
+        identify_sections = PDFProcessor.identify_sections
+        monkeypatch.setattr(
+            PDFProcessor, "identify_sections",
+            lambda self, text: identify_calls.append(text) or identify_sections(self, text)
+        )
+        sections = PDFProcessor().extract_sections(tmp_path / "paper.pdf")
+
+        assert sections["title"] == "Deep Learning for Protein Folding"
+        assert sections["abstract"] == "We fold proteins."
+        assert sections["introduction"].startswith("Proteins matter.")
+        assert len(parsed) == 1
+        assert len(identify_calls) == 1
+
+        parsed.clear()
+        assert "conclusion" not in PDFProcessor().extract_sections(tmp_path / "paper.pdf", ["conclusion"])
+        assert len(parsed) == len(pages)
+
     def test_pdf_processor_extract_prioritized_text(self, tmp_path):
         """Test PDF processor prioritized text extraction."""
         from infrastructure.literature.summarization.pdf_processor import PDFProcessor
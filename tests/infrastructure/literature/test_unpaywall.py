@@ -106,7 +106,7 @@ class TestUnpaywallSource:
         source = UnpaywallSource(config)
         
         # Mock the request to verify cleaned DOI
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 404
             mock_get.return_value = mock_response
@@ -123,7 +123,7 @@ class TestUnpaywallSource:
         config = LiteratureConfig(unpaywall_email="test@example.com")
         source = UnpaywallSource(config)
         
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 404
             mock_get.return_value = mock_response
@@ -138,7 +138,7 @@ class TestUnpaywallSource:
         config = LiteratureConfig(unpaywall_email="test@example.com")
         source = UnpaywallSource(config)
         
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 404
             mock_get.return_value = mock_response
@@ -223,7 +223,7 @@ class TestUnpaywallSource:
         config = LiteratureConfig(unpaywall_email="test@example.com")
         source = UnpaywallSource(config)
         
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 404
             mock_get.return_value = mock_response
@@ -239,7 +239,7 @@ class TestUnpaywallSource:
         config = LiteratureConfig(unpaywall_email="test@example.com")
         source = UnpaywallSource(config)
         
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.side_effect = requests.exceptions.ConnectionError("Network error")
             
             result = source.lookup("10.1038/nature12373")
@@ -400,7 +400,7 @@ class TestUnpaywallHealthMethods:
         assert source._consecutive_failures == 0
         
         # Simulate a failed lookup
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.side_effect = Exception("Network error")
             source.lookup("10.1038/nature12373")
             
@@ -415,7 +415,7 @@ class TestUnpaywallHealthMethods:
         source._consecutive_failures = 2
         
         # Mock successful lookup
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -13,6 +13,7 @@ def create_mock_literature_search():
     from infrastructure.literature.core import LiteratureConfig
     mock_search = Mock()
     mock_search.config = LiteratureConfig(download_dir="data/pdfs")
+    mock_search.library_index.find_existing_key.return_value = None
     return mock_search
 
 
@@ -170,7 +171,7 @@ class TestLiteratureWorkflow:
         # Mock the download method to return successful downloads
         original_download = literature_search.download_paper_with_result
         download_call_count = 0
-        def mock_download_paper_with_result(search_result):
+        def mock_download_paper_with_result(search_result, record=True):
             nonlocal download_call_count
             download_call_count += 1
             pdf_path = tmp_path / "pdfs" / f"paper{download_call_count}.pdf"
@@ -239,6 +240,44 @@ class TestLiteratureWorkflow:
         assert len(results) == 2
         assert literature_search.search.call_count == 2
 
+    def test_search_papers_filters_against_library(self, mock_config, tmp_path, monkeypatch):
+        """Test known papers are counted and completed ones are skipped."""
+        from infrastructure.literature.core import SearchStatistics
+        from infrastructure.literature.library import LibraryIndex
+
+        monkeypatch.chdir(tmp_path)
+        index = LibraryIndex(mock_config)
+        complete_key = index.add_entry(title="Complete Paper", authors=["A"], year=2020, doi="10.1/done")
+        partial_key = index.add_entry(title="Downloaded Only", authors=["B"], year=2021)
+        pdf_dir = Path(mock_config.download_dir)
+        pdf_dir.mkdir(parents=True, exist_ok=True)
+        (pdf_dir / f"{complete_key}.pdf").write_bytes(b"%PDF")
+        (pdf_dir / f"{partial_key}.pdf").write_bytes(b"%PDF")
+        (tmp_path / "data" / "summaries").mkdir(parents=True)
+        (tmp_path / "data" / "summaries" / f"{complete_key}_summary.md").write_text("summary")
+
+        literature_search = Mock()
+        literature_search.config = mock_config
+        literature_search.library_index = index
+        results = [
+            SearchResult("Complete Paper (preprint)", ["A"], 2020, "Abstract", "url1", doi="10.1/DONE"),
+            SearchResult("Downloaded only", ["B"], 2021, "Abstract", "url2"),
+            SearchResult("Brand New Paper", ["C"], 2022, "Abstract", "url3"),
+        ]
+        literature_search.search.side_effect = lambda *args, **kwargs: (
+            results, SearchStatistics(query="kw", total_results=3)
+        )
+        workflow = LiteratureWorkflow(literature_search)
+
+        kept = workflow._search_papers(["kw"], 10, skip_completed=True)
+
+        assert sorted(r.title for r in kept) == ["Brand New Paper", "Downloaded only"]
+        assert workflow.last_search_library_stats == {"new": 1, "known": 2, "skipped_complete": 1}
+
+        # Without skipping, known papers are reported but kept
+        assert len(workflow._search_papers(["kw"], 10)) == 3
+        assert workflow.last_search_library_stats["skipped_complete"] == 0
+
     def test_download_papers(self):
         """Test paper download functionality."""
         literature_search = create_mock_literature_search()
@@ -718,3 +757,48 @@ class TestLiteratureWorkflow:
             last_error="PDF extraction failed",
             summary_attempts=1
         )
+
+
+class TestReuseDuplicateSummary:
+    """Tests for reusing the summaries of a duplicate PDF."""
+
+    def test_reused_files_get_this_papers_header(self, tmp_path):
+        from infrastructure.literature.summarization import SummarizationEngine
+
+        original = SearchResult(
+            "Preprint title", ["A. Author"], 2020, "", "https://arxiv.org/abs/1",
+            doi="10.48550/arXiv.1", source="arxiv", venue="arXiv"
+        )
+        for suffix, title_suffix in (
+            ("_summary.md", ""),
+            ("_claims_quotes.md", " - Key Claims and Quotes"),
+            ("_methods_tools.md", " - Methods and Tools Analysis"),
+        ):
+            header = SummarizationEngine.paper_header(original, "author2020preprint", title_suffix)
+            (tmp_path / f"author2020preprint{suffix}").write_text(
+                header + f"**Generated:** 2024-01-01 00:00:00\n\n---\n\nBody{suffix}\n", encoding="utf-8"
+            )
+
+        workflow = LiteratureWorkflow(create_mock_literature_search())
+        workflow.content_index = Mock()
+        workflow.content_index.duplicates_of.return_value = ["author2020preprint"]
+        workflow._get_summary_path = lambda key: tmp_path / f"{key}_summary.md"
+        published = SearchResult(
+            "Published title", ["A. Author"], 2021, "", "https://doi.org/10.1/x",
+            doi="10.1/x", source="crossref", venue="Journal"
+        )
+
+        summary_path = workflow._reuse_duplicate_summary(published, "author2021published", tmp_path / "x.pdf")
+
+        assert summary_path == tmp_path / "author2021published_summary.md"
+        summary = summary_path.read_text(encoding="utf-8")
+        assert summary.startswith("# Published title\n")
+        assert "**DOI:** 10.1/x" in summary
+        assert "**Venue:** Journal" in summary
+        assert "(../pdfs/author2021published.pdf)" in summary
+        assert "author2020preprint" not in summary
+        assert summary.endswith("Body_summary.md\n")
+        claims = (tmp_path / "author2021published_claims_quotes.md").read_text(encoding="utf-8")
+        assert claims.startswith("# Published title - Key Claims and Quotes\n")
+        assert claims.endswith("Body_claims_quotes.md\n")
+        assert (tmp_path / "author2021published_methods_tools.md").exists()
@@ -151,6 +151,38 @@ class TestContextManagement:
         assert len(client.context.messages) == 1
         assert client.context.messages[0].role == "system"
 
+    def test_contexts_are_per_thread(self, config_with_system_prompt):
+        """Test a context cleared in one thread is untouched in another."""
+        import threading
+
+        client = LLMClient(config_with_system_prompt)
+        client.context.add_message("user", "Main thread question")
+        seen = {}
+
+        def worker():
+            seen["messages"] = [m.role for m in client.context.messages]
+            client.context.add_message("user", "Worker question")
+            client.context.clear()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert seen["messages"] == ["system"]
+        assert [m.role for m in client.context.messages] == ["system", "user"]
+
+    def test_conversation_restores_context(self, config_with_system_prompt):
+        """Test conversation() gives a fresh context and restores the previous one."""
+        client = LLMClient(config_with_system_prompt)
+        client.context.add_message("user", "Outer question")
+
+        with client.conversation() as context:
+            assert context is client.context
+            assert [m.role for m in context.messages] == ["system"]
+            context.add_message("user", "Inner question")
+
+        assert [m.content for m in client.context.messages][1:] == ["Outer question"]
+
 
 class TestGenerationOptionsIntegration:
     """Test GenerationOptions integration with LLMClient."""
@@ -0,0 +1,75 @@
+"""Tests for infrastructure/llm/core/response_cache.py"""
+import zlib
+from unittest.mock import MagicMock, patch
+
+from infrastructure.llm.core.client import LLMClient
+from infrastructure.llm.core.config import GenerationOptions, LLMConfig
+from infrastructure.llm.core.response_cache import LLMResponseCache, is_cacheable
+
+
+def chat_request(content="Summarize", seed=42, temperature=0.7):
+    return {
+        "model": "gemma3:4b",
+        "messages": [{"role": "user", "content": content}],
+        "options": {"temperature": temperature, "seed": seed},
+    }
+
+
+class TestLLMResponseCache:
+    """Tests for keys, lookups and eviction."""
+
+    def test_put_get_and_stats(self, tmp_path):
+        cache = LLMResponseCache(tmp_path / "llm.sqlite")
+        key = cache.make_key(chat_request())
+
+        assert cache.get(key) is None
+        cache.put(key, "gemma3:4b", "A summary")
+        assert cache.get(key) == "A summary"
+        assert cache.make_key({**chat_request(), "stream": True}) == key
+        assert cache.make_key(chat_request(seed=7)) != key
+
+        stats = cache.get_stats()
+        assert (stats["entries"], stats["hits"], stats["misses"]) == (1, 1, 1)
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        entry_size = len(zlib.compress(b"x" * 1000))
+        cache = LLMResponseCache(tmp_path / "llm.sqlite", max_bytes=2 * entry_size)
+        keys = [cache.make_key(chat_request(f"prompt {i}")) for i in range(3)]
+        cache.put(keys[0], "m", "x" * 1000)
+        cache.put(keys[1], "m", "y" * 1000)
+        cache.get(keys[0])
+        cache.put(keys[2], "m", "z" * 1000)
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[2]) is not None
+
+    def test_is_cacheable(self):
+        assert is_cacheable(chat_request(seed=1))
+        assert is_cacheable(chat_request(seed=None, temperature=0))
+        assert not is_cacheable(chat_request(seed=None))
+
+
+def test_client_serves_repeated_requests_from_cache(tmp_path):
+    """Test identical seeded requests reach the server once."""
+    config = LLMConfig(
+        auto_inject_system_prompt=False,
+        response_cache=True,
+        response_cache_file=str(tmp_path / "llm.sqlite"),
+    )
+    client = LLMClient(config)
+    response = MagicMock()
+    response.json.return_value = {"message": {"content": "Cached answer"}}
+
+    with patch("infrastructure.llm.core.client.requests.post", return_value=response) as post:
+        seeded = GenerationOptions(seed=42)
+        assert client.query("Question", options=seeded, reset_context=True) == "Cached answer"
+        assert client.query("Question", options=seeded, reset_context=True) == "Cached answer"
+        client.reset()
+        assert list(client.stream_query("Question", options=seeded, log_progress=False))[-1] == "Cached answer"
+        assert post.call_count == 1
+
+        client.query("Question", options=GenerationOptions(temperature=0.7), reset_context=True)
+        client.query("Question", options=GenerationOptions(temperature=0.7), reset_context=True)
+        assert post.call_count == 3
+
+    assert client.get_cache_stats()["hits"] == 2
@@ -0,0 +1,113 @@
+"""Tests for infrastructure/llm/core/session.py"""
+import json
+from unittest.mock import MagicMock, patch
+
+from infrastructure.llm.core.client import LLMClient
+from infrastructure.llm.core.config import LLMConfig
+from infrastructure.llm.core.session import RequestMetrics
+
+
+def chat_reply(content="ok", prompt_eval_count=100):
+    reply = MagicMock()
+    reply.json.return_value = {
+        "message": {"content": content},
+        "done": True,
+        "prompt_eval_count": prompt_eval_count,
+        "prompt_eval_duration": 500_000_000,
+        "load_duration": 100_000_000,
+    }
+    return reply
+
+
+class TestRequestMetrics:
+    """Tests for metrics parsed from Ollama responses."""
+
+    def test_non_streamed_ttft_is_load_plus_prompt_eval(self):
+        metrics = RequestMetrics.from_response("claims", 42, chat_reply().json())
+
+        assert metrics.prompt_tokens == 100
+        assert metrics.prompt_eval_seconds == 0.5
+        assert abs(metrics.ttft_seconds - 0.6) < 1e-9
+        assert not metrics.streaming
+
+    def test_streamed_ttft_is_client_measured(self):
+        metrics = RequestMetrics.from_response("draft", 42, {"prompt_eval_count": 7}, ttft_seconds=1.5)
+
+        assert metrics.ttft_seconds == 1.5
+        assert metrics.streaming
+        assert metrics.load_seconds is None
+
+
+class TestLLMClientSession:
+    """Tests for keep_alive and metric recording in sessions."""
+
+    def test_session_sets_keep_alive_and_records_stages(self):
+        client = LLMClient(LLMConfig(auto_inject_system_prompt=False))
+
+        with patch("infrastructure.llm.core.client.requests.post",
+                   side_effect=[chat_reply(prompt_eval_count=900), chat_reply(prompt_eval_count=40), chat_reply()]) as post:
+            with client.session(keep_alive="10m") as session:
+                session.stage = "claims"
+                client.query("paper + claims task", reset_context=True)
+                session.stage = "methods"
+                client.query("paper + methods task", reset_context=True)
+            assert client.active_session is None
+            client.query("outside", reset_context=True)
+
+        payloads = [call.kwargs["json"] for call in post.call_args_list]
+        assert [p.get("keep_alive") for p in payloads] == ["10m", "10m", None]
+        assert [(m.stage, m.prompt_tokens) for m in session.requests] == [("claims", 900), ("methods", 40)]
+        assert session.summary()["prompt_tokens"] == 940
+
+    def test_worker_threads_join_session(self):
+        """Test requests from map_chunks workers carry keep_alive and are recorded."""
+        from infrastructure.literature.summarization.chunk_map import map_chunks
+
+        client = LLMClient(LLMConfig(auto_inject_system_prompt=False))
+
+        with patch("infrastructure.llm.core.client.requests.post", return_value=chat_reply()) as post:
+            with client.session(keep_alive="10m") as session:
+                session.stage = "chunks"
+
+                def query_chunk(i, chunk):
+                    with client.use_session(session), client.conversation():
+                        return client.query(chunk, reset_context=True)
+
+                outcome = map_chunks(query_chunk, ["c1", "c2", "c3"], max_in_flight=3)
+
+        assert outcome.results == ["ok", "ok", "ok"]
+        assert [call.kwargs["json"].get("keep_alive") for call in post.call_args_list] == ["10m"] * 3
+        assert [m.stage for m in session.requests] == ["chunks"] * 3
+
+    def test_configured_keep_alive_outside_session(self):
+        client = LLMClient(LLMConfig(keep_alive="5m", auto_inject_system_prompt=False))
+
+        with patch("infrastructure.llm.core.client.requests.post", return_value=chat_reply()) as post:
+            client.query("Hello")
+
+        assert post.call_args.kwargs["json"]["keep_alive"] == "5m"
+
+    def test_stream_query_records_client_ttft(self):
+        client = LLMClient(LLMConfig(auto_inject_system_prompt=False))
+        reply = MagicMock()
+        reply.iter_lines.return_value = [
+            json.dumps({"message": {"content": "Hi"}, "done": False}).encode(),
+            json.dumps({"message": {"content": ""}, "done": True, "prompt_eval_count": 12}).encode(),
+        ]
+        reply.__enter__.return_value = reply
+
+        with patch("infrastructure.llm.core.client.requests.post", return_value=reply):
+            with client.session() as session:
+                assert "".join(client.stream_query("Hello", log_progress=False)) == "Hi"
+
+        assert len(session.requests) == 1
+        assert session.requests[0].streaming
+        assert session.requests[0].prompt_tokens == 12
+
+    def test_structured_instruction_follows_prompt(self):
+        client = LLMClient(LLMConfig(auto_inject_system_prompt=False))
+
+        with patch("infrastructure.llm.core.client.requests.post", return_value=chat_reply('{"a": 1}')) as post:
+            client.query_structured("PAPER PREFIX then task")
+
+        assert post.call_args.kwargs["json"]["messages"][-1]["content"].startswith("PAPER PREFIX then task")
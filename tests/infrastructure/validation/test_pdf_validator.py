@@ -14,12 +14,37 @@ import pytest
 # Add repo root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
+from infrastructure.validation import pdf_validator
 from infrastructure.validation.pdf_validator import (
     PDFValidationError,
     extract_text_from_pdf,
+    iter_pdf_pages,
+    write_pdf_text,
 )
 
 
+def make_pdf(path, pages):
+    """Create a PDF with one line of text per page."""
+    canvas_module = pytest.importorskip("reportlab.pdfgen.canvas")
+    c = canvas_module.Canvas(str(path))
+    for text in pages:
+        c.drawString(100, 750, text)
+        c.showPage()
+    c.save()
+    return path
+
+
+def fake_backend(pages, fail_on=()):
+    """Backend opener serving fixed page texts, raising on some pages."""
+    def open_backend(pdf_path, stack):
+        def page_text(index):
+            if index in fail_on:
+                raise ValueError(f"bad page {index}")
+            return pages[index]
+        return len(pages), page_text
+    return open_backend
+
+
 class TestPDFValidationError:
     """Test PDFValidationError exception."""
     
@@ -113,6 +138,54 @@ class TestExtractTextFromPDF:
             pytest.skip("reportlab not available for PDF creation")
 
 
+class TestIterPDFPages:
+    """Test page-level streaming extraction."""
+
+    def test_yields_pages_in_order(self, tmp_path):
+        pdf_path = make_pdf(tmp_path / "paper.pdf", ["First page", "Second page", "Third page"])
+        pages = list(iter_pdf_pages(pdf_path))
+        assert len(pages) == 3
+        assert "Second page" in pages[1]
+        assert extract_text_from_pdf(pdf_path) == "\n".join(pages)
+
+    def test_early_stop_and_max_pages(self, tmp_path):
+        pdf_path = make_pdf(tmp_path / "paper.pdf", [f"Page {i}" for i in range(5)])
+        assert len(list(iter_pdf_pages(pdf_path, max_pages=2))) == 2
+
+        pages = iter_pdf_pages(pdf_path)
+        assert "Page 0" in next(pages)
+        pages.close()
+
+    def test_failed_page_retried_with_next_backend(self, tmp_path, monkeypatch):
+        """Test only the failing page is parsed by the fallback backend."""
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        monkeypatch.setattr(pdf_validator, "_BACKENDS", [
+            ("primary", fake_backend(["p0", "p1", "p2"], fail_on={1})),
+            ("fallback", fake_backend(["f0", "f1", "f2"])),
+        ])
+        assert list(iter_pdf_pages(pdf_path)) == ["p0", "f1", "p2"]
+
+        monkeypatch.setattr(pdf_validator, "_BACKENDS", [
+            ("primary", fake_backend(["p0", "p1"], fail_on={0})),
+        ])
+        assert list(iter_pdf_pages(pdf_path)) == ["", "p1"]
+
+    def test_write_pdf_text(self, tmp_path):
+        pdf_path = make_pdf(tmp_path / "paper.pdf", ["First page", "Second page"])
+        output_path = tmp_path / "paper.txt"
+
+        info = write_pdf_text(pdf_path, output_path)
+        assert info.chars == len(output_path.read_text(encoding="utf-8"))
+        assert info.pages == 2 and info.words == 4
+        assert info.backend in ("pdfplumber", "pypdf", "PyPDF2")
+        assert output_path.read_text(encoding="utf-8") == extract_text_from_pdf(pdf_path)
+
+        with pytest.raises(PDFValidationError):
+            write_pdf_text(pdf_path, tmp_path / "short.txt", min_chars=1000)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["paper.pdf", "paper.txt"]
+
+
 class TestPDFValidatorModule:
     """Test PDF validator module structure."""
     